@@ -82,6 +82,7 @@
 #include "complexobject.h"
 #include "rangeobject.h"
 #include "memoryobject.h"
+#include "picklebufobject.h"
 #include "tupleobject.h"
 #include "listobject.h"
 #include "dictobject.h"
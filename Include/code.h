@@ -7,6 +7,38 @@
 extern "C" {
 #endif
 
+typedef struct {
+    PyObject *ptr;  /* Cached pointer (borrowed reference) */
+    uint64_t globals_ver;  /* ma_version_tag of the globals dict */
+    uint64_t builtins_ver; /* ma_version_tag of the builtins dict */
+} _PyOpcache_LoadGlobal;
+
+/* LOAD_ATTR and LOAD_METHOD entries are only valid while the type of the
+   object is the same and its tp_version_tag has not changed. */
+typedef struct {
+    PyTypeObject *type;    /* Borrowed reference, only compared */
+    unsigned int tp_version_tag;
+    Py_ssize_t hint;       /* >= 0: index in the instance dict,
+                              < -1: ~offset of a __slots__ member */
+} _PyOpcache_LoadAttr;
+
+typedef struct {
+    PyTypeObject *type;    /* Borrowed reference, only compared */
+    unsigned int tp_version_tag;
+    PyObject *meth;        /* Borrowed reference, owned by the type */
+} _PyOpcache_LoadMethod;
+
+/* Per-opcode cache entry, see co_opcache below */
+typedef struct {
+    union {
+        _PyOpcache_LoadGlobal lg;
+        _PyOpcache_LoadAttr la;
+        _PyOpcache_LoadMethod lm;
+    } u;
+    char optimized;  /* non-zero once the entry holds valid data */
+    unsigned char misses;  /* number of failed attempts to use the entry */
+} _PyOpcache;
+
 /* Bytecode object */
 typedef struct {
     PyObject_HEAD
@@ -35,6 +67,22 @@ typedef struct {
 				   Objects/lnotab_notes.txt for details. */
     void *co_zombieframe;     /* for optimization only (see frameobject.c) */
     PyObject *co_weakreflist;   /* to support weakrefs to code objects */
+    /* Scratch space for extra data relating to the code object.
+       Type is a void* to keep the format private in codeobject.c to force
+       people to go through the proper APIs. */
+    void *co_extra;
+
+    /* Per-opcode just-in-time cache.
+
+       To keep the cache small, opcodes are mapped to cache entries
+       indirectly: co_opcache_map is indexed by (next_instr - first_instr);
+       0 means the opcode has no cache entry and n > 0 means its entry is
+       co_opcache[n - 1].  Both arrays are only allocated once the code
+       object has been run OPCACHE_MIN_RUNS times. */
+    unsigned char *co_opcache_map;
+    _PyOpcache *co_opcache;
+    int co_opcache_flag;   /* used to decide when to create the cache */
+    unsigned char co_opcache_size;   /* length of co_opcache */
 } PyCodeObject;
 
 /* Masks for co_flags above */
@@ -123,6 +171,18 @@ PyAPI_FUNC(int) _PyCode_CheckLineNumber(PyCodeObject* co,
  * depending on the type and the value. The type is the first item to not
  * compare bytes and str which can raise a BytesWarning exception. */
 PyAPI_FUNC(PyObject*) _PyCode_ConstantKey(PyObject *obj);
+
+/* Get and set the scratch data stored by the co_extra user with the given
+   index, see _PyEval_RequestCodeExtraIndex().  Return 0 on success, -1 with
+   an exception set on error. */
+PyAPI_FUNC(int) _PyCode_GetExtra(PyObject *code, Py_ssize_t index,
+                                 void **extra);
+PyAPI_FUNC(int) _PyCode_SetExtra(PyObject *code, Py_ssize_t index,
+                                 void *extra);
+
+/* Allocate co_opcache_map and co_opcache for the code object.
+   Return 0 on success, -1 with an exception set on error. */
+PyAPI_FUNC(int) _PyCode_InitOpcache(PyCodeObject *co);
 #endif
 
 PyAPI_FUNC(PyObject*) PyCode_Optimize(PyObject *code, PyObject* consts,
@@ -96,6 +96,10 @@ PyAPI_FUNC(int) _PyImport_FixupBuiltin(
     );
 PyAPI_FUNC(int) _PyImport_FixupExtensionObject(PyObject*, PyObject *, PyObject *);
 
+/* How hash-based .pyc files are validated against their source:
+   "default", "always" or "never" (see --check-hash-based-pycs) */
+PyAPI_DATA(const char *) _Py_CheckHashBasedPycsMode;
+
 struct _inittab {
     const char *name;           /* ASCII encoded string */
     PyObject* (*initfunc)(void);
@@ -122,6 +126,11 @@ struct _frozen {
    collection of frozen modules: */
 
 PyAPI_DATA(const struct _frozen *) PyImport_FrozenModules;
+
+/* Standard library modules frozen for faster startup (see
+   Python/frozen_startup.c), searched after PyImport_FrozenModules: */
+
+PyAPI_DATA(const struct _frozen *) _PyImport_FrozenStartupModules;
 #endif
 
 #ifdef __cplusplus
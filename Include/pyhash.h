@@ -10,6 +10,7 @@ extern "C" {
 PyAPI_FUNC(Py_hash_t) _Py_HashDouble(double);
 PyAPI_FUNC(Py_hash_t) _Py_HashPointer(void*);
 PyAPI_FUNC(Py_hash_t) _Py_HashBytes(const void*, Py_ssize_t);
+PyAPI_FUNC(PY_UINT64_T) _Py_KeyedHash(PY_UINT64_T, const void *, Py_ssize_t);
 #endif
 
 /* Prime multiplier used in string and various other hashes. */
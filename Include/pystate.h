@@ -12,10 +12,17 @@ extern "C" {
 
 struct _ts; /* Forward */
 struct _is; /* Forward */
+struct _frame; /* Avoid including frameobject.h */
 
 #ifdef Py_LIMITED_API
 typedef struct _is PyInterpreterState;
 #else
+typedef PyObject* (*_PyFrameEvalFunction)(struct _frame *, int);
+
+/* Maximum number of users of the co_extra field of code objects, see
+   _PyEval_RequestCodeExtraIndex() */
+#define MAX_CO_EXTRA_USERS 255
+
 typedef struct _is {
 
     struct _is *next;
@@ -41,14 +48,19 @@ typedef struct _is {
 #endif
 
     PyObject *builtins_copy;
+
+    /* Function used to evaluate frames, see PEP 523 */
+    _PyFrameEvalFunction eval_frame;
+
+    /* Users of the co_extra field of code objects */
+    Py_ssize_t co_extra_user_count;
+    freefunc co_extra_freefuncs[MAX_CO_EXTRA_USERS];
 } PyInterpreterState;
 #endif
 
 
 /* State unique per thread */
 
-struct _frame; /* Avoid including frameobject.h */
-
 #ifndef Py_LIMITED_API
 /* Py_tracefunc return -1 when raising an exception, or 0 for success. */
 typedef int (*Py_tracefunc)(PyObject *, struct _frame *, int, PyObject *);
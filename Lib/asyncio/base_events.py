@@ -17,7 +17,6 @@ to modify the meaning of the API call itself.
 import collections
 import concurrent.futures
 import heapq
-import inspect
 import itertools
 import logging
 import os
@@ -58,9 +57,23 @@ _FATAL_ERROR_IGNORE = (BrokenPipeError,
                        ConnectionResetError, ConnectionAbortedError)
 
 
+class _EventLoopStats:
+    """Counters updated by each BaseEventLoop._run_once() iteration."""
+
+    __slots__ = ('iterations', 'callbacks', 'timers', 'select_time',
+                 'last_callbacks', 'last_timers', 'last_select_time')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def _asdict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 def _format_handle(handle):
     cb = handle._callback
-    if inspect.ismethod(cb) and isinstance(cb.__self__, tasks.Task):
+    if isinstance(getattr(cb, '__self__', None), tasks.Task):
         # format the task
         return repr(cb.__self__)
     else:
@@ -241,6 +254,7 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._current_handle = None
         self._task_factory = None
         self._coroutine_wrapper_set = False
+        self._stats = _EventLoopStats()
 
     def __repr__(self):
         return ('<%s running=%s closed=%s debug=%s>'
@@ -363,7 +377,7 @@ class BaseEventLoop(events.AbstractEventLoop):
         """
         self._check_closed()
 
-        new_task = not isinstance(future, futures.Future)
+        new_task = not futures.isfuture(future)
         future = tasks.ensure_future(future, loop=self)
         if new_task:
             # An exception is raised if the future didn't complete, so there
@@ -1222,41 +1236,45 @@ class BaseEventLoop(events.AbstractEventLoop):
         'call_later' callbacks.
         """
 
-        sched_count = len(self._scheduled)
+        scheduled = self._scheduled
+        sched_count = len(scheduled)
         if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
             self._timer_cancelled_count / sched_count >
                 _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
             # Remove delayed calls that were cancelled if their number
             # is too high
             new_scheduled = []
-            for handle in self._scheduled:
+            for handle in scheduled:
                 if handle._cancelled:
                     handle._scheduled = False
                 else:
                     new_scheduled.append(handle)
 
             heapq.heapify(new_scheduled)
-            self._scheduled = new_scheduled
+            self._scheduled = scheduled = new_scheduled
             self._timer_cancelled_count = 0
         else:
             # Remove delayed calls that were cancelled from head of queue.
-            while self._scheduled and self._scheduled[0]._cancelled:
+            while scheduled and scheduled[0]._cancelled:
                 self._timer_cancelled_count -= 1
-                handle = heapq.heappop(self._scheduled)
+                handle = heapq.heappop(scheduled)
                 handle._scheduled = False
 
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
-        elif self._scheduled:
+        elif scheduled:
             # Compute the desired timeout.
-            when = self._scheduled[0]._when
+            when = scheduled[0]._when
             timeout = max(0, when - self.time())
 
+        stats = self._stats
+        t0 = self.time()
+        event_list = self._selector.select(timeout)
+        dt = self.time() - t0
+        stats.select_time += dt
+        stats.last_select_time = dt
         if self._debug and timeout != 0:
-            t0 = self.time()
-            event_list = self._selector.select(timeout)
-            dt = self.time() - t0
             if dt >= 1.0:
                 level = logging.INFO
             else:
@@ -1273,19 +1291,24 @@ class BaseEventLoop(events.AbstractEventLoop):
                 logger.log(level,
                            'poll %.3f ms took %.3f ms: timeout',
                            timeout * 1e3, dt * 1e3)
-        else:
-            event_list = self._selector.select(timeout)
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
+        ready = self._ready
+        ntimers = 0
         end_time = self.time() + self._clock_resolution
-        while self._scheduled:
-            handle = self._scheduled[0]
+        while scheduled:
+            handle = scheduled[0]
             if handle._when >= end_time:
                 break
-            handle = heapq.heappop(self._scheduled)
+            handle = heapq.heappop(scheduled)
             handle._scheduled = False
-            self._ready.append(handle)
+            ready.append(handle)
+            ntimers += 1
+
+        stats.iterations += 1
+        stats.timers += ntimers
+        stats.last_timers = ntimers
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -1293,12 +1316,15 @@ class BaseEventLoop(events.AbstractEventLoop):
         # callbacks scheduled by callbacks run this time around --
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
-        ntodo = len(self._ready)
-        for i in range(ntodo):
-            handle = self._ready.popleft()
-            if handle._cancelled:
-                continue
-            if self._debug:
+        ntodo = len(ready)
+        popleft = ready.popleft
+        ncancelled = 0
+        if self._debug:
+            for i in range(ntodo):
+                handle = popleft()
+                if handle._cancelled:
+                    ncancelled += 1
+                    continue
                 try:
                     self._current_handle = handle
                     t0 = self.time()
@@ -1309,10 +1335,18 @@ class BaseEventLoop(events.AbstractEventLoop):
                                        _format_handle(handle), dt)
                 finally:
                     self._current_handle = None
-            else:
+        else:
+            for i in range(ntodo):
+                handle = popleft()
+                if handle._cancelled:
+                    ncancelled += 1
+                    continue
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+        stats.callbacks += ntodo - ncancelled
+        stats.last_callbacks = ntodo - ncancelled
+
     def _set_coroutine_wrapper(self, enabled):
         try:
             set_wrapper = sys.set_coroutine_wrapper
@@ -1346,6 +1380,15 @@ class BaseEventLoop(events.AbstractEventLoop):
                 set_wrapper(None)
                 self._coroutine_wrapper_set = False
 
+    def get_stats(self):
+        """Return a dict of event loop statistics.
+
+        The 'iterations', 'callbacks', 'timers' and 'select_time'
+        entries are totals since the loop was created;
+        the 'last_*' entries describe the most recent iteration.
+        """
+        return self._stats._asdict()
+
     def get_debug(self):
         return self._debug
 
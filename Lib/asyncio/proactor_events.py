@@ -13,6 +13,7 @@ from . import base_events
 from . import compat
 from . import constants
 from . import futures
+from . import protocols
 from . import sslproto
 from . import transports
 from .log import logger
@@ -211,7 +212,11 @@ class _ProactorReadPipeTransport(_ProactorBasePipeTransport,
             self._read_fut.add_done_callback(self._loop_reading)
         finally:
             if data:
-                self._protocol.data_received(data)
+                if protocols._is_buffered_protocol(self._protocol):
+                    protocols._feed_data_to_buffered_proto(self._protocol,
+                                                           data)
+                else:
+                    self._protocol.data_received(data)
             elif data is not None:
                 if self._loop.get_debug():
                     logger.debug("%r received EOF", self)
@@ -1,7 +1,7 @@
 """Abstract Protocol class."""
 
 __all__ = ['BaseProtocol', 'Protocol', 'DatagramProtocol',
-           'SubprocessProtocol']
+           'SubprocessProtocol', 'BufferedProtocol']
 
 
 class BaseProtocol:
@@ -100,6 +100,60 @@ class Protocol(BaseProtocol):
         """
 
 
+class BufferedProtocol(BaseProtocol):
+    """Interface for stream protocol with manual buffer control.
+
+    Instead of receiving a new bytes object in data_received(), the
+    protocol provides the buffer that the transport reads into, which
+    avoids an allocation and a copy per chunk of received data.
+
+    The transport calls get_buffer() to obtain a writable buffer, reads
+    directly into it and then calls buffer_updated() exactly once with
+    the number of bytes written.  The buffer returned by get_buffer()
+    must not be used by the protocol until buffer_updated() is called.
+
+    A class may implement both Protocol and BufferedProtocol: transports
+    able to read into a buffer then use get_buffer() and
+    buffer_updated(), the others call data_received().
+
+    State machine of calls:
+
+      start -> CM [-> GB [-> BU?]]* [-> ER?] -> CL -> end
+
+    * CM: connection_made()
+    * GB: get_buffer()
+    * BU: buffer_updated()
+    * ER: eof_received()
+    * CL: connection_lost()
+    """
+
+    def get_buffer(self, sizehint):
+        """Called to allocate a new receive buffer.
+
+        sizehint is the maximum number of bytes the transport would
+        like to read; the returned buffer may be smaller or larger.
+        The returned object must implement the writable buffer protocol
+        and must not be empty.
+        """
+        raise NotImplementedError
+
+    def buffer_updated(self, nbytes):
+        """Called when the buffer was updated with the received data.
+
+        nbytes is the number of bytes written into the buffer.  It is 0
+        when the read failed or would have blocked; the transport still
+        calls buffer_updated() so the protocol can release the buffer.
+        """
+
+    def eof_received(self):
+        """Called when the other end calls write_eof() or equivalent.
+
+        If this returns a false value (including None), the transport
+        will close itself.  If it returns a true value, closing the
+        transport is up to the protocol.
+        """
+
+
 class DatagramProtocol(BaseProtocol):
     """Interface for datagram protocol."""
 
@@ -132,3 +186,37 @@ class SubprocessProtocol(BaseProtocol):
 
     def process_exited(self):
         """Called when subprocess has exited."""
+
+
+def _is_buffered_protocol(proto):
+    """Return True if proto only accepts data through get_buffer().
+
+    Transports that receive bytes objects pass them to data_received()
+    when the protocol implements both interfaces.
+    """
+    return (isinstance(proto, BufferedProtocol) and
+            not isinstance(proto, Protocol))
+
+
+def _feed_data_to_buffered_proto(proto, data):
+    """Copy data into the buffers of a BufferedProtocol.
+
+    Used by transports that receive data as bytes objects.
+    """
+    data_len = len(data)
+    data = memoryview(data)
+    while data_len:
+        buf = proto.get_buffer(data_len)
+        buf_len = len(buf)
+        if not buf_len:
+            raise RuntimeError('get_buffer() returned an empty buffer')
+
+        if buf_len >= data_len:
+            buf[:data_len] = data
+            proto.buffer_updated(data_len)
+            return
+        else:
+            buf[:buf_len] = data[:buf_len]
+            proto.buffer_updated(buf_len)
+            data = data[buf_len:]
+            data_len = len(data)
@@ -9,6 +9,8 @@ __all__ = ['BaseSelectorEventLoop']
 import collections
 import errno
 import functools
+import itertools
+import os
 import socket
 import warnings
 try:
@@ -21,6 +23,7 @@ from . import compat
 from . import constants
 from . import events
 from . import futures
+from . import protocols
 from . import selectors
 from . import transports
 from . import sslproto
@@ -28,6 +31,15 @@ from .coroutines import coroutine
 from .log import logger
 
 
+# Maximum number of buffers passed to a single socket.sendmsg() call.
+try:
+    _SC_IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _SC_IOV_MAX = -1
+if _SC_IOV_MAX <= 0:
+    _SC_IOV_MAX = 16    # The POSIX minimum (_XOPEN_IOV_MAX)
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -629,11 +641,22 @@ class _SelectorTransport(transports._FlowControlMixin,
 
 class _SelectorSocketTransport(_SelectorTransport):
 
+    # The write buffer is a deque of bytes objects and memoryviews over
+    # bytes objects; it is flushed with sendmsg() where available so that
+    # buffered data is not copied into a contiguous bytearray.
+    _buffer_factory = collections.deque
+
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
         super().__init__(loop, sock, protocol, extra, server)
         self._eof = False
         self._paused = False
+        self._buffer_size = 0
+        self._has_sendmsg = hasattr(sock, 'sendmsg')
+        if isinstance(protocol, protocols.BufferedProtocol):
+            self._read_ready_cb = self._read_ready__get_buffer
+        else:
+            self._read_ready_cb = self._read_ready__data_received
 
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
@@ -665,6 +688,34 @@ class _SelectorSocketTransport(_SelectorTransport):
             logger.debug("%r resumes reading", self)
 
     def _read_ready(self):
+        self._read_ready_cb()
+
+    def _read_ready__get_buffer(self):
+        if self._conn_lost:
+            return
+
+        try:
+            buf = self._protocol.get_buffer(self.max_size)
+            if not len(buf):
+                raise RuntimeError('get_buffer() returned an empty buffer')
+        except Exception as exc:
+            self._fatal_error(
+                exc, 'Fatal error: protocol.get_buffer() call failed.')
+            return
+
+        try:
+            nbytes = self._sock.recv_into(buf)
+        except (BlockingIOError, InterruptedError):
+            self._protocol.buffer_updated(0)
+        except Exception as exc:
+            self._protocol.buffer_updated(0)
+            self._fatal_error(exc, 'Fatal read error on socket transport')
+        else:
+            self._protocol.buffer_updated(nbytes)
+            if not nbytes:
+                self._read_ready__on_eof()
+
+    def _read_ready__data_received(self):
         if self._conn_lost:
             return
         try:
@@ -677,16 +728,19 @@ class _SelectorSocketTransport(_SelectorTransport):
             if data:
                 self._protocol.data_received(data)
             else:
-                if self._loop.get_debug():
-                    logger.debug("%r received EOF", self)
-                keep_open = self._protocol.eof_received()
-                if keep_open:
-                    # We're keeping the connection open so the
-                    # protocol can write more, but we still can't
-                    # receive more, so remove the reader callback.
-                    self._loop.remove_reader(self._sock_fd)
-                else:
-                    self.close()
+                self._read_ready__on_eof()
+
+    def _read_ready__on_eof(self):
+        if self._loop.get_debug():
+            logger.debug("%r received EOF", self)
+        keep_open = self._protocol.eof_received()
+        if keep_open:
+            # We're keeping the connection open so the
+            # protocol can write more, but we still can't
+            # receive more, so remove the reader callback.
+            self._loop.remove_reader(self._sock_fd)
+        else:
+            self.close()
 
     def write(self, data):
         if not isinstance(data, (bytes, bytearray, memoryview)):
@@ -713,32 +767,92 @@ class _SelectorSocketTransport(_SelectorTransport):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
+                data = memoryview(data).cast('B')[n:]
                 if not data:
                     return
             # Not all was written; register write handler.
             self._loop.add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
-        self._buffer.extend(data)
+        self._buffer_append(data)
         self._maybe_pause_protocol()
 
+    def writelines(self, list_of_data):
+        list_of_data = list(list_of_data)
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError('data argument must be a bytes-like object, '
+                                'not %r' % type(data).__name__)
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        was_empty = not self._buffer
+        for data in list_of_data:
+            if data:
+                self._buffer_append(data)
+        if was_empty and self._buffer:
+            # Optimization: try to send everything now, in one call.
+            self._write_ready()
+            if self._buffer:
+                self._loop.add_writer(self._sock_fd, self._write_ready)
+        self._maybe_pause_protocol()
+
+    def _buffer_append(self, data):
+        # Only immutable data is kept by reference: a bytearray may be
+        # modified by the caller once write() has returned.
+        if not isinstance(data, bytes):
+            if (isinstance(data, memoryview) and
+                    isinstance(data.obj, bytes) and data.c_contiguous):
+                data = data.cast('B')
+            else:
+                data = bytes(data)
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+
+    def _buffer_consume(self, n):
+        self._buffer_size -= n
+        buffer = self._buffer
+        while n:
+            data = buffer[0]
+            if len(data) <= n:
+                n -= len(data)
+                buffer.popleft()
+            else:
+                buffer[0] = memoryview(data)[n:]
+                break
+
     def _write_ready(self):
         assert self._buffer, 'Data should not be empty'
 
         if self._conn_lost:
             return
+        buffer = self._buffer
         try:
-            n = self._sock.send(self._buffer)
+            if len(buffer) == 1:
+                n = self._sock.send(buffer[0])
+            elif self._has_sendmsg:
+                n = self._sock.sendmsg(itertools.islice(buffer, _SC_IOV_MAX))
+            else:
+                data = b''.join(buffer)
+                buffer.clear()
+                buffer.append(data)
+                n = self._sock.send(data)
         except (BlockingIOError, InterruptedError):
             pass
         except Exception as exc:
             self._loop.remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
         else:
             if n:
-                del self._buffer[:n]
+                self._buffer_consume(n)
             self._maybe_resume_protocol()  # May append to buffer.
             if not self._buffer:
                 self._loop.remove_writer(self._sock_fd)
@@ -757,6 +871,13 @@ class _SelectorSocketTransport(_SelectorTransport):
     def can_write_eof(self):
         return True
 
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
+    def _force_close(self, exc):
+        self._buffer_size = 0
+        super()._force_close(exc)
+
 
 class _SelectorSslTransport(_SelectorTransport):
 
@@ -787,6 +908,7 @@ class _SelectorSslTransport(_SelectorTransport):
         self._waiter = waiter
         self._sslcontext = sslcontext
         self._paused = False
+        self._buffered_protocol = protocols._is_buffered_protocol(protocol)
 
         # SSL-specific extra info.  (peercert is set later)
         self._extra.update(sslcontext=sslcontext)
@@ -919,7 +1041,11 @@ class _SelectorSslTransport(_SelectorTransport):
             self._fatal_error(exc, 'Fatal read error on SSL transport')
         else:
             if data:
-                self._protocol.data_received(data)
+                if self._buffered_protocol:
+                    protocols._feed_data_to_buffered_proto(self._protocol,
+                                                           data)
+                else:
+                    self._protocol.data_received(data)
             else:
                 try:
                     if self._loop.get_debug():
@@ -429,6 +429,8 @@ class SSLProtocol(protocols.Protocol):
         self._waiter = waiter
         self._loop = loop
         self._app_protocol = app_protocol
+        self._app_protocol_is_buffered = protocols._is_buffered_protocol(
+            app_protocol)
         self._app_transport = _SSLProtocolTransport(self._loop,
                                                     self, self._app_protocol)
         # _SSLPipe instance (None until the connection is made)
@@ -504,7 +506,11 @@ class SSLProtocol(protocols.Protocol):
 
         for chunk in appdata:
             if chunk:
-                self._app_protocol.data_received(chunk)
+                if self._app_protocol_is_buffered:
+                    protocols._feed_data_to_buffered_proto(
+                        self._app_protocol, chunk)
+                else:
+                    self._app_protocol.data_received(chunk)
             else:
                 self._start_shutdown()
                 break
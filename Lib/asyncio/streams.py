@@ -21,6 +21,12 @@ from .log import logger
 
 _DEFAULT_LIMIT = 2 ** 16
 
+# Bounds of the read size used when a transport reads directly into the
+# StreamReader buffer; it grows while reads fill the space offered.
+_MIN_READ_SIZE = 4 * 1024
+_MAX_READ_SIZE = 256 * 1024
+_ZEROS = memoryview(bytes(_MAX_READ_SIZE))
+
 
 class IncompleteReadError(EOFError):
     """
@@ -211,7 +217,8 @@ class FlowControlMixin(protocols.Protocol):
         yield from waiter
 
 
-class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
+class StreamReaderProtocol(FlowControlMixin, protocols.Protocol,
+                           protocols.BufferedProtocol):
     """Helper class to adapt between Protocol and StreamReader.
 
     (This is a helper class instead of making StreamReader itself a
@@ -252,6 +259,12 @@ class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
     def data_received(self, data):
         self._stream_reader.feed_data(data)
 
+    def get_buffer(self, sizehint):
+        return self._stream_reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        self._stream_reader._buffer_updated(nbytes)
+
     def eof_received(self):
         self._stream_reader.feed_eof()
         if self._over_ssl:
@@ -353,6 +366,8 @@ class StreamReader:
         self._exception = None
         self._transport = None
         self._paused = False
+        self._read_size = _MIN_READ_SIZE
+        self._recv_view = None  # Buffer lent by _get_buffer()
 
     def __repr__(self):
         info = ['StreamReader']
@@ -417,7 +432,49 @@ class StreamReader:
 
         self._buffer.extend(data)
         self._wakeup_waiter()
+        self._maybe_pause_transport()
+
+    def _get_buffer(self, sizehint):
+        """Grow the buffer and return a writable view of the new space.
+
+        This lets a transport read directly into the buffer, so the data
+        is not copied again.  It must be followed by a call to
+        _buffer_updated(), which gives back the unused space.
+        """
+        assert not self._eof, '_get_buffer after feed_eof'
+        assert self._recv_view is None, '_get_buffer called twice'
+
+        size = self._read_size
+        if 0 < sizehint < size:
+            size = sizehint
+        start = len(self._buffer)
+        self._buffer.extend(_ZEROS[:size])
+        self._recv_view = memoryview(self._buffer)[start:]
+        return self._recv_view
+
+    def _buffer_updated(self, nbytes):
+        """Keep the first nbytes of the space lent by _get_buffer()."""
+        view = self._recv_view
+        self._recv_view = None
+        size = len(view)
+        # The buffer cannot be resized while the view exists.
+        view.release()
+        del self._buffer[len(self._buffer) - size + nbytes:]
+        if not nbytes:
+            return
+
+        if nbytes == size:
+            self._read_size = min(size * 2, _MAX_READ_SIZE)
+        elif nbytes < size // 4:
+            # Shrink at once: growing the buffer by a large window which
+            # is mostly given back is not free.
+            self._read_size = max(1 << (2 * nbytes).bit_length(),
+                                  _MIN_READ_SIZE)
+
+        self._wakeup_waiter()
+        self._maybe_pause_transport()
 
+    def _maybe_pause_transport(self):
         if (self._transport is not None and
                 not self._paused and
                 len(self._buffer) > 2 * self._limit):
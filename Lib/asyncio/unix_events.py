@@ -18,6 +18,7 @@ from . import constants
 from . import coroutines
 from . import events
 from . import futures
+from . import protocols
 from . import selector_events
 from . import selectors
 from . import transports
@@ -312,6 +313,7 @@ class _UnixReadPipeTransport(transports.ReadTransport):
             raise ValueError("Pipe transport is for pipes/sockets only.")
         _set_nonblocking(self._fileno)
         self._protocol = protocol
+        self._buffered_protocol = protocols._is_buffered_protocol(protocol)
         self._closing = False
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
@@ -353,7 +355,11 @@ class _UnixReadPipeTransport(transports.ReadTransport):
             self._fatal_error(exc, 'Fatal read error on pipe transport')
         else:
             if data:
-                self._protocol.data_received(data)
+                if self._buffered_protocol:
+                    protocols._feed_data_to_buffered_proto(self._protocol,
+                                                           data)
+                else:
+                    self._protocol.data_received(data)
             else:
                 if self._loop.get_debug():
                     logger.info("%r was closed by peer", self)
@@ -24,7 +24,7 @@ from functools import partial
 
 __all__ = ["compile_dir","compile_file","compile_path"]
 
-def _walk_dir(dir, ddir=None, maxlevels=10, quiet=0):
+def _walk_dir(dir, ddir=None, maxlevels=10, quiet=0, dirs=None):
     if not quiet:
         print('Listing {!r}...'.format(dir))
     try:
@@ -33,6 +33,9 @@ def _walk_dir(dir, ddir=None, maxlevels=10, quiet=0):
         if quiet < 2:
             print("Can't list {!r}".format(dir))
         names = []
+    else:
+        if dirs is not None:
+            dirs.append(dir)
     names.sort()
     for name in names:
         if name == '__pycache__':
@@ -47,10 +50,26 @@ def _walk_dir(dir, ddir=None, maxlevels=10, quiet=0):
         elif (maxlevels > 0 and name != os.curdir and name != os.pardir and
               os.path.isdir(fullname) and not os.path.islink(fullname)):
             yield from _walk_dir(fullname, ddir=dfile,
-                                 maxlevels=maxlevels - 1, quiet=quiet)
+                                 maxlevels=maxlevels - 1, quiet=quiet,
+                                 dirs=dirs)
+
+def _write_indexes(dirs, quiet=0):
+    success = True
+    for dir in dirs:
+        if not quiet:
+            print('Indexing {!r}...'.format(dir))
+        try:
+            importlib.util.write_path_index(dir)
+        except OSError as e:
+            success = False
+            if quiet < 2:
+                print("*** Can't index {!r}: {}".format(dir, e))
+    return success
 
 def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
-                quiet=0, legacy=False, optimize=-1, workers=1):
+                quiet=0, legacy=False, optimize=-1, workers=1,
+                invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP,
+                index=False):
     """Byte-compile all modules in the given directory tree.
 
     Arguments (only dir is required):
@@ -65,9 +84,13 @@ def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
     legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
     optimize:  optimization level or -1 for level of the interpreter
     workers:   maximum number of parallel workers
+    invalidation_mode: how the up-to-dateness of the pyc will be checked
+    index:     if True, write the import index of each directory once its
+               files are compiled
     """
+    dirs = [] if index else None
     files = _walk_dir(dir, quiet=quiet, maxlevels=maxlevels,
-                      ddir=ddir)
+                      ddir=ddir, dirs=dirs)
     success = True
     if workers is not None and workers != 1 and ProcessPoolExecutor is not None:
         if workers < 0:
@@ -79,18 +102,22 @@ def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
                                            ddir=ddir, force=force,
                                            rx=rx, quiet=quiet,
                                            legacy=legacy,
-                                           optimize=optimize),
+                                           optimize=optimize,
+                                           invalidation_mode=invalidation_mode),
                                    files)
             success = min(results, default=True)
     else:
         for file in files:
             if not compile_file(file, ddir, force, rx, quiet,
-                                legacy, optimize):
+                                legacy, optimize, invalidation_mode):
                 success = False
+    if index and not _write_indexes(dirs, quiet):
+        success = False
     return success
 
 def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
-                 legacy=False, optimize=-1):
+                 legacy=False, optimize=-1,
+                 invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP):
     """Byte-compile one file.
 
     Arguments (only fullname is required):
@@ -103,6 +130,7 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                no output with 2
     legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
     optimize:  optimization level or -1 for level of the interpreter
+    invalidation_mode: how the up-to-dateness of the pyc will be checked
     """
     success = True
     name = os.path.basename(fullname)
@@ -130,10 +158,10 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
             if not force:
                 try:
                     mtime = int(os.stat(fullname).st_mtime)
-                    expect = struct.pack('<4sl', importlib.util.MAGIC_NUMBER,
-                                         mtime)
+                    expect = struct.pack('<4sll', importlib.util.MAGIC_NUMBER,
+                                         0, mtime)
                     with open(cfile, 'rb') as chandle:
-                        actual = chandle.read(8)
+                        actual = chandle.read(12)
                     if expect == actual:
                         return success
                 except OSError:
@@ -142,7 +170,8 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                 print('Compiling {!r}...'.format(fullname))
             try:
                 ok = py_compile.compile(fullname, cfile, dfile, True,
-                                        optimize=optimize)
+                                        optimize=optimize,
+                                        invalidation_mode=invalidation_mode)
             except py_compile.PyCompileError as err:
                 success = False
                 if quiet >= 2:
@@ -171,7 +200,9 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
     return success
 
 def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
-                 legacy=False, optimize=-1):
+                 legacy=False, optimize=-1,
+                 invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP,
+                 index=False):
     """Byte-compile all module on sys.path.
 
     Arguments (all optional):
@@ -182,6 +213,8 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
     quiet: as for compile_dir() (default 0)
     legacy: as for compile_dir() (default False)
     optimize: as for compile_dir() (default -1)
+    invalidation_mode: as for compile_dir()
+    index: as for compile_dir() (default False)
     """
     success = True
     for dir in sys.path:
@@ -189,9 +222,17 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
             if quiet < 2:
                 print('Skipping current directory')
         else:
-            success = success and compile_dir(dir, maxlevels, None,
-                                              force, quiet=quiet,
-                                              legacy=legacy, optimize=optimize)
+            success = success and compile_dir(
+                dir,
+                maxlevels,
+                None,
+                force,
+                quiet=quiet,
+                legacy=legacy,
+                optimize=optimize,
+                invalidation_mode=invalidation_mode,
+                index=index,
+            )
     return success
 
 
@@ -234,6 +275,16 @@ def main():
                               'to the equivalent of -l sys.path'))
     parser.add_argument('-j', '--workers', default=1,
                         type=int, help='Run compileall concurrently')
+    invalidation_modes = [mode.name.lower().replace('_', '-')
+                          for mode in py_compile.PycInvalidationMode]
+    parser.add_argument('--invalidation-mode', default='timestamp',
+                        choices=sorted(invalidation_modes),
+                        help=('set .pyc invalidation mode; defaults to '
+                              '"timestamp"'))
+    parser.add_argument('--index', action='store_true',
+                        help=('also write an import index for each '
+                              'directory, to speed up imports from it '
+                              'until it is modified'))
 
     args = parser.parse_args()
     compile_dests = args.compile_dest
@@ -262,23 +313,31 @@ def main():
     if args.workers is not None:
         args.workers = args.workers or None
 
+    ivl_mode = args.invalidation_mode.replace('-', '_').upper()
+    invalidation_mode = py_compile.PycInvalidationMode[ivl_mode]
+
     success = True
     try:
         if compile_dests:
             for dest in compile_dests:
                 if os.path.isfile(dest):
                     if not compile_file(dest, args.ddir, args.force, args.rx,
-                                        args.quiet, args.legacy):
+                                        args.quiet, args.legacy,
+                                        invalidation_mode=invalidation_mode):
                         success = False
                 else:
                     if not compile_dir(dest, maxlevels, args.ddir,
                                        args.force, args.rx, args.quiet,
-                                       args.legacy, workers=args.workers):
+                                       args.legacy, workers=args.workers,
+                                       invalidation_mode=invalidation_mode,
+                                       index=args.index):
                         success = False
             return success
         else:
             return compile_path(legacy=args.legacy, force=args.force,
-                                quiet=args.quiet)
+                                quiet=args.quiet,
+                                invalidation_mode=invalidation_mode,
+                                index=args.index)
     except KeyboardInterrupt:
         if args.quiet < 2:
             print("\n[interrupted]")
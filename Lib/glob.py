@@ -30,15 +30,16 @@ def iglob(pathname, *, recursive=False):
     If recursive is true, the pattern '**' will match any files and
     zero or more directories and subdirectories.
     """
-    it = _iglob(pathname, recursive)
+    it = _iglob(pathname, recursive, False)
     if recursive and _isrecursive(pathname):
         s = next(it)  # skip empty string
         assert not s
     return it
 
-def _iglob(pathname, recursive):
+def _iglob(pathname, recursive, dironly):
     dirname, basename = os.path.split(pathname)
     if not has_magic(pathname):
+        assert not dironly
         if basename:
             if os.path.lexists(pathname):
                 yield pathname
@@ -49,47 +50,42 @@ def _iglob(pathname, recursive):
         return
     if not dirname:
         if recursive and _isrecursive(basename):
-            yield from glob2(dirname, basename)
+            yield from _glob2(dirname, basename, dironly)
         else:
-            yield from glob1(dirname, basename)
+            yield from _glob1(dirname, basename, dironly)
         return
     # `os.path.split()` returns the argument itself as a dirname if it is a
     # drive or UNC path.  Prevent an infinite recursion if a drive or UNC path
     # contains magic characters (i.e. r'\\?\C:').
     if dirname != pathname and has_magic(dirname):
-        dirs = _iglob(dirname, recursive)
+        dirs = _iglob(dirname, recursive, True)
     else:
         dirs = [dirname]
     if has_magic(basename):
         if recursive and _isrecursive(basename):
-            glob_in_dir = glob2
+            glob_in_dir = _glob2
         else:
-            glob_in_dir = glob1
+            glob_in_dir = _glob1
     else:
-        glob_in_dir = glob0
+        glob_in_dir = _glob0
     for dirname in dirs:
-        for name in glob_in_dir(dirname, basename):
+        for name in glob_in_dir(dirname, basename, dironly):
             yield os.path.join(dirname, name)
 
 # These 2 helper functions non-recursively glob inside a literal directory.
-# They return a list of basenames. `glob1` accepts a pattern while `glob0`
+# They return a list of basenames.  _glob1 accepts a pattern while _glob0
 # takes a literal basename (so it only has to check for its existence).
+# With dironly, only directories are returned; this is used for the
+# intermediate components of a pattern.
 
-def glob1(dirname, pattern):
-    if not dirname:
-        if isinstance(pattern, bytes):
-            dirname = bytes(os.curdir, 'ASCII')
-        else:
-            dirname = os.curdir
-    try:
-        names = os.listdir(dirname)
-    except OSError:
-        return []
+def _glob1(dirname, pattern, dironly):
+    names = [entry.name for entry in _iterdir(dirname)
+             if not dironly or _isdir(entry)]
     if not _ishidden(pattern):
         names = [x for x in names if not _ishidden(x)]
     return fnmatch.filter(names, pattern)
 
-def glob0(dirname, basename):
+def _glob0(dirname, basename, dironly):
     if not basename:
         # `os.path.split()` returns an empty basename for paths ending with a
         # directory separator.  'q*x/' should match only directories.
@@ -100,30 +96,60 @@ def glob0(dirname, basename):
             return [basename]
     return []
 
+# Following functions are not public but can be used by third-party code.
+
+def glob0(dirname, pattern):
+    return _glob0(dirname, pattern, False)
+
+def glob1(dirname, pattern):
+    return _glob1(dirname, pattern, False)
+
 # This helper function recursively yields relative pathnames inside a literal
 # directory.
 
-def glob2(dirname, pattern):
+def _glob2(dirname, pattern, dironly):
     assert _isrecursive(pattern)
     yield pattern[:0]
-    yield from _rlistdir(dirname)
+    yield from _rlistdir(dirname, dironly)
 
-# Recursively yields relative pathnames inside a literal directory.
-def _rlistdir(dirname):
+def glob2(dirname, pattern):
+    return _glob2(dirname, pattern, False)
+
+# Returns a list of the os.DirEntry objects of a literal directory, or an
+# empty list if it cannot be read.
+def _iterdir(dirname):
     if not dirname:
         if isinstance(dirname, bytes):
             dirname = bytes(os.curdir, 'ASCII')
         else:
             dirname = os.curdir
     try:
-        names = os.listdir(dirname)
-    except os.error:
-        return
-    for x in names:
-        if not _ishidden(x):
-            yield x
+        with os.scandir(dirname) as it:
+            return list(it)
+    except OSError:
+        return []
+
+# os.scandir() gets the file type from the directory itself on most
+# platforms, so this only needs a stat() call for symbolic links.
+def _isdir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+# Recursively yields relative pathnames inside a literal directory.
+def _rlistdir(dirname, dironly):
+    for entry in _iterdir(dirname):
+        x = entry.name
+        if _ishidden(x):
+            continue
+        is_dir = _isdir(entry)
+        if dironly and not is_dir:
+            continue
+        yield x
+        if is_dir:
             path = os.path.join(dirname, x) if dirname else x
-            for y in _rlistdir(path):
+            for y in _rlistdir(path, dironly):
                 yield os.path.join(x, y)
 
 
@@ -786,10 +786,46 @@ class FrozenImporter:
         """
         return '<module {!r} (frozen)>'.format(m.__name__)
 
+    # Directory of the standard library, for the modules frozen from it
+    _stdlib_dir = None
+
+    @classmethod
+    def _stdlib_path(cls, fullname):
+        """Return the path of the file in the standard library which the
+        frozen module was built from, or None."""
+        if (_bootstrap_external is None or
+                not _imp._is_frozen_startup(fullname)):
+            return None
+        path_join = _bootstrap_external._path_join
+        if cls._stdlib_dir is None:
+            # The landmark of the standard library, as for getpath.c.  The
+            # entry is kept as it is, like the path based finder does, and
+            # site.abs_paths() makes __file__ absolute later.
+            cls._stdlib_dir = ''
+            for entry in sys.path:
+                if (entry and isinstance(entry, str) and
+                        _bootstrap_external._path_isfile(
+                            path_join(entry, 'os.py'))):
+                    cls._stdlib_dir = entry
+                    break
+        if not cls._stdlib_dir:
+            return None
+        if _imp.is_frozen_package(fullname):
+            return path_join(cls._stdlib_dir, *fullname.split('.'),
+                             '__init__.py')
+        return path_join(cls._stdlib_dir, *fullname.split('.')) + '.py'
+
     @classmethod
     def find_spec(cls, fullname, path=None, target=None):
         if _imp.is_frozen(fullname):
-            return spec_from_loader(fullname, cls, origin='frozen')
+            spec = spec_from_loader(fullname, cls, origin='frozen')
+            # Modules frozen from the standard library keep the location
+            # of their file, so that __file__ and __cached__ are set.
+            filename = cls._stdlib_path(fullname)
+            if filename is not None:
+                spec.origin = filename
+                spec.has_location = True
+            return spec
         else:
             return None
 
@@ -813,6 +849,8 @@ class FrozenImporter:
             raise ImportError('{!r} is not a frozen module'.format(name),
                               name=name)
         code = _call_with_frames_removed(_imp.get_frozen_object, name)
+        if module.__spec__.has_location:
+            _imp._fix_co_filename(code, module.__spec__.origin)
         exec(code, module.__dict__)
 
     @classmethod
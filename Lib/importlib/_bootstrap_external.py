@@ -96,6 +96,14 @@ def _path_isdir(path):
     return _path_is_mode_type(path, 0o040000)
 
 
+def _path_isabs(path):
+    """Replacement for os.path.isabs."""
+    if path.startswith(tuple(path_separators)):
+        return True
+    return (len(path_separators) > 1 and
+            path[1:3] in [':' + sep for sep in path_separators])
+
+
 def _write_atomic(path, data, mode=0o666):
     """Best-effort function to write data to a path atomically.
     Be prepared to handle a FileExistsError if concurrent writing of the
@@ -226,6 +234,9 @@ _code_type = type(_write_atomic.__code__)
 #     Python 3.6a1  3371 (add BUILD_CONST_KEY_MAP opcode #27140)
 #     Python 3.6a1  3372 (MAKE_FUNCTION simplification, remove MAKE_CLOSURE
                           #27095)
+#     Python 3.6a2  3373 (add LOAD_METHOD and CALL_METHOD opcodes)
+#     Python 3.6a2  3374 (add a flags field to the pyc header for
+#                         hash-based invalidation)
 #
 # MAGIC must change whenever the bytecode emitted by the compiler may no
 # longer be understood by older implementations of the eval loop (usually
@@ -234,7 +245,7 @@ _code_type = type(_write_atomic.__code__)
 # Whenever MAGIC_NUMBER is changed, the ranges in the magic_values array
 # in PC/launcher.c must also be updated.
 
-MAGIC_NUMBER = (3372).to_bytes(2, 'little') + b'\r\n'
+MAGIC_NUMBER = (3374).to_bytes(2, 'little') + b'\r\n'
 _RAW_MAGIC_NUMBER = int.from_bytes(MAGIC_NUMBER, 'little')  # For import.c
 
 _PYCACHE = '__pycache__'
@@ -323,6 +334,65 @@ def source_from_cache(path):
     return _path_join(head, base_filename + SOURCE_SUFFIXES[0])
 
 
+def _index_path(directory):
+    """Return the path of the index of the directory, or None if
+    sys.implementation.cache_tag is None."""
+    tag = sys.implementation.cache_tag
+    if tag is None:
+        return None
+    return _path_join(directory, _PYCACHE, '__index__.{}.idx'.format(tag))
+
+
+def _read_path_index(directory, mtime):
+    """Return the listing of the directory stored in its index, or None if
+    there is no index or it doesn't match the directory mtime."""
+    path = _index_path(directory)
+    if path is None:
+        return None
+    try:
+        with _io.FileIO(path, 'r') as file:
+            data = file.read()
+    except OSError:
+        return None
+    if data[:4] != MAGIC_NUMBER:
+        return None
+    try:
+        index_mtime, contents = marshal.loads(data[4:])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if index_mtime != mtime or type(contents) is not tuple:
+        return None
+    _bootstrap._verbose_message('{} matches {}', path, directory)
+    return contents
+
+
+def write_path_index(directory):
+    """Write the index of a directory to its __pycache__ directory.
+
+    The index holds the directory listing and mtime.  As long as they match,
+    FileFinder uses the listing instead of listing the directory, and then
+    stops checking the directory mtime on every lookup, until
+    importlib.invalidate_caches() is called.  If
+    sys.implementation.cache_tag is None then NotImplementedError is raised.
+
+    """
+    path = _index_path(directory)
+    if path is None:
+        raise NotImplementedError('sys.implementation.cache_tag is None')
+    try:
+        _os.mkdir(_path_split(path)[0])
+    except FileExistsError:
+        pass
+    # The mtime is read first: if the directory changes while it is listed,
+    # the index is stale from the start, instead of silently incomplete.
+    mtime = _path_stat(directory).st_mtime
+    contents = tuple(sorted(_os.listdir(directory)))
+    data = bytearray(MAGIC_NUMBER)
+    data.extend(marshal.dumps((mtime, contents)))
+    _write_atomic(path, data)
+    return path
+
+
 def _get_sourcefile(bytecode_path):
     """Convert a bytecode file path to a source path (if possible).
 
@@ -411,63 +481,96 @@ def _find_module_shim(self, fullname):
     return loader
 
 
-def _validate_bytecode_header(data, source_stats=None, name=None, path=None):
-    """Validate the header of the passed-in bytecode against source_stats (if
-    given) and returning the bytecode that can be compiled by compile().
+def _classify_pyc(data, name, exc_details):
+    """Perform basic validity checking of a pyc header and return the flags
+    field, which determines how the pyc should be further validated against
+    the source.
+
+    *data* is the contents of the pyc file. (Only the first 16 bytes are
+    required, though.)
 
-    All other arguments are used to enhance error reporting.
+    *name* is the name of the module being imported. It is used for logging.
 
-    ImportError is raised when the magic number is incorrect or the bytecode is
-    found to be stale. EOFError is raised when the data is found to be
+    *exc_details* is a dictionary passed to ImportError if it raised for
+    improved debugging.
+
+    ImportError is raised when the magic number is incorrect or when the flags
+    field is invalid. EOFError is raised when the data is found to be
     truncated.
 
     """
-    exc_details = {}
-    if name is not None:
-        exc_details['name'] = name
-    else:
-        # To prevent having to make all messages have a conditional name.
-        name = '<bytecode>'
-    if path is not None:
-        exc_details['path'] = path
     magic = data[:4]
-    raw_timestamp = data[4:8]
-    raw_size = data[8:12]
     if magic != MAGIC_NUMBER:
         message = 'bad magic number in {!r}: {!r}'.format(name, magic)
         _bootstrap._verbose_message('{}', message)
         raise ImportError(message, **exc_details)
-    elif len(raw_timestamp) != 4:
-        message = 'reached EOF while reading timestamp in {!r}'.format(name)
+    if len(data) < 16:
+        message = 'reached EOF while reading pyc header of {!r}'.format(name)
         _bootstrap._verbose_message('{}', message)
         raise EOFError(message)
-    elif len(raw_size) != 4:
-        message = 'reached EOF while reading size of source in {!r}'.format(name)
+    flags = _r_long(data[4:8])
+    # Only the first two flags are defined.
+    if flags & ~0b11:
+        message = 'invalid flags {!r} in {!r}'.format(flags, name)
+        raise ImportError(message, **exc_details)
+    return flags
+
+
+def _validate_timestamp_pyc(data, source_mtime, source_size, name,
+                            exc_details):
+    """Validate a pyc against the source last-modified time.
+
+    *data* is the contents of the pyc file. (Only the first 16 bytes are
+    required.)
+
+    *source_mtime* is the last modified timestamp of the source file.
+
+    *source_size* is None or the size of the source file in bytes.
+
+    *name* is the name of the module being imported. It is used for logging.
+
+    *exc_details* is a dictionary passed to ImportError if it raised for
+    improved debugging.
+
+    An ImportError is raised if the bytecode is stale.
+
+    """
+    if _r_long(data[8:12]) != (source_mtime & 0xFFFFFFFF):
+        message = 'bytecode is stale for {!r}'.format(name)
         _bootstrap._verbose_message('{}', message)
-        raise EOFError(message)
-    if source_stats is not None:
-        try:
-            source_mtime = int(source_stats['mtime'])
-        except KeyError:
-            pass
-        else:
-            if _r_long(raw_timestamp) != source_mtime:
-                message = 'bytecode is stale for {!r}'.format(name)
-                _bootstrap._verbose_message('{}', message)
-                raise ImportError(message, **exc_details)
-        try:
-            source_size = source_stats['size'] & 0xFFFFFFFF
-        except KeyError:
-            pass
-        else:
-            if _r_long(raw_size) != source_size:
-                raise ImportError('bytecode is stale for {!r}'.format(name),
-                                  **exc_details)
-    return data[12:]
+        raise ImportError(message, **exc_details)
+    if (source_size is not None and
+        _r_long(data[12:16]) != (source_size & 0xFFFFFFFF)):
+        raise ImportError('bytecode is stale for {!r}'.format(name),
+                          **exc_details)
+
+
+def _validate_hash_pyc(data, source_hash, name, exc_details):
+    """Validate a hash-based pyc by checking the real source hash against the
+    one in the pyc header.
+
+    *data* is the contents of the pyc file. (Only the first 16 bytes are
+    required.)
+
+    *source_hash* is the importlib.util.source_hash() of the source file.
+
+    *name* is the name of the module being imported. It is used for logging.
+
+    *exc_details* is a dictionary passed to ImportError if it raised for
+    improved debugging.
+
+    An ImportError is raised if the bytecode is stale.
+
+    """
+    if data[8:16] != source_hash:
+        raise ImportError(
+            'hash in bytecode doesn\'t match hash of source {!r}'.format(name),
+            **exc_details,
+        )
 
 
 def _compile_bytecode(data, name=None, bytecode_path=None, source_path=None):
-    """Compile bytecode as returned by _validate_bytecode_header()."""
+    """Compile bytecode, as found after the 16-byte header of a pyc file."""
     code = marshal.loads(data)
     if isinstance(code, _code_type):
         _bootstrap._verbose_message('code object from {!r}', bytecode_path)
@@ -478,16 +581,27 @@ def _compile_bytecode(data, name=None, bytecode_path=None, source_path=None):
         raise ImportError('Non-code object in {!r}'.format(bytecode_path),
                           name=name, path=bytecode_path)
 
-def _code_to_bytecode(code, mtime=0, source_size=0):
-    """Compile a code object into bytecode for writing out to a byte-compiled
-    file."""
+def _code_to_timestamp_pyc(code, mtime=0, source_size=0):
+    "Produce the data for a timestamp-based pyc."
     data = bytearray(MAGIC_NUMBER)
+    data.extend(_w_long(0))
     data.extend(_w_long(mtime))
     data.extend(_w_long(source_size))
     data.extend(marshal.dumps(code))
     return data
 
 
+def _code_to_hash_pyc(code, source_hash, checked=True):
+    "Produce the data for a hash-based pyc."
+    data = bytearray(MAGIC_NUMBER)
+    flags = 0b1 | checked << 1
+    data.extend(_w_long(flags))
+    assert len(source_hash) == 8
+    data.extend(source_hash)
+    data.extend(marshal.dumps(code))
+    return data
+
+
 def decode_source(source_bytes):
     """Decode bytes representing source code and return the string.
 
@@ -725,47 +839,89 @@ class SourceLoader(_LoaderBasics):
     def get_code(self, fullname):
         """Concrete implementation of InspectLoader.get_code.
 
-        Reading of bytecode requires path_stats to be implemented. To write
-        bytecode, set_data must also be implemented.
+        Reading of bytecode requires path_stats to be implemented, except
+        for unchecked hash-based pycs which are used without looking at the
+        source at all. To write bytecode, set_data must also be implemented.
 
         """
         source_path = self.get_filename(fullname)
         source_mtime = None
+        source_bytes = None
+        source_hash = None
+        hash_based = False
+        check_source = True
         try:
             bytecode_path = cache_from_source(source_path)
         except NotImplementedError:
             bytecode_path = None
         else:
             try:
-                st = self.path_stats(source_path)
-            except IOError:
+                data = self.get_data(bytecode_path)
+            except OSError:
                 pass
             else:
-                source_mtime = int(st['mtime'])
+                exc_details = {
+                    'name': fullname,
+                    'path': bytecode_path,
+                }
                 try:
-                    data = self.get_data(bytecode_path)
+                    flags = _classify_pyc(data, fullname, exc_details)
+                    hash_based = flags & 0b1 != 0
+                    if hash_based:
+                        check_source = flags & 0b10 != 0
+                        if (_imp.check_hash_based_pycs != 'never' and
+                            (check_source or
+                             _imp.check_hash_based_pycs == 'always')):
+                            source_bytes = self.get_data(source_path)
+                            source_hash = _imp.source_hash(
+                                _RAW_MAGIC_NUMBER,
+                                source_bytes,
+                            )
+                            _validate_hash_pyc(data, source_hash, fullname,
+                                               exc_details)
+                    else:
+                        st = self.path_stats(source_path)
+                        source_mtime = int(st['mtime'])
+                        _validate_timestamp_pyc(
+                            data,
+                            source_mtime,
+                            st['size'],
+                            fullname,
+                            exc_details,
+                        )
+                except (ImportError, EOFError, OSError):
+                    pass
+                else:
+                    _bootstrap._verbose_message('{} matches {}', bytecode_path,
+                                                source_path)
+                    return _compile_bytecode(memoryview(data)[16:],
+                                             name=fullname,
+                                             bytecode_path=bytecode_path,
+                                             source_path=source_path)
+            if not hash_based and source_mtime is None:
+                # Take the timestamp before reading the source so a
+                # concurrent edit can't be recorded as up to date.
+                try:
+                    st = self.path_stats(source_path)
                 except OSError:
                     pass
                 else:
-                    try:
-                        bytes_data = _validate_bytecode_header(data,
-                                source_stats=st, name=fullname,
-                                path=bytecode_path)
-                    except (ImportError, EOFError):
-                        pass
-                    else:
-                        _bootstrap._verbose_message('{} matches {}', bytecode_path,
-                                                    source_path)
-                        return _compile_bytecode(bytes_data, name=fullname,
-                                                 bytecode_path=bytecode_path,
-                                                 source_path=source_path)
-        source_bytes = self.get_data(source_path)
+                    source_mtime = int(st['mtime'])
+        if source_bytes is None:
+            source_bytes = self.get_data(source_path)
         code_object = self.source_to_code(source_bytes, source_path)
         _bootstrap._verbose_message('code object from {}', source_path)
         if (not sys.dont_write_bytecode and bytecode_path is not None and
-                source_mtime is not None):
-            data = _code_to_bytecode(code_object, source_mtime,
-                    len(source_bytes))
+                (hash_based or source_mtime is not None)):
+            if hash_based:
+                if source_hash is None:
+                    source_hash = _imp.source_hash(_RAW_MAGIC_NUMBER,
+                                                   source_bytes)
+                data = _code_to_hash_pyc(code_object, source_hash,
+                                         check_source)
+            else:
+                data = _code_to_timestamp_pyc(code_object, source_mtime,
+                                              len(source_bytes))
             try:
                 self._cache_bytecode(source_path, bytecode_path, data)
                 _bootstrap._verbose_message('wrote {!r}', bytecode_path)
@@ -867,8 +1023,18 @@ class SourcelessFileLoader(FileLoader, _LoaderBasics):
     def get_code(self, fullname):
         path = self.get_filename(fullname)
         data = self.get_data(path)
-        bytes_data = _validate_bytecode_header(data, name=fullname, path=path)
-        return _compile_bytecode(bytes_data, name=fullname, bytecode_path=path)
+        # Call _classify_pyc to do basic validation of the pyc but ignore the
+        # result. There's no source to check against.
+        exc_details = {
+            'name': fullname,
+            'path': path,
+        }
+        _classify_pyc(data, fullname, exc_details)
+        return _compile_bytecode(
+            memoryview(data)[16:],
+            name=fullname,
+            bytecode_path=path,
+        )
 
     def get_source(self, fullname):
         """Return None as there is no source code."""
@@ -1188,10 +1354,14 @@ class FileFinder:
         self._path_mtime = -1
         self._path_cache = set()
         self._relaxed_path_cache = set()
+        # Whether the cache was filled from a persistent index, and so is
+        # only checked again after invalidate_caches()
+        self._path_indexed = False
 
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
         self._path_mtime = -1
+        self._path_indexed = False
 
     find_module = _find_module_shim
 
@@ -1219,13 +1389,14 @@ class FileFinder:
         """
         is_namespace = False
         tail_module = fullname.rpartition('.')[2]
-        try:
-            mtime = _path_stat(self.path or _os.getcwd()).st_mtime
-        except OSError:
-            mtime = -1
-        if mtime != self._path_mtime:
-            self._fill_cache()
-            self._path_mtime = mtime
+        if not self._path_indexed:
+            try:
+                mtime = _path_stat(self.path or _os.getcwd()).st_mtime
+            except OSError:
+                mtime = -1
+            if mtime != self._path_mtime:
+                self._fill_cache(mtime)
+                self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
             cache = self._relaxed_path_cache
@@ -1260,15 +1431,21 @@ class FileFinder:
             return spec
         return None
 
-    def _fill_cache(self):
+    def _fill_cache(self, mtime=-1):
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+        contents = None
+        # A relative path may not be the directory that was indexed anymore.
+        if mtime != -1 and _path_isabs(path):
+            contents = _read_path_index(path, mtime)
+        self._path_indexed = contents is not None
+        if contents is None:
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                # Directory has either been removed, turned into a file, or
+                # made unreadable.
+                contents = []
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1,15 +1,21 @@
 """Utility code for constructing importers, etc."""
 from . import abc
+from ._bootstrap import BuiltinImporter
+from ._bootstrap import FrozenImporter
 from ._bootstrap import module_from_spec
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
+from ._bootstrap_external import ExtensionFileLoader
 from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import _RAW_MAGIC_NUMBER
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
 from ._bootstrap_external import source_from_cache
 from ._bootstrap_external import spec_from_file_location
+from ._bootstrap_external import write_path_index
 
+import _imp
 from contextlib import contextmanager
 import functools
 import sys
@@ -32,6 +38,20 @@ def resolve_name(name, package):
     return _resolve_name(name[level:], package, level)
 
 
+def source_hash(source_bytes):
+    "Return the hash of *source_bytes* as used in hash-based pyc files."
+    return _imp.source_hash(_RAW_MAGIC_NUMBER, source_bytes)
+
+
+def import_times():
+    """Return the (name, self_us, cumulative_us, depth) import times.
+
+    Times are only recorded when the interpreter runs with -X importtime or
+    PYTHONPROFILEIMPORTTIME set; otherwise the returned list is empty.
+    """
+    return _imp.get_import_times()
+
+
 def _find_spec_from_path(name, path=None):
     """Return the spec for the specified module.
 
@@ -286,3 +306,88 @@ class LazyLoader(abc.Loader):
         loader_state['__class__'] = module.__class__
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class LazyFinder(abc.MetaPathFinder):
+
+    """A meta path finder which makes the modules found by sys.meta_path lazy.
+
+    While installed, the modules it applies to are imported with a
+    LazyLoader: binding them is immediate, and executing them waits until an
+    attribute is accessed.  *packages* limits it to these packages (and
+    modules) with their submodules, and the modules in *exclude*, with their
+    submodules, are always imported eagerly.  It can be installed for the
+    whole interpreter with install(), or used as a context manager.
+    """
+
+    def __init__(self, packages=None, exclude=()):
+        self.packages = None if packages is None else frozenset(packages)
+        self.exclude = frozenset(exclude)
+
+    @staticmethod
+    def _matches(fullname, names):
+        if fullname in names:
+            return True
+        parts = fullname.split('.')
+        for i in range(1, len(parts)):
+            if '.'.join(parts[:i]) in names:
+                return True
+        return False
+
+    def is_lazy(self, fullname):
+        """Return True if the module named fullname is to be imported lazily."""
+        if self.packages is not None and not self._matches(fullname,
+                                                           self.packages):
+            return False
+        return not self._matches(fullname, self.exclude)
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the module spec with the other finders on sys.meta_path, and
+        make its loader lazy."""
+        if fullname == '__main__' or not self.is_lazy(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                # Let the import system fall back to find_module()
+                return None
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            # The modules of the built-in, frozen and extension loaders are
+            # executed when they are created, deferring them would not save
+            # anything.
+            if (loader is None or isinstance(loader, LazyLoader) or
+                    not hasattr(loader, 'exec_module') or
+                    loader in (BuiltinImporter, FrozenImporter) or
+                    isinstance(loader, ExtensionFileLoader)):
+                return spec
+            spec.loader = LazyLoader(loader)
+            return spec
+        return None
+
+    def install(self):
+        """Insert the finder at the front of sys.meta_path."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Remove the finder from sys.meta_path.
+
+        The modules already imported lazily stay lazy.
+        """
+        try:
+            sys.meta_path.remove(self)
+        except ValueError:
+            pass
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *args):
+        self.uninstall()
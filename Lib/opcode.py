@@ -214,4 +214,7 @@ def_op('BUILD_SET_UNPACK', 153)
 def_op('FORMAT_VALUE', 155)
 def_op('BUILD_CONST_KEY_MAP', 156)
 
+name_op('LOAD_METHOD', 160)     # Index in name list
+def_op('CALL_METHOD', 161)      # Number of positional arguments
+
 del def_op, name_op, jrel_op, jabs_op
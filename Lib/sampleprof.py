@@ -0,0 +1,301 @@
+#! /usr/bin/env python3
+
+"""Statistical profiler sampling the Python stacks of running threads.
+   Compatible with the 'profile' module.
+"""
+
+__all__ = ["run", "runctx", "Profile"]
+
+import sys
+import time
+import signal
+import threading
+import profile as _pyprofile
+
+# ____________________________________________________________
+# Simple interface
+
+def run(statement, filename=None, sort=-1):
+    return _pyprofile._Utils(Profile).run(statement, filename, sort)
+
+def runctx(statement, globals, locals, filename=None, sort=-1):
+    return _pyprofile._Utils(Profile).runctx(statement, globals, locals,
+                                             filename, sort)
+
+run.__doc__ = _pyprofile.run.__doc__
+runctx.__doc__ = _pyprofile.runctx.__doc__
+
+# ____________________________________________________________
+
+class Profile:
+    """Profile(interval=0.01, clock='wall', all_threads=True)
+
+    Builds a profiler object which samples the stacks of the running
+    threads every interval seconds, instead of tracing every call.  With
+    the 'wall' clock, a background thread takes the samples in real time,
+    so that waiting threads are sampled as well; if all_threads is false,
+    only the thread which enabled the profiler is sampled.  With the 'cpu'
+    clock, a SIGPROF handler samples the main thread as the process
+    consumes CPU time (this requires setitimer() and enabling the profiler
+    from the main thread).
+    """
+
+    def __init__(self, interval=0.01, clock='wall', all_threads=True):
+        if not interval > 0:
+            raise ValueError("interval must be greater than 0")
+        if clock not in ('wall', 'cpu'):
+            raise ValueError("clock must be 'wall' or 'cpu', not %r"
+                             % (clock,))
+        if clock == 'cpu' and not hasattr(signal, 'setitimer'):
+            raise ValueError("the 'cpu' clock requires signal.setitimer()")
+        self.interval = interval
+        self.clock = clock
+        self.all_threads = all_threads
+        self.enabled = False
+        self._thread = None
+        self._stop_event = None
+        self._old_handler = None
+        self._target = None
+        self._last_cpu_time = None
+        self.clear()
+
+    def clear(self):
+        """Forget the samples taken so far."""
+        # Maps tuples of function labels, outermost call first, to a
+        # [number of samples, seconds] list.  The samplers only add to it
+        # while holding the GIL, so it is read without a lock.
+        self._stacks = {}
+        self.samples = 0
+
+    def enable(self):
+        """Start sampling."""
+        if self.enabled:
+            return
+        self._target = threading.get_ident()
+        if self.clock == 'wall':
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._sample_loop,
+                                            name='sampleprof',
+                                            daemon=True)
+            self._thread.start()
+        else:
+            self._last_cpu_time = time.process_time()
+            self._old_handler = signal.signal(signal.SIGPROF,
+                                              self._sample_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval,
+                             self.interval)
+        self.enabled = True
+
+    def disable(self):
+        """Stop sampling."""
+        if not self.enabled:
+            return
+        if self.clock == 'wall':
+            self._stop_event.set()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+        else:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._old_handler)
+            self._old_handler = None
+        self.enabled = False
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def _sample_loop(self):
+        stop_event = self._stop_event
+        ident = threading.get_ident()
+        last = time.perf_counter()
+        while not stop_event.wait(self.interval):
+            now = time.perf_counter()
+            frames = sys._current_frames()
+            del frames[ident]
+            self._add_samples(frames, now - last)
+            last = now
+
+    def _sample_signal(self, signum, frame):
+        # The timer signals may be coalesced: weigh the sample with the CPU
+        # time actually consumed.  The handler runs in the main thread: the
+        # interrupted frame is the one to sample.
+        now = time.process_time()
+        self._add_samples({self._target: frame}, now - self._last_cpu_time)
+        self._last_cpu_time = now
+
+    def _add_samples(self, frames, seconds):
+        stacks = self._stacks
+        for ident, frame in frames.items():
+            if not self.all_threads and ident != self._target:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(label(code))
+                frame = frame.f_back
+            if not stack:
+                continue
+            stack.reverse()
+            stack = tuple(stack)
+            entry = stacks.get(stack)
+            if entry is None:
+                stacks[stack] = [1, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+            self.samples += 1
+
+    def print_stats(self, sort=-1):
+        import pstats
+        pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
+
+    def dump_stats(self, file):
+        import marshal
+        with open(file, 'wb') as f:
+            self.create_stats()
+            marshal.dump(self.stats, f)
+
+    def dump_collapsed(self, file):
+        """Write the sampled stacks to file in the "collapsed" format of
+        flame graph tools: one line per distinct stack, with the functions
+        from the outermost one separated by semicolons, then a space and
+        the number of samples."""
+        lines = []
+        for stack, (count, seconds) in list(self._stacks.items()):
+            names = ['%s (%s:%d)' % (name, filename, lineno)
+                     for filename, lineno, name in stack]
+            lines.append('%s %d\n' % (';'.join(names).replace('\n', ' '),
+                                      count))
+        lines.sort()
+        with open(file, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+    def create_stats(self):
+        self.disable()
+        self.snapshot_stats()
+
+    def snapshot_stats(self):
+        # A function's samples are the ones it is on the stack for, and its
+        # time is the time of these samples (cumtime) or of the ones it is
+        # running itself for (tottime).  A recursive function counts once
+        # per sample.
+        samples = {}
+        self.stats = {}
+        for stack, (count, seconds) in list(self._stacks.items()):
+            leaf = stack[-1]
+            for func in set(stack):
+                entry = samples.get(func)
+                if entry is None:
+                    entry = samples[func] = [0, 0.0, 0.0, {}]
+                entry[0] += count
+                entry[2] += seconds
+            samples[leaf][1] += seconds
+            for caller, func in set(zip(stack, stack[1:])):
+                callers = samples[func][3]
+                edge = callers.get(caller)
+                if edge is None:
+                    edge = callers[caller] = [0, 0.0, 0.0]
+                edge[0] += count
+                edge[2] += seconds
+            if len(stack) > 1:
+                samples[leaf][3][stack[-2]][1] += seconds
+        for func, (count, tt, ct, callers) in samples.items():
+            callers = {caller: (nc, nc, ctt, cct)
+                       for caller, (nc, ctt, cct) in callers.items()}
+            self.stats[func] = count, count, tt, ct, callers
+
+    # The following two methods can be called by clients to use
+    # a profiler to profile a statement, given as a string.
+
+    def run(self, cmd):
+        import __main__
+        dict = __main__.__dict__
+        return self.runctx(cmd, dict, dict)
+
+    def runctx(self, cmd, globals, locals):
+        self.enable()
+        try:
+            exec(cmd, globals, locals)
+        finally:
+            self.disable()
+        return self
+
+    # This method is more useful to profile a single function call.
+    def runcall(self, func, *args, **kw):
+        self.enable()
+        try:
+            return func(*args, **kw)
+        finally:
+            self.disable()
+
+# ____________________________________________________________
+
+def label(code):
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+# ____________________________________________________________
+
+def main():
+    import os
+    from optparse import OptionParser
+    usage = ("sampleprof.py [-o output_file_path] [-s sort] "
+             "[-f collapsed_file_path] [-i interval] [-c clock] "
+             "scriptfile [arg] ...")
+    parser = OptionParser(usage=usage)
+    parser.allow_interspersed_args = False
+    parser.add_option('-o', '--outfile', dest="outfile",
+        help="Save stats to <outfile>", default=None)
+    parser.add_option('-s', '--sort', dest="sort",
+        help="Sort order when printing to stdout, based on pstats.Stats class",
+        default=-1)
+    parser.add_option('-f', '--collapsed', dest="collapsed",
+        help="Save the stacks to <collapsed> for flame graph tools",
+        default=None)
+    parser.add_option('-i', '--interval', dest="interval", type="float",
+        help="Sampling interval in seconds (default: %default)",
+        default=0.01)
+    parser.add_option('-c', '--clock', dest="clock", choices=['wall', 'cpu'],
+        help="Sample in real time ('wall', the default) or CPU time ('cpu')",
+        default='wall')
+
+    if not sys.argv[1:]:
+        parser.print_usage()
+        sys.exit(2)
+
+    (options, args) = parser.parse_args()
+    sys.argv[:] = args
+
+    if len(args) > 0:
+        progname = args[0]
+        sys.path.insert(0, os.path.dirname(progname))
+        with open(progname, 'rb') as fp:
+            code = compile(fp.read(), progname, 'exec')
+        globs = {
+            '__file__': progname,
+            '__name__': '__main__',
+            '__package__': None,
+            '__cached__': None,
+        }
+        prof = Profile(options.interval, options.clock)
+        try:
+            prof.runctx(code, globs, None)
+        except SystemExit:
+            pass
+        finally:
+            if options.collapsed is not None:
+                prof.dump_collapsed(options.collapsed)
+            if options.outfile is not None:
+                prof.dump_stats(options.outfile)
+            elif options.collapsed is None:
+                prof.print_stats(options.sort)
+    else:
+        parser.print_usage()
+    return parser
+
+# When invoked as main program, invoke the profiler on a script
+if __name__ == '__main__':
+    main()
@@ -67,7 +67,91 @@ class RegistryError(Exception):
     and unpacking registeries fails"""
 
 
-def copyfileobj(fsrc, fdst, length=16*1024):
+COPY_BUFSIZE = 64 * 1024
+
+# Linux-only zero-copy primitives used by copyfile().  The flags are reset
+# when the running kernel turns out not to support them.
+_USE_CP_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_USE_CP_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+class _GiveupOnFastCopy(Exception):
+    """Raised as a signal to fall back on using read()/write() when a fast
+    copy function cannot copy the file."""
+
+
+def _fastcopy(fsrc, fdst, copy_func):
+    """Copy all the data of the regular file fsrc to fdst with
+    copy_func(infd, outfd, offset, count), which works inside the kernel.
+
+    _GiveupOnFastCopy is raised, with nothing written, if copy_func does not
+    support these files; errors after some data was copied are re-raised.
+    """
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    # Hopefully the whole file will be copied in a single call; the copy
+    # function is called in a loop until it reports EOF, so a block size
+    # that does not match the file size (or a file that changes while
+    # being copied) makes no difference.
+    try:
+        blocksize = max(os.fstat(infd).st_size, 2 ** 23)  # min 8 MiB
+    except OSError:
+        blocksize = 2 ** 27  # 128 MiB
+    # On 32-bit architectures truncate to 1 GiB to avoid OverflowError.
+    if sys.maxsize < 2 ** 32:
+        blocksize = min(blocksize, 2 ** 30)
+
+    offset = 0
+    while True:
+        try:
+            copied = copy_func(infd, outfd, offset, blocksize)
+        except OSError as err:
+            # ...in order to have a more informative exception.
+            err.filename = fsrc.name
+            err.filename2 = fdst.name
+            if err.errno == errno.ENOSPC:  # filesystem is full
+                raise err from None
+            # Give up if no data was copied yet.
+            if offset == 0 and os.lseek(outfd, 0, os.SEEK_CUR) == 0:
+                raise _GiveupOnFastCopy(err)
+            raise err
+        if copied == 0:
+            if offset == 0:
+                # Some special files (e.g. in /proc) report a size of zero
+                # but still have contents: let the regular loop copy them.
+                raise _GiveupOnFastCopy()
+            break  # EOF
+        offset += copied
+
+
+def _copy_file_range(infd, outfd, offset, count):
+    global _USE_CP_COPY_FILE_RANGE
+    try:
+        # Read from an explicit offset like sendfile() does: the position
+        # of infd is left alone and outfd is written at its position.
+        return os.copy_file_range(infd, outfd, count, offset)
+    except OSError as err:
+        if err.errno == errno.ENOSYS:
+            # The kernel does not implement copy_file_range() (< 4.5).
+            _USE_CP_COPY_FILE_RANGE = False
+        raise
+
+def _sendfile(infd, outfd, offset, count):
+    global _USE_CP_SENDFILE
+    try:
+        return os.sendfile(outfd, infd, offset, count)
+    except OSError as err:
+        if err.errno == errno.ENOTSOCK:
+            # sendfile() on this platform (probably Linux < 2.6.33) does not
+            # support copies between regular files (only sockets).
+            _USE_CP_SENDFILE = False
+        raise
+
+def copyfileobj(fsrc, fdst, length=COPY_BUFSIZE):
     """copy data from file-like object fsrc to file-like object fdst"""
     while 1:
         buf = fsrc.read(length)
@@ -113,6 +197,21 @@ def copyfile(src, dst, *, follow_symlinks=True):
     else:
         with open(src, 'rb') as fsrc:
             with open(dst, 'wb') as fdst:
+                # Note: copyfileobj() itself does not use the fast copy
+                # functions, since they do not work with arbitrary file
+                # objects (buffered or decoded data, append mode, ...).
+                if _USE_CP_COPY_FILE_RANGE:
+                    try:
+                        _fastcopy(fsrc, fdst, _copy_file_range)
+                        return dst
+                    except _GiveupOnFastCopy:
+                        pass
+                if _USE_CP_SENDFILE:
+                    try:
+                        _fastcopy(fsrc, fdst, _sendfile)
+                        return dst
+                    except _GiveupOnFastCopy:
+                        pass
                 copyfileobj(fsrc, fdst)
     return dst
 
@@ -264,8 +363,115 @@ def ignore_patterns(*patterns):
         return set(ignored_names)
     return _ignore_patterns
 
+def _copysymlink(linkto, srcname, dstname):
+    os.symlink(linkto, dstname)
+    copystat(srcname, dstname, follow_symlinks=False)
+
+def _copytree(src, dst, symlinks, ignore, copy_function,
+              ignore_dangling_symlinks, executor, results):
+    """Copy the tree at src to dst; see copytree().
+
+    Without an executor, the errors are appended to *results*.  Otherwise
+    the files are copied by the executor, and *results* gets one
+    (future, srcname, dstname) triple per submitted copy, a (None, src, dst)
+    triple for each directory whose metadata is to be copied once everything
+    before it is done, and a (None, None, errors) triple for errors raised
+    in the calling thread.  _copytree_wait() resolves them in order.
+    """
+    def report(errors):
+        if executor is not None:
+            results.append((None, None, errors))
+        else:
+            results.extend(errors)
+
+    with os.scandir(src) as scandir_it:
+        entries = list(scandir_it)
+    if ignore is not None:
+        ignored_names = ignore(src, [entry.name for entry in entries])
+    else:
+        ignored_names = set()
+
+    os.makedirs(dst)
+    for entry in entries:
+        if entry.name in ignored_names:
+            continue
+        srcname = os.path.join(src, entry.name)
+        dstname = os.path.join(dst, entry.name)
+        try:
+            if entry.is_symlink():
+                linkto = os.readlink(srcname)
+                if symlinks:
+                    # We can't just leave it to `copy_function` because legacy
+                    # code with a custom `copy_function` may rely on copytree
+                    # doing the right thing.
+                    func, args = _copysymlink, (linkto, srcname, dstname)
+                else:
+                    # ignore dangling symlink if the flag is on
+                    if not os.path.exists(linkto) and ignore_dangling_symlinks:
+                        continue
+                    # otherwise let the copy occurs. copy2 will raise an error
+                    if entry.is_dir():
+                        _copytree(srcname, dstname, symlinks, ignore,
+                                  copy_function, False, executor, results)
+                        continue
+                    func, args = copy_function, (srcname, dstname)
+            elif entry.is_dir():
+                _copytree(srcname, dstname, symlinks, ignore, copy_function,
+                          False, executor, results)
+                continue
+            else:
+                # Will raise a SpecialFileError for unsupported file types
+                func, args = copy_function, (srcname, dstname)
+            if executor is not None:
+                results.append((executor.submit(func, *args),
+                                srcname, dstname))
+            else:
+                func(*args)
+        # catch the Error from a custom copy_function so that we can
+        # continue with other files
+        except Error as err:
+            report(err.args[0])
+        except OSError as why:
+            report([(srcname, dstname, str(why))])
+    if executor is not None:
+        results.append((None, src, dst))
+    else:
+        _copytree_copystat(src, dst, results)
+
+def _copytree_copystat(src, dst, errors):
+    try:
+        copystat(src, dst)
+    except OSError as why:
+        # Copying file access times may fail on Windows
+        if getattr(why, 'winerror', None) is None:
+            errors.append((src, dst, str(why)))
+
+def _copytree_wait(results):
+    """Wait for the work recorded by a parallel _copytree() and return the
+    errors in the order a serial copy would have reported them."""
+    errors = []
+    for i, (future, srcname, dstname) in enumerate(results):
+        if future is None:
+            if srcname is None:
+                errors.extend(dstname)
+            else:
+                _copytree_copystat(srcname, dstname, errors)
+            continue
+        try:
+            future.result()
+        except Error as err:
+            errors.extend(err.args[0])
+        except OSError as why:
+            errors.append((srcname, dstname, str(why)))
+        except BaseException:
+            for future, _, _ in results[i + 1:]:
+                if future is not None:
+                    future.cancel()
+            raise
+    return errors
+
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
-             ignore_dangling_symlinks=False):
+             ignore_dangling_symlinks=False, *, workers=None):
     """Recursively copy a directory tree.
 
     The destination directory must not already exist.
@@ -299,62 +505,62 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     destination path as arguments. By default, copy2() is used, but any
     function that supports the same signature (like copy()) can be used.
 
+    If the optional workers argument is greater than 1, the files are
+    copied by a pool of that many threads, which can be faster on storage
+    serving several requests at once, such as network file systems and SSDs.
+    The directories are still walked by the calling thread, and errors are
+    reported as they would be for a serial copy.
+
     """
-    names = os.listdir(src)
-    if ignore is not None:
-        ignored_names = ignore(src, names)
+    if workers is None:
+        workers = 1
+    elif workers < 1:
+        raise ValueError("workers must be greater than 0")
+    if workers == 1:
+        errors = []
+        _copytree(src, dst, symlinks, ignore, copy_function,
+                  ignore_dangling_symlinks, None, errors)
     else:
-        ignored_names = set()
-
-    os.makedirs(dst)
-    errors = []
-    for name in names:
-        if name in ignored_names:
-            continue
-        srcname = os.path.join(src, name)
-        dstname = os.path.join(dst, name)
-        try:
-            if os.path.islink(srcname):
-                linkto = os.readlink(srcname)
-                if symlinks:
-                    # We can't just leave it to `copy_function` because legacy
-                    # code with a custom `copy_function` may rely on copytree
-                    # doing the right thing.
-                    os.symlink(linkto, dstname)
-                    copystat(srcname, dstname, follow_symlinks=not symlinks)
-                else:
-                    # ignore dangling symlink if the flag is on
-                    if not os.path.exists(linkto) and ignore_dangling_symlinks:
-                        continue
-                    # otherwise let the copy occurs. copy2 will raise an error
-                    if os.path.isdir(srcname):
-                        copytree(srcname, dstname, symlinks, ignore,
-                                 copy_function)
-                    else:
-                        copy_function(srcname, dstname)
-            elif os.path.isdir(srcname):
-                copytree(srcname, dstname, symlinks, ignore, copy_function)
-            else:
-                # Will raise a SpecialFileError for unsupported file types
-                copy_function(srcname, dstname)
-        # catch the Error from the recursive copytree so that we can
-        # continue with other files
-        except Error as err:
-            errors.extend(err.args[0])
-        except OSError as why:
-            errors.append((srcname, dstname, str(why)))
-    try:
-        copystat(src, dst)
-    except OSError as why:
-        # Copying file access times may fail on Windows
-        if getattr(why, 'winerror', None) is None:
-            errors.append((src, dst, str(why)))
+        from concurrent.futures import ThreadPoolExecutor
+        results = []
+        with ThreadPoolExecutor(workers) as executor:
+            try:
+                _copytree(src, dst, symlinks, ignore, copy_function,
+                          ignore_dangling_symlinks, executor, results)
+            finally:
+                # Don't leave copies running behind an exception
+                errors = _copytree_wait(results)
     if errors:
         raise Error(errors)
     return dst
 
+def _rmtree_unlink(name, fullname, dir_fd, onerror, executor, pending):
+    if executor is not None:
+        pending.append((executor.submit(os.unlink, name, dir_fd=dir_fd),
+                        fullname))
+        return
+    try:
+        os.unlink(name, dir_fd=dir_fd)
+    except OSError:
+        onerror(os.unlink, fullname, sys.exc_info())
+
+def _rmtree_wait(pending, onerror):
+    # Wait for all the unlinks submitted for a directory before reporting
+    # their errors, in order, and before the directory itself is removed.
+    for future, fullname in pending:
+        future.exception()
+    if onerror is None:
+        return
+    for future, fullname in pending:
+        exc = future.exception()
+        if exc is not None:
+            try:
+                raise exc
+            except OSError:
+                onerror(os.unlink, fullname, sys.exc_info())
+
 # version vulnerable to race conditions
-def _rmtree_unsafe(path, onerror):
+def _rmtree_unsafe(path, onerror, executor=None):
     try:
         if os.path.islink(path):
             # symlinks to directories are forbidden, see bug #1669
@@ -363,80 +569,95 @@ def _rmtree_unsafe(path, onerror):
         onerror(os.path.islink, path, sys.exc_info())
         # can't continue even if onerror hook returns
         return
-    names = []
+    entries = []
     try:
-        names = os.listdir(path)
+        with os.scandir(path) as scandir_it:
+            entries = list(scandir_it)
     except OSError:
         onerror(os.listdir, path, sys.exc_info())
-    for name in names:
-        fullname = os.path.join(path, name)
-        try:
-            mode = os.lstat(fullname).st_mode
-        except OSError:
-            mode = 0
-        if stat.S_ISDIR(mode):
-            _rmtree_unsafe(fullname, onerror)
-        else:
+    pending = []
+    try:
+        for entry in entries:
+            fullname = entry.path
             try:
-                os.unlink(fullname)
+                is_dir = entry.is_dir(follow_symlinks=False)
             except OSError:
-                onerror(os.unlink, fullname, sys.exc_info())
+                is_dir = False
+            if is_dir:
+                _rmtree_unsafe(fullname, onerror, executor)
+            else:
+                _rmtree_unlink(fullname, fullname, None, onerror, executor,
+                               pending)
+    except BaseException:
+        _rmtree_wait(pending, None)
+        raise
+    _rmtree_wait(pending, onerror)
     try:
         os.rmdir(path)
     except OSError:
         onerror(os.rmdir, path, sys.exc_info())
 
 # Version using fd-based APIs to protect against races
-def _rmtree_safe_fd(topfd, path, onerror):
-    names = []
+def _rmtree_safe_fd(topfd, path, onerror, executor=None):
+    entries = []
     try:
-        names = os.listdir(topfd)
+        with os.scandir(topfd) as scandir_it:
+            entries = list(scandir_it)
     except OSError as err:
         err.filename = path
         onerror(os.listdir, path, sys.exc_info())
-    for name in names:
-        fullname = os.path.join(path, name)
-        try:
-            orig_st = os.stat(name, dir_fd=topfd, follow_symlinks=False)
-            mode = orig_st.st_mode
-        except OSError:
-            mode = 0
-        if stat.S_ISDIR(mode):
+    pending = []
+    try:
+        for entry in entries:
+            fullname = os.path.join(path, entry.name)
             try:
-                dirfd = os.open(name, os.O_RDONLY, dir_fd=topfd)
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    orig_st = entry.stat(follow_symlinks=False)
+                    is_dir = stat.S_ISDIR(orig_st.st_mode)
             except OSError:
-                onerror(os.open, fullname, sys.exc_info())
-            else:
+                is_dir = False
+            if is_dir:
                 try:
-                    if os.path.samestat(orig_st, os.fstat(dirfd)):
-                        _rmtree_safe_fd(dirfd, fullname, onerror)
-                        try:
-                            os.rmdir(name, dir_fd=topfd)
-                        except OSError:
-                            onerror(os.rmdir, fullname, sys.exc_info())
-                    else:
-                        try:
-                            # This can only happen if someone replaces
-                            # a directory with a symlink after the call to
-                            # stat.S_ISDIR above.
-                            raise OSError("Cannot call rmtree on a symbolic "
-                                          "link")
-                        except OSError:
-                            onerror(os.path.islink, fullname, sys.exc_info())
-                finally:
-                    os.close(dirfd)
-        else:
-            try:
-                os.unlink(name, dir_fd=topfd)
-            except OSError:
-                onerror(os.unlink, fullname, sys.exc_info())
+                    dirfd = os.open(entry.name, os.O_RDONLY, dir_fd=topfd)
+                except OSError:
+                    onerror(os.open, fullname, sys.exc_info())
+                else:
+                    try:
+                        if os.path.samestat(orig_st, os.fstat(dirfd)):
+                            _rmtree_safe_fd(dirfd, fullname, onerror,
+                                            executor)
+                            try:
+                                os.rmdir(entry.name, dir_fd=topfd)
+                            except OSError:
+                                onerror(os.rmdir, fullname, sys.exc_info())
+                        else:
+                            try:
+                                # This can only happen if someone replaces
+                                # a directory with a symlink after the call to
+                                # stat.S_ISDIR above.
+                                raise OSError("Cannot call rmtree on a "
+                                              "symbolic link")
+                            except OSError:
+                                onerror(os.path.islink, fullname,
+                                        sys.exc_info())
+                    finally:
+                        os.close(dirfd)
+            else:
+                _rmtree_unlink(entry.name, fullname, topfd, onerror, executor,
+                               pending)
+    except BaseException:
+        # topfd must stay open until the unlinks relative to it are done
+        _rmtree_wait(pending, None)
+        raise
+    _rmtree_wait(pending, onerror)
 
 _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                      os.supports_dir_fd and
                      os.listdir in os.supports_fd and
                      os.stat in os.supports_follow_symlinks)
 
-def rmtree(path, ignore_errors=False, onerror=None):
+def rmtree(path, ignore_errors=False, onerror=None, *, workers=None):
     """Recursively delete a directory tree.
 
     If ignore_errors is set, errors are ignored; otherwise, if onerror
@@ -446,6 +667,11 @@ def rmtree(path, ignore_errors=False, onerror=None):
     exc_info is a tuple returned by sys.exc_info().  If ignore_errors
     is false and onerror is None, an exception is raised.
 
+    If the optional workers argument is greater than 1, the files are
+    removed by a pool of that many threads.  onerror is still called from
+    the calling thread; the errors for the files of a directory are
+    reported in order, once all of them have been tried.
+
     """
     if ignore_errors:
         def onerror(*args):
@@ -453,6 +679,18 @@ def rmtree(path, ignore_errors=False, onerror=None):
     elif onerror is None:
         def onerror(*args):
             raise
+    if workers is None:
+        workers = 1
+    elif workers < 1:
+        raise ValueError("workers must be greater than 0")
+    if workers == 1:
+        _rmtree(path, onerror, None)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            _rmtree(path, onerror, executor)
+
+def _rmtree(path, onerror, executor):
     if _use_fd_functions:
         # While the unsafe rmtree works fine on bytes, the fd based does not.
         if isinstance(path, bytes):
@@ -471,7 +709,7 @@ def rmtree(path, ignore_errors=False, onerror=None):
             return
         try:
             if os.path.samestat(orig_st, os.fstat(fd)):
-                _rmtree_safe_fd(fd, path, onerror)
+                _rmtree_safe_fd(fd, path, onerror, executor)
                 try:
                     os.rmdir(path)
                 except OSError:
@@ -485,7 +723,7 @@ def rmtree(path, ignore_errors=False, onerror=None):
         finally:
             os.close(fd)
     else:
-        return _rmtree_unsafe(path, onerror)
+        return _rmtree_unsafe(path, onerror, executor)
 
 # Allow introspection of whether or not the hardening against symlink
 # attacks is supported on the current platform
@@ -18,6 +18,7 @@ import random
 import logging
 import struct
 import operator
+import pickle
 import test.support
 import test.support.script_helper
 
@@ -51,6 +52,12 @@ try:
 except ImportError:
     HAS_SHAREDCTYPES = False
 
+try:
+    from multiprocessing import shared_memory
+    HAS_SHMEM = True
+except ImportError:
+    HAS_SHMEM = False
+
 try:
     import msvcrt
 except ImportError:
@@ -2901,6 +2908,188 @@ class _TestSharedCTypes(BaseTestCase):
         self.assertEqual(bar.x, 2)
         self.assertAlmostEqual(bar.y, 5.0)
 
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemory(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @staticmethod
+    def _attach_existing_shmem_then_write(shmem_name_or_obj, binary_data):
+        if isinstance(shmem_name_or_obj, str):
+            local_sms = shared_memory.SharedMemory(shmem_name_or_obj)
+        else:
+            local_sms = shmem_name_or_obj
+        local_sms.buf[:len(binary_data)] = binary_data
+        local_sms.close()
+
+    def test_shared_memory_basics(self):
+        sms = shared_memory.SharedMemory('test01_tsmb', create=True, size=512)
+
+        # Verify attributes are readable.
+        self.assertEqual(sms.name, 'test01_tsmb')
+        self.assertGreaterEqual(sms.size, 512)
+        self.assertGreaterEqual(len(sms.buf), sms.size)
+        self.assertIn('test01_tsmb', repr(sms))
+
+        # Modify contents of shared memory segment through memoryview.
+        sms.buf[0] = 42
+        self.assertEqual(sms.buf[0], 42)
+
+        # Attach to existing shared memory segment.
+        also_sms = shared_memory.SharedMemory('test01_tsmb')
+        self.assertEqual(also_sms.buf[0], 42)
+        also_sms.close()
+
+        # Attach to existing shared memory segment but specify a new size.
+        same_sms = shared_memory.SharedMemory('test01_tsmb', size=20*sms.size)
+        self.assertLess(same_sms.size, 20*sms.size)  # Size was ignored.
+        same_sms.close()
+
+        # Creating a shared memory segment with a name in use fails.
+        with self.assertRaises(FileExistsError):
+            shared_memory.SharedMemory('test01_tsmb', create=True, size=512)
+
+        # A random name is chosen when none is given.
+        name_tsmb = shared_memory.SharedMemory(create=True, size=1)
+        self.addCleanup(name_tsmb.unlink)
+        self.addCleanup(name_tsmb.close)
+        self.assertNotEqual(name_tsmb.name, sms.name)
+
+        sms.close()
+        self.assertIsNone(sms.buf)
+
+        # Test that the shared memory was unlinked.
+        sms.unlink()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory('test01_tsmb')
+
+    def test_shared_memory_errors(self):
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=-2)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=0)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=False)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory('test01_notthere')
+
+    def test_shared_memory_across_processes(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        # Verify remote attachment to existing block by name is working.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms.name, b'howdy')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'howdy')
+
+        # Verify pickling of SharedMemory instance also works.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms, b'HELLO')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'HELLO')
+
+    def test_shared_memory_ShareableList_basics(self):
+        sl = shared_memory.ShareableList(
+            ['howdy', b'HoWdY', -273.154, 100, None, True, 42]
+        )
+        self.addCleanup(sl.shm.unlink)
+        self.addCleanup(sl.shm.close)
+
+        # Verify attributes are readable.
+        self.assertEqual(sl.format, '8s8sdqxxxxxx?xxxxxxxx?q')
+
+        # Exercise len().
+        self.assertEqual(len(sl), 7)
+
+        # Exercise index().
+        with self.assertRaises(ValueError):
+            sl.index('100')
+        self.assertEqual(sl.index(100), 3)
+
+        # Exercise retrieving individual values.
+        self.assertEqual(sl[0], 'howdy')
+        self.assertEqual(sl[-2], True)
+
+        # Exercise iterability.
+        self.assertEqual(
+            tuple(sl),
+            ('howdy', b'HoWdY', -273.154, 100, None, True, 42)
+        )
+
+        # Exercise modifying individual values.
+        sl[3] = 42
+        self.assertEqual(sl[3], 42)
+        sl[4] = 'some'  # Change type at a given position.
+        self.assertEqual(sl[4], 'some')
+        self.assertEqual(sl.format, '8s8sdq8sxxxxxxx?q')
+        with self.assertRaisesRegex(ValueError, 'exceeds available storage'):
+            sl[4] = 'far too many'
+        self.assertEqual(sl[4], 'some')
+        sl[0] = 'encodés'  # Exactly 8 bytes of UTF-8 data
+        self.assertEqual(sl[0], 'encodés')
+        self.assertEqual(sl[1], b'HoWdY')  # no spillage
+        with self.assertRaisesRegex(ValueError, 'exceeds available storage'):
+            sl[0] = 'encodées'  # Exactly 9 bytes of UTF-8 data
+        self.assertEqual(sl[1], b'HoWdY')
+        with self.assertRaises(IndexError):
+            sl[7]
+        with self.assertRaises(IndexError):
+            sl[7] = 2
+
+        # Exercise count().
+        self.assertEqual(sl.count(42), 2)
+        self.assertEqual(sl.count(b'HoWdY'), 1)
+        self.assertEqual(sl.count(b'adios'), 0)
+
+        # Non-ASCII text is sized by its encoded length.
+        sl_text = shared_memory.ShareableList(['é' * 8])
+        self.addCleanup(sl_text.shm.unlink)
+        self.addCleanup(sl_text.shm.close)
+        self.assertEqual(sl_text[0], 'é' * 8)
+
+        # Attach to an existing ShareableList by name.
+        sl_tethered = shared_memory.ShareableList(name=sl.shm.name)
+        self.addCleanup(sl_tethered.shm.close)
+        self.assertEqual(sl.shm.name, sl_tethered.shm.name)
+        sl_tethered[-1] = 880
+        self.assertEqual(sl[-1], 880)
+
+        # An empty ShareableList is allowed.
+        empty_sl = shared_memory.ShareableList()
+        self.addCleanup(empty_sl.shm.unlink)
+        self.addCleanup(empty_sl.shm.close)
+        self.assertEqual(len(empty_sl), 0)
+        self.assertEqual(empty_sl.format, '')
+        with self.assertRaises(ValueError):
+            empty_sl.index(None)
+
+    def test_shared_memory_ShareableList_pickling(self):
+        sl = shared_memory.ShareableList(range(1000))
+        self.addCleanup(sl.shm.unlink)
+        self.addCleanup(sl.shm.close)
+
+        serialized_sl = pickle.dumps(sl)
+        deserialized_sl = pickle.loads(serialized_sl)
+        self.addCleanup(deserialized_sl.shm.close)
+        self.assertEqual(deserialized_sl.shm.name, sl.shm.name)
+        self.assertEqual(list(deserialized_sl), list(range(1000)))
+
+        sl[0] = 'changed'
+        self.assertEqual(deserialized_sl[0], 'changed')
+        # Only the name of the shared memory block is pickled.
+        self.assertLess(len(serialized_sl), 200)
+
 #
 #
 #
@@ -2990,6 +3179,10 @@ class _TestImportStar(unittest.TestCase):
             # This module requires _ctypes
             modules.remove('multiprocessing.sharedctypes')
 
+        if not HAS_SHMEM:
+            # This module requires _posixshmem
+            modules.remove('multiprocessing.shared_memory')
+
         for name in modules:
             __import__(name)
             mod = sys.modules[name]
@@ -548,6 +548,55 @@ class BaseEventLoopTests(test_utils.TestCase):
         # Ensure only uncancelled events remain scheduled
         self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
 
+    def test__run_once_stats(self):
+        self.loop._process_events = mock.Mock()
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['iterations'], 0)
+        self.assertEqual(stats['callbacks'], 0)
+
+        def cb():
+            pass
+
+        self.loop.call_soon(cb)
+        self.loop.call_soon(cb).cancel()
+        self.loop.call_at(self.loop.time() - 1, cb)
+        self.loop.call_later(3600, cb)
+        self.loop._run_once()
+
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['iterations'], 1)
+        self.assertEqual(stats['timers'], 1)
+        self.assertEqual(stats['callbacks'], 2)
+        self.assertEqual(stats['last_timers'], 1)
+        self.assertEqual(stats['last_callbacks'], 2)
+        self.assertGreaterEqual(stats['select_time'], 0)
+
+        self.loop.call_soon(cb)
+        self.loop._run_once()
+
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['iterations'], 2)
+        self.assertEqual(stats['timers'], 1)
+        self.assertEqual(stats['callbacks'], 3)
+        self.assertEqual(stats['last_timers'], 0)
+        self.assertEqual(stats['last_callbacks'], 1)
+        self.assertEqual(len(self.loop._scheduled), 1)
+
+    def test__run_once_timer_due_after_process_events(self):
+        # Timers which come due while I/O events are processed run in
+        # the same iteration
+        now = self.loop.time()
+        self.loop.time = mock.Mock(return_value=now)
+
+        def process_events(event_list):
+            self.loop.time.return_value = now + 1.0
+
+        self.loop._process_events = process_events
+        calls = []
+        self.loop.call_at(now + 0.5, calls.append, 'timer')
+        self.loop._run_once()
+        self.assertEqual(calls, ['timer'])
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
             self.loop.run_until_complete, 'blah')
@@ -1017,6 +1066,15 @@ class BaseEventLoopWithSelectorTests(test_utils.TestCase):
         self.loop = asyncio.new_event_loop()
         self.set_event_loop(self.loop)
 
+    def test_stats_select_time(self):
+        # The time spent in select() is measured outside debug mode too
+        self.loop.set_debug(False)
+        self.loop.run_until_complete(asyncio.sleep(0.01, loop=self.loop))
+        stats = self.loop.get_stats()
+        self.assertGreater(stats['select_time'], 0)
+        self.assertGreaterEqual(stats['select_time'],
+                                stats['last_select_time'])
+
     @patch_socket
     def test_create_connection_multiple_errors(self, m_socket):
 
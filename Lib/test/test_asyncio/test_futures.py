@@ -8,6 +8,7 @@ import unittest
 from unittest import mock
 
 import asyncio
+from asyncio import futures
 from asyncio import test_utils
 try:
     from test import support
@@ -25,14 +26,17 @@ def last_cb():
     pass
 
 
-class FutureTests(test_utils.TestCase):
+class BaseFutureTests:
+
+    def _new_future(self, *args, **kwargs):
+        return self.cls(*args, **kwargs)
 
     def setUp(self):
         self.loop = self.new_test_loop()
         self.addCleanup(self.loop.close)
 
     def test_initial_state(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
         self.assertFalse(f.cancelled())
         self.assertFalse(f.done())
         f.cancel()
@@ -40,15 +44,15 @@ class FutureTests(test_utils.TestCase):
 
     def test_init_constructor_default_loop(self):
         asyncio.set_event_loop(self.loop)
-        f = asyncio.Future()
+        f = self._new_future()
         self.assertIs(f._loop, self.loop)
 
     def test_constructor_positional(self):
         # Make sure Future doesn't accept a positional argument
-        self.assertRaises(TypeError, asyncio.Future, 42)
+        self.assertRaises(TypeError, self._new_future, 42)
 
     def test_cancel(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
         self.assertTrue(f.cancel())
         self.assertTrue(f.cancelled())
         self.assertTrue(f.done())
@@ -59,7 +63,7 @@ class FutureTests(test_utils.TestCase):
         self.assertFalse(f.cancel())
 
     def test_result(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
         self.assertRaises(asyncio.InvalidStateError, f.result)
 
         f.set_result(42)
@@ -73,7 +77,7 @@ class FutureTests(test_utils.TestCase):
 
     def test_exception(self):
         exc = RuntimeError()
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
         self.assertRaises(asyncio.InvalidStateError, f.exception)
 
         # StopIteration cannot be raised into a Future - CPython issue26221
@@ -90,12 +94,12 @@ class FutureTests(test_utils.TestCase):
         self.assertFalse(f.cancel())
 
     def test_exception_class(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
         f.set_exception(RuntimeError)
         self.assertIsInstance(f.exception(), RuntimeError)
 
     def test_yield_from_twice(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
 
         def fixture():
             yield 'A'
@@ -114,7 +118,7 @@ class FutureTests(test_utils.TestCase):
 
     def test_future_repr(self):
         self.loop.set_debug(True)
-        f_pending_debug = asyncio.Future(loop=self.loop)
+        f_pending_debug = self._new_future(loop=self.loop)
         frame = f_pending_debug._source_traceback[-1]
         self.assertEqual(repr(f_pending_debug),
                          '<Future pending created at %s:%s>'
@@ -122,21 +126,21 @@ class FutureTests(test_utils.TestCase):
         f_pending_debug.cancel()
 
         self.loop.set_debug(False)
-        f_pending = asyncio.Future(loop=self.loop)
+        f_pending = self._new_future(loop=self.loop)
         self.assertEqual(repr(f_pending), '<Future pending>')
         f_pending.cancel()
 
-        f_cancelled = asyncio.Future(loop=self.loop)
+        f_cancelled = self._new_future(loop=self.loop)
         f_cancelled.cancel()
         self.assertEqual(repr(f_cancelled), '<Future cancelled>')
 
-        f_result = asyncio.Future(loop=self.loop)
+        f_result = self._new_future(loop=self.loop)
         f_result.set_result(4)
         self.assertEqual(repr(f_result), '<Future finished result=4>')
         self.assertEqual(f_result.result(), 4)
 
         exc = RuntimeError()
-        f_exception = asyncio.Future(loop=self.loop)
+        f_exception = self._new_future(loop=self.loop)
         f_exception.set_exception(exc)
         self.assertEqual(repr(f_exception),
                          '<Future finished exception=RuntimeError()>')
@@ -147,7 +151,7 @@ class FutureTests(test_utils.TestCase):
             text = '%s() at %s:%s' % (func.__qualname__, filename, lineno)
             return re.escape(text)
 
-        f_one_callbacks = asyncio.Future(loop=self.loop)
+        f_one_callbacks = self._new_future(loop=self.loop)
         f_one_callbacks.add_done_callback(_fakefunc)
         fake_repr = func_repr(_fakefunc)
         self.assertRegex(repr(f_one_callbacks),
@@ -156,7 +160,7 @@ class FutureTests(test_utils.TestCase):
         self.assertEqual(repr(f_one_callbacks),
                          '<Future cancelled>')
 
-        f_two_callbacks = asyncio.Future(loop=self.loop)
+        f_two_callbacks = self._new_future(loop=self.loop)
         f_two_callbacks.add_done_callback(first_cb)
         f_two_callbacks.add_done_callback(last_cb)
         first_repr = func_repr(first_cb)
@@ -165,7 +169,7 @@ class FutureTests(test_utils.TestCase):
                          r'<Future pending cb=\[%s, %s\]>'
                          % (first_repr, last_repr))
 
-        f_many_callbacks = asyncio.Future(loop=self.loop)
+        f_many_callbacks = self._new_future(loop=self.loop)
         f_many_callbacks.add_done_callback(first_cb)
         for i in range(8):
             f_many_callbacks.add_done_callback(_fakefunc)
@@ -180,31 +184,31 @@ class FutureTests(test_utils.TestCase):
     def test_copy_state(self):
         from asyncio.futures import _copy_future_state
 
-        f = asyncio.Future(loop=self.loop)
+        f = self._new_future(loop=self.loop)
         f.set_result(10)
 
-        newf = asyncio.Future(loop=self.loop)
+        newf = self._new_future(loop=self.loop)
         _copy_future_state(f, newf)
         self.assertTrue(newf.done())
         self.assertEqual(newf.result(), 10)
 
-        f_exception = asyncio.Future(loop=self.loop)
+        f_exception = self._new_future(loop=self.loop)
         f_exception.set_exception(RuntimeError())
 
-        newf_exception = asyncio.Future(loop=self.loop)
+        newf_exception = self._new_future(loop=self.loop)
         _copy_future_state(f_exception, newf_exception)
         self.assertTrue(newf_exception.done())
         self.assertRaises(RuntimeError, newf_exception.result)
 
-        f_cancelled = asyncio.Future(loop=self.loop)
+        f_cancelled = self._new_future(loop=self.loop)
         f_cancelled.cancel()
 
-        newf_cancelled = asyncio.Future(loop=self.loop)
+        newf_cancelled = self._new_future(loop=self.loop)
         _copy_future_state(f_cancelled, newf_cancelled)
         self.assertTrue(newf_cancelled.cancelled())
 
     def test_iter(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
 
         def coro():
             yield from fut
@@ -217,20 +221,20 @@ class FutureTests(test_utils.TestCase):
 
     @mock.patch('asyncio.base_events.logger')
     def test_tb_logger_abandoned(self, m_log):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         del fut
         self.assertFalse(m_log.error.called)
 
     @mock.patch('asyncio.base_events.logger')
     def test_tb_logger_result_unretrieved(self, m_log):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         fut.set_result(42)
         del fut
         self.assertFalse(m_log.error.called)
 
     @mock.patch('asyncio.base_events.logger')
     def test_tb_logger_result_retrieved(self, m_log):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         fut.set_result(42)
         fut.result()
         del fut
@@ -238,7 +242,7 @@ class FutureTests(test_utils.TestCase):
 
     @mock.patch('asyncio.base_events.logger')
     def test_tb_logger_exception_unretrieved(self, m_log):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         fut.set_exception(RuntimeError('boom'))
         del fut
         test_utils.run_briefly(self.loop)
@@ -247,7 +251,7 @@ class FutureTests(test_utils.TestCase):
 
     @mock.patch('asyncio.base_events.logger')
     def test_tb_logger_exception_retrieved(self, m_log):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         fut.set_exception(RuntimeError('boom'))
         fut.exception()
         del fut
@@ -255,7 +259,7 @@ class FutureTests(test_utils.TestCase):
 
     @mock.patch('asyncio.base_events.logger')
     def test_tb_logger_exception_result_retrieved(self, m_log):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         fut.set_exception(RuntimeError('boom'))
         self.assertRaises(RuntimeError, fut.result)
         del fut
@@ -274,7 +278,7 @@ class FutureTests(test_utils.TestCase):
         self.assertNotEqual(ident, threading.get_ident())
 
     def test_wrap_future_future(self):
-        f1 = asyncio.Future(loop=self.loop)
+        f1 = self._new_future(loop=self.loop)
         f2 = asyncio.wrap_future(f1)
         self.assertIs(f1, f2)
 
@@ -309,7 +313,7 @@ class FutureTests(test_utils.TestCase):
     def test_future_source_traceback(self):
         self.loop.set_debug(True)
 
-        future = asyncio.Future(loop=self.loop)
+        future = self.cls(loop=self.loop)
         lineno = sys._getframe().f_lineno - 1
         self.assertIsInstance(future._source_traceback, list)
         self.assertEqual(future._source_traceback[-1][:3],
@@ -328,7 +332,7 @@ class FutureTests(test_utils.TestCase):
                 return exc
         exc = memory_error()
 
-        future = asyncio.Future(loop=self.loop)
+        future = self.cls(loop=self.loop)
         if debug:
             source_traceback = future._source_traceback
         future.set_exception(exc)
@@ -348,7 +352,7 @@ class FutureTests(test_utils.TestCase):
                          r'.*\n'
                          r'  File "{filename}", line {lineno}, '
                             r'in check_future_exception_never_retrieved\n'
-                         r'    future = asyncio\.Future\(loop=self\.loop\)$'
+                         r'    future = self\.cls\(loop=self\.loop\)$'
                          ).format(filename=re.escape(frame[0]),
                                   lineno=frame[1])
             else:
@@ -367,7 +371,7 @@ class FutureTests(test_utils.TestCase):
                          r'.*\n'
                          r'  File "{filename}", line {lineno}, '
                             r'in check_future_exception_never_retrieved\n'
-                         r'    future = asyncio\.Future\(loop=self\.loop\)\n'
+                         r'    future = self\.cls\(loop=self\.loop\)\n'
                          r'Traceback \(most recent call last\):\n'
                          r'.*\n'
                          r'MemoryError$'
@@ -390,14 +394,23 @@ class FutureTests(test_utils.TestCase):
         self.check_future_exception_never_retrieved(True)
 
     def test_set_result_unless_cancelled(self):
-        from asyncio import futures
-        fut = asyncio.Future(loop=self.loop)
+        fut = self._new_future(loop=self.loop)
         fut.cancel()
         futures._set_result_unless_cancelled(fut, 2)
         self.assertTrue(fut.cancelled())
 
 
-class FutureDoneCallbackTests(test_utils.TestCase):
+@unittest.skipUnless(hasattr(futures, '_CFuture'),
+                     'requires the C _asyncio module')
+class CFutureTests(BaseFutureTests, test_utils.TestCase):
+    cls = getattr(futures, '_CFuture')
+
+
+class PyFutureTests(BaseFutureTests, test_utils.TestCase):
+    cls = futures._PyFuture
+
+
+class BaseFutureDoneCallbackTests:
 
     def setUp(self):
         self.loop = self.new_test_loop()
@@ -412,7 +425,7 @@ class FutureDoneCallbackTests(test_utils.TestCase):
         return bag_appender
 
     def _new_future(self):
-        return asyncio.Future(loop=self.loop)
+        raise NotImplementedError
 
     def test_callbacks_invoked_on_set_result(self):
         bag = []
@@ -476,5 +489,22 @@ class FutureDoneCallbackTests(test_utils.TestCase):
         self.assertEqual(f.result(), 'foo')
 
 
+
+@unittest.skipUnless(hasattr(futures, '_CFuture'),
+                     'requires the C _asyncio module')
+class CFutureDoneCallbackTests(BaseFutureDoneCallbackTests,
+                               test_utils.TestCase):
+
+    def _new_future(self):
+        return futures._CFuture(loop=self.loop)
+
+
+class PyFutureDoneCallbackTests(BaseFutureDoneCallbackTests,
+                                test_utils.TestCase):
+
+    def _new_future(self):
+        return futures._PyFuture(loop=self.loop)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import collections
 import errno
 import socket
 import unittest
@@ -925,18 +926,19 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'data']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer.append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
         self.assertEqual(list_to_buffer([b'data1', b'data2']),
-                         transport._buffer)
+                         list_to_buffer(transport._buffer))
 
     def test_write_partial(self):
         data = b'data'
@@ -946,7 +948,8 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'ta']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -956,7 +959,8 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'ta']),
+                         list_to_buffer(transport._buffer))
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -967,7 +971,8 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'ta']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_partial_none(self):
         data = b'data'
@@ -978,7 +983,8 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'data']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -988,7 +994,8 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'data']),
+                         list_to_buffer(transport._buffer))
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -1029,7 +1036,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = len(data)
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -1041,7 +1048,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
         transport = self.socket_transport()
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -1059,40 +1066,43 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = 2
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'ta']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_ready_partial_none(self):
         data = b'data'
         self.sock.send.return_value = 0
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'data']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_ready_tryagain(self):
-        self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg.side_effect = BlockingIOError
 
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer = collections.deque([b'data1', b'data2'])
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list_to_buffer([b'data1data2']),
+                         list_to_buffer(transport._buffer))
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport._write_ready()
         transport._fatal_error.assert_called_with(
                                    err,
@@ -1112,7 +1122,8 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(list_to_buffer(tr._buffer),
+                         list_to_buffer([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -1121,6 +1132,130 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.shutdown.assert_called_with(socket.SHUT_WR)
         tr.close()
 
+    def test_write_buffer_keeps_bytes(self):
+        self.sock.send.return_value = 0
+        data = b'data'
+
+        transport = self.socket_transport()
+        transport.write(data)
+        self.assertIs(transport._buffer[0].obj, data)
+
+        data = bytearray(b'data')
+        transport.write(data)
+        data[:] = b'xxxx'
+        self.assertEqual(list_to_buffer([b'data', b'data']),
+                         list_to_buffer(transport._buffer))
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+
+    def sendmsg(self, nbytes):
+        # sendmsg() side effect recording the buffers passed to it.
+        self.sendmsg_buffers = []
+
+        def sendmsg(buffers):
+            self.sendmsg_buffers.append([bytes(b) for b in buffers])
+            return nbytes
+        return sendmsg
+
+    def test_write_ready_sendmsg(self):
+        self.sock.send.return_value = 0
+        self.sock.sendmsg.side_effect = self.sendmsg(10)
+
+        transport = self.socket_transport()
+        transport.write(b'data1')
+        transport.write(b'data2')
+        self.assertEqual(self.sock.send.call_count, 1)
+        self.assertFalse(self.sock.sendmsg.called)
+        transport._write_ready()
+
+        self.assertEqual(self.sendmsg_buffers, [[b'data1', b'data2']])
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_write_ready_sendmsg_partial(self):
+        self.sock.sendmsg.return_value = 7
+
+        transport = self.socket_transport()
+        transport._buffer.extend([b'data1', b'data2'])
+        transport._buffer_size = 10
+        self.loop.add_writer(7, transport._write_ready)
+        transport._write_ready()
+
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'ta2']),
+                         list_to_buffer(transport._buffer))
+        self.assertEqual(transport.get_write_buffer_size(), 3)
+
+    @mock.patch('asyncio.selector_events._SC_IOV_MAX', 2)
+    def test_write_ready_sendmsg_iov_max(self):
+        self.sock.sendmsg.side_effect = self.sendmsg(10)
+
+        transport = self.socket_transport()
+        transport._buffer.extend([b'data1', b'data2', b'data3'])
+        transport._buffer_size = 15
+        self.loop.add_writer(7, transport._write_ready)
+        transport._write_ready()
+
+        self.assertEqual(self.sendmsg_buffers, [[b'data1', b'data2']])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'data3']),
+                         list_to_buffer(transport._buffer))
+
+    def test_write_ready_no_sendmsg(self):
+        self.sock.send.return_value = 7
+
+        transport = self.socket_transport()
+        transport._has_sendmsg = False
+        transport._buffer.extend([b'data1', b'data2'])
+        transport._buffer_size = 10
+        self.loop.add_writer(7, transport._write_ready)
+        transport._write_ready()
+
+        self.sock.send.assert_called_with(b'data1data2')
+        self.assertEqual(list_to_buffer([b'ta2']),
+                         list_to_buffer(transport._buffer))
+
+    def test_writelines(self):
+        self.sock.sendmsg.side_effect = self.sendmsg(10)
+
+        transport = self.socket_transport()
+        transport.writelines([b'data1', bytearray(b'data2'), b''])
+
+        self.assertEqual(self.sendmsg_buffers, [[b'data1', b'data2']])
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_partial(self):
+        self.sock.sendmsg.return_value = 2
+
+        transport = self.socket_transport()
+        transport.writelines(iter([b'data1', memoryview(b'data2')]))
+
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'ta1data2']),
+                         list_to_buffer(transport._buffer))
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+
+    def test_writelines_buffer(self):
+        transport = self.socket_transport()
+        transport._buffer.append(b'data1')
+        transport.writelines([b'data2', b'data3'])
+
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list_to_buffer([b'data1', b'data2', b'data3']),
+                         list_to_buffer(transport._buffer))
+
+    def test_writelines_str(self):
+        transport = self.socket_transport()
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_after_eof(self):
+        transport = self.socket_transport()
+        transport.write_eof()
+        self.assertRaises(RuntimeError, transport.writelines, [b'data'])
+
     @mock.patch('asyncio.base_events.logger')
     def test_transport_close_remove_writer(self, m_log):
         remove_writer = self.loop.remove_writer = mock.Mock()
@@ -1130,6 +1265,117 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         remove_writer.assert_called_with(self.sock_fd)
 
 
+class SelectorSocketTransportBufferedProtocolTests(test_utils.TestCase):
+
+    def setUp(self):
+        self.loop = self.new_test_loop()
+
+        self.protocol = test_utils.make_test_protocol(asyncio.BufferedProtocol)
+        self.buf = bytearray(1)
+        self.protocol.get_buffer.side_effect = lambda hint: self.buf
+
+        self.sock = mock.Mock(socket.socket)
+        self.sock_fd = self.sock.fileno.return_value = 7
+
+    def socket_transport(self, waiter=None):
+        transport = _SelectorSocketTransport(self.loop, self.sock,
+                                             self.protocol, waiter=waiter)
+        self.addCleanup(close_transport, transport)
+        return transport
+
+    def test_ctor(self):
+        waiter = asyncio.Future(loop=self.loop)
+        tr = self.socket_transport(waiter=waiter)
+        self.loop.run_until_complete(waiter)
+
+        self.loop.assert_reader(7, tr._read_ready)
+        test_utils.run_briefly(self.loop)
+        self.protocol.connection_made.assert_called_with(tr)
+
+    def test_get_buffer_error(self):
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+
+        self.protocol.get_buffer.side_effect = LookupError()
+        transport._read_ready()
+
+        self.assertTrue(transport._fatal_error.called)
+        self.assertTrue(self.protocol.get_buffer.called)
+        self.assertFalse(self.protocol.buffer_updated.called)
+        self.assertFalse(self.sock.recv_into.called)
+
+    def test_get_buffer_zerosized(self):
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+
+        self.protocol.get_buffer.side_effect = lambda hint: bytearray(0)
+        transport._read_ready()
+
+        self.assertTrue(transport._fatal_error.called)
+        self.assertIsInstance(transport._fatal_error.call_args[0][0],
+                              RuntimeError)
+        self.assertFalse(self.protocol.buffer_updated.called)
+        self.assertFalse(self.sock.recv_into.called)
+
+    def test_read_ready(self):
+        transport = self.socket_transport()
+
+        self.sock.recv_into.return_value = 10
+        transport._read_ready()
+
+        self.protocol.get_buffer.assert_called_with(transport.max_size)
+        self.sock.recv_into.assert_called_with(self.buf)
+        self.protocol.buffer_updated.assert_called_with(10)
+        self.assertFalse(self.sock.recv.called)
+
+    def test_read_ready_eof(self):
+        transport = self.socket_transport()
+        transport.close = mock.Mock()
+
+        self.sock.recv_into.return_value = 0
+        transport._read_ready()
+
+        self.protocol.buffer_updated.assert_called_with(0)
+        self.protocol.eof_received.assert_called_with()
+        transport.close.assert_called_with()
+
+    def test_read_ready_eof_keep_open(self):
+        transport = self.socket_transport()
+        transport.close = mock.Mock()
+
+        self.sock.recv_into.return_value = 0
+        self.protocol.eof_received.return_value = True
+        transport._read_ready()
+
+        self.protocol.eof_received.assert_called_with()
+        self.assertFalse(transport.close.called)
+
+    @mock.patch('logging.exception')
+    def test_read_ready_tryagain(self, m_exc):
+        self.sock.recv_into.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        self.protocol.buffer_updated.assert_called_with(0)
+        self.assertFalse(self.protocol.eof_received.called)
+        self.assertFalse(transport._fatal_error.called)
+
+    @mock.patch('logging.exception')
+    def test_read_ready_err(self, m_exc):
+        err = self.sock.recv_into.side_effect = OSError()
+
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        self.protocol.buffer_updated.assert_called_with(0)
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal read error on socket transport')
+
+
 @unittest.skipIf(ssl is None, 'No ssl module')
 class SelectorSslTransportTests(test_utils.TestCase):
 
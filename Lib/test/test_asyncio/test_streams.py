@@ -130,6 +130,74 @@ class StreamReaderTests(test_utils.TestCase):
         stream.feed_data(self.DATA)
         self.assertEqual(self.DATA, stream._buffer)
 
+    def test_protocol_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        stream.feed_data(b'spam')
+
+        buf = protocol.get_buffer(-1)
+        self.assertGreater(len(buf), len(self.DATA))
+        buf[:len(self.DATA)] = self.DATA
+        protocol.buffer_updated(len(self.DATA))
+        self.assertEqual(b'spam' + self.DATA, stream._buffer)
+
+        # Nothing read: the space lent to the transport is dropped.
+        buf = protocol.get_buffer(3)
+        self.assertEqual(len(buf), 3)
+        protocol.buffer_updated(0)
+        self.assertEqual(b'spam' + self.DATA, stream._buffer)
+
+        read_task = asyncio.Task(stream.read(4), loop=self.loop)
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'spam', data)
+
+    def test_protocol_buffer_read_size(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+
+        size = len(protocol.get_buffer(-1))
+        protocol.buffer_updated(size)
+        self.assertEqual(len(protocol.get_buffer(-1)), 2 * size)
+        protocol.buffer_updated(1)
+        self.assertEqual(len(protocol.get_buffer(-1)), size)
+        protocol.buffer_updated(0)
+        self.assertEqual(len(stream._buffer), size + 1)
+
+    def test_protocol_buffer_not_copied(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        stream.feed_data(b'spam')
+
+        # The transport reads into the stream buffer itself: the data is
+        # in place before buffer_updated() is even called.
+        buf = protocol.get_buffer(-1)
+        self.assertIs(buf.obj, stream._buffer)
+        buf[:3] = b'egg'
+        self.assertEqual(stream._buffer[:7], b'spamegg')
+        protocol.buffer_updated(3)
+        self.assertEqual(stream._buffer, b'spamegg')
+
+    def test_protocol_buffer_shrinks(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+
+        # A small read in a large window shrinks it at once
+        stream._read_size = asyncio.streams._MAX_READ_SIZE
+        protocol.get_buffer(-1)
+        protocol.buffer_updated(100)
+        self.assertEqual(len(protocol.get_buffer(-1)),
+                         asyncio.streams._MIN_READ_SIZE)
+        protocol.buffer_updated(0)
+        self.assertEqual(len(stream._buffer), 100)
+
+    def test_feed_data_to_buffered_protocol(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        data = bytes(range(256)) * 100
+
+        asyncio.protocols._feed_data_to_buffered_proto(protocol, data)
+        self.assertEqual(data, stream._buffer)
+
     def test_read_zero(self):
         # Read zero bytes.
         stream = asyncio.StreamReader(loop=self.loop)
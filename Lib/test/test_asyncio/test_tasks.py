@@ -14,6 +14,8 @@ from unittest import mock
 
 import asyncio
 from asyncio import coroutines
+from asyncio import futures
+from asyncio import tasks
 from asyncio import test_utils
 try:
     from test import support
@@ -72,14 +74,17 @@ class Dummy:
         pass
 
 
-class TaskTests(test_utils.TestCase):
+class BaseTaskTests:
+
+    Task = None
+    Future = None
 
     def setUp(self):
         self.loop = self.new_test_loop()
 
     def test_other_loop_future(self):
         other_loop = asyncio.new_event_loop()
-        fut = asyncio.Future(loop=other_loop)
+        fut = self.Future(loop=other_loop)
 
         @asyncio.coroutine
         def run(fut):
@@ -96,7 +101,7 @@ class TaskTests(test_utils.TestCase):
         @asyncio.coroutine
         def notmuch():
             return 'ok'
-        t = asyncio.Task(notmuch(), loop=self.loop)
+        t = self.Task(notmuch(), loop=self.loop)
         self.loop.run_until_complete(t)
         self.assertTrue(t.done())
         self.assertEqual(t.result(), 'ok')
@@ -104,7 +109,7 @@ class TaskTests(test_utils.TestCase):
 
         loop = asyncio.new_event_loop()
         self.set_event_loop(loop)
-        t = asyncio.Task(notmuch(), loop=loop)
+        t = self.Task(notmuch(), loop=loop)
         self.assertIs(t._loop, loop)
         loop.run_until_complete(t)
         loop.close()
@@ -127,7 +132,7 @@ class TaskTests(test_utils.TestCase):
         loop.close()
 
     def test_ensure_future_future(self):
-        f_orig = asyncio.Future(loop=self.loop)
+        f_orig = self.Future(loop=self.loop)
         f_orig.set_result('ko')
 
         f = asyncio.ensure_future(f_orig)
@@ -151,7 +156,7 @@ class TaskTests(test_utils.TestCase):
         @asyncio.coroutine
         def notmuch():
             return 'ok'
-        t_orig = asyncio.Task(notmuch(), loop=self.loop)
+        t_orig = self.Task(notmuch(), loop=self.loop)
         t = asyncio.ensure_future(t_orig)
         self.loop.run_until_complete(t)
         self.assertTrue(t.done())
@@ -192,7 +197,7 @@ class TaskTests(test_utils.TestCase):
             asyncio.ensure_future('ok')
 
     def test_async_warning(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self.Future(loop=self.loop)
         with self.assertWarnsRegex(DeprecationWarning,
                                    'function is deprecated, use ensure_'):
             self.assertIs(f, asyncio.async(f))
@@ -240,7 +245,7 @@ class TaskTests(test_utils.TestCase):
         self.assertEqual(notmuch.__name__, 'notmuch')
         if PY35:
             self.assertEqual(notmuch.__qualname__,
-                             'TaskTests.test_task_repr.<locals>.notmuch')
+                             'BaseTaskTests.test_task_repr.<locals>.notmuch')
         self.assertEqual(notmuch.__module__, __name__)
 
         filename, lineno = test_utils.get_function_source(notmuch)
@@ -249,7 +254,7 @@ class TaskTests(test_utils.TestCase):
         # test coroutine object
         gen = notmuch()
         if coroutines._DEBUG or PY35:
-            coro_qualname = 'TaskTests.test_task_repr.<locals>.notmuch'
+            coro_qualname = 'BaseTaskTests.test_task_repr.<locals>.notmuch'
         else:
             coro_qualname = 'notmuch'
         self.assertEqual(gen.__name__, 'notmuch')
@@ -258,7 +263,7 @@ class TaskTests(test_utils.TestCase):
                              coro_qualname)
 
         # test pending Task
-        t = asyncio.Task(gen, loop=self.loop)
+        t = self.Task(gen, loop=self.loop)
         t.add_done_callback(Dummy())
 
         coro = format_coroutine(coro_qualname, 'running', src,
@@ -280,7 +285,7 @@ class TaskTests(test_utils.TestCase):
                          '<Task cancelled %s>' % coro)
 
         # test finished Task
-        t = asyncio.Task(notmuch(), loop=self.loop)
+        t = self.Task(notmuch(), loop=self.loop)
         self.loop.run_until_complete(t)
         coro = format_coroutine(coro_qualname, 'done', src,
                                 t._source_traceback)
@@ -300,7 +305,7 @@ class TaskTests(test_utils.TestCase):
         self.assertEqual(notmuch.__name__, 'notmuch')
         if PY35:
             self.assertEqual(notmuch.__qualname__,
-                             'TaskTests.test_task_repr_coro_decorator'
+                             'BaseTaskTests.test_task_repr_coro_decorator'
                              '.<locals>.notmuch')
         self.assertEqual(notmuch.__module__, __name__)
 
@@ -311,7 +316,7 @@ class TaskTests(test_utils.TestCase):
             # function, as expected, and have a qualified name (__qualname__
             # attribute).
             coro_name = 'notmuch'
-            coro_qualname = ('TaskTests.test_task_repr_coro_decorator'
+            coro_qualname = ('BaseTaskTests.test_task_repr_coro_decorator'
                              '.<locals>.notmuch')
         else:
             # On Python < 3.5, generators inherit the name of the code, not of
@@ -339,7 +344,7 @@ class TaskTests(test_utils.TestCase):
             self.assertEqual(repr(gen), '<CoroWrapper %s>' % coro)
 
         # test pending Task
-        t = asyncio.Task(gen, loop=self.loop)
+        t = self.Task(gen, loop=self.loop)
         t.add_done_callback(Dummy())
 
         # format the coroutine object
@@ -362,8 +367,8 @@ class TaskTests(test_utils.TestCase):
         def wait_for(fut):
             return (yield from fut)
 
-        fut = asyncio.Future(loop=self.loop)
-        task = asyncio.Task(wait_for(fut), loop=self.loop)
+        fut = self.Future(loop=self.loop)
+        task = self.Task(wait_for(fut), loop=self.loop)
         test_utils.run_briefly(self.loop)
         self.assertRegex(repr(task),
                          '<Task .* wait_for=%s>' % re.escape(repr(fut)))
@@ -389,7 +394,7 @@ class TaskTests(test_utils.TestCase):
             self.addCleanup(task._coro.close)
 
         coro_repr = repr(task._coro)
-        expected = ('<CoroWrapper TaskTests.test_task_repr_partial_corowrapper'
+        expected = ('<CoroWrapper BaseTaskTests.test_task_repr_partial_corowrapper'
                     '.<locals>.func(1)() running, ')
         self.assertTrue(coro_repr.startswith(expected),
                         coro_repr)
@@ -426,7 +431,7 @@ class TaskTests(test_utils.TestCase):
             yield from asyncio.sleep(10.0, loop=loop)
             return 12
 
-        t = asyncio.Task(task(), loop=loop)
+        t = self.Task(task(), loop=loop)
         loop.call_soon(t.cancel)
         with self.assertRaises(asyncio.CancelledError):
             loop.run_until_complete(t)
@@ -441,7 +446,7 @@ class TaskTests(test_utils.TestCase):
             yield
             return 12
 
-        t = asyncio.Task(task(), loop=self.loop)
+        t = self.Task(task(), loop=self.loop)
         test_utils.run_briefly(self.loop)  # start coro
         t.cancel()
         self.assertRaises(
@@ -451,14 +456,14 @@ class TaskTests(test_utils.TestCase):
         self.assertFalse(t.cancel())
 
     def test_cancel_inner_future(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def task():
             yield from f
             return 12
 
-        t = asyncio.Task(task(), loop=self.loop)
+        t = self.Task(task(), loop=self.loop)
         test_utils.run_briefly(self.loop)  # start task
         f.cancel()
         with self.assertRaises(asyncio.CancelledError):
@@ -467,14 +472,14 @@ class TaskTests(test_utils.TestCase):
         self.assertTrue(t.cancelled())
 
     def test_cancel_both_task_and_inner_future(self):
-        f = asyncio.Future(loop=self.loop)
+        f = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def task():
             yield from f
             return 12
 
-        t = asyncio.Task(task(), loop=self.loop)
+        t = self.Task(task(), loop=self.loop)
         test_utils.run_briefly(self.loop)
 
         f.cancel()
@@ -488,8 +493,8 @@ class TaskTests(test_utils.TestCase):
         self.assertTrue(t.cancelled())
 
     def test_cancel_task_catching(self):
-        fut1 = asyncio.Future(loop=self.loop)
-        fut2 = asyncio.Future(loop=self.loop)
+        fut1 = self.Future(loop=self.loop)
+        fut2 = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def task():
@@ -499,7 +504,7 @@ class TaskTests(test_utils.TestCase):
             except asyncio.CancelledError:
                 return 42
 
-        t = asyncio.Task(task(), loop=self.loop)
+        t = self.Task(task(), loop=self.loop)
         test_utils.run_briefly(self.loop)
         self.assertIs(t._fut_waiter, fut1)  # White-box test.
         fut1.set_result(None)
@@ -512,9 +517,9 @@ class TaskTests(test_utils.TestCase):
         self.assertFalse(t.cancelled())
 
     def test_cancel_task_ignoring(self):
-        fut1 = asyncio.Future(loop=self.loop)
-        fut2 = asyncio.Future(loop=self.loop)
-        fut3 = asyncio.Future(loop=self.loop)
+        fut1 = self.Future(loop=self.loop)
+        fut2 = self.Future(loop=self.loop)
+        fut3 = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def task():
@@ -526,7 +531,7 @@ class TaskTests(test_utils.TestCase):
             res = yield from fut3
             return res
 
-        t = asyncio.Task(task(), loop=self.loop)
+        t = self.Task(task(), loop=self.loop)
         test_utils.run_briefly(self.loop)
         self.assertIs(t._fut_waiter, fut1)  # White-box test.
         fut1.set_result(None)
@@ -554,7 +559,7 @@ class TaskTests(test_utils.TestCase):
             yield from asyncio.sleep(100, loop=loop)
             return 12
 
-        t = asyncio.Task(task(), loop=loop)
+        t = self.Task(task(), loop=loop)
         self.assertRaises(
             asyncio.CancelledError, loop.run_until_complete, t)
         self.assertTrue(t.done())
@@ -587,7 +592,7 @@ class TaskTests(test_utils.TestCase):
                 if x == 2:
                     loop.stop()
 
-        t = asyncio.Task(task(), loop=loop)
+        t = self.Task(task(), loop=loop)
         with self.assertRaises(RuntimeError) as cm:
             loop.run_until_complete(t)
         self.assertEqual(str(cm.exception),
@@ -625,7 +630,7 @@ class TaskTests(test_utils.TestCase):
                 foo_running = False
             return 'done'
 
-        fut = asyncio.Task(foo(), loop=loop)
+        fut = self.Task(foo(), loop=loop)
 
         with self.assertRaises(asyncio.TimeoutError):
             loop.run_until_complete(asyncio.wait_for(fut, 0.1, loop=loop))
@@ -665,7 +670,7 @@ class TaskTests(test_utils.TestCase):
 
         asyncio.set_event_loop(loop)
         try:
-            fut = asyncio.Task(foo(), loop=loop)
+            fut = self.Task(foo(), loop=loop)
             with self.assertRaises(asyncio.TimeoutError):
                 loop.run_until_complete(asyncio.wait_for(fut, 0.01))
         finally:
@@ -684,7 +689,7 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        fut = asyncio.Future(loop=loop)
+        fut = self.Future(loop=loop)
         task = asyncio.wait_for(fut, timeout=0.2, loop=loop)
         loop.call_later(0.1, fut.set_result, "ok")
         res = loop.run_until_complete(task)
@@ -701,8 +706,8 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        a = asyncio.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
-        b = asyncio.Task(asyncio.sleep(0.15, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
+        b = self.Task(asyncio.sleep(0.15, loop=loop), loop=loop)
 
         @asyncio.coroutine
         def foo():
@@ -711,12 +716,12 @@ class TaskTests(test_utils.TestCase):
             self.assertEqual(pending, set())
             return 42
 
-        res = loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        res = loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertEqual(res, 42)
         self.assertAlmostEqual(0.15, loop.time())
 
         # Doing it again should take no time and exercise a different path.
-        res = loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        res = loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertAlmostEqual(0.15, loop.time())
         self.assertEqual(res, 42)
 
@@ -731,8 +736,8 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        a = asyncio.Task(asyncio.sleep(0.01, loop=loop), loop=loop)
-        b = asyncio.Task(asyncio.sleep(0.015, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(0.01, loop=loop), loop=loop)
+        b = self.Task(asyncio.sleep(0.015, loop=loop), loop=loop)
 
         @asyncio.coroutine
         def foo():
@@ -743,7 +748,7 @@ class TaskTests(test_utils.TestCase):
 
         asyncio.set_event_loop(loop)
         res = loop.run_until_complete(
-            asyncio.Task(foo(), loop=loop))
+            self.Task(foo(), loop=loop))
 
         self.assertEqual(res, 42)
 
@@ -753,7 +758,7 @@ class TaskTests(test_utils.TestCase):
             return s
         c = coro('test')
 
-        task = asyncio.Task(
+        task = self.Task(
             asyncio.wait([c, c, coro('spam')], loop=self.loop),
             loop=self.loop)
 
@@ -786,9 +791,9 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        a = asyncio.Task(asyncio.sleep(10.0, loop=loop), loop=loop)
-        b = asyncio.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
-        task = asyncio.Task(
+        a = self.Task(asyncio.sleep(10.0, loop=loop), loop=loop)
+        b = self.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
+        task = self.Task(
             asyncio.wait([b, a], return_when=asyncio.FIRST_COMPLETED,
                          loop=loop),
             loop=loop)
@@ -818,9 +823,9 @@ class TaskTests(test_utils.TestCase):
             yield
             yield
 
-        a = asyncio.Task(coro1(), loop=self.loop)
-        b = asyncio.Task(coro2(), loop=self.loop)
-        task = asyncio.Task(
+        a = self.Task(coro1(), loop=self.loop)
+        b = self.Task(coro2(), loop=self.loop)
+        task = self.Task(
             asyncio.wait([b, a], return_when=asyncio.FIRST_COMPLETED,
                          loop=self.loop),
             loop=self.loop)
@@ -842,14 +847,14 @@ class TaskTests(test_utils.TestCase):
         loop = self.new_test_loop(gen)
 
         # first_exception, task already has exception
-        a = asyncio.Task(asyncio.sleep(10.0, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(10.0, loop=loop), loop=loop)
 
         @asyncio.coroutine
         def exc():
             raise ZeroDivisionError('err')
 
-        b = asyncio.Task(exc(), loop=loop)
-        task = asyncio.Task(
+        b = self.Task(exc(), loop=loop)
+        task = self.Task(
             asyncio.wait([b, a], return_when=asyncio.FIRST_EXCEPTION,
                          loop=loop),
             loop=loop)
@@ -875,14 +880,14 @@ class TaskTests(test_utils.TestCase):
         loop = self.new_test_loop(gen)
 
         # first_exception, exception during waiting
-        a = asyncio.Task(asyncio.sleep(10.0, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(10.0, loop=loop), loop=loop)
 
         @asyncio.coroutine
         def exc():
             yield from asyncio.sleep(0.01, loop=loop)
             raise ZeroDivisionError('err')
 
-        b = asyncio.Task(exc(), loop=loop)
+        b = self.Task(exc(), loop=loop)
         task = asyncio.wait([b, a], return_when=asyncio.FIRST_EXCEPTION,
                             loop=loop)
 
@@ -906,14 +911,14 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        a = asyncio.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
 
         @asyncio.coroutine
         def sleeper():
             yield from asyncio.sleep(0.15, loop=loop)
             raise ZeroDivisionError('really')
 
-        b = asyncio.Task(sleeper(), loop=loop)
+        b = self.Task(sleeper(), loop=loop)
 
         @asyncio.coroutine
         def foo():
@@ -923,10 +928,10 @@ class TaskTests(test_utils.TestCase):
             errors = set(f for f in done if f.exception() is not None)
             self.assertEqual(len(errors), 1)
 
-        loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertAlmostEqual(0.15, loop.time())
 
-        loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertAlmostEqual(0.15, loop.time())
 
     def test_wait_with_timeout(self):
@@ -942,8 +947,8 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        a = asyncio.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
-        b = asyncio.Task(asyncio.sleep(0.15, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
+        b = self.Task(asyncio.sleep(0.15, loop=loop), loop=loop)
 
         @asyncio.coroutine
         def foo():
@@ -952,7 +957,7 @@ class TaskTests(test_utils.TestCase):
             self.assertEqual(done, set([a]))
             self.assertEqual(pending, set([b]))
 
-        loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertAlmostEqual(0.11, loop.time())
 
         # move forward to close generator
@@ -972,8 +977,8 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        a = asyncio.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
-        b = asyncio.Task(asyncio.sleep(0.15, loop=loop), loop=loop)
+        a = self.Task(asyncio.sleep(0.1, loop=loop), loop=loop)
+        b = self.Task(asyncio.sleep(0.15, loop=loop), loop=loop)
 
         done, pending = loop.run_until_complete(
             asyncio.wait([b, a], timeout=0.1, loop=loop))
@@ -1021,14 +1026,14 @@ class TaskTests(test_utils.TestCase):
                 values.append((yield from f))
             return values
 
-        res = loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        res = loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertAlmostEqual(0.15, loop.time())
         self.assertTrue('a' in res[:2])
         self.assertTrue('b' in res[:2])
         self.assertEqual(res[2], 'c')
 
         # Doing it again should take no time and exercise a different path.
-        res = loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        res = loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertAlmostEqual(0.15, loop.time())
 
     def test_as_completed_with_timeout(self):
@@ -1057,7 +1062,7 @@ class TaskTests(test_utils.TestCase):
                     values.append((2, exc))
             return values
 
-        res = loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        res = loop.run_until_complete(self.Task(foo(), loop=loop))
         self.assertEqual(len(res), 2, res)
         self.assertEqual(res[0], (1, 'a'))
         self.assertEqual(res[1][0], 2)
@@ -1085,7 +1090,7 @@ class TaskTests(test_utils.TestCase):
                 v = yield from f
                 self.assertEqual(v, 'a')
 
-        loop.run_until_complete(asyncio.Task(foo(), loop=loop))
+        loop.run_until_complete(self.Task(foo(), loop=loop))
 
     def test_as_completed_reverse_wait(self):
 
@@ -1145,7 +1150,7 @@ class TaskTests(test_utils.TestCase):
                 result.append((yield from f))
             return result
 
-        fut = asyncio.Task(runner(), loop=self.loop)
+        fut = self.Task(runner(), loop=self.loop)
         self.loop.run_until_complete(fut)
         result = fut.result()
         self.assertEqual(set(result), {'ham', 'spam'})
@@ -1168,7 +1173,7 @@ class TaskTests(test_utils.TestCase):
             res = yield from asyncio.sleep(dt/2, arg, loop=loop)
             return res
 
-        t = asyncio.Task(sleeper(0.1, 'yeah'), loop=loop)
+        t = self.Task(sleeper(0.1, 'yeah'), loop=loop)
         loop.run_until_complete(t)
         self.assertTrue(t.done())
         self.assertEqual(t.result(), 'yeah')
@@ -1183,7 +1188,7 @@ class TaskTests(test_utils.TestCase):
 
         loop = self.new_test_loop(gen)
 
-        t = asyncio.Task(asyncio.sleep(10.0, 'yeah', loop=loop),
+        t = self.Task(asyncio.sleep(10.0, 'yeah', loop=loop),
                          loop=loop)
 
         handle = None
@@ -1220,7 +1225,7 @@ class TaskTests(test_utils.TestCase):
 
         @asyncio.coroutine
         def doit():
-            sleeper = asyncio.Task(sleep(5000), loop=loop)
+            sleeper = self.Task(sleep(5000), loop=loop)
             loop.call_later(0.1, sleeper.cancel)
             try:
                 yield from sleeper
@@ -1234,13 +1239,13 @@ class TaskTests(test_utils.TestCase):
         self.assertAlmostEqual(0.1, loop.time())
 
     def test_task_cancel_waiter_future(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def coro():
             yield from fut
 
-        task = asyncio.Task(coro(), loop=self.loop)
+        task = self.Task(coro(), loop=self.loop)
         test_utils.run_briefly(self.loop)
         self.assertIs(task._fut_waiter, fut)
 
@@ -1257,7 +1262,7 @@ class TaskTests(test_utils.TestCase):
             return 'ko'
 
         gen = notmuch()
-        task = asyncio.Task(gen, loop=self.loop)
+        task = self.Task(gen, loop=self.loop)
         task.set_result('ok')
 
         self.assertRaises(AssertionError, task._step)
@@ -1293,7 +1298,7 @@ class TaskTests(test_utils.TestCase):
             nonlocal result
             result = yield from fut
 
-        t = asyncio.Task(wait_for_future(), loop=self.loop)
+        t = self.Task(wait_for_future(), loop=self.loop)
         test_utils.run_briefly(self.loop)
         self.assertTrue(fut.cb_added)
 
@@ -1309,7 +1314,7 @@ class TaskTests(test_utils.TestCase):
         def notmutch():
             raise BaseException()
 
-        task = asyncio.Task(notmutch(), loop=self.loop)
+        task = self.Task(notmutch(), loop=self.loop)
         self.assertRaises(BaseException, task._step)
 
         self.assertTrue(task.done())
@@ -1337,7 +1342,7 @@ class TaskTests(test_utils.TestCase):
             except asyncio.CancelledError:
                 raise base_exc
 
-        task = asyncio.Task(notmutch(), loop=loop)
+        task = self.Task(notmutch(), loop=loop)
         test_utils.run_briefly(loop)
 
         task.cancel()
@@ -1365,7 +1370,7 @@ class TaskTests(test_utils.TestCase):
         self.assertTrue(asyncio.iscoroutinefunction(fn2))
 
     def test_yield_vs_yield_from(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def wait_for_future():
@@ -1409,7 +1414,7 @@ class TaskTests(test_utils.TestCase):
         self.assertEqual(res, 'test')
 
     def test_coroutine_non_gen_function_return_future(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def func():
@@ -1419,49 +1424,49 @@ class TaskTests(test_utils.TestCase):
         def coro():
             fut.set_result('test')
 
-        t1 = asyncio.Task(func(), loop=self.loop)
-        t2 = asyncio.Task(coro(), loop=self.loop)
+        t1 = self.Task(func(), loop=self.loop)
+        t2 = self.Task(coro(), loop=self.loop)
         res = self.loop.run_until_complete(t1)
         self.assertEqual(res, 'test')
         self.assertIsNone(t2.result())
 
     def test_current_task(self):
-        self.assertIsNone(asyncio.Task.current_task(loop=self.loop))
+        self.assertIsNone(self.Task.current_task(loop=self.loop))
 
         @asyncio.coroutine
         def coro(loop):
-            self.assertTrue(asyncio.Task.current_task(loop=loop) is task)
+            self.assertTrue(self.Task.current_task(loop=loop) is task)
 
-        task = asyncio.Task(coro(self.loop), loop=self.loop)
+        task = self.Task(coro(self.loop), loop=self.loop)
         self.loop.run_until_complete(task)
-        self.assertIsNone(asyncio.Task.current_task(loop=self.loop))
+        self.assertIsNone(self.Task.current_task(loop=self.loop))
 
     def test_current_task_with_interleaving_tasks(self):
-        self.assertIsNone(asyncio.Task.current_task(loop=self.loop))
+        self.assertIsNone(self.Task.current_task(loop=self.loop))
 
-        fut1 = asyncio.Future(loop=self.loop)
-        fut2 = asyncio.Future(loop=self.loop)
+        fut1 = self.Future(loop=self.loop)
+        fut2 = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def coro1(loop):
-            self.assertTrue(asyncio.Task.current_task(loop=loop) is task1)
+            self.assertTrue(self.Task.current_task(loop=loop) is task1)
             yield from fut1
-            self.assertTrue(asyncio.Task.current_task(loop=loop) is task1)
+            self.assertTrue(self.Task.current_task(loop=loop) is task1)
             fut2.set_result(True)
 
         @asyncio.coroutine
         def coro2(loop):
-            self.assertTrue(asyncio.Task.current_task(loop=loop) is task2)
+            self.assertTrue(self.Task.current_task(loop=loop) is task2)
             fut1.set_result(True)
             yield from fut2
-            self.assertTrue(asyncio.Task.current_task(loop=loop) is task2)
+            self.assertTrue(self.Task.current_task(loop=loop) is task2)
 
-        task1 = asyncio.Task(coro1(self.loop), loop=self.loop)
-        task2 = asyncio.Task(coro2(self.loop), loop=self.loop)
+        task1 = self.Task(coro1(self.loop), loop=self.loop)
+        task2 = self.Task(coro2(self.loop), loop=self.loop)
 
         self.loop.run_until_complete(asyncio.wait((task1, task2),
                                                   loop=self.loop))
-        self.assertIsNone(asyncio.Task.current_task(loop=self.loop))
+        self.assertIsNone(self.Task.current_task(loop=self.loop))
 
     # Some thorough tests for cancellation propagation through
     # coroutines, tasks and wait().
@@ -1469,7 +1474,7 @@ class TaskTests(test_utils.TestCase):
     def test_yield_future_passes_cancel(self):
         # Cancelling outer() cancels inner() cancels waiter.
         proof = 0
-        waiter = asyncio.Future(loop=self.loop)
+        waiter = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def inner():
@@ -1503,7 +1508,7 @@ class TaskTests(test_utils.TestCase):
         # Cancelling outer() makes wait() return early, leaves inner()
         # running.
         proof = 0
-        waiter = asyncio.Future(loop=self.loop)
+        waiter = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def inner():
@@ -1527,14 +1532,14 @@ class TaskTests(test_utils.TestCase):
         self.assertEqual(proof, 1)
 
     def test_shield_result(self):
-        inner = asyncio.Future(loop=self.loop)
+        inner = self.Future(loop=self.loop)
         outer = asyncio.shield(inner)
         inner.set_result(42)
         res = self.loop.run_until_complete(outer)
         self.assertEqual(res, 42)
 
     def test_shield_exception(self):
-        inner = asyncio.Future(loop=self.loop)
+        inner = self.Future(loop=self.loop)
         outer = asyncio.shield(inner)
         test_utils.run_briefly(self.loop)
         exc = RuntimeError('expected')
@@ -1543,7 +1548,7 @@ class TaskTests(test_utils.TestCase):
         self.assertIs(outer.exception(), exc)
 
     def test_shield_cancel(self):
-        inner = asyncio.Future(loop=self.loop)
+        inner = self.Future(loop=self.loop)
         outer = asyncio.shield(inner)
         test_utils.run_briefly(self.loop)
         inner.cancel()
@@ -1551,7 +1556,7 @@ class TaskTests(test_utils.TestCase):
         self.assertTrue(outer.cancelled())
 
     def test_shield_shortcut(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self.Future(loop=self.loop)
         fut.set_result(42)
         res = self.loop.run_until_complete(asyncio.shield(fut))
         self.assertEqual(res, 42)
@@ -1559,7 +1564,7 @@ class TaskTests(test_utils.TestCase):
     def test_shield_effect(self):
         # Cancelling outer() does not affect inner().
         proof = 0
-        waiter = asyncio.Future(loop=self.loop)
+        waiter = self.Future(loop=self.loop)
 
         @asyncio.coroutine
         def inner():
@@ -1583,8 +1588,8 @@ class TaskTests(test_utils.TestCase):
         self.assertEqual(proof, 1)
 
     def test_shield_gather(self):
-        child1 = asyncio.Future(loop=self.loop)
-        child2 = asyncio.Future(loop=self.loop)
+        child1 = self.Future(loop=self.loop)
+        child2 = self.Future(loop=self.loop)
         parent = asyncio.gather(child1, child2, loop=self.loop)
         outer = asyncio.shield(parent, loop=self.loop)
         test_utils.run_briefly(self.loop)
@@ -1597,8 +1602,8 @@ class TaskTests(test_utils.TestCase):
         self.assertEqual(parent.result(), [1, 2])
 
     def test_gather_shield(self):
-        child1 = asyncio.Future(loop=self.loop)
-        child2 = asyncio.Future(loop=self.loop)
+        child1 = self.Future(loop=self.loop)
+        child2 = self.Future(loop=self.loop)
         inner1 = asyncio.shield(child1, loop=self.loop)
         inner2 = asyncio.shield(child2, loop=self.loop)
         parent = asyncio.gather(inner1, inner2, loop=self.loop)
@@ -1614,7 +1619,7 @@ class TaskTests(test_utils.TestCase):
         test_utils.run_briefly(self.loop)
 
     def test_as_completed_invalid_args(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self.Future(loop=self.loop)
 
         # as_completed() expects a list of futures, not a future instance
         self.assertRaises(TypeError, self.loop.run_until_complete,
@@ -1625,7 +1630,7 @@ class TaskTests(test_utils.TestCase):
         coro.close()
 
     def test_wait_invalid_args(self):
-        fut = asyncio.Future(loop=self.loop)
+        fut = self.Future(loop=self.loop)
 
         # wait() expects a list of futures, not a future instance
         self.assertRaises(TypeError, self.loop.run_until_complete,
@@ -1652,7 +1657,7 @@ class TaskTests(test_utils.TestCase):
                 yield from fut
 
             # A completed Future used to run the coroutine.
-            fut = asyncio.Future(loop=self.loop)
+            fut = self.Future(loop=self.loop)
             fut.set_result(None)
 
             # Call the coroutine.
@@ -1686,15 +1691,15 @@ class TaskTests(test_utils.TestCase):
 
             @asyncio.coroutine
             def t2():
-                f = asyncio.Future(loop=self.loop)
-                asyncio.Task(t3(f), loop=self.loop)
+                f = self.Future(loop=self.loop)
+                self.Task(t3(f), loop=self.loop)
                 return (yield from f)
 
             @asyncio.coroutine
             def t3(f):
                 f.set_result((1, 2, 3))
 
-            task = asyncio.Task(t1(), loop=self.loop)
+            task = self.Task(t1(), loop=self.loop)
             val = self.loop.run_until_complete(task)
             self.assertEqual(val, (1, 2, 3))
 
@@ -1728,7 +1733,7 @@ class TaskTests(test_utils.TestCase):
     def test_log_destroyed_pending_task(self):
         @asyncio.coroutine
         def kill_me(loop):
-            future = asyncio.Future(loop=loop)
+            future = self.Future(loop=loop)
             yield from future
             # at this point, the only reference to kill_me() task is
             # the Task._wakeup() method in future._callbacks
@@ -1740,8 +1745,8 @@ class TaskTests(test_utils.TestCase):
 
         # schedule the task
         coro = kill_me(self.loop)
-        task = asyncio.ensure_future(coro, loop=self.loop)
-        self.assertEqual(asyncio.Task.all_tasks(loop=self.loop), {task})
+        task = self.Task(coro, loop=self.loop)
+        self.assertEqual(self.Task.all_tasks(loop=self.loop), {task})
 
         # execute the task so it waits for future
         self.loop._run_once()
@@ -1756,7 +1761,7 @@ class TaskTests(test_utils.TestCase):
         # no more reference to kill_me() task: the task is destroyed by the GC
         support.gc_collect()
 
-        self.assertEqual(asyncio.Task.all_tasks(loop=self.loop), set())
+        self.assertEqual(self.Task.all_tasks(loop=self.loop), set())
 
         mock_handler.assert_called_with(self.loop, {
             'message': 'Task was destroyed but it is pending!',
@@ -1821,7 +1826,7 @@ class TaskTests(test_utils.TestCase):
     def test_task_source_traceback(self):
         self.loop.set_debug(True)
 
-        task = asyncio.Task(coroutine_function(), loop=self.loop)
+        task = self.Task(coroutine_function(), loop=self.loop)
         lineno = sys._getframe().f_lineno - 1
         self.assertIsInstance(task._source_traceback, list)
         self.assertEqual(task._source_traceback[-1][:3],
@@ -1836,7 +1841,7 @@ class TaskTests(test_utils.TestCase):
 
         @asyncio.coroutine
         def blocking_coroutine():
-            fut = asyncio.Future(loop=loop)
+            fut = self.Future(loop=loop)
             # Block: fut result is never set
             yield from fut
 
@@ -1858,6 +1863,32 @@ class TaskTests(test_utils.TestCase):
         self._test_cancel_wait_for(60.0)
 
 
+@unittest.skipUnless(hasattr(futures, '_CFuture'),
+                     'requires the C _asyncio module')
+class CTask_CFuture_Tests(BaseTaskTests, test_utils.TestCase):
+    Task = getattr(tasks, '_CTask', None)
+    Future = getattr(futures, '_CFuture', None)
+
+
+@unittest.skipUnless(hasattr(futures, '_CFuture'),
+                     'requires the C _asyncio module')
+class CTask_PyFuture_Tests(BaseTaskTests, test_utils.TestCase):
+    Task = getattr(tasks, '_CTask', None)
+    Future = futures._PyFuture
+
+
+@unittest.skipUnless(hasattr(futures, '_CFuture'),
+                     'requires the C _asyncio module')
+class PyTask_CFuture_Tests(BaseTaskTests, test_utils.TestCase):
+    Task = tasks._PyTask
+    Future = getattr(futures, '_CFuture', None)
+
+
+class PyTask_PyFuture_Tests(BaseTaskTests, test_utils.TestCase):
+    Task = tasks._PyTask
+    Future = futures._PyFuture
+
+
 class GatherTestsBase:
 
     def setUp(self):
@@ -241,6 +241,21 @@ class CAPITest(unittest.TestCase):
     def test_buildvalue_N(self):
         _testcapi.test_buildvalue_N()
 
+    def test_eval_frame_hook(self):
+        # PEP 523: the frame evaluation function can be replaced
+        def inner():
+            return 42
+        def outer():
+            return inner()
+        names = []
+        _testcapi.set_eval_frame_record(names)
+        try:
+            result = outer()
+        finally:
+            _testcapi.set_eval_frame_default()
+        self.assertEqual(result, 42)
+        self.assertEqual(names, ['outer', 'inner'])
+
 
 @unittest.skipUnless(threading, 'Threading required for this test.')
 class TestPendingCalls(unittest.TestCase):
@@ -101,6 +101,69 @@ class CmdLineTest(unittest.TestCase):
         else:
             self.assertEqual(err, b'')
 
+    def test_importtime(self):
+        code = ('import importlib.util, json; '
+                'print(importlib.util.import_times()[-1])')
+        rc, out, err = assert_python_ok('-X', 'importtime', '-c', code)
+        lines = err.splitlines()
+        self.assertEqual(lines[0],
+                         b'import time: self [us] | cumulative | '
+                         b'imported package')
+        self.assertRegex(err,
+                         br'(?m)^import time: +\d+ \| +\d+ \|   json\.decoder$')
+        self.assertRegex(err, br'(?m)^import time: +\d+ \| +\d+ \| json$')
+        name, self_us, cumulative_us, depth = eval(out)
+        self.assertEqual((name, depth), ('json', 0))
+        self.assertGreaterEqual(cumulative_us, self_us)
+
+        # The environment variable is equivalent to -X importtime
+        rc, out, err = assert_python_ok('-c', 'import json',
+                                        PYTHONPROFILEIMPORTTIME='1')
+        self.assertIn(b'import time:', err)
+
+        # Disabled by default
+        code = 'import importlib.util, json; print(importlib.util.import_times())'
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertEqual(out.rstrip(), b'[]')
+        self.assertNotIn(b'import time:', err)
+
+    def test_importtime_unencodable_name(self):
+        # A name which cannot be encoded to UTF-8 is reported escaped and
+        # the ImportError is not lost
+        code = ('try:\n'
+                '    __import__("\\udcff")\n'
+                'except ImportError:\n'
+                '    print("ImportError")\n')
+        rc, out, err = assert_python_ok('-X', 'importtime', '-c', code)
+        self.assertEqual(out.rstrip(), b'ImportError')
+        self.assertRegex(err, br'(?m)^import time: +\d+ \| +\d+ \| \\udcff$')
+
+    def test_frozen_modules(self):
+        code = ('import _imp, os; '
+                'print(_imp.is_frozen("os"), hasattr(os, "__file__"))')
+        rc, out, err = assert_python_ok('-X', 'frozen_modules=off', '-c', code)
+        self.assertEqual(out.rstrip(), b'False True')
+        # os is only frozen when built with "make frozen-startup"
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertIn(out.rstrip(), (b'False True', b'True True'))
+        # The frozen modules keep the location of their source file
+        code = 'import os; print(os.__file__, os.__cached__)'
+        rc, out, err = assert_python_ok('-X', 'frozen_modules=off', '-c', code)
+        rc, out2, err = assert_python_ok('-c', code)
+        self.assertEqual(out2, out)
+
+    def test_check_hash_based_pycs(self):
+        code = 'import _imp; print(_imp.check_hash_based_pycs)'
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertEqual(out.rstrip(), b'default')
+        for mode in ('default', 'always', 'never'):
+            rc, out, err = assert_python_ok('--check-hash-based-pycs', mode,
+                                            '-c', code)
+            self.assertEqual(out.rstrip(), mode.encode())
+        rc, out, err = assert_python_failure('--check-hash-based-pycs',
+                                             'bogus', '-c', code)
+        self.assertIn(b'--check-hash-based-pycs must be one of', err)
+
     def test_run_module(self):
         # Test expected operation of the '-m' switch
         # Switch needs an argument
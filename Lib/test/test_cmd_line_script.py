@@ -435,7 +435,7 @@ class CmdLineTest(unittest.TestCase):
             ('builtins.x', br'Error while finding spec.*AttributeError'),
             ('builtins.x.y', br'Error while finding spec.*'
                 br'ImportError.*No module named.*not a package'),
-            ('os.path', br'loader.*cannot handle'),
+            ('os.path', br'loader.*cannot handle|is not a frozen module'),
             ('importlib', br'No module named.*'
                 br'is a package and cannot be directly executed'),
             ('importlib.nonexistant', br'No module named'),
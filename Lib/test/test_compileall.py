@@ -48,9 +48,9 @@ class CompileallTests(unittest.TestCase):
 
     def data(self):
         with open(self.bc_path, 'rb') as file:
-            data = file.read(8)
+            data = file.read(12)
         mtime = int(os.stat(self.source_path).st_mtime)
-        compare = struct.pack('<4sl', importlib.util.MAGIC_NUMBER, mtime)
+        compare = struct.pack('<4sll', importlib.util.MAGIC_NUMBER, 0, mtime)
         return data, compare
 
     @unittest.skipUnless(hasattr(os, 'stat'), 'test needs os.stat()')
@@ -70,8 +70,8 @@ class CompileallTests(unittest.TestCase):
 
     def test_mtime(self):
         # Test a change in mtime leads to a new .pyc.
-        self.recreation_check(struct.pack('<4sl', importlib.util.MAGIC_NUMBER,
-                                          1))
+        self.recreation_check(struct.pack('<4sll', importlib.util.MAGIC_NUMBER,
+                                          0, 1))
 
     def test_magic_number(self):
         # Test a change in mtime leads to a new .pyc.
@@ -102,6 +102,29 @@ class CompileallTests(unittest.TestCase):
         self.assertFalse(compileall.compile_dir(self.directory,
                                                 force=False, quiet=2))
 
+    def test_compile_dir_invalidation_mode(self):
+        for mode, flags in ((py_compile.PycInvalidationMode.CHECKED_HASH, 0b11),
+                            (py_compile.PycInvalidationMode.UNCHECKED_HASH, 0b1),
+                            (py_compile.PycInvalidationMode.TIMESTAMP, 0)):
+            with self.subTest(mode=mode):
+                self.assertTrue(compileall.compile_dir(
+                    self.directory, quiet=2, invalidation_mode=mode))
+                with open(self.bc_path, 'rb') as fp:
+                    data = fp.read(8)
+                self.assertEqual(int.from_bytes(data[4:8], 'little'), flags)
+
+    def test_compile_dir_index(self):
+        self.assertTrue(compileall.compile_dir(self.directory, quiet=2,
+                                               index=True))
+        for directory in (self.directory, self.subdirectory):
+            index = importlib._bootstrap_external._index_path(directory)
+            self.assertTrue(os.path.isfile(index))
+            mtime = os.stat(directory).st_mtime
+            contents = importlib._bootstrap_external._read_path_index(
+                directory, mtime)
+            self.assertEqual(list(contents), sorted(os.listdir(directory)))
+        self.assertIn('_test3.py', contents)
+
     def test_compile_path(self):
         # Exclude Lib/test/ which contains invalid Python files like
         # Lib/test/badsyntax_pep3120.py
@@ -503,6 +526,24 @@ class CommandLineTests(unittest.TestCase):
         self.assertCompiled(self.initfn)
         self.assertCompiled(self.barfn)
 
+    def test_invalidation_mode(self):
+        self.assertRunOK('--invalidation-mode=checked-hash', self.pkgdir)
+        with open(importlib.util.cache_from_source(self.initfn), 'rb') as fp:
+            pyc = fp.read()
+        self.assertEqual(int.from_bytes(pyc[4:8], 'little'), 0b11)
+        self.assertRunOK('--invalidation-mode=unchecked-hash', self.pkgdir)
+        with open(importlib.util.cache_from_source(self.initfn), 'rb') as fp:
+            pyc = fp.read()
+        self.assertEqual(int.from_bytes(pyc[4:8], 'little'), 0b01)
+        self.assertRunNotOK('--invalidation-mode=bogus', self.pkgdir)
+
+    def test_index(self):
+        self.assertRunOK('-q', '--index', self.directory)
+        self.assertCompiled(self.barfn)
+        for directory in (self.directory, self.pkgdir):
+            index = importlib._bootstrap_external._index_path(directory)
+            self.assertTrue(os.path.isfile(index))
+
     def test_invalid_arg_produces_message(self):
         out = self.assertRunOK('badfilename')
         self.assertRegex(out, b"Can't list 'badfilename'")
@@ -739,6 +739,111 @@ class GCTests(unittest.TestCase):
         self.assertEqual(new[1]["collections"], old[1]["collections"])
         self.assertEqual(new[2]["collections"], old[2]["collections"] + 1)
 
+    def test_freeze(self):
+        gc.freeze()
+        count = gc.get_count()
+        self.addCleanup(gc.unfreeze)
+        self.assertEqual(count, (0, 0, 0))
+        self.assertGreater(gc.get_freeze_count(), 0)
+        gc.unfreeze()
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_freeze_cycle(self):
+        # Frozen garbage is not collected until it is unfrozen
+        class A:
+            pass
+        a = A()
+        a.a = a
+        wr = weakref.ref(a)
+        gc.collect()
+        gc.freeze()
+        self.addCleanup(gc.unfreeze)
+        del a
+        gc.collect()
+        self.assertIsNotNone(wr())
+        self.assertTrue(gc.is_tracked(wr()))
+        self.assertIn(wr(), gc.get_objects())
+        gc.unfreeze()
+        gc.collect()
+        self.assertIsNone(wr())
+
+    def test_set_incremental(self):
+        self.addCleanup(gc.set_incremental)
+        self.assertEqual(gc.get_incremental(), (None, None))
+        gc.set_incremental(100)
+        self.assertEqual(gc.get_incremental(), (100, None))
+        gc.set_incremental(max_time=0.01)
+        self.assertEqual(gc.get_incremental(), (None, 0.01))
+        gc.set_incremental(max_objects=100, max_time=0.01)
+        self.assertEqual(gc.get_incremental(), (100, 0.01))
+        for args in [(0,), (-1,), (None, 0), (None, -0.5),
+                     (None, float('nan'))]:
+            self.assertRaises(ValueError, gc.set_incremental, *args)
+        self.assertRaises(TypeError, gc.set_incremental, 1.5)
+        self.assertRaises(TypeError, gc.set_incremental, None, 'x')
+        self.assertEqual(gc.get_incremental(), (100, 0.01))
+        gc.set_incremental()
+        self.assertEqual(gc.get_incremental(), (None, None))
+
+    def test_incremental(self):
+        # Garbage cycles in the oldest generation are found by slices
+        class A:
+            pass
+        objs = []
+        for i in range(100):
+            a = A()
+            a.a = a
+            objs.append(a)
+        refs = [weakref.ref(a) for a in objs]
+        gc.collect()
+        del a, objs
+        slices = []
+        def callback(phase, info):
+            if phase == "stop" and info["incremental"]:
+                slices.append(info)
+        gc.callbacks.append(callback)
+        self.addCleanup(gc.callbacks.remove, callback)
+        self.addCleanup(gc.set_threshold, *gc.get_threshold())
+        self.addCleanup(gc.set_incremental)
+        if not gc.isenabled():
+            self.addCleanup(gc.disable)
+            gc.enable()
+        gc.set_threshold(100, 1, 1)
+        gc.set_incremental(max_objects=1000)
+        keep = []
+        for i in range(10**6):
+            keep.append([])
+            if not i % 1000 and not any(r() for r in refs):
+                break
+        self.assertEqual([r for r in refs if r()], [])
+        self.assertTrue(slices)
+        for info in slices:
+            self.assertEqual(info["generation"], 2)
+        # The objects a pass has visited are still tracked
+        self.assertIn(keep, gc.get_objects())
+        self.assertIn(keep, gc.get_referrers(keep[0]))
+
+    def test_get_pause_stats(self):
+        stats = gc.get_pause_stats()
+        self.assertEqual(len(stats), 3)
+        for st in stats:
+            self.assertEqual(set(st), {"pauses", "total", "max", "histogram"})
+            self.assertGreaterEqual(st["total"], st["max"])
+            bounds = [bound for bound, count in st["histogram"]]
+            self.assertEqual(bounds, [1e-4, 1e-3, 1e-2, 1e-1, 1.0,
+                                      float('inf')])
+            self.assertEqual(sum(count for bound, count in st["histogram"]),
+                             st["pauses"])
+        if gc.isenabled():
+            self.addCleanup(gc.enable)
+            gc.disable()
+        old = gc.get_pause_stats()
+        gc.collect(1)
+        new = gc.get_pause_stats()
+        self.assertEqual(new[0]["pauses"], old[0]["pauses"])
+        self.assertEqual(new[1]["pauses"], old[1]["pauses"] + 1)
+        self.assertGreaterEqual(new[1]["total"], old[1]["total"])
+
 
 class GCCallbackTests(unittest.TestCase):
     def setUp(self):
@@ -817,6 +922,11 @@ class GCCallbackTests(unittest.TestCase):
             self.assertTrue("generation" in info)
             self.assertTrue("collected" in info)
             self.assertTrue("uncollectable" in info)
+            self.assertIs(info["incremental"], False)
+            if v[1] == "stop":
+                self.assertGreaterEqual(info["duration"], 0.0)
+            else:
+                self.assertNotIn("duration", info)
 
     def test_collect_generation(self):
         self.preclean()
@@ -3,6 +3,7 @@ import os
 import shutil
 import sys
 import unittest
+from unittest import mock
 
 from test.support import (TESTFN, skip_unless_symlink,
                           can_symlink, create_empty_file, change_cwd)
@@ -264,6 +265,24 @@ class GlobTests(unittest.TestCase):
                 expect += [join('sym3', 'EF')]
             eq(glob.glob(join('**', 'EF'), recursive=True), expect)
 
+    def test_recursive_glob_scans_directories_only(self):
+        # The file types reported by os.scandir() are used to decide where
+        # to recurse: files are neither stat()ed nor scanned.
+        scanned = []
+        def scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+        def fail(*args, **kwargs):
+            self.fail('unexpected stat() call')
+        real_scandir = os.scandir
+        with mock.patch('os.scandir', scandir), \
+             mock.patch('os.stat', fail), mock.patch('os.lstat', fail):
+            self.assertTrue(self.rglob('**'))
+            self.assertTrue(self.rglob('*', '**', '*F'))
+        self.assertTrue(scanned)
+        for path in scanned:
+            self.assertTrue(os.path.isdir(path), path)
+
 
 @skip_unless_symlink
 class SymlinkLoopGlobTests(unittest.TestCase):
@@ -4,6 +4,7 @@ from .. import util
 machinery = util.import_importlib('importlib.machinery')
 
 import errno
+import importlib.util
 import os
 import py_compile
 import stat
@@ -143,6 +144,40 @@ class FinderTests(abc.FinderTests):
         finder.invalidate_caches()
         self.assertEqual(finder._path_mtime, -1)
 
+    def test_path_index(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            importlib.util.write_path_index(root)
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+            self.assertTrue(finder._path_indexed)
+            # An indexed directory is only checked again after
+            # invalidate_caches().
+            with open(os.path.join(root, 'new.py'), 'w'):
+                pass
+            self.assertEqual(self._find(finder, 'new'), self.NOT_FOUND)
+            finder.invalidate_caches()
+            self.assertIsNotNone(self._find(finder, 'new', loader_only=True))
+            self.assertFalse(finder._path_indexed)
+
+    def test_stale_path_index(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            index = importlib.util.write_path_index(root)
+            with open(os.path.join(root, 'new.py'), 'w'):
+                pass
+            os.utime(root, ns=(1, 1))
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'new', loader_only=True))
+            self.assertFalse(finder._path_indexed)
+            # A damaged index is ignored too
+            importlib.util.write_path_index(root)
+            with open(index, 'r+b') as file:
+                file.truncate(10)
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'new', loader_only=True))
+            self.assertFalse(finder._path_indexed)
+
     # Regression test for http://bugs.python.org/issue14846
     def test_dir_removal_handling(self):
         mod = 'mod'
@@ -1,7 +1,10 @@
+import builtins
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
+from test import support
 import types
 import unittest
 
@@ -141,5 +144,97 @@ class LazyLoaderTests(unittest.TestCase):
             module.__name__
 
 
+class LazyFinderTests(unittest.TestCase):
+
+    def setUp(self):
+        # pkg/__init__.py, pkg/sub.py and mod.py; each module records its
+        # execution in the builtins module.
+        self.executed = []
+        self.enterContext(test_util.uncache('lazy_finder_pkg',
+                                            'lazy_finder_pkg.sub',
+                                            'lazy_finder_mod'))
+        self.addCleanup(delattr, builtins, 'lazy_finder_executed')
+        builtins.lazy_finder_executed = self.executed
+        tmp_dir = self.enterContext(support.temp_dir())
+        os.mkdir(os.path.join(tmp_dir, 'lazy_finder_pkg'))
+        for name in ('lazy_finder_pkg/__init__', 'lazy_finder_pkg/sub',
+                     'lazy_finder_mod'):
+            with open(os.path.join(tmp_dir, name + '.py'), 'w') as file:
+                file.write('lazy_finder_executed.append(__name__)\n'
+                           'attr = 42\n')
+        self.enterContext(support.DirsOnSysPath(tmp_dir))
+        importlib.invalidate_caches()
+
+    def enterContext(self, cm):
+        result = cm.__enter__()
+        self.addCleanup(cm.__exit__, None, None, None)
+        return result
+
+    def test_lazy(self):
+        with util.LazyFinder() as finder:
+            self.assertIs(sys.meta_path[0], finder)
+            import lazy_finder_mod
+            self.assertEqual(self.executed, [])
+            self.assertIsInstance(lazy_finder_mod, util._LazyModule)
+            # Importing it again doesn't load it either
+            import lazy_finder_mod
+            self.assertEqual(self.executed, [])
+        self.assertNotIn(finder, sys.meta_path)
+        self.assertEqual(lazy_finder_mod.attr, 42)
+        self.assertEqual(self.executed, ['lazy_finder_mod'])
+        self.assertIs(type(lazy_finder_mod), types.ModuleType)
+
+    def test_submodule(self):
+        with util.LazyFinder():
+            import lazy_finder_pkg.sub
+            # The parent package must be loaded to find its submodule
+            self.assertEqual(self.executed, ['lazy_finder_pkg'])
+            self.assertEqual(lazy_finder_pkg.sub.attr, 42)
+        self.assertEqual(self.executed, ['lazy_finder_pkg',
+                                         'lazy_finder_pkg.sub'])
+
+    def test_packages(self):
+        with util.LazyFinder(packages=['lazy_finder_pkg']) as finder:
+            self.assertTrue(finder.is_lazy('lazy_finder_pkg'))
+            self.assertTrue(finder.is_lazy('lazy_finder_pkg.sub'))
+            self.assertFalse(finder.is_lazy('lazy_finder_pkg_2'))
+            import lazy_finder_mod
+            import lazy_finder_pkg
+            self.assertEqual(self.executed, ['lazy_finder_mod'])
+
+    def test_exclude(self):
+        with util.LazyFinder(exclude=['lazy_finder_pkg.sub']) as finder:
+            self.assertTrue(finder.is_lazy('lazy_finder_pkg'))
+            self.assertFalse(finder.is_lazy('lazy_finder_pkg.sub'))
+            self.assertFalse(finder.is_lazy('lazy_finder_pkg.sub.x'))
+            import lazy_finder_pkg.sub
+            self.assertEqual(self.executed, ['lazy_finder_pkg',
+                                             'lazy_finder_pkg.sub'])
+            import lazy_finder_mod
+            self.assertEqual(len(self.executed), 2)
+
+    def test_not_lazy(self):
+        # Built-in and extension modules are executed when created
+        with util.LazyFinder():
+            with test_util.uncache('_testcapi'):
+                import _testcapi
+                self.assertIs(type(_testcapi), types.ModuleType)
+            self.assertIsNone(util.LazyFinder().find_spec('nonexistent',
+                                                          None))
+
+    def test_install(self):
+        finder = util.LazyFinder()
+        finder.install()
+        try:
+            finder.install()
+            self.assertEqual(sys.meta_path.count(finder), 1)
+            import lazy_finder_mod
+            self.assertEqual(self.executed, [])
+        finally:
+            finder.uninstall()
+        self.assertNotIn(finder, sys.meta_path)
+        finder.uninstall()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -265,6 +265,42 @@ class BugsTestCase(unittest.TestCase):
             finally:
                 support.unlink(support.TESTFN)
 
+    def test_load_file_modes(self):
+        # marshal.load() must see unflushed writes and leave the file
+        # positioned after the object, however the file is buffered.
+        data = (1, 'abc', b'def' * 1000, 1.0)
+        self.addCleanup(support.unlink, support.TESTFN)
+        for buffering in (0, -1):
+            with open(support.TESTFN, 'w+b', buffering=buffering) as f:
+                f.write(b'head')
+                marshal.dump(data, f)
+                end = f.tell()
+                f.write(b'tail')
+                f.seek(4)
+                self.assertEqual(marshal.load(f), data)
+                self.assertEqual(f.tell(), end)
+                self.assertEqual(f.read(), b'tail')
+                self.assertRaises(EOFError, marshal.load, f)
+
+    def test_load_compressed_file(self):
+        # The fileno() of a compressed file is not where its data comes
+        # from: it must not be read through a mapping.
+        data = (1, 'abc', b'def' * 1000, 1.0)
+        self.addCleanup(support.unlink, support.TESTFN)
+        for name in ('gzip', 'bz2'):
+            with self.subTest(module=name):
+                try:
+                    module = __import__(name)
+                except ImportError:
+                    continue
+                with module.open(support.TESTFN, 'wb') as f:
+                    marshal.dump(data, f)
+                    marshal.dump(data[1], f)
+                with module.open(support.TESTFN, 'rb') as f:
+                    self.assertEqual(marshal.load(f), data)
+                    self.assertEqual(marshal.load(f), data[1])
+                    self.assertRaises(EOFError, marshal.load, f)
+
     def test_loads_reject_unicode_strings(self):
         # Issue #14177: marshal.loads() should not accept unicode strings
         unicode_string = 'T'
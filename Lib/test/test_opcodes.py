@@ -103,6 +103,122 @@ class OpcodeTest(unittest.TestCase):
                 return 42
         self.assertEqual(MyString() % 3, 42)
 
+    def test_load_global_cache_invalidation(self):
+        # LOAD_GLOBAL caches its result once the code object is hot; the
+        # cache must notice changes to both the globals and the builtins.
+        import builtins
+        ns = {}
+        exec('def f():\n    return (x, len)\n', ns)
+        f = ns['f']
+        ns['x'] = 1
+        for i in range(2000):
+            self.assertEqual(f(), (1, len))
+        ns['x'] = 2
+        self.assertEqual(f(), (2, len))
+        ns['len'] = 3
+        self.assertEqual(f(), (2, 3))
+        del ns['len']
+        self.assertEqual(f(), (2, len))
+        del ns['x']
+        self.assertRaises(NameError, f)
+        ns['x'] = 4
+        orig_len = builtins.len
+        try:
+            builtins.len = 5
+            result = f()
+        finally:
+            builtins.len = orig_len
+        self.assertEqual(result, (4, 5))
+        self.assertEqual(f(), (4, len))
+
+        # The same code object run with other globals must not reuse
+        # the cached values.
+        g = type(f)(f.__code__, {'x': 6, '__builtins__': builtins})
+        self.assertEqual(g(), (6, len))
+        self.assertEqual(f(), (4, len))
+
+    def test_method_call(self):
+        class A:
+            def meth(self, *args):
+                return ('meth', self, args)
+        a = A()
+        self.assertEqual(a.meth(), ('meth', a, ()))
+        self.assertEqual(a.meth(1, 2), ('meth', a, (1, 2)))
+        # an instance attribute shadows the method
+        a.meth = lambda *args: ('attr', args)
+        self.assertEqual(a.meth(1), ('attr', (1,)))
+        del a.meth
+        # builtin methods, static methods and class methods
+        l = []
+        l.append(1)
+        self.assertEqual(l, [1])
+        class B:
+            s = staticmethod(lambda *args: args)
+            c = classmethod(lambda *args: args)
+        self.assertEqual(B().s(1), (1,))
+        self.assertEqual(B().c(1), (B, 1))
+        # errors propagate from both the lookup and the call
+        self.assertRaises(AttributeError, lambda: a.missing())
+        self.assertRaises(TypeError, lambda: a.meth(x=1))
+
+    def test_load_attr_cache_invalidation(self):
+        # LOAD_ATTR and LOAD_METHOD cache lookups using the type version
+        # tag; run the code often enough for the cache to kick in, then
+        # check that changes to the class and the instance are noticed.
+        class A:
+            def __init__(self):
+                self.x = 1
+            def meth(self):
+                return 'meth'
+        class S:
+            __slots__ = ('x',)
+
+        def get_x(obj):
+            return obj.x
+        def call_meth(obj):
+            return obj.meth()
+
+        a = A()
+        s = S()
+        s.x = 2
+        for i in range(2000):
+            self.assertEqual(get_x(a), 1)
+            self.assertEqual(call_meth(a), 'meth')
+        self.assertEqual(get_x(s), 2)
+        for i in range(2000):
+            self.assertEqual(get_x(s), 2)
+        del s.x
+        self.assertRaises(AttributeError, get_x, s)
+
+        a.x = 3
+        self.assertEqual(get_x(a), 3)
+        b = A()
+        b.y = 4
+        del b.x
+        self.assertRaises(AttributeError, get_x, b)
+        b.x = 5
+        self.assertEqual(get_x(b), 5)
+
+        # A data descriptor added to the class takes precedence over the
+        # instance dict
+        A.x = property(lambda self: 'prop')
+        self.assertEqual(get_x(a), 'prop')
+        del A.x
+        self.assertEqual(get_x(a), 3)
+
+        A.meth = lambda self: 'new meth'
+        self.assertEqual(call_meth(a), 'new meth')
+        a.meth = lambda: 'instance'
+        self.assertEqual(call_meth(a), 'instance')
+        del a.meth
+        self.assertEqual(call_meth(a), 'new meth')
+
+        class B(A):
+            pass
+        self.assertEqual(call_meth(B()), 'new meth')
+        A.meth = lambda self: 'newer meth'
+        self.assertEqual(call_meth(B()), 'newer meth')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -186,6 +186,34 @@ class FileTests(unittest.TestCase):
             self.assertEqual(fobj.read().splitlines(),
                 [b"bacon", b"eggs", b"spam"])
 
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'),
+                         'test needs os.copy_file_range()')
+    def test_copy_file_range(self):
+        TESTFN2 = support.TESTFN + '.3'
+        self.addCleanup(support.unlink, support.TESTFN)
+        self.addCleanup(support.unlink, TESTFN2)
+        create_file(support.TESTFN, b'spam and eggs')
+        self.assertRaises(ValueError, os.copy_file_range, 0, 1, -1)
+        with open(support.TESTFN, 'rb') as src, open(TESTFN2, 'w+b') as dst:
+            try:
+                n = os.copy_file_range(src.fileno(), dst.fileno(), 4)
+            except OSError as e:
+                # The kernel or the filesystem may not support it
+                self.skipTest(e)
+            self.assertEqual(n, 4)
+            # Both file positions were updated
+            self.assertEqual(src.tell(), 4)
+            self.assertEqual(dst.tell(), 4)
+            # Explicit offsets leave the file positions alone
+            n = os.copy_file_range(src.fileno(), dst.fileno(), 100,
+                                   offset_src=9, offset_dst=4)
+            self.assertEqual(n, 4)
+            self.assertEqual(src.tell(), 4)
+            self.assertEqual(os.copy_file_range(src.fileno(), dst.fileno(),
+                                                100, offset_src=13), 0)
+            dst.seek(0)
+            self.assertEqual(dst.read(), b'spameggs')
+
     def write_windows_console(self, *args):
         retcode = subprocess.call(args,
             # use a new console to not flood the test output
@@ -3043,6 +3071,31 @@ class TestScandir(unittest.TestCase):
         self.assertEqual(entry.path,
                          os.fsencode(os.path.join(self.path, 'file.txt')))
 
+    @unittest.skipUnless(os.scandir in os.supports_fd,
+                         'fd support for scandir required for this test.')
+    def test_fd(self):
+        self.create_file("file.txt")
+        os.mkdir(os.path.join(self.path, "dir"))
+        fd = os.open(self.path, os.O_RDONLY)
+        self.addCleanup(os.close, fd)
+        for _ in range(2):
+            # The file descriptor is left open and can be reused
+            with os.scandir(fd) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+            self.assertEqual([entry.name for entry in entries],
+                             ['dir', 'file.txt'])
+            self.assertEqual([entry.path for entry in entries],
+                             ['dir', 'file.txt'])
+            dirent, fileent = entries
+            self.assertTrue(dirent.is_dir())
+            self.assertFalse(fileent.is_dir(follow_symlinks=False))
+            # stat() is relative to the directory, not the current one
+            self.assertEqual(fileent.stat(follow_symlinks=False),
+                             os.stat('file.txt', dir_fd=fd,
+                                     follow_symlinks=False))
+            self.assertEqual(fileent.stat().st_size, 6)
+        os.fstat(fd)
+
     def test_empty_path(self):
         self.assertRaises(FileNotFoundError, os.scandir, '')
 
@@ -3058,8 +3111,14 @@ class TestScandir(unittest.TestCase):
         self.assertEqual(len(entries2), 0, entries2)
 
     def test_bad_path_type(self):
-        for obj in [1234, 1.234, {}, []]:
+        for obj in [1.234, {}, []]:
             self.assertRaises(TypeError, os.scandir, obj)
+        if os.scandir in os.supports_fd:
+            fd = os.open(self.create_file(), os.O_RDONLY)
+            self.addCleanup(os.close, fd)
+            self.assertRaises(NotADirectoryError, os.scandir, fd)
+        else:
+            self.assertRaises(TypeError, os.scandir, 1234)
 
     def test_close(self):
         self.create_file("file.txt")
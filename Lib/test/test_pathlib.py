@@ -8,6 +8,7 @@ import socket
 import stat
 import tempfile
 import unittest
+from unittest import mock
 
 from test import support
 TESTFN = support.TESTFN
@@ -1415,6 +1416,21 @@ class _BasePathTest(object):
         self.assertIn(cm.exception.errno, (errno.ENOTDIR,
                                            errno.ENOENT, errno.EINVAL))
 
+    def test_iterdir_modified(self):
+        # Entries renamed during the iteration are not returned again
+        P = self.cls
+        p = P(BASE, 'dirRename')
+        p.mkdir()
+        for i in range(3000):
+            (p / ('f%d' % i)).touch()
+        paths = []
+        for q in p.iterdir():
+            paths.append(q)
+            q.rename(q.with_name(q.name + '.renamed'))
+        self.assertEqual(len(paths), 3000)
+        self.assertEqual(set(paths),
+                         { P(p, 'f%d' % i) for i in range(3000) })
+
     def test_glob_common(self):
         def _check(glob, expected):
             self.assertEqual(set(glob), { P(BASE, q) for q in expected })
@@ -1485,6 +1501,29 @@ class _BasePathTest(object):
         self.assertEqual(set(p.glob("dirA/../file*")), { P(BASE, "dirA/../fileA") })
         self.assertEqual(set(p.glob("../xyzzy")), set())
 
+    def test_glob_no_stat(self):
+        # Wildcards are matched using the file types reported by
+        # os.scandir(): only the starting directory is stat()ed.
+        P = self.cls
+        p = P(BASE)
+        calls = []
+        real_stat = pathlib._NormalAccessor.stat
+        def stat(path):
+            calls.append(path)
+            return real_stat(path)
+        with mock.patch.object(pathlib._NormalAccessor, 'stat',
+                               staticmethod(stat)):
+            self.assertEqual(set(p.rglob("file*")),
+                             { P(BASE, q) for q in ["fileA", "dirB/fileB",
+                                                    "dirC/fileC",
+                                                    "dirC/dirD/fileD"] })
+            self.assertEqual(calls, [p])
+            del calls[:]
+            self.assertEqual(set(p.glob("dir*/file*")),
+                             { P(BASE, q) for q in ["dirB/fileB",
+                                                    "dirC/fileC"] })
+            self.assertEqual(calls, [p])
+
 
     def _check_resolve(self, p, expected):
         q = p.resolve()
@@ -0,0 +1,152 @@
+"""Test suite for the sampleprof module."""
+
+import pstats
+import signal
+import threading
+import time
+import unittest
+from test import support
+from test.support.script_helper import assert_python_ok
+
+import sampleprof
+
+
+def spin(profiler, samples):
+    # Run until the profiler took enough samples (or give up after a while)
+    deadline = time.monotonic() + 30
+    while profiler.samples < samples and time.monotonic() < deadline:
+        sum(range(1000))
+
+
+def wait_for(event):
+    event.wait()
+
+
+class SampleProfTest(unittest.TestCase):
+
+    def tearDown(self):
+        support.unlink(support.TESTFN)
+
+    def test_arguments(self):
+        self.assertRaises(ValueError, sampleprof.Profile, 0)
+        self.assertRaises(ValueError, sampleprof.Profile, -1.0)
+        self.assertRaises(ValueError, sampleprof.Profile, clock='cycles')
+
+    def test_wall_clock(self):
+        prof = sampleprof.Profile(0.001)
+        event = threading.Event()
+        thread = threading.Thread(target=wait_for, args=(event,))
+        thread.start()
+        try:
+            with prof:
+                self.assertTrue(prof.enabled)
+                spin(prof, 50)
+        finally:
+            event.set()
+            thread.join()
+        self.assertFalse(prof.enabled)
+        stats = pstats.Stats(prof).stats
+        funcs = {func[2]: func for func in stats}
+        # Both the running and the waiting threads were sampled
+        self.assertIn('spin', funcs)
+        self.assertIn('wait_for', funcs)
+        cc, nc, tt, ct, callers = stats[funcs['spin']]
+        self.assertGreater(nc, 0)
+        self.assertGreater(ct, 0)
+        self.assertLessEqual(tt, ct)
+        self.assertIn(funcs['test_wall_clock'], callers)
+        # Sampling stopped
+        samples = prof.samples
+        time.sleep(0.01)
+        self.assertEqual(prof.samples, samples)
+
+    def test_all_threads(self):
+        prof = sampleprof.Profile(0.001, all_threads=False)
+        event = threading.Event()
+        thread = threading.Thread(target=wait_for, args=(event,))
+        thread.start()
+        try:
+            prof.runcall(spin, prof, 20)
+        finally:
+            event.set()
+            thread.join()
+        prof.create_stats()
+        funcs = {func[2] for func in prof.stats}
+        self.assertIn('spin', funcs)
+        self.assertNotIn('wait_for', funcs)
+
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), 'requires setitimer()')
+    def test_cpu_clock(self):
+        handler = signal.getsignal(signal.SIGPROF)
+        prof = sampleprof.Profile(0.001, clock='cpu')
+        prof.runcall(spin, prof, 20)
+        self.assertIs(signal.getsignal(signal.SIGPROF), handler)
+        self.assertEqual(signal.getitimer(signal.ITIMER_PROF), (0.0, 0.0))
+        prof.create_stats()
+        funcs = {func[2] for func in prof.stats}
+        self.assertIn('spin', funcs)
+        self.assertNotIn('_sample_signal', funcs)
+
+    def test_snapshot_stats(self):
+        prof = sampleprof.Profile()
+        f = ('f.py', 1, 'f')
+        g = ('g.py', 2, 'g')
+        prof._stacks = {(f, g, f): [2, 0.25], (f,): [1, 0.5]}
+        prof.create_stats()
+        # A recursive function counts once per sample
+        self.assertEqual(prof.stats[f], (3, 3, 0.75, 0.75, {g: (2, 2, 0.25,
+                                                                0.25)}))
+        self.assertEqual(prof.stats[g], (2, 2, 0.0, 0.25, {f: (2, 2, 0.0,
+                                                               0.25)}))
+        prof.clear()
+        prof.create_stats()
+        self.assertEqual(prof.stats, {})
+
+    def test_dump_stats(self):
+        prof = sampleprof.Profile(0.001)
+        prof.runcall(spin, prof, 10)
+        prof.dump_stats(support.TESTFN)
+        stats = pstats.Stats(support.TESTFN)
+        self.assertIn('spin', {func[2] for func in stats.stats})
+
+    def test_dump_collapsed(self):
+        prof = sampleprof.Profile(0.001)
+        prof.runcall(spin, prof, 10)
+        prof.dump_collapsed(support.TESTFN)
+        with open(support.TESTFN, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        total = 0
+        leaves = set()
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            frames = stack.split(';')
+            for frame in frames:
+                self.assertRegex(frame, r'^\S+ \(.*:\d+\)$')
+            leaves.add(frames[-1].split()[0])
+            total += int(count)
+        self.assertEqual(total, prof.samples)
+        self.assertIn('spin', leaves)
+
+    def test_main(self):
+        with open(support.TESTFN, 'w') as f:
+            f.write('import time\n'
+                    'def busy():\n'
+                    '    t = time.monotonic()\n'
+                    '    while time.monotonic() - t < 0.2:\n'
+                    '        pass\n'
+                    'busy()\n')
+        collapsed = support.TESTFN + '.txt'
+        self.addCleanup(support.unlink, collapsed)
+        assert_python_ok('-m', 'sampleprof', '-i', '0.001', '-f', collapsed,
+                         support.TESTFN)
+        with open(collapsed, encoding='utf-8') as f:
+            self.assertIn('busy (', f.read())
+        rc, out, err = assert_python_ok('-m', 'sampleprof', '-s', 'tottime',
+                                        '-i', '0.001', support.TESTFN)
+        self.assertIn(b'(busy)', out)
+        self.assertIn(b'Ordered by: internal time', out)
+
+
+if __name__ == "__main__":
+    unittest.main()
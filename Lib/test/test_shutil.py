@@ -10,6 +10,7 @@ import os
 import os.path
 import errno
 import functools
+import io
 import subprocess
 from contextlib import ExitStack
 from shutil import (make_archive,
@@ -1812,6 +1813,232 @@ class TestCopyFile(unittest.TestCase):
         finally:
             os.rmdir(dst_dir)
 
+@unittest.skipUnless(shutil._USE_CP_COPY_FILE_RANGE or shutil._USE_CP_SENDFILE,
+                     'requires os.copy_file_range() or os.sendfile() on Linux')
+class TestZeroCopy(unittest.TestCase):
+    FILEDATA = b'0123456789' * 200000  # 2 MB
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.tmpdir)
+        self.src = os.path.join(self.tmpdir, 'src')
+        self.dst = os.path.join(self.tmpdir, 'dst')
+        write_file(self.src, self.FILEDATA, binary=True)
+        # Each test may disable the fast paths, as happens on old kernels
+        self.addCleanup(setattr, shutil, '_USE_CP_COPY_FILE_RANGE',
+                        shutil._USE_CP_COPY_FILE_RANGE)
+        self.addCleanup(setattr, shutil, '_USE_CP_SENDFILE',
+                        shutil._USE_CP_SENDFILE)
+
+    def assert_copied(self):
+        self.assertEqual(read_file(self.dst, binary=True), self.FILEDATA)
+
+    def fail_with(self, err):
+        def func(*args, **kwargs):
+            raise OSError(err, os.strerror(err))
+        return func
+
+    def test_copyfile(self):
+        with unittest.mock.patch('shutil.copyfileobj') as m:
+            shutil.copyfile(self.src, self.dst)
+        self.assertFalse(m.called)
+        self.assert_copied()
+
+    def test_copy_and_copytree(self):
+        with unittest.mock.patch('shutil.copyfileobj') as m:
+            shutil.copy(self.src, self.dst)
+            self.assert_copied()
+            os.mkdir(os.path.join(self.tmpdir, 'tree'))
+            os.rename(self.dst, os.path.join(self.tmpdir, 'tree', 'file'))
+            shutil.copytree(os.path.join(self.tmpdir, 'tree'),
+                            os.path.join(self.tmpdir, 'tree2'))
+        self.assertFalse(m.called)
+        self.assertEqual(read_file((self.tmpdir, 'tree2', 'file'),
+                                   binary=True), self.FILEDATA)
+
+    def test_empty_file(self):
+        write_file(self.src, b'', binary=True)
+        shutil.copyfile(self.src, self.dst)
+        self.assertEqual(read_file(self.dst, binary=True), b'')
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'),
+                         'requires os.copy_file_range()')
+    def test_copy_file_range_unsupported(self):
+        # ENOSYS disables copy_file_range() for good
+        with unittest.mock.patch('os.copy_file_range',
+                                 self.fail_with(errno.ENOSYS)):
+            shutil.copyfile(self.src, self.dst)
+        self.assert_copied()
+        self.assertFalse(shutil._USE_CP_COPY_FILE_RANGE)
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'),
+                         'requires os.copy_file_range()')
+    def test_copy_file_range_exdev(self):
+        # Other errors only fall back for the current file
+        with unittest.mock.patch('os.copy_file_range',
+                                 self.fail_with(errno.EXDEV)):
+            shutil.copyfile(self.src, self.dst)
+        self.assert_copied()
+        self.assertTrue(shutil._USE_CP_COPY_FILE_RANGE)
+
+    def test_fallback_to_copyfileobj(self):
+        with ExitStack() as stack:
+            if hasattr(os, 'copy_file_range'):
+                stack.enter_context(unittest.mock.patch(
+                    'os.copy_file_range', self.fail_with(errno.EINVAL)))
+            if hasattr(os, 'sendfile'):
+                stack.enter_context(unittest.mock.patch(
+                    'os.sendfile', self.fail_with(errno.ENOTSOCK)))
+            shutil.copyfile(self.src, self.dst)
+        self.assert_copied()
+        self.assertFalse(shutil._USE_CP_SENDFILE)
+
+    def test_zero_size_special_file(self):
+        # A copy function copying nothing at the start of the file is not
+        # trusted (files in /proc report a size of zero).
+        with ExitStack() as stack:
+            if hasattr(os, 'copy_file_range'):
+                stack.enter_context(unittest.mock.patch(
+                    'os.copy_file_range', return_value=0))
+            if hasattr(os, 'sendfile'):
+                stack.enter_context(unittest.mock.patch(
+                    'os.sendfile', return_value=0))
+            shutil.copyfile(self.src, self.dst)
+        self.assert_copied()
+
+    def test_error_after_partial_copy(self):
+        def copy_func(infd, outfd, offset, count):
+            if offset:
+                raise OSError(errno.EIO, os.strerror(errno.EIO))
+            return os.write(outfd, os.read(infd, 1000))
+        with open(self.src, 'rb') as fsrc, open(self.dst, 'wb') as fdst:
+            with self.assertRaises(OSError) as cm:
+                shutil._fastcopy(fsrc, fdst, copy_func)
+        self.assertEqual(cm.exception.errno, errno.EIO)
+        self.assertEqual(cm.exception.filename, self.src)
+        self.assertEqual(cm.exception.filename2, self.dst)
+
+    def test_disk_full(self):
+        with open(self.src, 'rb') as fsrc, open(self.dst, 'wb') as fdst:
+            with self.assertRaises(OSError) as cm:
+                shutil._fastcopy(fsrc, fdst, self.fail_with(errno.ENOSPC))
+        self.assertEqual(cm.exception.errno, errno.ENOSPC)
+
+    def test_copy_func_offset(self):
+        # Both copy functions read from the given offset without moving the
+        # position of the source file, and append to the destination file.
+        funcs = []
+        if hasattr(os, 'copy_file_range'):
+            funcs.append(shutil._copy_file_range)
+        if hasattr(os, 'sendfile'):
+            funcs.append(shutil._sendfile)
+        for func in funcs:
+            with self.subTest(func=func.__name__):
+                with open(self.src, 'rb') as fsrc, \
+                     open(self.dst, 'wb') as fdst:
+                    infd, outfd = fsrc.fileno(), fdst.fileno()
+                    try:
+                        self.assertEqual(func(infd, outfd, 10, 5), 5)
+                        self.assertEqual(func(infd, outfd, 20, 5), 5)
+                    except OSError as err:
+                        self.skipTest('%s() failed: %s' % (func.__name__, err))
+                    self.assertEqual(os.lseek(infd, 0, os.SEEK_CUR), 0)
+                self.assertEqual(read_file(self.dst, binary=True),
+                                 self.FILEDATA[10:15] + self.FILEDATA[20:25])
+
+    def test_non_regular_file(self):
+        with self.assertRaises(shutil._GiveupOnFastCopy):
+            shutil._fastcopy(io.BytesIO(self.FILEDATA), io.BytesIO(),
+                             shutil._sendfile)
+
+
+class TestParallelTree(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.tmp_dir)
+        self.src_dir = os.path.join(self.tmp_dir, 'src')
+        os.mkdir(self.src_dir)
+        for i in range(3):
+            sub_dir = os.path.join(self.src_dir, 'dir%d' % i)
+            os.mkdir(sub_dir)
+            os.mkdir(os.path.join(sub_dir, 'empty'))
+            for j in range(10):
+                write_file((sub_dir, 'file%d' % j), str(i * j))
+            write_file((self.src_dir, 'file%d' % i), str(i))
+        os.utime(os.path.join(self.src_dir, 'dir1'), (12345, 12345))
+
+    def test_copytree(self):
+        dst_dir = os.path.join(self.tmp_dir, 'dst')
+        shutil.copytree(self.src_dir, dst_dir, workers=4)
+        self.assertEqual(rlistdir(dst_dir), rlistdir(self.src_dir))
+        self.assertEqual(read_file((dst_dir, 'dir2', 'file7')), '14')
+        # The metadata of a directory is copied after its contents
+        self.assertEqual(os.stat(os.path.join(dst_dir, 'dir1')).st_mtime,
+                         12345)
+
+    def test_copytree_errors(self):
+        def copy_function(src, dst):
+            if src.endswith(('3', '5')):
+                raise OSError(errno.EIO, 'fake error', src)
+            return shutil.copy2(src, dst)
+
+        errors = []
+        for workers in (None, 4):
+            dst_dir = os.path.join(self.tmp_dir, 'dst%s' % workers)
+            with self.assertRaises(shutil.Error) as cm:
+                shutil.copytree(self.src_dir, dst_dir,
+                                copy_function=copy_function, workers=workers)
+            errors.append([(os.path.relpath(src, self.src_dir),
+                            os.path.relpath(dst, dst_dir), msg)
+                           for src, dst, msg in cm.exception.args[0]])
+        self.assertEqual(len(errors[0]), 6)
+        self.assertEqual(errors[1], errors[0])
+
+    def test_rmtree(self):
+        shutil.rmtree(self.src_dir, workers=4)
+        self.assertFalse(os.path.exists(self.src_dir))
+
+    def test_rmtree_errors(self):
+        real_unlink = os.unlink
+        def unlink(path, *args, **kwargs):
+            if path.endswith(('3', '5')):
+                raise OSError(errno.EIO, 'fake error', path)
+            return real_unlink(path, *args, **kwargs)
+
+        failed = []
+        def onerror(func, path, exc_info):
+            self.assertIsInstance(exc_info[1], OSError)
+            failed.append((func, os.path.relpath(path, self.src_dir)))
+
+        with support.swap_attr(os, 'unlink', unlink):
+            shutil.rmtree(self.src_dir, onerror=onerror, workers=4)
+        unlinked = [path for func, path in failed if func is unlink]
+        self.assertEqual(sorted(unlinked),
+                         [os.path.join('dir%d' % i, 'file%d' % j)
+                          for i in range(3) for j in (3, 5)])
+        # The errors of a directory are reported before the directory itself
+        # fails to be removed.
+        for i in range(3):
+            sub_dir = 'dir%d' % i
+            for j in (3, 5):
+                self.assertLess(failed.index((unlink, os.path.join(
+                                    sub_dir, 'file%d' % j))),
+                                failed.index((os.rmdir, sub_dir)))
+        self.assertEqual(failed[-1], (os.rmdir, '.'))
+        self.assertEqual(rlistdir(self.src_dir),
+                         ['dir0/', 'dir0/file3', 'dir0/file5',
+                          'dir1/', 'dir1/file3', 'dir1/file5',
+                          'dir2/', 'dir2/file3', 'dir2/file5'])
+
+    def test_bad_workers(self):
+        dst_dir = os.path.join(self.tmp_dir, 'dst')
+        self.assertRaises(ValueError, shutil.copytree, self.src_dir, dst_dir,
+                          workers=0)
+        self.assertFalse(os.path.exists(dst_dir))
+        self.assertRaises(ValueError, shutil.rmtree, self.src_dir, workers=0)
+        self.assertTrue(os.path.exists(self.src_dir))
+
 class TermsizeTests(unittest.TestCase):
     def test_does_not_crash(self):
         """Check if get_terminal_size() returns a meaningful value.
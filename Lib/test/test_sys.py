@@ -10,6 +10,7 @@ import codecs
 import gc
 import sysconfig
 import platform
+import re
 
 # count the number of test runs, used to create unique
 # strings to intern in test_intern()
@@ -770,10 +771,51 @@ class SysModuleTest(unittest.TestCase):
         args = ['-c', 'import sys; sys._debugmallocstats()']
         ret, out, err = assert_python_ok(*args)
         self.assertIn(b"free PyDictObjects", err)
+        if sysconfig.get_config_var('WITH_PYMALLOC'):
+            self.assertIn(b"released pools", err)
+            self.assertIn(b"Fragmentation", err)
 
         # The function has no parameter
         self.assertRaises(TypeError, sys._debugmallocstats, True)
 
+    @test.support.cpython_only
+    @unittest.skipUnless(sysconfig.get_config_var('WITH_PYMALLOC'),
+                         'requires pymalloc')
+    @unittest.skipIf(sys.platform == 'win32',
+                     'pools are only released from mmap()ed arenas')
+    def test_debugmallocstats_released_pools(self):
+        # Freeing most of the small objects of the arenas, but not all,
+        # gives the pages of their empty pools back to the system, and
+        # allocating again reuses those pools.  The debug hooks check the
+        # blocks of the reused pools.
+        code = textwrap.dedent("""
+            import sys
+            def stats(when):
+                print(when, file=sys.stderr, flush=True)
+                sys._debugmallocstats()
+            n = 200000
+            a = ['%08d' % i for i in range(n)]
+            stats('allocated')
+            keep = a[::1000]
+            del a
+            stats('freed')
+            b = ['%08d' % i for i in range(n)]
+            stats('reallocated')
+            assert all(s == '%08d' % i for i, s in enumerate(b))
+            assert all(s == '%08d' % (i * 1000) for i, s in enumerate(keep))
+            del b, keep
+        """)
+        rc, out, err = assert_python_ok('-c', code,
+                                        PYTHONMALLOC='pymalloc_debug')
+        released = {}
+        for when in (b'allocated', b'freed', b'reallocated'):
+            m = re.search(when + br'\n.*?^(\d+) released pools', err,
+                          re.MULTILINE | re.DOTALL)
+            self.assertIsNotNone(m, when)
+            released[when] = int(m.group(1))
+        self.assertGreater(released[b'freed'], released[b'allocated'])
+        self.assertLess(released[b'reallocated'], released[b'freed'])
+
     @unittest.skipUnless(hasattr(sys, "getallocatedblocks"),
                          "sys.getallocatedblocks unavailable on this build")
     def test_getallocatedblocks(self):
@@ -912,13 +954,13 @@ class SizeofTest(unittest.TestCase):
             return inner
         check(get_cell().__closure__[0], size('P'))
         # code
-        check(get_cell().__code__, size('5i9Pi3P'))
-        check(get_cell.__code__, size('5i9Pi3P'))
+        check(get_cell().__code__, size('5i9Pi4P2PiB'))
+        check(get_cell.__code__, size('5i9Pi4P2PiB'))
         def get_cell2(x):
             def inner():
                 return x
             return inner
-        check(get_cell2.__code__, size('5i9Pi3P') + 1)
+        check(get_cell2.__code__, size('5i9Pi4P2PiB') + 1)
         # complex
         check(complex(0,1), size('2d'))
         # method_descriptor (descriptor object)
@@ -936,9 +978,9 @@ class SizeofTest(unittest.TestCase):
         # method-wrapper (descriptor object)
         check({}.__iter__, size('2P'))
         # dict
-        check({}, size('n2P') + calcsize('2nPn') + 8*calcsize('n2P'))
+        check({}, size('nQ2P') + calcsize('2nP2n') + 8 + (8*2//3)*calcsize('n2P'))
         longdict = {1:1, 2:2, 3:3, 4:4, 5:5, 6:6, 7:7, 8:8}
-        check(longdict, size('n2P') + calcsize('2nPn') + 16*calcsize('n2P'))
+        check(longdict, size('nQ2P') + calcsize('2nP2n') + 16 + (16*2//3)*calcsize('n2P'))
         # dictionary-keyview
         check({}.keys(), size('P'))
         # dictionary-valueview
@@ -1096,13 +1138,13 @@ class SizeofTest(unittest.TestCase):
                   '10P'                 # PySequenceMethods
                   '2P'                  # PyBufferProcs
                   '4P')
-        # Separate block for PyDictKeysObject with 4 entries
-        s += calcsize("2nPn") + 4*calcsize("n2P")
+        # Separate block for PyDictKeysObject with 8 keys and 5 entries
+        s += calcsize("2nP2n") + 8 + 5*calcsize("n2P")
         # class
         class newstyleclass(object): pass
         check(newstyleclass, s)
         # dict with shared keys
-        check(newstyleclass().__dict__, size('n2P' + '2nPn'))
+        check(newstyleclass().__dict__, size('nQ2P') + 5*self.P)
         # unicode
         # each tuple contains a string and its expected character size
         # don't put any static strings here, as they may contain
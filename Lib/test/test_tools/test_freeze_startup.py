@@ -0,0 +1,67 @@
+"""Tests for the freeze_startup script in the Tools/freeze directory."""
+
+import os
+import unittest
+
+from test import support
+from test.test_tools import skip_if_missing, toolsdir
+
+skip_if_missing()
+
+
+class FreezeStartupTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with support.DirsOnSysPath(os.path.join(toolsdir, 'freeze')):
+            import freeze_startup
+        cls.freeze_startup = freeze_startup
+
+    def tearDown(self):
+        support.unlink(support.TESTFN)
+
+    def read_header(self, *args):
+        self.freeze_startup.main(list(args) + [support.TESTFN])
+        with open(support.TESTFN) as f:
+            return f.read()
+
+    def test_startup_modules(self):
+        header = self.read_header()
+        for name in self.freeze_startup.STARTUP_MODULES:
+            symbol = self.freeze_startup.symbol(name)
+            self.assertIn('static const unsigned char %s[]' % symbol, header)
+            self.assertIn('{"%s", %s, (int)sizeof(%s)},'
+                          % (name, symbol, symbol), header)
+        self.assertFalse(os.path.exists(support.TESTFN + '.new'))
+
+    def test_no_packages(self):
+        # Frozen packages could not find their submodules on disk.
+        for name in self.freeze_startup.STARTUP_MODULES:
+            path = os.path.join(self.freeze_startup.LIBDIR,
+                                *name.split('.'))
+            self.assertFalse(os.path.isdir(path), name)
+
+    def test_makefile_sources(self):
+        # The Makefile regenerates the header when one of these changes.
+        makefile = os.path.join(self.freeze_startup.LIBDIR, os.pardir,
+                                'Makefile.pre.in')
+        if not os.path.exists(makefile):
+            self.skipTest('Makefile.pre.in not found')
+        with open(makefile) as f:
+            text = f.read()
+        start = text.index('\nFROZEN_STARTUP_SOURCES=')
+        block = text[start:text.index('\n\n', start)]
+        sources = [line.strip(' \t\\')
+                   for line in block.splitlines()[2:]]
+        expected = ['$(srcdir)/Lib/%s.py' % name.replace('.', '/')
+                    for name in self.freeze_startup.STARTUP_MODULES]
+        self.assertEqual(sources, expected)
+
+    def test_empty(self):
+        header = self.read_header('--empty')
+        self.assertIn('#define _Py_FROZEN_STARTUP_MODULES\n', header)
+        self.assertNotIn('static const unsigned char', header)
+
+
+if __name__ == '__main__':
+    unittest.main()
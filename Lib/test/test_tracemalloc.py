@@ -1,4 +1,5 @@
 import contextlib
+import math
 import os
 import sys
 import tracemalloc
@@ -180,6 +181,120 @@ class TestTracemallocEnabled(unittest.TestCase):
         domain2, size2, traceback2 = trace2
         self.assertIs(traceback2, traceback1)
 
+    def test_get_traces_cached_traceback(self):
+        # Traceback tuples are shared by consecutive calls
+        obj, obj_traceback = allocate_bytes(123)
+        trace1 = self.find_trace(tracemalloc._get_traces(), obj_traceback)
+        trace2 = self.find_trace(tracemalloc._get_traces(), obj_traceback)
+        self.assertIs(trace2[2], trace1[2])
+
+        tracemalloc.clear_traces()
+        obj, obj_traceback = allocate_bytes(123)
+        trace3 = self.find_trace(tracemalloc._get_traces(), obj_traceback)
+        self.assertEqual(trace3[2], trace1[2])
+
+    def test_iter_traces(self):
+        obj_size = 12345
+        obj, obj_traceback = allocate_bytes(obj_size)
+
+        traces = list(tracemalloc._iter_traces())
+        trace = self.find_trace(traces, obj_traceback)
+        domain, size, traceback = trace
+        self.assertEqual(size, obj_size)
+        self.assertEqual(traceback, obj_traceback._frames)
+        self.assertIs(traceback,
+                      self.find_trace(tracemalloc._get_traces(),
+                                      obj_traceback)[2])
+
+        # the iterator works on a copy of the traces, but the tracebacks
+        # are freed by clear_traces()
+        traces = tracemalloc._iter_traces()
+        next(traces)
+        tracemalloc.clear_traces()
+        with self.assertRaises(RuntimeError):
+            next(traces)
+        self.assertEqual(list(traces), [])
+
+        tracemalloc.stop()
+        self.assertEqual(list(tracemalloc._iter_traces()), [])
+
+    def test_sample_interval(self):
+        self.assertEqual(tracemalloc.get_sample_interval(), 0)
+        tracemalloc.stop()
+        self.assertRaises(ValueError, tracemalloc.start, sample_interval=-1)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        interval = 16 * 1024
+        tracemalloc.start(sample_interval=interval)
+        self.assertEqual(tracemalloc.get_sample_interval(), interval)
+        self.assertEqual(tracemalloc.get_traceback_limit(), 1)
+
+        # a memory block much larger than the interval is always traced,
+        # with its real size
+        obj_size = 1024 * 1024
+        obj, obj_traceback = allocate_bytes(obj_size)
+        trace = self.find_trace(tracemalloc._get_traces(), obj_traceback)
+        self.assertEqual(trace[1], obj_size)
+        del obj
+
+        # small memory blocks are sampled, and their total size is
+        # estimated
+        tracemalloc.clear_traces()
+        count = 5000
+        obj_size = 1000
+        objs = [allocate_bytes(obj_size)[0] for index in range(count)]
+        lineno = allocate_bytes.__code__.co_firstlineno + 4
+        total = count * obj_size
+        traces = tracemalloc._get_traces()
+        self.assertLess(len(traces), count / 2)
+        size, peak_size = tracemalloc.get_traced_memory()
+        self.assertAlmostEqual(size, total, delta=total * 0.3)
+
+        snapshot = tracemalloc.take_snapshot()
+        self.assertEqual(snapshot.sample_interval, interval)
+        for stat in snapshot.statistics('lineno'):
+            frame = stat.traceback[0]
+            if frame.filename == __file__ and frame.lineno == lineno:
+                break
+        else:
+            self.fail("statistic not found")
+        self.assertAlmostEqual(stat.size, total, delta=total * 0.3)
+        self.assertAlmostEqual(stat.count, count, delta=count * 0.3)
+
+        tracemalloc.stop()
+        tracemalloc.start()
+        self.assertEqual(tracemalloc.get_sample_interval(), 0)
+
+    def test_take_statistics(self):
+        obj_size = 12345
+        obj, obj_traceback = allocate_bytes(obj_size)
+        frame = obj_traceback[0]
+
+        stats = tracemalloc.take_statistics('lineno')
+        self.assertTrue(stats)
+        self.assertEqual(stats, sorted(stats, reverse=True,
+                                       key=tracemalloc.Statistic._sort_key))
+        stat = [stat for stat in stats if stat.traceback[0] == frame][0]
+        self.assertGreaterEqual(stat.size, obj_size)
+
+        # filters
+        filters = [tracemalloc.Filter(True, __file__, frame.lineno)]
+        stats = tracemalloc.take_statistics('filename', filters=filters)
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0].traceback[0].filename, __file__)
+        self.assertGreaterEqual(stats[0].size, obj_size)
+
+        # compare to the statistics taken before the allocation
+        del obj
+        stats2 = tracemalloc.take_statistics('filename', filters=filters)
+        diff = tracemalloc.compare_statistics(stats, stats2)
+        self.assertEqual(diff[0].traceback, stats[0].traceback)
+        self.assertLessEqual(diff[0].size_diff, -obj_size)
+
+        tracemalloc.stop()
+        with self.assertRaises(RuntimeError):
+            tracemalloc.take_statistics('lineno')
+
     def test_get_traced_memory(self):
         # Python allocates some internals objects, so the test must tolerate
         # a small difference between the expected size and the real usage
@@ -440,6 +555,40 @@ class TestSnapshot(unittest.TestCase):
             tracemalloc.StatisticDiff(tb_a_2, 30, 0, 3, 0),
         ])
 
+    def test_snapshot_sample_interval(self):
+        raw_traces = [
+            (0, 10, (('a.py', 2),)),
+            (0, 10, (('a.py', 2),)),
+            (0, 5000, (('b.py', 1),)),
+        ]
+        snapshot = tracemalloc.Snapshot(raw_traces, 1, sample_interval=1000)
+        weight10 = 1 / (1 - math.exp(-10 / 1000))
+        weight5000 = 1 / (1 - math.exp(-5000 / 1000))
+        self.assertEqual(snapshot.statistics('lineno'), [
+            tracemalloc.Statistic(traceback_lineno('b.py', 1),
+                                  round(5000 * weight5000), 1),
+            tracemalloc.Statistic(traceback_lineno('a.py', 2),
+                                  round(20 * weight10), round(2 * weight10)),
+        ])
+
+        snapshot2 = snapshot.filter_traces([])
+        self.assertEqual(snapshot2.sample_interval, 1000)
+
+        # snapshots pickled by older versions
+        del snapshot2.sample_interval
+        self.assertEqual(snapshot2.sample_interval, 0)
+        self.assertEqual(snapshot2.statistics('filename')[0],
+                         tracemalloc.Statistic(traceback_filename('b.py'),
+                                               5000, 1))
+
+    def test_compare_statistics(self):
+        snapshot, snapshot2 = create_snapshots()
+        for key_type in ('lineno', 'filename', 'traceback'):
+            stats = snapshot.statistics(key_type)
+            stats2 = snapshot2.statistics(key_type)
+            self.assertEqual(tracemalloc.compare_statistics(stats, stats2),
+                             snapshot2.compare_to(snapshot, key_type))
+
     def test_snapshot_group_by_file(self):
         snapshot, snapshot2 = create_snapshots()
         tb_0 = traceback_filename('<unknown>')
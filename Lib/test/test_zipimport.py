@@ -36,7 +36,7 @@ def make_pyc(co, mtime, size):
         else:
             mtime = int(-0x100000000 + int(mtime))
     pyc = (importlib.util.MAGIC_NUMBER +
-        struct.pack("<ii", int(mtime), size & 0xFFFFFFFF) + data)
+        struct.pack("<iii", 0, int(mtime), size & 0xFFFFFFFF) + data)
     return pyc
 
 def module_path_to_dotted_name(path):
@@ -207,6 +207,36 @@ class UncompressedZipImportTestCase(ImportHooksBaseTestCase):
         else:
             self.fail("expected ImportError; import from bad pyc")
 
+    def testUncheckedHashBasedPyc(self):
+        source = b"state = 'old'"
+        source_hash = importlib.util.source_hash(source)
+        bytecode = importlib._bootstrap_external._code_to_hash_pyc(
+            compile(source, "???", "exec"),
+            source_hash,
+            False, # unchecked
+        )
+        files = {TESTMOD + ".py": (NOW, "state = 'new'"),
+                 TESTMOD + ".pyc": (NOW - 20, bytecode)}
+        def check(mod):
+            self.assertEqual(mod.state, 'old')
+        self.doTest(None, files, TESTMOD, call=check)
+
+    def testCheckedHashBasedPyc(self):
+        # Checked hash-based pycs aren't validated inside zip files; the
+        # source is used instead.
+        source = b"state = 'old'"
+        source_hash = importlib.util.source_hash(source)
+        bytecode = importlib._bootstrap_external._code_to_hash_pyc(
+            compile(source, "???", "exec"),
+            source_hash,
+            True,
+        )
+        files = {TESTMOD + ".py": (NOW, "state = 'new'"),
+                 TESTMOD + ".pyc": (NOW - 20, bytecode)}
+        def check(mod):
+            self.assertEqual(mod.state, 'new')
+        self.doTest(None, files, TESTMOD, call=check)
+
     def testBadMTime(self):
         badtime_pyc = bytearray(test_pyc)
         # flip the second bit -- not the first as that one isn't stored in the
@@ -521,6 +551,47 @@ class UncompressedZipImportTestCase(ImportHooksBaseTestCase):
             z.close()
             os.remove(TEMP_ZIP)
 
+    def testGetDataArchiveChanged(self):
+        with ZipFile(TEMP_ZIP, "w") as z:
+            z.compression = self.compression
+            z.writestr("testdata.dat", b"some data")
+            z.writestr("empty.dat", b"")
+        self.addCleanup(support.unlink, TEMP_ZIP)
+        zi = zipimport.zipimporter(TEMP_ZIP)
+        self.assertEqual(zi.get_data("testdata.dat"), b"some data")
+        self.assertEqual(zi.get_data("empty.dat"), b"")
+        # The importer must not read a changed archive from stale memory
+        with open(TEMP_ZIP, "ab") as f:
+            f.write(b"\0" * 100)
+        self.assertEqual(zi.get_data("testdata.dat"), b"some data")
+        self.assertEqual(zi.get_data("empty.dat"), b"")
+
+    def testGetDataArchiveTruncated(self):
+        with ZipFile(TEMP_ZIP, "w") as z:
+            z.compression = self.compression
+            z.writestr("testdata.dat", b"some data" * 100)
+        self.addCleanup(support.unlink, TEMP_ZIP)
+        zi = zipimport.zipimporter(TEMP_ZIP)
+        self.assertEqual(zi.get_data("testdata.dat"), b"some data" * 100)
+        # Truncating the archive in place makes reading it fail cleanly
+        with open(TEMP_ZIP, "r+b") as f:
+            f.truncate(10)
+        with self.assertRaises((zipimport.ZipImportError, OSError,
+                                EOFError)):
+            zi.get_data("testdata.dat")
+
+    def testSharedDirectory(self):
+        with ZipFile(TEMP_ZIP, "w") as z:
+            z.writestr("sub/testdata.dat", b"some data")
+        self.addCleanup(support.unlink, TEMP_ZIP)
+        zi = zipimport.zipimporter(TEMP_ZIP)
+        zi2 = zipimport.zipimporter(os.path.join(TEMP_ZIP, "sub"))
+        files = zipimport._zip_directory_cache[TEMP_ZIP]
+        self.assertIsInstance(files, dict)
+        self.assertIs(zi._files, files)
+        self.assertIs(zi2._files, files)
+        self.assertEqual(list(files), [os.path.join("sub", "testdata.dat")])
+
     def testImporterAttr(self):
         src = """if 1:  # indent hack
         def get_file():
@@ -2,12 +2,13 @@ from collections import Sequence, Iterable
 from functools import total_ordering
 import fnmatch
 import linecache
+import math
 import os.path
 import pickle
 
 # Import types and functions implemented in C
 from _tracemalloc import *
-from _tracemalloc import _get_object_traceback, _get_traces
+from _tracemalloc import _get_object_traceback, _get_traces, _iter_traces
 
 
 def _format_size(size, sign):
@@ -133,6 +134,78 @@ def _compare_grouped_stats(old_group, new_group):
     return statistics
 
 
+def _sample_weight(size, sample_interval):
+    # A memory block of size bytes is traced with the probability
+    # 1 - exp(-size / sample_interval): its trace stands for 1 / probability
+    # memory blocks of this size.
+    if not size:
+        return 1.0
+    return -1.0 / math.expm1(-size / sample_interval)
+
+
+def _group_traces(traces, key_type, cumulative, sample_interval=0):
+    if key_type not in ('traceback', 'filename', 'lineno'):
+        raise ValueError("unknown key_type: %r" % (key_type,))
+    if cumulative and key_type not in ('lineno', 'filename'):
+        raise ValueError("cumulative mode cannot by used "
+                         "with key type %r" % key_type)
+
+    stats = {}
+    tracebacks = {}
+    weights = {}
+    count = 1
+    for trace in traces:
+        domain, size, trace_traceback = trace
+        if sample_interval:
+            # scale sampled traces into estimates of all memory blocks
+            try:
+                count = weights[size]
+            except KeyError:
+                count = weights[size] = _sample_weight(size, sample_interval)
+            size *= count
+        if not cumulative:
+            try:
+                traceback = tracebacks[trace_traceback]
+            except KeyError:
+                if key_type == 'traceback':
+                    frames = trace_traceback
+                elif key_type == 'lineno':
+                    frames = trace_traceback[:1]
+                else: # key_type == 'filename':
+                    frames = ((trace_traceback[0][0], 0),)
+                traceback = Traceback(frames)
+                tracebacks[trace_traceback] = traceback
+            try:
+                stat = stats[traceback]
+                stat.size += size
+                stat.count += count
+            except KeyError:
+                stats[traceback] = Statistic(traceback, size, count)
+        else:
+            # cumulative statistics
+            for frame in trace_traceback:
+                try:
+                    traceback = tracebacks[frame]
+                except KeyError:
+                    if key_type == 'lineno':
+                        frames = (frame,)
+                    else: # key_type == 'filename':
+                        frames = ((frame[0], 0),)
+                    traceback = Traceback(frames)
+                    tracebacks[frame] = traceback
+                try:
+                    stat = stats[traceback]
+                    stat.size += size
+                    stat.count += count
+                except KeyError:
+                    stats[traceback] = Statistic(traceback, size, count)
+    if sample_interval:
+        for stat in stats.values():
+            stat.size = round(stat.size)
+            stat.count = round(stat.count)
+    return stats
+
+
 @total_ordering
 class Frame:
     """
@@ -376,16 +449,47 @@ class DomainFilter(BaseFilter):
         return (domain == self.domain) ^ (not self.inclusive)
 
 
+def _split_filters(filters):
+    if not isinstance(filters, Iterable):
+        raise TypeError("filters must be a list of filters, not %s"
+                        % type(filters).__name__)
+    include_filters = []
+    exclude_filters = []
+    for trace_filter in filters:
+        if trace_filter.inclusive:
+            include_filters.append(trace_filter)
+        else:
+            exclude_filters.append(trace_filter)
+    return include_filters, exclude_filters
+
+
+def _filter_trace(include_filters, exclude_filters, trace):
+    if include_filters:
+        if not any(trace_filter._match(trace)
+                   for trace_filter in include_filters):
+            return False
+    if exclude_filters:
+        if any(not trace_filter._match(trace)
+               for trace_filter in exclude_filters):
+            return False
+    return True
+
+
 class Snapshot:
     """
     Snapshot of traces of memory blocks allocated by Python.
     """
 
-    def __init__(self, traces, traceback_limit):
+    # Snapshots pickled by older versions only contain traces of all
+    # memory blocks
+    sample_interval = 0
+
+    def __init__(self, traces, traceback_limit, sample_interval=0):
         # traces is a tuple of trace tuples: see _Traces constructor for
         # the exact format
         self.traces = _Traces(traces)
         self.traceback_limit = traceback_limit
+        self.sample_interval = sample_interval
 
     def dump(self, filename):
         """
@@ -403,15 +507,7 @@ class Snapshot:
             return pickle.load(fp)
 
     def _filter_trace(self, include_filters, exclude_filters, trace):
-        if include_filters:
-            if not any(trace_filter._match(trace)
-                       for trace_filter in include_filters):
-                return False
-        if exclude_filters:
-            if any(not trace_filter._match(trace)
-                   for trace_filter in exclude_filters):
-                return False
-        return True
+        return _filter_trace(include_filters, exclude_filters, trace)
 
     def filter_traces(self, filters):
         """
@@ -419,75 +515,20 @@ class Snapshot:
         is a list of Filter or DomainFilter instances.  If filters is an empty
         list, return a new Snapshot instance with a copy of the traces.
         """
-        if not isinstance(filters, Iterable):
-            raise TypeError("filters must be a list of filters, not %s"
-                            % type(filters).__name__)
+        include_filters, exclude_filters = _split_filters(filters)
         if filters:
-            include_filters = []
-            exclude_filters = []
-            for trace_filter in filters:
-                if trace_filter.inclusive:
-                    include_filters.append(trace_filter)
-                else:
-                    exclude_filters.append(trace_filter)
             new_traces = [trace for trace in self.traces._traces
                           if self._filter_trace(include_filters,
                                                 exclude_filters,
                                                 trace)]
         else:
             new_traces = self.traces._traces.copy()
-        return Snapshot(new_traces, self.traceback_limit)
+        return Snapshot(new_traces, self.traceback_limit,
+                        self.sample_interval)
 
     def _group_by(self, key_type, cumulative):
-        if key_type not in ('traceback', 'filename', 'lineno'):
-            raise ValueError("unknown key_type: %r" % (key_type,))
-        if cumulative and key_type not in ('lineno', 'filename'):
-            raise ValueError("cumulative mode cannot by used "
-                             "with key type %r" % key_type)
-
-        stats = {}
-        tracebacks = {}
-        if not cumulative:
-            for trace in self.traces._traces:
-                domain, size, trace_traceback = trace
-                try:
-                    traceback = tracebacks[trace_traceback]
-                except KeyError:
-                    if key_type == 'traceback':
-                        frames = trace_traceback
-                    elif key_type == 'lineno':
-                        frames = trace_traceback[:1]
-                    else: # key_type == 'filename':
-                        frames = ((trace_traceback[0][0], 0),)
-                    traceback = Traceback(frames)
-                    tracebacks[trace_traceback] = traceback
-                try:
-                    stat = stats[traceback]
-                    stat.size += size
-                    stat.count += 1
-                except KeyError:
-                    stats[traceback] = Statistic(traceback, size, 1)
-        else:
-            # cumulative statistics
-            for trace in self.traces._traces:
-                domain, size, trace_traceback = trace
-                for frame in trace_traceback:
-                    try:
-                        traceback = tracebacks[frame]
-                    except KeyError:
-                        if key_type == 'lineno':
-                            frames = (frame,)
-                        else: # key_type == 'filename':
-                            frames = ((frame[0], 0),)
-                        traceback = Traceback(frames)
-                        tracebacks[frame] = traceback
-                    try:
-                        stat = stats[traceback]
-                        stat.size += size
-                        stat.count += 1
-                    except KeyError:
-                        stats[traceback] = Statistic(traceback, size, 1)
-        return stats
+        return _group_traces(self.traces._traces, key_type, cumulative,
+                             self.sample_interval)
 
     def statistics(self, key_type, cumulative=False):
         """
@@ -521,4 +562,39 @@ def take_snapshot():
                            "allocations to take a snapshot")
     traces = _get_traces()
     traceback_limit = get_traceback_limit()
-    return Snapshot(traces, traceback_limit)
+    return Snapshot(traces, traceback_limit, get_sample_interval())
+
+
+def take_statistics(key_type, cumulative=False, filters=()):
+    """
+    Group statistics on the traced memory blocks by key_type, as
+    take_snapshot().filter_traces(filters).statistics(key_type, cumulative)
+    does, but aggregate the traces one by one instead of building a
+    snapshot. Return a sorted list of Statistic instances.
+    """
+    if not is_tracing():
+        raise RuntimeError("the tracemalloc module must be tracing memory "
+                           "allocations to take statistics")
+    include_filters, exclude_filters = _split_filters(filters)
+    traces = _iter_traces()
+    if include_filters or exclude_filters:
+        traces = (trace for trace in traces
+                  if _filter_trace(include_filters, exclude_filters, trace))
+    grouped = _group_traces(traces, key_type, cumulative,
+                            get_sample_interval())
+    statistics = list(grouped.values())
+    statistics.sort(reverse=True, key=Statistic._sort_key)
+    return statistics
+
+
+def compare_statistics(old_statistics, new_statistics):
+    """
+    Compute the differences between two lists of Statistic instances
+    grouped by the same key type, for example returned by
+    take_statistics(). Return a sorted list of StatisticDiff instances.
+    """
+    old_group = {stat.traceback: stat for stat in old_statistics}
+    new_group = {stat.traceback: stat for stat in new_statistics}
+    statistics = _compare_grouped_stats(old_group, new_group)
+    statistics.sort(reverse=True, key=StatisticDiff._sort_key)
+    return statistics
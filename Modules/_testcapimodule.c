@@ -12,6 +12,7 @@
 #include "structmember.h"
 #include "datetime.h"
 #include "marshal.h"
+#include "frameobject.h"
 #include <signal.h>
 
 #ifdef MS_WINDOWS
@@ -3933,6 +3934,57 @@ tracemalloc_get_traceback(PyObject *self, PyObject *args)
     return _PyTraceMalloc_GetTraceback(domain, (Py_uintptr_t)ptr);
 }
 
+static PyObject *
+dict_get_version(PyObject *self, PyObject *args)
+{
+    PyDictObject *dict;
+    uint64_t version;
+
+    if (!PyArg_ParseTuple(args, "O!", &PyDict_Type, &dict))
+        return NULL;
+
+    version = dict->ma_version_tag;
+
+    Py_BUILD_ASSERT(sizeof(unsigned PY_LONG_LONG) >= sizeof(version));
+    return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)version);
+}
+
+
+/* Frame evaluation function recording the name of each code object it
+   runs, see set_eval_frame_record() */
+static PyObject *record_list = NULL;
+
+static PyObject *
+record_eval(PyFrameObject *f, int exc)
+{
+    if (record_list != NULL) {
+        if (PyList_Append(record_list, f->f_code->co_name) < 0)
+            return NULL;
+    }
+    return _PyEval_EvalFrameDefault(f, exc);
+}
+
+static PyObject *
+set_eval_frame_record(PyObject *self, PyObject *list)
+{
+    if (!PyList_Check(list)) {
+        PyErr_SetString(PyExc_TypeError, "argument must be a list");
+        return NULL;
+    }
+    Py_INCREF(list);
+    Py_XSETREF(record_list, list);
+    PyThreadState_GET()->interp->eval_frame = record_eval;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+set_eval_frame_default(PyObject *self, PyObject *unused)
+{
+    PyThreadState_GET()->interp->eval_frame = _PyEval_EvalFrameDefault;
+    Py_CLEAR(record_list);
+    Py_RETURN_NONE;
+}
+
 
 static PyMethodDef TestMethods[] = {
     {"raise_exception",         raise_exception,                 METH_VARARGS},
@@ -4134,6 +4186,9 @@ static PyMethodDef TestMethods[] = {
     {"tracemalloc_track", tracemalloc_track, METH_VARARGS},
     {"tracemalloc_untrack", tracemalloc_untrack, METH_VARARGS},
     {"tracemalloc_get_traceback", tracemalloc_get_traceback, METH_VARARGS},
+    {"dict_get_version", dict_get_version, METH_VARARGS},
+    {"set_eval_frame_record", set_eval_frame_record, METH_O},
+    {"set_eval_frame_default", set_eval_frame_default, METH_NOARGS},
     {NULL, NULL} /* sentinel */
 };
 
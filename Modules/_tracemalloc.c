@@ -43,7 +43,12 @@ static struct {
     /* use domain in trace key?
        Variable protected by the GIL. */
     int use_domain;
-} tracemalloc_config = {TRACEMALLOC_NOT_INITIALIZED, 0, 1, 0};
+
+    /* mean number of bytes allocated between two traced memory blocks,
+       0 to trace all memory blocks.
+       Variable protected by the GIL. */
+    size_t sample_interval;
+} tracemalloc_config = {TRACEMALLOC_NOT_INITIALIZED, 0, 1, 0, 0};
 
 #if defined(TRACE_RAW_MALLOC) && defined(WITH_THREAD)
 /* This lock is needed because tracemalloc_free() is called without
@@ -121,6 +126,15 @@ static size_t tracemalloc_traced_memory = 0;
    Protected by TABLES_LOCK(). */
 static size_t tracemalloc_peak_traced_memory = 0;
 
+/* Number of bytes which can still be allocated before the next memory block
+   is traced, when sampling memory allocations.
+   Protected by the GIL. */
+static size_t tracemalloc_sample_countdown = 0;
+
+/* State of the pseudo-random number generator of the sampler.
+   Protected by the GIL. */
+static unsigned PY_LONG_LONG tracemalloc_sample_state = 1;
+
 /* Hash table used as a set to intern filenames:
    PyObject* => PyObject*.
    Protected by the GIL */
@@ -139,6 +153,17 @@ static _Py_hashtable_t *tracemalloc_tracebacks = NULL;
    Protected by TABLES_LOCK(). */
 static _Py_hashtable_t *tracemalloc_traces = NULL;
 
+/* Hash table used to cache the tuples of (filename, lineno) tuples created
+   for tracebacks by _get_traces() and _iter_traces(), so that consecutive
+   snapshots share them: traceback_t* => PyObject*.
+   Protected by the GIL */
+static _Py_hashtable_t *tracemalloc_traceback_objects = NULL;
+
+/* Incremented each time traces and tracebacks are cleared, to invalidate
+   the iterators of _iter_traces().
+   Protected by the GIL */
+static size_t tracemalloc_traces_generation = 0;
+
 
 #ifdef TRACE_DEBUG
 static void
@@ -571,10 +596,87 @@ tracemalloc_use_domain(void)
 }
 
 
+/* Multiplier of the xorshift64* pseudo-random number generator */
+#define SAMPLE_MULTIPLIER \
+        (((unsigned PY_LONG_LONG)0x2545F491 << 32) | 0x4F6CDD1DU)
+
+static void
+sample_seed(void)
+{
+    unsigned PY_LONG_LONG seed;
+
+    seed = (unsigned PY_LONG_LONG)_PyTime_GetMonotonicClock();
+    seed ^= (unsigned PY_LONG_LONG)(Py_uintptr_t)&seed;
+    /* the state of xorshift must not be zero */
+    tracemalloc_sample_state = seed | 1;
+}
+
+
+/* Draw the number of bytes until the next traced memory block: the
+   allocated bytes are traced as a Poisson process, the distance between
+   two sampled bytes follows an exponential distribution. */
+static size_t
+sample_countdown(void)
+{
+    unsigned PY_LONG_LONG x;
+    double uniform, bytes;
+
+    x = tracemalloc_sample_state;
+    x ^= x >> 12;
+    x ^= x << 25;
+    x ^= x >> 27;
+    tracemalloc_sample_state = x;
+    x *= SAMPLE_MULTIPLIER;
+
+    /* 53 random bits: uniform in (0.0; 1.0] */
+    uniform = ((double)(x >> 11) + 1.0) / 9007199254740992.0;
+    bytes = ceil(-log(uniform) * (double)tracemalloc_config.sample_interval);
+    if (bytes >= (double)PY_SSIZE_T_MAX)
+        return PY_SSIZE_T_MAX;
+    return (size_t)bytes;
+}
+
+
+/* Decide if a new memory block of size bytes must be traced: always if
+   sampling is disabled, otherwise with the probability
+   1 - exp(-size / sample_interval).
+   The GIL must be held, but not TABLES_LOCK(). */
+static int
+tracemalloc_sample(size_t size)
+{
+    if (tracemalloc_config.sample_interval == 0)
+        return 1;
+
+    if (size < tracemalloc_sample_countdown) {
+        tracemalloc_sample_countdown -= size;
+        return 0;
+    }
+    tracemalloc_sample_countdown = sample_countdown();
+    return 1;
+}
+
+
+/* Get the number of bytes that the trace of a memory block of size bytes
+   stands for: size divided by the probability to trace the memory block. */
+static size_t
+trace_weighted_size(size_t size)
+{
+    double probability;
+
+    if (tracemalloc_config.sample_interval == 0 || size == 0)
+        return size;
+
+    probability = 1.0 - exp(-(double)size
+                            / (double)tracemalloc_config.sample_interval);
+    return (size_t)((double)size / probability + 0.5);
+}
+
+
 static void
 tracemalloc_remove_trace(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr)
 {
     trace_t trace;
+    size_t size;
     int removed;
 
     assert(tracemalloc_config.tracing);
@@ -590,8 +692,9 @@ tracemalloc_remove_trace(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr)
         return;
     }
 
-    assert(tracemalloc_traced_memory >= trace.size);
-    tracemalloc_traced_memory -= trace.size;
+    size = trace_weighted_size(trace.size);
+    assert(tracemalloc_traced_memory >= size);
+    tracemalloc_traced_memory -= size;
 }
 
 #define REMOVE_TRACE(ptr) \
@@ -605,6 +708,7 @@ tracemalloc_add_trace(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr,
     pointer_t key = {ptr, domain};
     traceback_t *traceback;
     trace_t trace;
+    size_t weighted_size;
     _Py_hashtable_entry_t* entry;
     int res;
 
@@ -633,8 +737,9 @@ tracemalloc_add_trace(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr,
     if (entry != NULL) {
         /* the memory block is already tracked */
         _Py_HASHTABLE_ENTRY_READ_DATA(tracemalloc_traces, entry, trace);
-        assert(tracemalloc_traced_memory >= trace.size);
-        tracemalloc_traced_memory -= trace.size;
+        weighted_size = trace_weighted_size(trace.size);
+        assert(tracemalloc_traced_memory >= weighted_size);
+        tracemalloc_traced_memory -= weighted_size;
 
         trace.size = size;
         trace.traceback = traceback;
@@ -655,8 +760,9 @@ tracemalloc_add_trace(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr,
         }
     }
 
-    assert(tracemalloc_traced_memory <= PY_SIZE_MAX - size);
-    tracemalloc_traced_memory += size;
+    weighted_size = trace_weighted_size(size);
+    assert(tracemalloc_traced_memory <= PY_SIZE_MAX - weighted_size);
+    tracemalloc_traced_memory += weighted_size;
     if (tracemalloc_traced_memory > tracemalloc_peak_traced_memory)
         tracemalloc_peak_traced_memory = tracemalloc_traced_memory;
     return 0;
@@ -681,6 +787,9 @@ tracemalloc_alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
     if (ptr == NULL)
         return NULL;
 
+    if (!tracemalloc_sample(nelem * elsize))
+        return ptr;
+
     TABLES_LOCK();
     if (ADD_TRACE(ptr, nelem * elsize) < 0) {
         /* Failed to allocate a trace for the new memory block */
@@ -706,6 +815,15 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
     if (ptr != NULL) {
         /* an existing memory block has been resized */
 
+        if (!tracemalloc_sample(new_size)) {
+            /* the resized memory block is not sampled: forget its old
+               trace */
+            TABLES_LOCK();
+            REMOVE_TRACE(ptr);
+            TABLES_UNLOCK();
+            return ptr2;
+        }
+
         TABLES_LOCK();
 
         /* tracemalloc_add_trace() updates the trace if there is already
@@ -714,7 +832,8 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
             REMOVE_TRACE(ptr);
         }
 
-        if (ADD_TRACE(ptr2, new_size) < 0) {
+        if (ADD_TRACE(ptr2, new_size) < 0
+            && tracemalloc_config.sample_interval == 0) {
             /* Memory allocation failed. The error cannot be reported to
                the caller, because realloc() may already have shrinked the
                memory block and so removed bytes.
@@ -723,7 +842,10 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
                released, so the hash table should have at least one free entry.
 
                The GIL and the table lock ensures that only one thread is
-               allocating memory. */
+               allocating memory.
+
+               When sampling, the old memory block may not have been traced:
+               the sample is lost. */
             assert(0 && "should never happen");
         }
         TABLES_UNLOCK();
@@ -731,6 +853,9 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
     else {
         /* new allocation */
 
+        if (!tracemalloc_sample(new_size))
+            return ptr2;
+
         TABLES_LOCK();
         if (ADD_TRACE(ptr2, new_size) < 0) {
             /* Failed to allocate a trace for the new memory block */
@@ -949,6 +1074,18 @@ traceback_free_traceback(_Py_hashtable_t *ht, _Py_hashtable_entry_t *entry,
 }
 
 
+static int
+tracemalloc_pyobject_decref_cb(_Py_hashtable_t *tracebacks,
+                               _Py_hashtable_entry_t *entry,
+                               void *user_data)
+{
+    PyObject *obj;
+    _Py_HASHTABLE_ENTRY_READ_DATA(tracebacks, entry, obj);
+    Py_DECREF(obj);
+    return 0;
+}
+
+
 /* reentrant flag must be set to call this function and GIL must be held */
 static void
 tracemalloc_clear_traces(void)
@@ -964,6 +1101,11 @@ tracemalloc_clear_traces(void)
     tracemalloc_peak_traced_memory = 0;
     TABLES_UNLOCK();
 
+    tracemalloc_traces_generation++;
+    _Py_hashtable_foreach(tracemalloc_traceback_objects,
+                          tracemalloc_pyobject_decref_cb, NULL);
+    _Py_hashtable_clear(tracemalloc_traceback_objects);
+
     _Py_hashtable_foreach(tracemalloc_tracebacks, traceback_free_traceback, NULL);
     _Py_hashtable_clear(tracemalloc_tracebacks);
 
@@ -1016,6 +1158,11 @@ tracemalloc_init(void)
                                            hashtable_hash_traceback,
                                            hashtable_compare_traceback);
 
+    tracemalloc_traceback_objects = hashtable_new(sizeof(traceback_t *),
+                                                  sizeof(PyObject *),
+                                                  _Py_hashtable_hash_ptr,
+                                                  _Py_hashtable_compare_direct);
+
     if (tracemalloc_config.use_domain) {
         tracemalloc_traces = hashtable_new(sizeof(pointer_t),
                                            sizeof(trace_t),
@@ -1030,6 +1177,7 @@ tracemalloc_init(void)
     }
 
     if (tracemalloc_filenames == NULL || tracemalloc_tracebacks == NULL
+       || tracemalloc_traceback_objects == NULL
        || tracemalloc_traces == NULL) {
         PyErr_NoMemory();
         return -1;
@@ -1061,6 +1209,7 @@ tracemalloc_deinit(void)
     tracemalloc_stop();
 
     /* destroy hash tables */
+    _Py_hashtable_destroy(tracemalloc_traceback_objects);
     _Py_hashtable_destroy(tracemalloc_tracebacks);
     _Py_hashtable_destroy(tracemalloc_filenames);
     _Py_hashtable_destroy(tracemalloc_traces);
@@ -1082,7 +1231,7 @@ tracemalloc_deinit(void)
 
 
 static int
-tracemalloc_start(int max_nframe)
+tracemalloc_start(int max_nframe, size_t sample_interval)
 {
     PyMemAllocatorEx alloc;
     size_t size;
@@ -1098,6 +1247,13 @@ tracemalloc_start(int max_nframe)
     assert(1 <= max_nframe && max_nframe <= MAX_NFRAME);
     tracemalloc_config.max_nframe = max_nframe;
 
+    assert(sample_interval <= PY_SSIZE_T_MAX);
+    tracemalloc_config.sample_interval = sample_interval;
+    if (sample_interval != 0) {
+        sample_seed();
+        tracemalloc_sample_countdown = sample_countdown();
+    }
+
     /* allocate a buffer to store a new traceback */
     size = TRACEBACK_SIZE(max_nframe);
     assert(tracemalloc_traceback == NULL);
@@ -1292,23 +1448,14 @@ trace_to_pyobject(_PyTraceMalloc_domain_t domain, trace_t *trace,
 }
 
 
-typedef struct {
-    _Py_hashtable_t *traces;
-    _Py_hashtable_t *tracebacks;
-    PyObject *list;
-} get_traces_t;
-
-static int
-tracemalloc_get_traces_fill(_Py_hashtable_t *traces, _Py_hashtable_entry_t *entry,
-                            void *user_data)
+static PyObject*
+trace_entry_to_pyobject(_Py_hashtable_t *traces, _Py_hashtable_entry_t *entry,
+                        int use_domain)
 {
-    get_traces_t *get_traces = user_data;
     _PyTraceMalloc_domain_t domain;
     trace_t trace;
-    PyObject *tracemalloc_obj;
-    int res;
 
-    if (tracemalloc_config.use_domain) {
+    if (use_domain) {
         pointer_t key;
         _Py_HASHTABLE_ENTRY_READ_KEY(traces, entry, key);
         domain = key.domain;
@@ -1318,7 +1465,25 @@ tracemalloc_get_traces_fill(_Py_hashtable_t *traces, _Py_hashtable_entry_t *entr
     }
     _Py_HASHTABLE_ENTRY_READ_DATA(traces, entry, trace);
 
-    tracemalloc_obj = trace_to_pyobject(domain, &trace, get_traces->tracebacks);
+    return trace_to_pyobject(domain, &trace, tracemalloc_traceback_objects);
+}
+
+
+typedef struct {
+    _Py_hashtable_t *traces;
+    PyObject *list;
+} get_traces_t;
+
+static int
+tracemalloc_get_traces_fill(_Py_hashtable_t *traces, _Py_hashtable_entry_t *entry,
+                            void *user_data)
+{
+    get_traces_t *get_traces = user_data;
+    PyObject *tracemalloc_obj;
+    int res;
+
+    tracemalloc_obj = trace_entry_to_pyobject(traces, entry,
+                                              tracemalloc_config.use_domain);
     if (tracemalloc_obj == NULL)
         return 1;
 
@@ -1331,18 +1496,6 @@ tracemalloc_get_traces_fill(_Py_hashtable_t *traces, _Py_hashtable_entry_t *entr
 }
 
 
-static int
-tracemalloc_pyobject_decref_cb(_Py_hashtable_t *tracebacks,
-                               _Py_hashtable_entry_t *entry,
-                               void *user_data)
-{
-    PyObject *obj;
-    _Py_HASHTABLE_ENTRY_READ_DATA(tracebacks, entry, obj);
-    Py_DECREF(obj);
-    return 0;
-}
-
-
 PyDoc_STRVAR(tracemalloc_get_traces_doc,
     "_get_traces() -> list\n"
     "\n"
@@ -1359,7 +1512,6 @@ py_tracemalloc_get_traces(PyObject *self, PyObject *obj)
     int err;
 
     get_traces.traces = NULL;
-    get_traces.tracebacks = NULL;
     get_traces.list = PyList_New(0);
     if (get_traces.list == NULL)
         goto error;
@@ -1367,17 +1519,6 @@ py_tracemalloc_get_traces(PyObject *self, PyObject *obj)
     if (!tracemalloc_config.tracing)
         return get_traces.list;
 
-    /* the traceback hash table is used temporarily to intern traceback tuple
-       of (filename, lineno) tuples */
-    get_traces.tracebacks = hashtable_new(sizeof(traceback_t *),
-                                          sizeof(PyObject *),
-                                          _Py_hashtable_hash_ptr,
-                                          _Py_hashtable_compare_direct);
-    if (get_traces.tracebacks == NULL) {
-        PyErr_NoMemory();
-        goto error;
-    }
-
     TABLES_LOCK();
     get_traces.traces = _Py_hashtable_copy(tracemalloc_traces);
     TABLES_UNLOCK();
@@ -1387,6 +1528,8 @@ py_tracemalloc_get_traces(PyObject *self, PyObject *obj)
         goto error;
     }
 
+    /* traceback tuples of (filename, lineno) tuples are interned in
+       tracemalloc_traceback_objects */
     set_reentrant(1);
     err = _Py_hashtable_foreach(get_traces.traces,
                                 tracemalloc_get_traces_fill, &get_traces);
@@ -1400,11 +1543,6 @@ error:
     Py_CLEAR(get_traces.list);
 
 finally:
-    if (get_traces.tracebacks != NULL) {
-        _Py_hashtable_foreach(get_traces.tracebacks,
-                              tracemalloc_pyobject_decref_cb, NULL);
-        _Py_hashtable_destroy(get_traces.tracebacks);
-    }
     if (get_traces.traces != NULL) {
         _Py_hashtable_destroy(get_traces.traces);
     }
@@ -1413,6 +1551,141 @@ finally:
 }
 
 
+/* Iterator on a copy of the traces, to get the traces one by one */
+typedef struct {
+    PyObject_HEAD
+    /* copy of tracemalloc_traces, NULL when the iterator is exhausted */
+    _Py_hashtable_t *traces;
+    int use_domain;
+    size_t bucket;
+    _Py_hashtable_entry_t *entry;
+    /* value of tracemalloc_traces_generation when the traces were copied:
+       the tracebacks of the copy are freed when traces are cleared */
+    size_t generation;
+} tracesiterobject;
+
+static void
+tracesiter_clear(tracesiterobject *it)
+{
+    if (it->traces != NULL) {
+        _Py_hashtable_destroy(it->traces);
+        it->traces = NULL;
+    }
+}
+
+static void
+tracesiter_dealloc(tracesiterobject *it)
+{
+    tracesiter_clear(it);
+    PyObject_Del(it);
+}
+
+static PyObject*
+tracesiter_next(tracesiterobject *it)
+{
+    _Py_hashtable_t *traces = it->traces;
+    _Py_hashtable_entry_t *entry;
+    PyObject *trace_obj;
+
+    if (traces == NULL)
+        return NULL;
+
+    if (it->generation != tracemalloc_traces_generation) {
+        tracesiter_clear(it);
+        PyErr_SetString(PyExc_RuntimeError,
+                        "traces were cleared during iteration");
+        return NULL;
+    }
+
+    entry = it->entry;
+    while (entry == NULL) {
+        if (it->bucket == traces->num_buckets) {
+            tracesiter_clear(it);
+            return NULL;
+        }
+        entry = (_Py_hashtable_entry_t *)_Py_SLIST_HEAD(
+                                            &traces->buckets[it->bucket]);
+        it->bucket++;
+    }
+    it->entry = (_Py_hashtable_entry_t *)_Py_SLIST_ITEM_NEXT(entry);
+
+    set_reentrant(1);
+    trace_obj = trace_entry_to_pyobject(traces, entry, it->use_domain);
+    set_reentrant(0);
+    return trace_obj;
+}
+
+static PyTypeObject TracesIter_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_tracemalloc._traces_iterator",            /* tp_name */
+    sizeof(tracesiterobject),                   /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    /* methods */
+    (destructor)tracesiter_dealloc,             /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    PyObject_GenericGetAttr,                    /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                         /* tp_flags */
+    0,                                          /* tp_doc */
+    0,                                          /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    PyObject_SelfIter,                          /* tp_iter */
+    (iternextfunc)tracesiter_next,              /* tp_iternext */
+};
+
+
+PyDoc_STRVAR(tracemalloc_iter_traces_doc,
+    "_iter_traces() -> iterator\n"
+    "\n"
+    "Iterate on the traces of all memory blocks allocated by Python,\n"
+    "in the format of _get_traces(), without building a list.\n"
+    "\n"
+    "The traces are copied when the iterator is created. The iterator\n"
+    "raises a RuntimeError if traces are cleared in the meantime.");
+
+static PyObject*
+py_tracemalloc_iter_traces(PyObject *self)
+{
+    tracesiterobject *it;
+
+    it = PyObject_New(tracesiterobject, &TracesIter_Type);
+    if (it == NULL)
+        return NULL;
+    it->traces = NULL;
+    it->use_domain = 0;
+    it->bucket = 0;
+    it->entry = NULL;
+    it->generation = tracemalloc_traces_generation;
+
+    if (!tracemalloc_config.tracing)
+        return (PyObject *)it;
+
+    TABLES_LOCK();
+    it->traces = _Py_hashtable_copy(tracemalloc_traces);
+    it->use_domain = tracemalloc_config.use_domain;
+    TABLES_UNLOCK();
+
+    if (it->traces == NULL) {
+        Py_DECREF(it);
+        return PyErr_NoMemory();
+    }
+    return (PyObject *)it;
+}
+
+
 static traceback_t*
 tracemalloc_get_traceback(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr)
 {
@@ -1504,18 +1777,24 @@ _PyMem_DumpTraceback(int fd, const void *ptr)
 
 
 PyDoc_STRVAR(tracemalloc_start_doc,
-    "start(nframe: int=1)\n"
+    "start(nframe: int=1, *, sample_interval: int=0)\n"
     "\n"
     "Start tracing Python memory allocations. Set also the maximum number \n"
-    "of frames stored in the traceback of a trace to nframe.");
+    "of frames stored in the traceback of a trace to nframe.\n"
+    "\n"
+    "If sample_interval is non-zero, only trace a sample of the memory\n"
+    "blocks: on average, one every sample_interval allocated bytes.");
 
 static PyObject*
-py_tracemalloc_start(PyObject *self, PyObject *args)
+py_tracemalloc_start(PyObject *self, PyObject *args, PyObject *kwds)
 {
+    static char *kwlist[] = {"nframe", "sample_interval", NULL};
     Py_ssize_t nframe = 1;
+    Py_ssize_t sample_interval = 0;
     int nframe_int;
 
-    if (!PyArg_ParseTuple(args, "|n:start", &nframe))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|n$n:start", kwlist,
+                                     &nframe, &sample_interval))
         return NULL;
 
     if (nframe < 1 || nframe > MAX_NFRAME) {
@@ -1526,7 +1805,13 @@ py_tracemalloc_start(PyObject *self, PyObject *args)
     }
     nframe_int = Py_SAFE_DOWNCAST(nframe, Py_ssize_t, int);
 
-    if (tracemalloc_start(nframe_int) < 0)
+    if (sample_interval < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the sample interval must be positive or zero");
+        return NULL;
+    }
+
+    if (tracemalloc_start(nframe_int, (size_t)sample_interval) < 0)
         return NULL;
 
     Py_RETURN_NONE;
@@ -1563,6 +1848,21 @@ py_tracemalloc_get_traceback_limit(PyObject *self)
 }
 
 
+PyDoc_STRVAR(tracemalloc_get_sample_interval_doc,
+    "get_sample_interval() -> int\n"
+    "\n"
+    "Get the mean number of allocated bytes between two traced memory\n"
+    "blocks, or 0 if all memory blocks are traced.\n"
+    "\n"
+    "By default, all memory blocks are traced: the interval is 0.");
+
+static PyObject*
+py_tracemalloc_get_sample_interval(PyObject *self)
+{
+    return PyLong_FromSize_t(tracemalloc_config.sample_interval);
+}
+
+
 PyDoc_STRVAR(tracemalloc_get_tracemalloc_memory_doc,
     "get_tracemalloc_memory() -> int\n"
     "\n"
@@ -1577,6 +1877,7 @@ tracemalloc_get_tracemalloc_memory(PyObject *self)
 
     size = _Py_hashtable_size(tracemalloc_tracebacks);
     size += _Py_hashtable_size(tracemalloc_filenames);
+    size += _Py_hashtable_size(tracemalloc_traceback_objects);
 
     TABLES_LOCK();
     size += _Py_hashtable_size(tracemalloc_traces);
@@ -1591,7 +1892,9 @@ PyDoc_STRVAR(tracemalloc_get_traced_memory_doc,
     "get_traced_memory() -> (int, int)\n"
     "\n"
     "Get the current size and peak size of memory blocks traced\n"
-    "by the tracemalloc module as a tuple: (current: int, peak: int).");
+    "by the tracemalloc module as a tuple: (current: int, peak: int).\n"
+    "\n"
+    "When sampling, the sizes are estimated from the traced memory blocks.");
 
 static PyObject*
 tracemalloc_get_traced_memory(PyObject *self)
@@ -1620,14 +1923,18 @@ static PyMethodDef module_methods[] = {
      METH_NOARGS, tracemalloc_clear_traces_doc},
     {"_get_traces", (PyCFunction)py_tracemalloc_get_traces,
      METH_NOARGS, tracemalloc_get_traces_doc},
+    {"_iter_traces", (PyCFunction)py_tracemalloc_iter_traces,
+     METH_NOARGS, tracemalloc_iter_traces_doc},
     {"_get_object_traceback", (PyCFunction)py_tracemalloc_get_object_traceback,
      METH_O, tracemalloc_get_object_traceback_doc},
     {"start", (PyCFunction)py_tracemalloc_start,
-      METH_VARARGS, tracemalloc_start_doc},
+      METH_VARARGS | METH_KEYWORDS, tracemalloc_start_doc},
     {"stop", (PyCFunction)py_tracemalloc_stop,
       METH_NOARGS, tracemalloc_stop_doc},
     {"get_traceback_limit", (PyCFunction)py_tracemalloc_get_traceback_limit,
      METH_NOARGS, tracemalloc_get_traceback_limit_doc},
+    {"get_sample_interval", (PyCFunction)py_tracemalloc_get_sample_interval,
+     METH_NOARGS, tracemalloc_get_sample_interval_doc},
     {"get_tracemalloc_memory", (PyCFunction)tracemalloc_get_tracemalloc_memory,
      METH_NOARGS, tracemalloc_get_tracemalloc_memory_doc},
     {"get_traced_memory", (PyCFunction)tracemalloc_get_traced_memory,
@@ -1653,6 +1960,10 @@ PyMODINIT_FUNC
 PyInit__tracemalloc(void)
 {
     PyObject *m;
+
+    if (PyType_Ready(&TracesIter_Type) < 0)
+        return NULL;
+
     m = PyModule_Create(&module_def);
     if (m == NULL)
         return NULL;
@@ -1748,7 +2059,7 @@ _PyTraceMalloc_Init(void)
         }
     }
 
-    return tracemalloc_start(nframe);
+    return tracemalloc_start(nframe, 0);
 }
 
 
@@ -1780,7 +2091,14 @@ _PyTraceMalloc_Track(_PyTraceMalloc_domain_t domain, Py_uintptr_t ptr,
 #endif
 
     TABLES_LOCK();
-    res = tracemalloc_add_trace(domain, ptr, size);
+    if (tracemalloc_sample(size)) {
+        res = tracemalloc_add_trace(domain, ptr, size);
+    }
+    else {
+        /* forget the previous trace of the memory block, if any */
+        tracemalloc_remove_trace(domain, ptr);
+        res = 0;
+    }
     TABLES_UNLOCK();
 
 #ifdef WITH_THREAD
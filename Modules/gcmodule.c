@@ -55,6 +55,32 @@ static struct gc_generation generations[NUM_GENERATIONS] = {
 
 PyGC_Head *_PyGC_generation0 = GEN_HEAD(0);
 
+/* objects moved out of the generations by gc.freeze(); they are never
+   collected (nor their PyGC_Head written to) until gc.unfreeze() */
+static struct gc_generation permanent_generation = {
+    {{&permanent_generation.head, &permanent_generation.head, 0}}, 0, 0
+};
+
+/* Incremental collection of the oldest generation (see gc.set_incremental()).
+   A "pass" examines every object of the oldest generation once, a slice
+   of it per collection.  The objects a pass has already examined are kept
+   in incremental_visited until the pass ends. */
+static Py_ssize_t incremental_max_objects = 0;  /* 0: no object budget */
+static double incremental_max_time = 0.0;       /* 0: no time budget */
+static double incremental_cost = 0.0;   /* seconds per examined object */
+static int incremental_in_pass = 0;
+static Py_ssize_t incremental_survivors = 0;
+static PyGC_Head incremental_visited = {
+    {&incremental_visited, &incremental_visited, 0}
+};
+
+#define INCREMENTAL_ENABLED() \
+    (incremental_max_objects > 0 || incremental_max_time > 0.0)
+
+/* Size of the first slices of a pass with a time budget, before the cost
+   per object has been measured */
+#define INCREMENTAL_DEFAULT_OBJECTS 10000
+
 static int enabled = 1; /* automatic collection enabled? */
 
 /* true if we are currently running the collector */
@@ -82,6 +108,10 @@ static Py_ssize_t long_lived_total = 0;
 */
 static Py_ssize_t long_lived_pending = 0;
 
+/* long_lived_total after the last full collection of the oldest generation
+   (see collect_generations()) */
+static Py_ssize_t full_collection_total = 0;
+
 /*
    NOTE: about the counting of long-lived objects.
 
@@ -180,6 +210,21 @@ struct gc_generation_stats {
 
 static struct gc_generation_stats generation_stats[NUM_GENERATIONS];
 
+/* Pause times per generation; each slice of an incremental collection is a
+   pause of the oldest generation.  histogram[i] counts the pauses shorter
+   than 10**(i-4) seconds (and not shorter than 10**(i-5) seconds); the last
+   bucket counts the pauses of a second or more. */
+#define PAUSE_BUCKETS 6
+
+struct gc_pause_stats {
+    Py_ssize_t pauses;
+    _PyTime_t total;
+    _PyTime_t max;
+    Py_ssize_t histogram[PAUSE_BUCKETS];
+};
+
+static struct gc_pause_stats pause_stats[NUM_GENERATIONS];
+
 /*--------------------------------------------------------------------------
 gc_refs values.
 
@@ -217,14 +262,36 @@ GC_TENTATIVELY_UNREACHABLE
     Only objects with GC_TENTATIVELY_UNREACHABLE still set are candidates
     for collection.  If it's decided not to collect such an object (e.g.,
     it has a __del__ method), its gc_refs is restored to GC_REACHABLE again.
+
+Tracked objects can also be in one of these variants of GC_REACHABLE
+between collections:
+
+GC_PERMANENT
+    The object was moved to the permanent generation by gc.freeze().
+
+GC_VISITED_0, GC_VISITED_1
+    The current pass of an incremental collection already examined the
+    object.  The passes alternate between both marks, so that when a pass
+    ends the mark of the previous one means "not visited" again without
+    resetting every object.
 ----------------------------------------------------------------------------
 */
 #define GC_UNTRACKED                    _PyGC_REFS_UNTRACKED
 #define GC_REACHABLE                    _PyGC_REFS_REACHABLE
 #define GC_TENTATIVELY_UNREACHABLE      _PyGC_REFS_TENTATIVELY_UNREACHABLE
+#define GC_PERMANENT                    (-5)
+#define GC_VISITED_0                    (-6)
+#define GC_VISITED_1                    (-7)
+
+/* the mark of the objects visited by the current incremental pass */
+static Py_ssize_t visited_mark = GC_VISITED_0;
+
+#define REFS_IS_REACHABLE(refs) \
+    ((refs) == GC_REACHABLE || \
+     ((refs) <= GC_PERMANENT && (refs) >= GC_VISITED_1))
 
 #define IS_TRACKED(o) (_PyGC_REFS(o) != GC_UNTRACKED)
-#define IS_REACHABLE(o) (_PyGC_REFS(o) == GC_REACHABLE)
+#define IS_REACHABLE(o) REFS_IS_REACHABLE(_PyGC_REFS(o))
 #define IS_TENTATIVELY_UNREACHABLE(o) ( \
     _PyGC_REFS(o) == GC_TENTATIVELY_UNREACHABLE)
 
@@ -341,7 +408,7 @@ update_refs(PyGC_Head *containers)
 {
     PyGC_Head *gc = containers->gc.gc_next;
     for (; gc != containers; gc = gc->gc.gc_next) {
-        assert(_PyGCHead_REFS(gc) == GC_REACHABLE);
+        assert(REFS_IS_REACHABLE(_PyGCHead_REFS(gc)));
         _PyGCHead_SET_REFS(gc, Py_REFCNT(FROM_GC(gc)));
         /* Python's cyclic gc should never see an incoming refcount
          * of 0:  if something decref'ed to 0, it should have been
@@ -430,14 +497,14 @@ visit_reachable(PyObject *op, PyGC_Head *reachable)
         /* Else there's nothing to do.
          * If gc_refs > 0, it must be in move_unreachable's 'young'
          * list, and move_unreachable will eventually get to it.
-         * If gc_refs == GC_REACHABLE, it's either in some other
-         * generation so we don't care about it, or move_unreachable
-         * already dealt with it.
+         * If gc_refs == GC_REACHABLE (or a variant of it), it's either
+         * in some other generation so we don't care about it, or
+         * move_unreachable already dealt with it.
          * If gc_refs == GC_UNTRACKED, it must be ignored.
          */
          else {
             assert(gc_refs > 0
-                   || gc_refs == GC_REACHABLE
+                   || REFS_IS_REACHABLE(gc_refs)
                    || gc_refs == GC_UNTRACKED);
          }
     }
@@ -894,11 +961,149 @@ clear_freelists(void)
     (void)PySet_ClearFreeList();
 }
 
+/* Set gc_refs of every object in a GC list and return their number. */
+static Py_ssize_t
+gc_list_set_refs(PyGC_Head *list, Py_ssize_t refs)
+{
+    PyGC_Head *gc;
+    Py_ssize_t n = 0;
+    for (gc = list->gc.gc_next; gc != list; gc = gc->gc.gc_next) {
+        _PyGCHead_SET_REFS(gc, refs);
+        n++;
+    }
+    return n;
+}
+
+/* Give the objects examined by the current incremental pass back to the
+ * oldest generation and end the pass.
+ */
+static void
+end_incremental_pass(void)
+{
+    gc_list_merge(&incremental_visited, GEN_HEAD(NUM_GENERATIONS-1));
+    if (incremental_in_pass) {
+        /* the objects marked by this pass are unvisited for the next one */
+        visited_mark = (visited_mark == GC_VISITED_0) ? GC_VISITED_1
+                                                      : GC_VISITED_0;
+        incremental_in_pass = 0;
+    }
+}
+
+/* Return the maximum number of objects an incremental collection examines. */
+static Py_ssize_t
+incremental_budget(void)
+{
+    Py_ssize_t budget = PY_SSIZE_T_MAX;
+    if (incremental_max_objects > 0)
+        budget = incremental_max_objects;
+    if (incremental_max_time > 0.0) {
+        double n = INCREMENTAL_DEFAULT_OBJECTS;
+        if (incremental_cost > 0.0)
+            n = incremental_max_time / incremental_cost;
+        if (n < (double)budget)
+            budget = n < 1.0 ? 1 : (Py_ssize_t)n;
+    }
+    return budget;
+}
+
+struct pull_state {
+    PyGC_Head *increment;
+    Py_ssize_t examined;
+    Py_ssize_t limit;
+};
+
+/* A traversal callback for fill_increment(). */
+static int
+visit_pull(PyObject *op, struct pull_state *st)
+{
+    if (PyObject_IS_GC(op) && st->examined < st->limit) {
+        PyGC_Head *gc = AS_GC(op);
+        Py_ssize_t gc_refs = _PyGCHead_REFS(gc);
+        /* Not visited by this pass yet: the object is in the oldest
+         * generation, or was revived into incremental_visited. */
+        if (gc_refs == GC_REACHABLE ||
+            (gc_refs <= GC_VISITED_0 && gc_refs != visited_mark)) {
+            gc_list_move(gc, st->increment);
+            _PyGCHead_SET_REFS(gc, visited_mark);
+            st->examined++;
+        }
+    }
+    return 0;
+}
+
+/* Move the young generations and a slice of the oldest generation to
+ * `increment`, and return the number of objects moved.  The slice starts
+ * with the oldest objects and pulls in the unvisited objects they refer
+ * to (transitively), so that a garbage cycle usually ends up in a single
+ * slice.  Every object in
+ * `increment` gets the visited mark.
+ */
+static Py_ssize_t
+fill_increment(PyGC_Head *increment)
+{
+    PyGC_Head *oldest = GEN_HEAD(NUM_GENERATIONS-1);
+    PyGC_Head *scanned;     /* the last object whose referents were pulled */
+    Py_ssize_t young = 0, budget;
+    struct pull_state st;
+    int i;
+
+    for (i = 0; i < NUM_GENERATIONS-1; i++) {
+        young += gc_list_set_refs(GEN_HEAD(i), visited_mark);
+        gc_list_merge(GEN_HEAD(i), increment);
+    }
+    /* Leave at least a quarter of the budget to the oldest generation, so
+     * that the pass progresses even when the young generations are big. */
+    budget = incremental_budget();
+    st.increment = increment;
+    st.examined = 0;
+    st.limit = Py_MAX(budget - young, budget / 4);
+    if (st.limit < 1)
+        st.limit = 1;
+
+    /* The young objects are not scanned: the objects they refer to in the
+     * oldest generation are reachable anyway. */
+    scanned = increment->gc.gc_prev;
+    while (st.examined < st.limit) {
+        PyGC_Head *gc = scanned->gc.gc_next;
+        if (gc == increment) {
+            /* everything pulled in is scanned: seed with an old object */
+            if (gc_list_is_empty(oldest))
+                break;
+            gc = oldest->gc.gc_next;
+            gc_list_move(gc, increment);
+            _PyGCHead_SET_REFS(gc, visited_mark);
+            st.examined++;
+        }
+        (void) Py_TYPE(FROM_GC(gc))->tp_traverse(FROM_GC(gc),
+                                                 (visitproc)visit_pull,
+                                                 &st);
+        scanned = gc;
+    }
+    return young + st.examined;
+}
+
+/* Record the duration of a collection of `generation` in pause_stats. */
+static void
+record_pause(int generation, _PyTime_t duration)
+{
+    struct gc_pause_stats *ps = &pause_stats[generation];
+    _PyTime_t bound = _PyTime_FromNanoseconds(100000);     /* 100 us */
+    int i;
+
+    ps->pauses++;
+    ps->total += duration;
+    if (duration > ps->max)
+        ps->max = duration;
+    for (i = 0; i < PAUSE_BUCKETS-1 && duration >= bound; i++)
+        bound *= 10;
+    ps->histogram[i]++;
+}
+
 /* This is the main function.  Read this to understand how the
  * collection process works. */
 static Py_ssize_t
 collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
-        int nofail)
+        int nofail, int incremental)
 {
     int i;
     Py_ssize_t m = 0; /* # objects collected */
@@ -907,22 +1112,25 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
     PyGC_Head *old; /* next older generation */
     PyGC_Head unreachable; /* non-problematic unreachable trash */
     PyGC_Head finalizers;  /* objects with, & reachable from, __del__ */
+    PyGC_Head increment;   /* the slice of an incremental collection */
     PyGC_Head *gc;
-    _PyTime_t t1 = 0;   /* initialize to prevent a compiler warning */
+    Py_ssize_t examined = 0;
+    _PyTime_t t1, t2;
 
     struct gc_generation_stats *stats = &generation_stats[generation];
 
+    assert(!incremental || generation == NUM_GENERATIONS-1);
     if (debug & DEBUG_STATS) {
-        PySys_WriteStderr("gc: collecting generation %d...\n",
-                          generation);
+        PySys_WriteStderr("gc: collecting generation %d%s...\n",
+                          generation, incremental ? " incrementally" : "");
         PySys_WriteStderr("gc: objects in each generation:");
         for (i = 0; i < NUM_GENERATIONS; i++)
             PySys_FormatStderr(" %zd",
                               gc_list_size(GEN_HEAD(i)));
-        t1 = _PyTime_GetMonotonicClock();
 
         PySys_WriteStderr("\n");
     }
+    t1 = _PyTime_GetMonotonicClock();
 
     /* update collection and allocation counters */
     if (generation+1 < NUM_GENERATIONS)
@@ -930,17 +1138,37 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
     for (i = 0; i <= generation; i++)
         generations[i].count = 0;
 
-    /* merge younger generations with one we are currently collecting */
-    for (i = 0; i < generation; i++) {
-        gc_list_merge(GEN_HEAD(i), GEN_HEAD(generation));
+    if (incremental) {
+        /* Collect the young generations and a slice of the oldest one,
+         * and keep the survivors aside until the pass has examined the
+         * whole oldest generation.
+         */
+        if (!incremental_in_pass) {
+            incremental_in_pass = 1;
+            incremental_survivors = 0;
+        }
+        gc_list_init(&increment);
+        examined = fill_increment(&increment);
+        young = &increment;
+        old = &incremental_visited;
     }
+    else {
+        /* a full collection examines the objects of the pass too */
+        if (generation == NUM_GENERATIONS-1)
+            end_incremental_pass();
 
-    /* handy references */
-    young = GEN_HEAD(generation);
-    if (generation < NUM_GENERATIONS-1)
-        old = GEN_HEAD(generation+1);
-    else
-        old = young;
+        /* merge younger generations with one we are currently collecting */
+        for (i = 0; i < generation; i++) {
+            gc_list_merge(GEN_HEAD(i), GEN_HEAD(generation));
+        }
+
+        /* handy references */
+        young = GEN_HEAD(generation);
+        if (generation < NUM_GENERATIONS-1)
+            old = GEN_HEAD(generation+1);
+        else
+            old = young;
+    }
 
     /* Using ob_refcnt and gc_refs, calculate which objects in the
      * container set are reachable from outside the set (i.e., have a
@@ -960,7 +1188,12 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
     move_unreachable(young, &unreachable);
 
     /* Move reachable objects to next generation. */
-    if (young != old) {
+    if (incremental) {
+        untrack_dicts(young);
+        incremental_survivors += gc_list_set_refs(young, visited_mark);
+        gc_list_merge(young, old);
+    }
+    else if (young != old) {
         if (generation == NUM_GENERATIONS - 2) {
             long_lived_pending += gc_list_size(young);
         }
@@ -972,6 +1205,7 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
         untrack_dicts(young);
         long_lived_pending = 0;
         long_lived_total = gc_list_size(young);
+        full_collection_total = long_lived_total;
     }
 
     /* All objects in unreachable are trash, but objects reachable from
@@ -1024,7 +1258,7 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
             debug_cycle("uncollectable", FROM_GC(gc));
     }
     if (debug & DEBUG_STATS) {
-        _PyTime_t t2 = _PyTime_GetMonotonicClock();
+        t2 = _PyTime_GetMonotonicClock();
 
         if (m == 0 && n == 0)
             PySys_WriteStderr("gc: done");
@@ -1042,9 +1276,18 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
      */
     (void)handle_legacy_finalizers(&finalizers, old);
 
+    if (incremental && incremental_in_pass
+        && gc_list_is_empty(GEN_HEAD(generation))) {
+        /* the pass examined the whole oldest generation */
+        long_lived_pending = 0;
+        long_lived_total = incremental_survivors;
+        end_incremental_pass();
+    }
+
     /* Clear free list only during the collection of the highest
-     * generation */
-    if (generation == NUM_GENERATIONS-1) {
+     * generation (at the end of a pass when collecting incrementally) */
+    if (generation == NUM_GENERATIONS-1
+        && !(incremental && incremental_in_pass)) {
         clear_freelists();
     }
 
@@ -1068,6 +1311,15 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
     stats->collections++;
     stats->collected += m;
     stats->uncollectable += n;
+    t2 = _PyTime_GetMonotonicClock();
+    record_pause(generation, t2 - t1);
+    if (incremental && examined > 0) {
+        /* smooth the cost per object over the last slices */
+        double cost = _PyTime_AsSecondsDouble(t2 - t1) / examined;
+        if (incremental_cost > 0.0)
+            cost = (incremental_cost * 3 + cost) / 4;
+        incremental_cost = cost;
+    }
     return n+m;
 }
 
@@ -1075,8 +1327,9 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
  * is starting or stopping
  */
 static void
-invoke_gc_callback(const char *phase, int generation,
-                   Py_ssize_t collected, Py_ssize_t uncollectable)
+invoke_gc_callback(const char *phase, int generation, int incremental,
+                   Py_ssize_t collected, Py_ssize_t uncollectable,
+                   _PyTime_t duration)
 {
     Py_ssize_t i;
     PyObject *info = NULL;
@@ -1087,10 +1340,19 @@ invoke_gc_callback(const char *phase, int generation,
     /* The local variable cannot be rebound, check it for sanity */
     assert(callbacks != NULL && PyList_CheckExact(callbacks));
     if (PyList_GET_SIZE(callbacks) != 0) {
-        info = Py_BuildValue("{sisnsn}",
-            "generation", generation,
-            "collected", collected,
-            "uncollectable", uncollectable);
+        if (strcmp(phase, "stop") == 0)
+            info = Py_BuildValue("{sisNsnsnsd}",
+                "generation", generation,
+                "incremental", PyBool_FromLong(incremental),
+                "collected", collected,
+                "uncollectable", uncollectable,
+                "duration", _PyTime_AsSecondsDouble(duration));
+        else
+            info = Py_BuildValue("{sisNsnsn}",
+                "generation", generation,
+                "incremental", PyBool_FromLong(incremental),
+                "collected", collected,
+                "uncollectable", uncollectable);
         if (info == NULL) {
             PyErr_WriteUnraisable(NULL);
             return;
@@ -1112,12 +1374,16 @@ invoke_gc_callback(const char *phase, int generation,
  * progress callbacks.
  */
 static Py_ssize_t
-collect_with_callback(int generation)
+collect_with_callback(int generation, int incremental)
 {
     Py_ssize_t result, collected, uncollectable;
-    invoke_gc_callback("start", generation, 0, 0);
-    result = collect(generation, &collected, &uncollectable, 0);
-    invoke_gc_callback("stop", generation, collected, uncollectable);
+    _PyTime_t t;
+    invoke_gc_callback("start", generation, incremental, 0, 0, 0);
+    t = _PyTime_GetMonotonicClock();
+    result = collect(generation, &collected, &uncollectable, 0, incremental);
+    t = _PyTime_GetMonotonicClock() - t;
+    invoke_gc_callback("stop", generation, incremental,
+                       collected, uncollectable, t);
     return result;
 }
 
@@ -1139,7 +1405,24 @@ collect_generations(void)
             if (i == NUM_GENERATIONS - 1
                 && long_lived_pending < long_lived_total / 4)
                 continue;
-            n = collect_with_callback(i);
+            if (INCREMENTAL_ENABLED()) {
+                /* A garbage cycle larger than a slice survives the
+                   incremental passes: collect everything at once
+                   whenever the oldest generation doubled in size. */
+                if (i == NUM_GENERATIONS - 1 && !incremental_in_pass
+                    && long_lived_total > 2 * full_collection_total) {
+                    n = collect_with_callback(i, 0);
+                    break;
+                }
+                /* Start a pass, or continue it instead of collecting the
+                   middle generation. */
+                if (i == NUM_GENERATIONS - 1 ||
+                    (i == NUM_GENERATIONS - 2 && incremental_in_pass)) {
+                    n = collect_with_callback(NUM_GENERATIONS - 1, 1);
+                    break;
+                }
+            }
+            n = collect_with_callback(i, 0);
             break;
         }
     }
@@ -1210,7 +1493,7 @@ gc_collect(PyObject *self, PyObject *args, PyObject *kws)
         n = 0; /* already collecting, don't do anything */
     else {
         collecting = 1;
-        n = collect_with_callback(genarg);
+        n = collect_with_callback(genarg, 0);
         collecting = 0;
     }
 
@@ -1304,6 +1587,81 @@ gc_get_count(PyObject *self, PyObject *noargs)
                          generations[2].count);
 }
 
+PyDoc_STRVAR(gc_set_incremental__doc__,
+"set_incremental(max_objects=None, max_time=None) -> None\n"
+"\n"
+"Collect the oldest generation incrementally, in slices examining at most\n"
+"max_objects objects, or taking about max_time seconds.  With both\n"
+"arguments None, collect the oldest generation all at once.\n");
+
+static PyObject *
+gc_set_incremental(PyObject *self, PyObject *args, PyObject *kws)
+{
+    static char *keywords[] = {"max_objects", "max_time", NULL};
+    PyObject *objects_arg = Py_None, *time_arg = Py_None;
+    Py_ssize_t max_objects = 0;
+    double max_time = 0.0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kws, "|OO:set_incremental",
+                                     keywords, &objects_arg, &time_arg))
+        return NULL;
+    if (objects_arg != Py_None) {
+        max_objects = PyLong_AsSsize_t(objects_arg);
+        if (max_objects == -1 && PyErr_Occurred())
+            return NULL;
+        if (max_objects <= 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "max_objects must be greater than 0");
+            return NULL;
+        }
+    }
+    if (time_arg != Py_None) {
+        max_time = PyFloat_AsDouble(time_arg);
+        if (max_time == -1.0 && PyErr_Occurred())
+            return NULL;
+        if (!(max_time > 0.0)) {
+            PyErr_SetString(PyExc_ValueError,
+                            "max_time must be greater than 0");
+            return NULL;
+        }
+    }
+    incremental_max_objects = max_objects;
+    incremental_max_time = max_time;
+    if (!INCREMENTAL_ENABLED())
+        end_incremental_pass();
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(gc_get_incremental__doc__,
+"get_incremental() -> (max_objects, max_time)\n"
+"\n"
+"Return the limits of incremental collections set by set_incremental().\n");
+
+static PyObject *
+gc_get_incremental(PyObject *self, PyObject *noargs)
+{
+    PyObject *max_objects, *max_time;
+
+    if (incremental_max_objects > 0)
+        max_objects = PyLong_FromSsize_t(incremental_max_objects);
+    else {
+        max_objects = Py_None;
+        Py_INCREF(max_objects);
+    }
+    if (incremental_max_time > 0.0)
+        max_time = PyFloat_FromDouble(incremental_max_time);
+    else {
+        max_time = Py_None;
+        Py_INCREF(max_time);
+    }
+    if (max_objects == NULL || max_time == NULL) {
+        Py_XDECREF(max_objects);
+        Py_XDECREF(max_time);
+        return NULL;
+    }
+    return Py_BuildValue("(NN)", max_objects, max_time);
+}
+
 static int
 referrersvisit(PyObject* obj, PyObject *objs)
 {
@@ -1350,6 +1708,11 @@ gc_get_referrers(PyObject *self, PyObject *args)
             return NULL;
         }
     }
+    if (!(gc_referrers_for(args, &incremental_visited, result)) ||
+        !(gc_referrers_for(args, &permanent_generation.head, result))) {
+        Py_DECREF(result);
+        return NULL;
+    }
     return result;
 }
 
@@ -1411,6 +1774,11 @@ gc_get_objects(PyObject *self, PyObject *noargs)
             return NULL;
         }
     }
+    if (append_objects(result, &incremental_visited) ||
+        append_objects(result, &permanent_generation.head)) {
+        Py_DECREF(result);
+        return NULL;
+    }
     return result;
 }
 
@@ -1459,6 +1827,66 @@ error:
     return NULL;
 }
 
+PyDoc_STRVAR(gc_get_pause_stats__doc__,
+"get_pause_stats() -> [...]\n"
+"\n"
+"Return a list of dictionaries containing per-generation pause times.\n");
+
+static PyObject *
+gc_get_pause_stats(PyObject *self, PyObject *noargs)
+{
+    int i, j;
+    PyObject *result;
+    struct gc_pause_stats stats[NUM_GENERATIONS], *st;
+
+    /* a snapshot, as in gc_get_stats() */
+    for (i = 0; i < NUM_GENERATIONS; i++) {
+        stats[i] = pause_stats[i];
+    }
+
+    result = PyList_New(0);
+    if (result == NULL)
+        return NULL;
+
+    for (i = 0; i < NUM_GENERATIONS; i++) {
+        PyObject *dict, *histogram;
+        double bound = 1e-4;
+        st = &stats[i];
+        histogram = PyList_New(PAUSE_BUCKETS);
+        if (histogram == NULL)
+            goto error;
+        for (j = 0; j < PAUSE_BUCKETS; j++) {
+            PyObject *item = Py_BuildValue(
+                "(dn)", j < PAUSE_BUCKETS-1 ? bound : Py_HUGE_VAL,
+                st->histogram[j]);
+            if (item == NULL) {
+                Py_DECREF(histogram);
+                goto error;
+            }
+            PyList_SET_ITEM(histogram, j, item);
+            bound *= 10;
+        }
+        dict = Py_BuildValue("{snsdsdsN}",
+                             "pauses", st->pauses,
+                             "total", _PyTime_AsSecondsDouble(st->total),
+                             "max", _PyTime_AsSecondsDouble(st->max),
+                             "histogram", histogram
+                            );
+        if (dict == NULL)
+            goto error;
+        if (PyList_Append(result, dict)) {
+            Py_DECREF(dict);
+            goto error;
+        }
+        Py_DECREF(dict);
+    }
+    return result;
+
+error:
+    Py_XDECREF(result);
+    return NULL;
+}
+
 
 PyDoc_STRVAR(gc_is_tracked__doc__,
 "is_tracked(obj) -> bool\n"
@@ -1481,6 +1909,58 @@ gc_is_tracked(PyObject *self, PyObject *obj)
 }
 
 
+PyDoc_STRVAR(gc_freeze__doc__,
+"freeze() -> None\n"
+"\n"
+"Freeze all current tracked objects and ignore them for future collections.\n"
+"\n"
+"This can be used before a POSIX fork() call to make the gc copy-on-write\n"
+"friendly.\n"
+"Note: collection before a POSIX fork() call may free pages for future\n"
+"allocation which can cause copy-on-write.\n");
+
+static PyObject *
+gc_freeze(PyObject *self, PyObject *noargs)
+{
+    int i;
+    end_incremental_pass();
+    for (i = 0; i < NUM_GENERATIONS; i++) {
+        /* keep incremental collections from pulling them back in */
+        gc_list_set_refs(GEN_HEAD(i), GC_PERMANENT);
+        gc_list_merge(GEN_HEAD(i), &permanent_generation.head);
+        generations[i].count = 0;
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(gc_unfreeze__doc__,
+"unfreeze() -> None\n"
+"\n"
+"Unfreeze all objects in the permanent generation.\n"
+"\n"
+"Put all objects in the permanent generation back into oldest generation.\n");
+
+static PyObject *
+gc_unfreeze(PyObject *self, PyObject *noargs)
+{
+    gc_list_set_refs(&permanent_generation.head, GC_REACHABLE);
+    gc_list_merge(&permanent_generation.head,
+                  GEN_HEAD(NUM_GENERATIONS-1));
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(gc_get_freeze_count__doc__,
+"get_freeze_count() -> int\n"
+"\n"
+"Return the number of objects in the permanent generation.\n");
+
+static PyObject *
+gc_get_freeze_count(PyObject *self, PyObject *noargs)
+{
+    return PyLong_FromSsize_t(gc_list_size(&permanent_generation.head));
+}
+
+
 PyDoc_STRVAR(gc__doc__,
 "This module provides access to the garbage collector for reference cycles.\n"
 "\n"
@@ -1490,14 +1970,20 @@ PyDoc_STRVAR(gc__doc__,
 "collect() -- Do a full collection right now.\n"
 "get_count() -- Return the current collection counts.\n"
 "get_stats() -- Return list of dictionaries containing per-generation stats.\n"
+"get_pause_stats() -- Return per-generation pause times.\n"
 "set_debug() -- Set debugging flags.\n"
 "get_debug() -- Get debugging flags.\n"
 "set_threshold() -- Set the collection thresholds.\n"
 "get_threshold() -- Return the current the collection thresholds.\n"
+"set_incremental() -- Collect the oldest generation in slices.\n"
+"get_incremental() -- Return the limits of incremental collections.\n"
 "get_objects() -- Return a list of all objects tracked by the collector.\n"
 "is_tracked() -- Returns true if a given object is tracked.\n"
 "get_referrers() -- Return the list of objects that refer to an object.\n"
-"get_referents() -- Return the list of objects that an object refers to.\n");
+"get_referents() -- Return the list of objects that an object refers to.\n"
+"freeze() -- Freeze all tracked objects and ignore them for future collections.\n"
+"unfreeze() -- Unfreeze all objects in the permanent generation.\n"
+"get_freeze_count() -- Return the number of objects in the permanent generation.\n");
 
 static PyMethodDef GcMethods[] = {
     {"enable",             gc_enable,     METH_NOARGS,  gc_enable__doc__},
@@ -1508,15 +1994,25 @@ static PyMethodDef GcMethods[] = {
     {"get_count",          gc_get_count,  METH_NOARGS,  gc_get_count__doc__},
     {"set_threshold",  gc_set_thresh, METH_VARARGS, gc_set_thresh__doc__},
     {"get_threshold",  gc_get_thresh, METH_NOARGS,  gc_get_thresh__doc__},
+    {"set_incremental", (PyCFunction)gc_set_incremental,
+        METH_VARARGS | METH_KEYWORDS,           gc_set_incremental__doc__},
+    {"get_incremental", gc_get_incremental, METH_NOARGS,
+        gc_get_incremental__doc__},
     {"collect",            (PyCFunction)gc_collect,
         METH_VARARGS | METH_KEYWORDS,           gc_collect__doc__},
     {"get_objects",    gc_get_objects,METH_NOARGS,  gc_get_objects__doc__},
     {"get_stats",      gc_get_stats, METH_NOARGS, gc_get_stats__doc__},
+    {"get_pause_stats", gc_get_pause_stats, METH_NOARGS,
+        gc_get_pause_stats__doc__},
     {"is_tracked",     gc_is_tracked, METH_O,       gc_is_tracked__doc__},
     {"get_referrers",  gc_get_referrers, METH_VARARGS,
         gc_get_referrers__doc__},
     {"get_referents",  gc_get_referents, METH_VARARGS,
         gc_get_referents__doc__},
+    {"freeze",         gc_freeze,     METH_NOARGS,  gc_freeze__doc__},
+    {"unfreeze",       gc_unfreeze,   METH_NOARGS,  gc_unfreeze__doc__},
+    {"get_freeze_count", gc_get_freeze_count, METH_NOARGS,
+        gc_get_freeze_count__doc__},
     {NULL,      NULL}           /* Sentinel */
 };
 
@@ -1580,7 +2076,7 @@ PyGC_Collect(void)
         n = 0; /* already collecting, don't do anything */
     else {
         collecting = 1;
-        n = collect_with_callback(NUM_GENERATIONS - 1);
+        n = collect_with_callback(NUM_GENERATIONS - 1, 0);
         collecting = 0;
     }
 
@@ -1602,7 +2098,7 @@ _PyGC_CollectNoFail(void)
         n = 0;
     else {
         collecting = 1;
-        n = collect(NUM_GENERATIONS - 1, NULL, NULL, 1);
+        n = collect(NUM_GENERATIONS - 1, NULL, NULL, 1, 0);
         collecting = 0;
     }
     return n;
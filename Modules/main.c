@@ -80,6 +80,8 @@ static const char usage_3[] = "\
 -X opt : set implementation-specific option\n\
 ";
 static const char usage_4[] = "\
+--check-hash-based-pycs always|default|never:\n\
+    control how Python invalidates hash-based .pyc files\n\
 file   : program read from script file\n\
 -      : program read from stdin (default; interactive mode if a tty)\n\
 arg ...: arguments passed to program in sys.argv[1:]\n\n\
@@ -498,6 +500,21 @@ Py_Main(int argc, wchar_t **argv)
             /* Ignored */
             break;
 
+        case 0:
+            /* --check-hash-based-pycs */
+            if (wcscmp(_PyOS_optarg, L"always") == 0)
+                _Py_CheckHashBasedPycsMode = "always";
+            else if (wcscmp(_PyOS_optarg, L"never") == 0)
+                _Py_CheckHashBasedPycsMode = "never";
+            else if (wcscmp(_PyOS_optarg, L"default") == 0)
+                _Py_CheckHashBasedPycsMode = "default";
+            else {
+                fprintf(stderr, "--check-hash-based-pycs must be one of "
+                        "'default', 'always', or 'never'\n");
+                return usage(2, argv[0]);
+            }
+            break;
+
         /* This space reserved for other options */
 
         default:
@@ -8667,6 +8667,73 @@ os_pwrite_impl(PyObject *module, int fd, Py_buffer *buffer, Py_off_t offset)
 #endif /* HAVE_PWRITE */
 
 
+#ifdef HAVE_COPY_FILE_RANGE
+/*[clinic input]
+os.copy_file_range
+
+    src: int
+        Source file descriptor.
+    dst: int
+        Destination file descriptor.
+    count: Py_ssize_t
+        Number of bytes to copy.
+    offset_src: object = None
+        Starting offset in src.
+    offset_dst: object = None
+        Starting offset in dst.
+
+Copy count bytes from one file descriptor to another.
+
+The data is copied inside the kernel, without going through user space.
+If offset_src is None, src is read from its current position, which is
+then updated; likewise for offset_dst.  Returns the number of bytes
+copied, which may be less than count; 0 means end of file.
+[clinic start generated code]*/
+
+static PyObject *
+os_copy_file_range_impl(PyObject *module, int src, int dst, Py_ssize_t count,
+                        PyObject *offset_src, PyObject *offset_dst)
+/*[clinic end generated code: output=1a91713a1d99fc7a input=6a9d945c0a5be00a]*/
+{
+    Py_off_t offset_src_val, offset_dst_val;
+    loff_t *p_offset_src = NULL;
+    loff_t *p_offset_dst = NULL;
+    loff_t off_src, off_dst;
+    Py_ssize_t ret;
+    int async_err = 0;
+
+    if (count < 0) {
+        PyErr_SetString(PyExc_ValueError, "negative value not allowed");
+        return NULL;
+    }
+    if (offset_src != Py_None) {
+        if (!Py_off_t_converter(offset_src, &offset_src_val))
+            return NULL;
+        off_src = offset_src_val;
+        p_offset_src = &off_src;
+    }
+    if (offset_dst != Py_None) {
+        if (!Py_off_t_converter(offset_dst, &offset_dst_val))
+            return NULL;
+        off_dst = offset_dst_val;
+        p_offset_dst = &off_dst;
+    }
+
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        /* The flags argument must currently be 0 */
+        ret = copy_file_range(src, p_offset_src, dst, p_offset_dst,
+                              (size_t)count, 0);
+        Py_END_ALLOW_THREADS
+    } while (ret < 0 && errno == EINTR && !(async_err = PyErr_CheckSignals()));
+
+    if (ret < 0)
+        return (!async_err) ? posix_error() : NULL;
+    return PyLong_FromSsize_t(ret);
+}
+#endif /* HAVE_COPY_FILE_RANGE */
+
+
 #ifdef HAVE_MKFIFO
 /*[clinic input]
 os.mkfifo
@@ -11429,6 +11496,7 @@ typedef struct {
     unsigned char d_type;
 #endif
     ino_t d_ino;
+    int dir_fd;
 #endif
 } DirEntry;
 
@@ -11505,7 +11573,17 @@ DirEntry_fetch_stat(DirEntry *self, int follow_symlinks)
         return NULL;
     path = PyBytes_AS_STRING(bytes);
 
-    if (follow_symlinks)
+    if (self->dir_fd != DEFAULT_DIR_FD) {
+#ifdef HAVE_FSTATAT
+        result = fstatat(self->dir_fd, path, &st,
+                         follow_symlinks ? 0 : AT_SYMLINK_NOFOLLOW);
+#else
+        Py_DECREF(bytes);
+        PyErr_SetString(PyExc_NotImplementedError, "can't fetch stat");
+        return NULL;
+#endif /* HAVE_FSTATAT */
+    }
+    else if (follow_symlinks)
         result = STAT(path, &st);
     else
         result = LSTAT(path, &st);
@@ -11912,21 +11990,34 @@ DirEntry_from_posix_info(path_t *path, const char *name, Py_ssize_t name_len,
     entry->stat = NULL;
     entry->lstat = NULL;
 
-    joined_path = join_path_filename(path->narrow, name, name_len);
-    if (!joined_path)
-        goto error;
-
-    if (!path->narrow || !PyBytes_Check(path->object)) {
+    if (path->fd != -1) {
+        /* Scanning a directory file descriptor: the path is relative to
+           it, so it is the name, and stat() needs the descriptor */
+        entry->dir_fd = path->fd;
         entry->name = PyUnicode_DecodeFSDefaultAndSize(name, name_len);
-        entry->path = PyUnicode_DecodeFSDefault(joined_path);
+        if (!entry->name)
+            goto error;
+        Py_INCREF(entry->name);
+        entry->path = entry->name;
     }
     else {
-        entry->name = PyBytes_FromStringAndSize(name, name_len);
-        entry->path = PyBytes_FromString(joined_path);
+        entry->dir_fd = DEFAULT_DIR_FD;
+        joined_path = join_path_filename(path->narrow, name, name_len);
+        if (!joined_path)
+            goto error;
+
+        if (!path->narrow || !PyBytes_Check(path->object)) {
+            entry->name = PyUnicode_DecodeFSDefaultAndSize(name, name_len);
+            entry->path = PyUnicode_DecodeFSDefault(joined_path);
+        }
+        else {
+            entry->name = PyBytes_FromStringAndSize(name, name_len);
+            entry->path = PyBytes_FromString(joined_path);
+        }
+        PyMem_Free(joined_path);
+        if (!entry->name || !entry->path)
+            goto error;
     }
-    PyMem_Free(joined_path);
-    if (!entry->name || !entry->path)
-        goto error;
 
 #ifdef HAVE_DIRENT_D_TYPE
     entry->d_type = d_type;
@@ -12037,6 +12128,11 @@ ScandirIterator_closedir(ScandirIterator *iterator)
 
     iterator->dirp = NULL;
     Py_BEGIN_ALLOW_THREADS
+#ifdef HAVE_FDOPENDIR
+    /* The duplicated descriptor shares its position with the caller's */
+    if (iterator->path.fd != -1)
+        rewinddir(dirp);
+#endif
     closedir(dirp);
     Py_END_ALLOW_THREADS
     return;
@@ -12219,6 +12315,9 @@ posix_scandir(PyObject *self, PyObject *args, PyObject *kwargs)
     wchar_t *path_strW;
 #else
     const char *path;
+#ifdef HAVE_FDOPENDIR
+    int fd = -1;
+#endif
 #endif
 
     iterator = PyObject_New(ScandirIterator, &ScandirIteratorType);
@@ -12227,6 +12326,10 @@ posix_scandir(PyObject *self, PyObject *args, PyObject *kwargs)
     memset(&iterator->path, 0, sizeof(path_t));
     iterator->path.function_name = "scandir";
     iterator->path.nullable = 1;
+    iterator->path.fd = -1;
+#ifdef HAVE_FDOPENDIR
+    iterator->path.allow_fd = 1;
+#endif
 
 #ifdef MS_WINDOWS
     iterator->handle = INVALID_HANDLE_VALUE;
@@ -12267,18 +12370,40 @@ posix_scandir(PyObject *self, PyObject *args, PyObject *kwargs)
         goto error;
     }
 #else /* POSIX */
-    if (iterator->path.narrow)
-        path = iterator->path.narrow;
+    errno = 0;
+#ifdef HAVE_FDOPENDIR
+    if (iterator->path.fd != -1) {
+        /* closedir() closes the FD, so we duplicate it */
+        fd = _Py_dup(iterator->path.fd);
+        if (fd == -1)
+            goto error;
+
+        Py_BEGIN_ALLOW_THREADS
+        iterator->dirp = fdopendir(fd);
+        Py_END_ALLOW_THREADS
+    }
     else
-        path = ".";
+#endif
+    {
+        if (iterator->path.narrow)
+            path = iterator->path.narrow;
+        else
+            path = ".";
 
-    errno = 0;
-    Py_BEGIN_ALLOW_THREADS
-    iterator->dirp = opendir(path);
-    Py_END_ALLOW_THREADS
+        Py_BEGIN_ALLOW_THREADS
+        iterator->dirp = opendir(path);
+        Py_END_ALLOW_THREADS
+    }
 
     if (!iterator->dirp) {
         path_error(&iterator->path);
+#ifdef HAVE_FDOPENDIR
+        if (fd != -1) {
+            Py_BEGIN_ALLOW_THREADS
+            close(fd);
+            Py_END_ALLOW_THREADS
+        }
+#endif
         goto error;
     }
 #endif
@@ -12478,6 +12603,7 @@ static PyMethodDef posix_methods[] = {
     OS_WRITE_METHODDEF
     OS_WRITEV_METHODDEF
     OS_PWRITE_METHODDEF
+    OS_COPY_FILE_RANGE_METHODDEF
 #ifdef HAVE_SENDFILE
     {"sendfile",        (PyCFunction)posix_sendfile, METH_VARARGS | METH_KEYWORDS,
                             posix_sendfile__doc__},
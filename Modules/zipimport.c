@@ -44,13 +44,42 @@ struct _zipimporter {
     PyObject *files;    /* dict with file info {path: toc_entry} */
 };
 
+/* The files dict of an archive.  It is shared by all zipimporters for
+   the archive through zip_directory_cache and, where pread() is available,
+   keeps the archive open: get_data() then reads the file data with pread()
+   instead of reopening the archive. */
+typedef struct {
+    PyDictObject dict;
+#ifdef HAVE_PREAD
+    FILE *fp;                   /* NULL if the archive isn't kept open */
+    struct stat st;             /* stat of the archive when opened */
+#endif
+} ZipDirectory;
+
+static PyTypeObject ZipDirectory_Type;
+
+#define ZipDirectory_Check(op) PyObject_TypeCheck(op, &ZipDirectory_Type)
+
+#ifdef HAVE_PREAD
+#if defined(HAVE_STAT_TV_NSEC)
+#define ST_MTIME_NSEC(st) ((st).st_mtim.tv_nsec)
+#elif defined(HAVE_STAT_TV_NSEC2)
+#define ST_MTIME_NSEC(st) ((st).st_mtimespec.tv_nsec)
+#elif defined(HAVE_STAT_NSEC)
+#define ST_MTIME_NSEC(st) ((st).st_mtime_nsec)
+#else
+#define ST_MTIME_NSEC(st) 0
+#endif
+#endif
+
 static PyObject *ZipImportError;
 /* read_directory() cache */
 static PyObject *zip_directory_cache = NULL;
 
 /* forward decls */
 static PyObject *read_directory(PyObject *archive);
-static PyObject *get_data(PyObject *archive, PyObject *toc_entry);
+static PyObject *get_data(PyObject *archive, PyObject *files,
+                          PyObject *toc_entry);
 static PyObject *get_module_code(ZipImporter *self, PyObject *fullname,
                                  int *p_ispackage, PyObject **p_modpath);
 
@@ -609,7 +638,7 @@ zipimporter_get_data(PyObject *obj, PyObject *args)
     }
     Py_DECREF(key);
     Py_DECREF(path);
-    return get_data(self->archive, toc_entry);
+    return get_data(self->archive, self->files, toc_entry);
   error:
     Py_DECREF(path);
     return NULL;
@@ -667,7 +696,7 @@ zipimporter_get_source(PyObject *obj, PyObject *args)
     Py_DECREF(fullpath);
     if (toc_entry != NULL) {
         PyObject *res, *bytes;
-        bytes = get_data(self->archive, toc_entry);
+        bytes = get_data(self->archive, self->files, toc_entry);
         if (bytes == NULL)
             return NULL;
         res = PyUnicode_FromStringAndSize(PyBytes_AS_STRING(bytes),
@@ -825,6 +854,57 @@ static PyTypeObject ZipImporter_Type = {
 };
 
 
+/* zip directory object definition */
+
+static void
+zipdirectory_dealloc(ZipDirectory *self)
+{
+#ifdef HAVE_PREAD
+    /* dict_dealloc() may be deferred by the trashcan and call us again */
+    if (self->fp != NULL) {
+        fclose(self->fp);
+        self->fp = NULL;
+    }
+#endif
+    PyDict_Type.tp_dealloc((PyObject *)self);
+}
+
+static PyTypeObject ZipDirectory_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "zipimport._ZipDirectory",
+    sizeof(ZipDirectory),
+    0,                                          /* tp_itemsize */
+    (destructor)zipdirectory_dealloc,           /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                         /* tp_flags (GC
+                                                   is inherited) */
+    0,                                          /* tp_doc */
+    0,                                          /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    0,                                          /* tp_methods */
+    0,                                          /* tp_members */
+    0,                                          /* tp_getset */
+    DEFERRED_ADDRESS(&PyDict_Type),             /* tp_base */
+};
+
+
 /* implementation */
 
 /* Given a buffer, return the unsigned int that is represented by the first
@@ -864,6 +944,25 @@ set_file_error(PyObject *archive, int eof)
     }
 }
 
+#ifdef HAVE_PREAD
+/* Keep the archive opened as fp for the zip directory object, which
+   takes over fp.  Return 0 if the archive can't be checked for changes
+   with stat() later on: the caller then closes it, and get_data()
+   reopens the archive for each file. */
+static int
+keep_archive_open(ZipDirectory *zd, FILE *fp)
+{
+    struct stat st;
+
+    if (fstat(fileno(fp), &st) != 0 || !S_ISREG(st.st_mode)) {
+        return 0;
+    }
+    zd->fp = fp;
+    zd->st = st;
+    return 1;
+}
+#endif
+
 /*
    read_directory(archive) -> files dict (new reference)
 
@@ -885,6 +984,8 @@ set_file_error(PyObject *archive, int eof)
 
    Directories can be recognized by the trailing SEP in the name,
    data_size and file_offset are 0.
+
+   The central directory is read in one go and parsed from memory.
 */
 static PyObject *
 read_directory(PyObject *archive)
@@ -896,7 +997,10 @@ read_directory(PyObject *archive)
     unsigned long file_offset, header_position;
     unsigned long arc_offset;  /* Absolute offset to start of the zip-archive. */
     unsigned int count, i;
-    unsigned char buffer[46];
+    unsigned char buffer[22];
+    const unsigned char *p = NULL, *end;
+    unsigned char *dir_copy = NULL;
+    size_t dir_size;
     char name[MAXPATHLEN + 5];
     PyObject *nameobj = NULL;
     PyObject *path;
@@ -948,57 +1052,79 @@ read_directory(PyObject *archive)
     }
     header_position -= header_size;
     arc_offset = header_position - header_offset;
+    dir_size = header_size;
 
-    files = PyDict_New();
+    files = PyObject_CallObject((PyObject *)&ZipDirectory_Type, NULL);
     if (files == NULL) {
         goto error;
     }
     /* Start of Central Directory */
-    count = 0;
+    dir_copy = (unsigned char *)PyMem_Malloc(dir_size + 1);
+    if (dir_copy == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
     if (fseek(fp, (long)header_position, 0) == -1) {
         goto file_error;
     }
+    if (fread(dir_copy, 1, dir_size, fp) != dir_size) {
+        goto eof_error;
+    }
+#ifdef HAVE_PREAD
+    if (!keep_archive_open((ZipDirectory *)files, fp))
+#endif
+    {
+        fclose(fp);
+    }
+    fp = NULL;
+    p = dir_copy;
+
+    end = p + dir_size;
+    count = 0;
     for (;;) {
         PyObject *t;
-        size_t n;
         int err;
 
-        n = fread(buffer, 1, 46, fp);
-        if (n < 4) {
+        if (p == end) {
+            break;
+        }
+        if (end - p < 4) {
             goto eof_error;
         }
         /* Start of file header */
-        if (get_uint32(buffer) != 0x02014B50u) {
+        if (get_uint32(p) != 0x02014B50u) {
             break;              /* Bad: Central Dir File Header */
         }
-        if (n != 46) {
+        if (end - p < 46) {
             goto eof_error;
         }
-        flags = get_uint16(buffer + 8);
-        compress = get_uint16(buffer + 10);
-        time = get_uint16(buffer + 12);
-        date = get_uint16(buffer + 14);
-        crc = get_uint32(buffer + 16);
-        data_size = get_uint32(buffer + 20);
-        file_size = get_uint32(buffer + 24);
-        name_size = get_uint16(buffer + 28);
+        flags = get_uint16(p + 8);
+        compress = get_uint16(p + 10);
+        time = get_uint16(p + 12);
+        date = get_uint16(p + 14);
+        crc = get_uint32(p + 16);
+        data_size = get_uint32(p + 20);
+        file_size = get_uint32(p + 24);
+        name_size = get_uint16(p + 28);
         header_size = (unsigned int)name_size +
-           get_uint16(buffer + 30) /* extra field */ +
-           get_uint16(buffer + 32) /* comment */;
+           get_uint16(p + 30) /* extra field */ +
+           get_uint16(p + 32) /* comment */;
 
-        file_offset = get_uint32(buffer + 42);
+        file_offset = get_uint32(p + 42);
         if (file_offset > header_offset) {
             errmsg = "bad local header offset";
             goto invalid_header;
         }
         file_offset += arc_offset;
 
+        p += 46;
+        if ((size_t)(end - p) < header_size) {
+            goto eof_error;
+        }
         if (name_size > MAXPATHLEN) {
             name_size = MAXPATHLEN;
         }
-        if (fread(name, 1, name_size, fp) != name_size) {
-            goto file_error;
-        }
+        memcpy(name, p, name_size);
         name[name_size] = '\0';  /* Add terminating null byte */
         if (SEP != '/') {
             for (i = 0; i < name_size; i++) {
@@ -1007,16 +1133,8 @@ read_directory(PyObject *archive)
                 }
             }
         }
-        /* Skip the rest of the header.
-         * On Windows, calling fseek to skip over the fields we don't use is
-         * slower than reading the data because fseek flushes stdio's
-         * internal buffers.  See issue #8745. */
-        assert(header_size <= 3*0xFFFFu);
-        for (i = name_size; i < header_size; i++) {
-            if (getc(fp) == EOF) {
-                goto file_error;
-            }
-        }
+        /* Skip the rest of the header */
+        p += header_size;
 
         bootstrap = 0;
         if (flags & 0x0800) {
@@ -1065,7 +1183,7 @@ read_directory(PyObject *archive)
         }
         count++;
     }
-    fclose(fp);
+    PyMem_Free(dir_copy);
     if (Py_VerboseFlag) {
         PySys_FormatStderr("# zipimport: found %u names in %R\n",
                            count, archive);
@@ -1073,7 +1191,7 @@ read_directory(PyObject *archive)
     return files;
 
 eof_error:
-    set_file_error(archive, !ferror(fp));
+    set_file_error(archive, fp == NULL || !ferror(fp));
     goto error;
 
 file_error:
@@ -1086,7 +1204,10 @@ invalid_header:
     goto error;
 
 error:
-    fclose(fp);
+    if (fp != NULL) {
+        fclose(fp);
+    }
+    PyMem_Free(dir_copy);
     Py_XDECREF(files);
     Py_XDECREF(nameobj);
     return NULL;
@@ -1125,18 +1246,91 @@ get_decompress_func(void)
     return decompress;
 }
 
-/* Given a path to a Zip file and a toc_entry, return the (uncompressed)
-   data as a new reference. */
+#ifdef HAVE_PREAD
+/* Return the file descriptor of the archive kept open by its zip
+   directory, or -1 if it isn't kept open or has changed on disk since it
+   was opened (the archive is then reopened, as it may have been replaced
+   or truncated).  Return -2 with an exception set on error. */
+static int
+get_archive_fd(PyObject *archive, PyObject *files)
+{
+    ZipDirectory *zd;
+    struct stat st;
+    int rv;
+
+    if (!ZipDirectory_Check(files)) {
+        return -1;
+    }
+    zd = (ZipDirectory *)files;
+    if (zd->fp == NULL) {
+        return -1;
+    }
+    rv = _Py_stat(archive, &st);
+    if (rv == -2) {
+        return -2;
+    }
+    if (rv != 0 ||
+        st.st_size != zd->st.st_size ||
+        st.st_mtime != zd->st.st_mtime ||
+        ST_MTIME_NSEC(st) != ST_MTIME_NSEC(zd->st) ||
+        st.st_ino != zd->st.st_ino ||
+        st.st_dev != zd->st.st_dev) {
+        fclose(zd->fp);
+        zd->fp = NULL;
+        return -1;
+    }
+    return fileno(zd->fp);
+}
+#endif
+
+/* Read size bytes at offset of the archive, from fp if it isn't NULL
+   or else with pread() from fd.  pread() leaves the file position alone,
+   which may be shared with forked processes.  Return the number of bytes
+   read, which is less than size at the end of the file, or -1 if the
+   archive can't be read. */
+static Py_ssize_t
+read_archive(FILE *fp, int fd, long offset, void *buf, Py_ssize_t size)
+{
+#ifdef HAVE_PREAD
+    Py_ssize_t done, n;
+
+    if (fp == NULL) {
+        for (done = 0; done < size; done += n) {
+            n = pread(fd, (char *)buf + done, (size_t)(size - done),
+                      (off_t)offset + done);
+            if (n == 0) {
+                break;
+            }
+            if (n < 0) {
+                if (errno == EINTR) {
+                    n = 0;
+                    continue;
+                }
+                return -1;
+            }
+        }
+        return done;
+    }
+#endif
+    if (fseek(fp, offset, 0) == -1) {
+        return -1;
+    }
+    return (Py_ssize_t)fread(buf, 1, (size_t)size, fp);
+}
+
+/* Given a path to a Zip file, its files dict and a toc_entry, return the
+   (uncompressed) data as a new reference. */
 static PyObject *
-get_data(PyObject *archive, PyObject *toc_entry)
+get_data(PyObject *archive, PyObject *files, PyObject *toc_entry)
 {
     PyObject *raw_data = NULL, *data, *decompress;
     char *buf;
-    FILE *fp;
+    FILE *fp = NULL;
+    int fd = -1;
     PyObject *datapath;
     unsigned short compress, time, date;
     unsigned int crc;
-    Py_ssize_t data_size, file_size, bytes_size;
+    Py_ssize_t data_size, file_size, bytes_size, n;
     long file_offset, header_size;
     unsigned char buffer[30];
     const char *errmsg = NULL;
@@ -1151,15 +1345,24 @@ get_data(PyObject *archive, PyObject *toc_entry)
         return NULL;
     }
 
-    fp = _Py_fopen_obj(archive, "rb");
-    if (!fp) {
+#ifdef HAVE_PREAD
+    fd = get_archive_fd(archive, files);
+    if (fd == -2) {
         return NULL;
     }
+#endif
+    if (fd < 0) {
+        fp = _Py_fopen_obj(archive, "rb");
+        if (!fp) {
+            return NULL;
+        }
+    }
     /* Check to make sure the local file header is correct */
-    if (fseek(fp, file_offset, 0) == -1) {
+    n = read_archive(fp, fd, file_offset, buffer, 30);
+    if (n < 0) {
         goto file_error;
     }
-    if (fread(buffer, 1, 30, fp) != 30) {
+    if (n != 30) {
         goto eof_error;
     }
     if (get_uint32(buffer) != 0x04034B50u) {
@@ -1178,7 +1381,9 @@ get_data(PyObject *archive, PyObject *toc_entry)
     file_offset += header_size;  /* Start of file data */
 
     if (data_size > LONG_MAX - 1) {
-        fclose(fp);
+        if (fp != NULL) {
+            fclose(fp);
+        }
         PyErr_NoMemory();
         return NULL;
     }
@@ -1192,17 +1397,20 @@ get_data(PyObject *archive, PyObject *toc_entry)
     }
     buf = PyBytes_AsString(raw_data);
 
-    if (fseek(fp, file_offset, 0) == -1) {
+    n = read_archive(fp, fd, file_offset, buf, data_size);
+    if (n < 0) {
         goto file_error;
     }
-    if (fread(buf, 1, data_size, fp) != (size_t)data_size) {
+    if (n != data_size) {
         PyErr_SetString(PyExc_IOError,
                         "zipimport: can't read data");
         goto error;
     }
 
-    fclose(fp);
-    fp = NULL;
+    if (fp != NULL) {
+        fclose(fp);
+        fp = NULL;
+    }
 
     if (compress != 0) {
         buf[data_size] = 'Z';  /* saw this in zipfile.py */
@@ -1230,7 +1438,7 @@ get_data(PyObject *archive, PyObject *toc_entry)
     return data;
 
 eof_error:
-    set_file_error(archive, !ferror(fp));
+    set_file_error(archive, fp == NULL || !ferror(fp));
     goto error;
 
 file_error:
@@ -1274,8 +1482,9 @@ unmarshal_code(PyObject *pathname, PyObject *data, time_t mtime)
     PyObject *code;
     unsigned char *buf = (unsigned char *)PyBytes_AsString(data);
     Py_ssize_t size = PyBytes_Size(data);
+    unsigned int flags;
 
-    if (size < 12) {
+    if (size < 16) {
         PyErr_SetString(ZipImportError,
                         "bad pyc data");
         return NULL;
@@ -1290,7 +1499,20 @@ unmarshal_code(PyObject *pathname, PyObject *data, time_t mtime)
         return Py_None;  /* signal caller to try alternative */
     }
 
-    if (mtime != 0 && !eq_mtime(get_uint32(buf + 4), mtime)) {
+    flags = get_uint32(buf + 4);
+    if (flags != 0) {
+        /* Hash-based pyc.  Checking the hash would mean reading and hashing
+           the source from the archive, so only unchecked hash-based pycs
+           (or any of them under --check-hash-based-pycs never) are used;
+           otherwise fall back to the source. */
+        if (strcmp(_Py_CheckHashBasedPycsMode, "never") != 0 &&
+            (flags != 0x1 ||
+             strcmp(_Py_CheckHashBasedPycsMode, "always") == 0)) {
+            Py_INCREF(Py_None);
+            return Py_None;  /* signal caller to try alternative */
+        }
+    }
+    else if (mtime != 0 && !eq_mtime(get_uint32(buf + 8), mtime)) {
         if (Py_VerboseFlag) {
             PySys_FormatStderr("# %R has bad mtime\n",
                                pathname);
@@ -1301,7 +1523,7 @@ unmarshal_code(PyObject *pathname, PyObject *data, time_t mtime)
 
     /* XXX the pyc's size field is ignored; timestamp collisions are probably
        unimportant with zip files. */
-    code = PyMarshal_ReadObjectFromString((char *)buf + 12, size - 12);
+    code = PyMarshal_ReadObjectFromString((char *)buf + 16, size - 16);
     if (code == NULL) {
         return NULL;
     }
@@ -1443,7 +1665,7 @@ get_code_from_data(ZipImporter *self, int ispackage, int isbytecode,
 {
     PyObject *data, *modpath, *code;
 
-    data = get_data(self->archive, toc_entry);
+    data = get_data(self->archive, self->files, toc_entry);
     if (data == NULL)
         return NULL;
 
@@ -1580,6 +1802,10 @@ PyInit_zipimport(void)
                            ZipImportError) < 0)
         return NULL;
 
+    ZipDirectory_Type.tp_base = &PyDict_Type;
+    if (PyType_Ready(&ZipDirectory_Type) < 0)
+        return NULL;
+
     Py_INCREF(&ZipImporter_Type);
     if (PyModule_AddObject(mod, "zipimporter",
                            (PyObject *)&ZipImporter_Type) < 0)
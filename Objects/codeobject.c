@@ -1,5 +1,6 @@
 #include "Python.h"
 #include "code.h"
+#include "opcode.h"
 #include "structmember.h"
 
 #define NAME_CHARS \
@@ -152,9 +153,63 @@ PyCode_New(int argcount, int kwonlyargcount,
     co->co_lnotab = lnotab;
     co->co_zombieframe = NULL;
     co->co_weakreflist = NULL;
+    co->co_extra = NULL;
+    co->co_opcache_map = NULL;
+    co->co_opcache = NULL;
+    co->co_opcache_flag = 0;
+    co->co_opcache_size = 0;
     return co;
 }
 
+int
+_PyCode_InitOpcache(PyCodeObject *co)
+{
+    const unsigned char *code;
+    Py_ssize_t i, co_size, opts = 0;
+
+    co_size = PyBytes_GET_SIZE(co->co_code) / 2;
+    /* The map is indexed by the offset of the *next* instruction, hence
+       the extra byte. */
+    co->co_opcache_map = (unsigned char *)PyMem_Calloc(co_size + 1, 1);
+    if (co->co_opcache_map == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    code = (const unsigned char *)PyBytes_AS_STRING(co->co_code);
+    for (i = 0; i < co_size; ) {
+        unsigned char opcode = code[2*i];
+        i++;  /* 'i' is now aligned to (next_instr - first_instr) */
+
+        if (opcode == LOAD_GLOBAL || opcode == LOAD_ATTR ||
+                opcode == LOAD_METHOD) {
+            opts++;
+            co->co_opcache_map[i] = (unsigned char)opts;
+            if (opts > 254) {
+                break;
+            }
+        }
+    }
+
+    if (opts) {
+        co->co_opcache = (_PyOpcache *)PyMem_Calloc(opts, sizeof(_PyOpcache));
+        if (co->co_opcache == NULL) {
+            PyMem_FREE(co->co_opcache_map);
+            co->co_opcache_map = NULL;
+            PyErr_NoMemory();
+            return -1;
+        }
+    }
+    else {
+        PyMem_FREE(co->co_opcache_map);
+        co->co_opcache_map = NULL;
+        co->co_opcache = NULL;
+    }
+
+    co->co_opcache_size = (unsigned char)opts;
+    return 0;
+}
+
 PyCodeObject *
 PyCode_NewEmpty(const char *filename, const char *funcname, int firstlineno)
 {
@@ -358,9 +413,31 @@ code_new(PyTypeObject *type, PyObject *args, PyObject *kw)
     return co;
 }
 
+/* Holder for co_extra information */
+typedef struct {
+    Py_ssize_t ce_size;
+    void *ce_extras[1];
+} _PyCodeObjectExtra;
+
 static void
 code_dealloc(PyCodeObject *co)
 {
+    if (co->co_extra != NULL) {
+        PyInterpreterState *interp = PyThreadState_Get()->interp;
+        _PyCodeObjectExtra *co_extra = co->co_extra;
+        Py_ssize_t i;
+
+        for (i = 0; i < co_extra->ce_size; i++) {
+            freefunc free_extra = interp->co_extra_freefuncs[i];
+
+            if (free_extra != NULL) {
+                free_extra(co_extra->ce_extras[i]);
+            }
+        }
+
+        PyMem_Free(co_extra);
+    }
+
     Py_XDECREF(co->co_code);
     Py_XDECREF(co->co_consts);
     Py_XDECREF(co->co_names);
@@ -372,6 +449,10 @@ code_dealloc(PyCodeObject *co)
     Py_XDECREF(co->co_lnotab);
     if (co->co_cell2arg != NULL)
         PyMem_FREE(co->co_cell2arg);
+    if (co->co_opcache_map != NULL)
+        PyMem_FREE(co->co_opcache_map);
+    if (co->co_opcache != NULL)
+        PyMem_FREE(co->co_opcache);
     if (co->co_zombieframe != NULL)
         PyObject_GC_Del(co->co_zombieframe);
     if (co->co_weakreflist != NULL)
@@ -383,10 +464,19 @@ static PyObject *
 code_sizeof(PyCodeObject *co, void *unused)
 {
     Py_ssize_t res;
+    _PyCodeObjectExtra *co_extra = (_PyCodeObjectExtra*) co->co_extra;
 
     res = _PyObject_SIZE(Py_TYPE(co));
     if (co->co_cell2arg != NULL && co->co_cellvars != NULL)
         res += PyTuple_GET_SIZE(co->co_cellvars) * sizeof(unsigned char);
+    if (co_extra != NULL)
+        res += sizeof(_PyCodeObjectExtra) +
+               (co_extra->ce_size-1) * sizeof(co_extra->ce_extras[0]);
+    if (co->co_opcache != NULL) {
+        /* co_opcache_map has one byte per code unit, plus one */
+        res += PyBytes_GET_SIZE(co->co_code) / 2 + 1;
+        res += co->co_opcache_size * sizeof(_PyOpcache);
+    }
     return PyLong_FromSsize_t(res);
 }
 
@@ -752,3 +842,70 @@ _PyCode_CheckLineNumber(PyCodeObject* co, int lasti, PyAddrPair *bounds)
 
     return line;
 }
+
+int
+_PyCode_GetExtra(PyObject *code, Py_ssize_t index, void **extra)
+{
+    PyCodeObject *o;
+    _PyCodeObjectExtra *co_extra;
+
+    if (!PyCode_Check(code)) {
+        PyErr_BadInternalCall();
+        return -1;
+    }
+
+    o = (PyCodeObject*) code;
+    co_extra = (_PyCodeObjectExtra*) o->co_extra;
+
+    if (co_extra == NULL || co_extra->ce_size <= index) {
+        *extra = NULL;
+        return 0;
+    }
+
+    *extra = co_extra->ce_extras[index];
+    return 0;
+}
+
+int
+_PyCode_SetExtra(PyObject *code, Py_ssize_t index, void *extra)
+{
+    PyInterpreterState *interp = PyThreadState_Get()->interp;
+    PyCodeObject *o;
+    _PyCodeObjectExtra *co_extra;
+
+    if (!PyCode_Check(code) || index < 0 ||
+            index >= interp->co_extra_user_count) {
+        PyErr_BadInternalCall();
+        return -1;
+    }
+
+    o = (PyCodeObject*) code;
+    co_extra = (_PyCodeObjectExtra *) o->co_extra;
+
+    if (co_extra == NULL || co_extra->ce_size <= index) {
+        Py_ssize_t i = (co_extra == NULL ? 0 : co_extra->ce_size);
+        co_extra = PyMem_Realloc(
+                co_extra,
+                sizeof(_PyCodeObjectExtra) +
+                (interp->co_extra_user_count-1) * sizeof(void*));
+        if (co_extra == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (; i < interp->co_extra_user_count; i++) {
+            co_extra->ce_extras[i] = NULL;
+        }
+        co_extra->ce_size = interp->co_extra_user_count;
+        o->co_extra = co_extra;
+    }
+
+    if (co_extra->ce_extras[index] != NULL) {
+        freefunc free = interp->co_extra_freefuncs[index];
+        if (free != NULL) {
+            free(co_extra->ce_extras[index]);
+        }
+    }
+
+    co_extra->ce_extras[index] = extra;
+    return 0;
+}
@@ -63,6 +63,20 @@ static void _PyMem_DebugCheckAddress(char api_id, const void *p);
 #  endif
 #endif
 
+/* Pages of the empty pools of a live arena can be given back to the system
+ * (see decommit_pools()).  MADV_DONTNEED releases them at once on Linux,
+ * where MADV_FREE only lets the kernel reclaim them under memory pressure.
+ */
+#ifdef ARENAS_USE_MMAP
+#  if defined(__linux__) && defined(MADV_DONTNEED)
+#    define POOL_DECOMMIT_ADVICE MADV_DONTNEED
+#  elif defined(MADV_FREE)
+#    define POOL_DECOMMIT_ADVICE MADV_FREE
+#  elif defined(MADV_DONTNEED)
+#    define POOL_DECOMMIT_ADVICE MADV_DONTNEED
+#  endif
+#endif
+
 /* Forward declaration */
 static void* _PyObject_Malloc(void *ctx, size_t size);
 static void* _PyObject_Calloc(void *ctx, size_t nelem, size_t elsize);
@@ -715,6 +729,16 @@ static int running_on_valgrind = -1;
 #define POOL_SIZE               SYSTEM_PAGE_SIZE        /* must be 2^N */
 #define POOL_SIZE_MASK          SYSTEM_PAGE_SIZE_MASK
 
+#define MAX_POOLS_IN_ARENA      (ARENA_SIZE / POOL_SIZE)
+
+/*
+ * When that many empty pools are cached in an arena which still has pools
+ * in use, their pages are given back to the system.  A lower value returns
+ * memory sooner, at the cost of more system calls and page faults when the
+ * pools are used again.
+ */
+#define DECOMMIT_THRESHOLD      (MAX_POOLS_IN_ARENA / 4)
+
 /*
  * -- End of tunable settings section --
  */
@@ -776,7 +800,7 @@ struct arena_object {
     block* pool_address;
 
     /* The number of available pools in the arena:  free pools + never-
-     * allocated pools.
+     * allocated pools + decommitted pools.
      */
     uint nfreepools;
 
@@ -786,6 +810,17 @@ struct arena_object {
     /* Singly-linked list of available pools. */
     struct pool_header* freepools;
 
+    /* The number of pools in the freepools list. */
+    uint ncachedpools;
+
+    /* Free pools whose pages were given back to the system by
+     * decommit_pools().  Their memory (pool header included) may read as
+     * zeros, so they are tracked in a bitmap indexed by POOL_INDEX()
+     * rather than linked through freepools.
+     */
+    uint ndecommitted;
+    unsigned char decommitted[MAX_POOLS_IN_ARENA / 8];
+
     /* Whenever this arena_object is not associated with an allocated
      * arena, the nextarena member is used to link all unassociated
      * arena_objects in the singly-linked `unused_arena_objects` list.
@@ -811,6 +846,12 @@ struct arena_object {
 /* Round pointer P down to the closest pool-aligned address <= P, as a poolp */
 #define POOL_ADDR(P) ((poolp)_Py_ALIGN_DOWN((P), POOL_SIZE))
 
+/* Convert between a pool and its index in the arena described by AO. */
+#define POOL_INDEX(AO, P) ((uint)(((uptr)(P) - (AO)->address) / POOL_SIZE))
+#define POOL_AT(AO, I) \
+    ((poolp)((uptr)_Py_ALIGN_UP((AO)->address, POOL_SIZE) + \
+             (uptr)(I) * POOL_SIZE))
+
 /* Return total number of blocks in pool of size index I, as a uint. */
 #define NUMBLOCKS(I) ((uint)(POOL_SIZE - POOL_OVERHEAD) / INDEX2SIZE(I))
 
@@ -1015,6 +1056,8 @@ static size_t narenas_currently_allocated = 0;
 static size_t ntimes_arena_allocated = 0;
 /* High water mark (max value ever seen) for narenas_currently_allocated. */
 static size_t narenas_highwater = 0;
+/* Total number of pools given back to the system by decommit_pools(). */
+static size_t ntimes_pool_decommitted = 0;
 
 static Py_ssize_t _Py_AllocatedBlocks = 0;
 
@@ -1108,6 +1151,9 @@ new_arena(void)
     if (narenas_currently_allocated > narenas_highwater)
         narenas_highwater = narenas_currently_allocated;
     arenaobj->freepools = NULL;
+    arenaobj->ncachedpools = 0;
+    arenaobj->ndecommitted = 0;
+    memset(arenaobj->decommitted, 0, sizeof(arenaobj->decommitted));
     /* pool_address <- first pool-aligned address in the arena
        nfreepools <- number of whole pools that fit after alignment */
     arenaobj->pool_address = (block*)arenaobj->address;
@@ -1123,6 +1169,75 @@ new_arena(void)
     return arenaobj;
 }
 
+#define POOL_IS_DECOMMITTED(AO, I) \
+    ((AO)->decommitted[(I) / 8] & (1 << ((I) % 8)))
+
+#ifdef POOL_DECOMMIT_ADVICE
+/* Give the pages of the cached free pools of arena `ao` back to the system.
+ * The pools stay available (they are counted in nfreepools), but they are
+ * moved from the freepools list to the decommitted bitmap, and the next
+ * use of their pages costs a page fault.  Only whole system pages are
+ * released, in runs of adjacent pools.
+ */
+static void
+decommit_pools(struct arena_object *ao)
+{
+    static uptr page_size = 0;
+    unsigned char fresh[MAX_POOLS_IN_ARENA / 8];
+    poolp pool;
+    uint i, j;
+
+    if (page_size == 0) {
+        long n = sysconf(_SC_PAGESIZE);
+        page_size = n > 0 ? (uptr)n : POOL_SIZE;
+    }
+
+    /* The pool headers are read before any page is released. */
+    memset(fresh, 0, sizeof(fresh));
+    for (pool = ao->freepools; pool != NULL; pool = pool->nextpool) {
+        i = POOL_INDEX(ao, pool);
+        assert(!POOL_IS_DECOMMITTED(ao, i));
+        fresh[i / 8] |= 1 << (i % 8);
+        ao->decommitted[i / 8] |= 1 << (i % 8);
+    }
+    ao->ndecommitted += ao->ncachedpools;
+    ntimes_pool_decommitted += ao->ncachedpools;
+    ao->freepools = NULL;
+    ao->ncachedpools = 0;
+
+    for (i = 0; i < ao->ntotalpools; i = j) {
+        uptr start, end;
+        if (!(fresh[i / 8] & (1 << (i % 8)))) {
+            j = i + 1;
+            continue;
+        }
+        for (j = i + 1;
+             j < ao->ntotalpools && (fresh[j / 8] & (1 << (j % 8)));
+             j++)
+            ;
+        /* pools [i, j) are free: release the pages they cover entirely */
+        start = _Py_SIZE_ROUND_UP((uptr)POOL_AT(ao, i), page_size);
+        end = _Py_SIZE_ROUND_DOWN((uptr)POOL_AT(ao, j), page_size);
+        if (start < end)
+            (void)madvise((void *)start, end - start, POOL_DECOMMIT_ADVICE);
+    }
+}
+#endif
+
+/* Take a decommitted pool of arena `ao`. */
+static poolp
+take_decommitted_pool(struct arena_object *ao)
+{
+    uint i;
+
+    assert(ao->ndecommitted > 0);
+    for (i = 0; !POOL_IS_DECOMMITTED(ao, i); i++)
+        assert(i < ao->ntotalpools);
+    ao->decommitted[i / 8] &= ~(1 << (i % 8));
+    --ao->ndecommitted;
+    return POOL_AT(ao, i);
+}
+
 /*
 Py_ADDRESS_IN_RANGE(P, POOL)
 
@@ -1352,6 +1467,7 @@ _PyObject_Alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
         if (pool != NULL) {
             /* Unlink from cached pools. */
             usable_arenas->freepools = pool->nextpool;
+            --usable_arenas->ncachedpools;
 
             /* This arena already had the smallest nfreepools
              * value, so decreasing nfreepools doesn't change
@@ -1376,14 +1492,15 @@ _PyObject_Alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
             }
             else {
                 /* nfreepools > 0:  it must be that freepools
-                 * isn't NULL, or that we haven't yet carved
+                 * isn't NULL, that we haven't yet carved
                  * off all the arena's pools for the first
-                 * time.
+                 * time, or that some pools were decommitted.
                  */
                 assert(usable_arenas->freepools != NULL ||
                        usable_arenas->pool_address <=
                        (block*)usable_arenas->address +
-                           ARENA_SIZE - POOL_SIZE);
+                           ARENA_SIZE - POOL_SIZE ||
+                       usable_arenas->ndecommitted > 0);
             }
         init_pool:
             /* Frontlink to used pools. */
@@ -1424,16 +1541,21 @@ _PyObject_Alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
             return (void *)bp;
         }
 
-        /* Carve off a new pool. */
+        /* Carve off a new pool, or else reuse a decommitted one: its
+         * header has to be initialized as well.
+         */
         assert(usable_arenas->nfreepools > 0);
         assert(usable_arenas->freepools == NULL);
-        pool = (poolp)usable_arenas->pool_address;
-        assert((block*)pool <= (block*)usable_arenas->address +
-                               ARENA_SIZE - POOL_SIZE);
+        if (usable_arenas->pool_address <= (block*)usable_arenas->address +
+                                           ARENA_SIZE - POOL_SIZE) {
+            pool = (poolp)usable_arenas->pool_address;
+            usable_arenas->pool_address += POOL_SIZE;
+        }
+        else
+            pool = take_decommitted_pool(usable_arenas);
         pool->arenaindex = (uint)(usable_arenas - arenas);
         assert(&arenas[pool->arenaindex] == usable_arenas);
         pool->szidx = DUMMY_SIZE_IDX;
-        usable_arenas->pool_address += POOL_SIZE;
         --usable_arenas->nfreepools;
 
         if (usable_arenas->nfreepools == 0) {
@@ -1548,6 +1670,7 @@ _PyObject_Free(void *ctx, void *p)
             ao = &arenas[pool->arenaindex];
             pool->nextpool = ao->freepools;
             ao->freepools = pool;
+            ++ao->ncachedpools;
             nf = ++ao->nfreepools;
 
             /* All the rest is arena management.  We just freed
@@ -1561,6 +1684,9 @@ _PyObject_Free(void *ctx, void *p)
              *    restore that usable_arenas is sorted in order of
              *    nfreepools.
              * 4. Else there's nothing more to do.
+             * Besides, in cases 3 and 4, if enough free pools are
+             * cached in the arena, their pages are given back to the
+             * system.
              */
             if (nf == ao->ntotalpools) {
                 /* Case 1.  First unlink ao from usable_arenas.
@@ -1627,6 +1753,11 @@ _PyObject_Free(void *ctx, void *p)
              * a few un-scientific tests, it seems like this
              * approach allowed a lot more memory to be freed.
              */
+#ifdef POOL_DECOMMIT_ADVICE
+            if (ao->ncachedpools >= DECOMMIT_THRESHOLD &&
+                _PyObject_Arena.alloc == _PyObject_ArenaMmap)
+                decommit_pools(ao);
+#endif
             if (ao->nextarena == NULL ||
                          nf <= ao->nextarena->nfreepools) {
                 /* Case 4.  Nothing to do. */
@@ -2308,6 +2439,12 @@ _PyObject_DebugMallocStats(FILE *out)
     size_t available_bytes = 0;
     /* # of free pools + pools not yet carved out of current arena */
     uint numfreepools = 0;
+    /* # of free pools given back to the system */
+    uint numdecommitted = 0;
+    /* # of arenas with up to 25%, 50%, 75% and 100% of their pools used */
+    size_t arenas_by_usage[4] = {0, 0, 0, 0};
+    /* # of bytes in arenas minus the decommitted pools */
+    size_t resident;
     /* # of bytes for arena alignment padding */
     size_t arena_alignment = 0;
     /* # of bytes in used and full pools used for pool_headers */
@@ -2343,6 +2480,10 @@ _PyObject_DebugMallocStats(FILE *out)
         narenas += 1;
 
         numfreepools += arenas[i].nfreepools;
+        numdecommitted += arenas[i].ndecommitted;
+        arenas_by_usage[
+            (arenas[i].ntotalpools - arenas[i].nfreepools) * 4 /
+            (arenas[i].ntotalpools + 1)] += 1;
 
         /* round up to pool alignment */
         if (base & (uptr)POOL_SIZE_MASK) {
@@ -2357,9 +2498,14 @@ _PyObject_DebugMallocStats(FILE *out)
                     base < (uptr) arenas[i].pool_address;
                     ++j, base += POOL_SIZE) {
             poolp p = (poolp)base;
-            const uint sz = p->szidx;
+            uint sz;
             uint freeblocks;
 
+            if (POOL_IS_DECOMMITTED(&arenas[i], j)) {
+                /* don't fault the pages in */
+                continue;
+            }
+            sz = p->szidx;
             if (p->ref.count == 0) {
                 /* currently unused */
 #ifdef Py_DEBUG
@@ -2422,13 +2568,37 @@ _PyObject_DebugMallocStats(FILE *out)
     total += printone(out, "# bytes in available blocks", available_bytes);
 
     PyOS_snprintf(buf, sizeof(buf),
-        "%u unused pools * %d bytes", numfreepools, POOL_SIZE);
-    total += printone(out, buf, (size_t)numfreepools * POOL_SIZE);
+        "%u unused pools * %d bytes", numfreepools - numdecommitted,
+        POOL_SIZE);
+    total += printone(out, buf,
+                      (size_t)(numfreepools - numdecommitted) * POOL_SIZE);
+
+    PyOS_snprintf(buf, sizeof(buf),
+        "%u released pools * %d bytes", numdecommitted, POOL_SIZE);
+    total += printone(out, buf, (size_t)numdecommitted * POOL_SIZE);
 
     total += printone(out, "# bytes lost to pool headers", pool_header_bytes);
     total += printone(out, "# bytes lost to quantization", quantization);
     total += printone(out, "# bytes lost to arena alignment", arena_alignment);
     (void)printone(out, "Total", total);
+
+    /* Fragmentation: memory held by the arenas but not used by blocks */
+    fputc('\n', out);
+    (void)printone(out, "# arenas with <= 25% of pools used",
+                   arenas_by_usage[0]);
+    (void)printone(out, "# arenas with 25-50% of pools used",
+                   arenas_by_usage[1]);
+    (void)printone(out, "# arenas with 50-75% of pools used",
+                   arenas_by_usage[2]);
+    (void)printone(out, "# arenas with > 75% of pools used",
+                   arenas_by_usage[3]);
+    (void)printone(out, "# pools released total",
+                   ntimes_pool_decommitted);
+    resident = narenas * ARENA_SIZE - (size_t)numdecommitted * POOL_SIZE;
+    (void)printone(out, "# bytes in resident arenas", resident);
+    fprintf(out, "Fragmentation: %.1f%% of the resident arena bytes are "
+                 "not in allocated blocks\n",
+            resident ? 100.0 * (resident - allocated_bytes) / resident : 0.0);
 }
 
 #endif /* #ifdef WITH_PYMALLOC */
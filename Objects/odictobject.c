@@ -39,13 +39,9 @@ we've considered:
    __getitem__(), get(), etc. accordingly.
 
 The approach with the least performance impact (time and space) is #2,
-mirroring the key order of dict's dk_enties with an array of node pointers.
-While lookdict() and friends (dk_lookup) don't give us the index into the
-array, we make use of pointer arithmetic to get that index.  An alternative
-would be to refactor lookdict() to provide the index, explicitly exposing
-the implementation detail.  We could even just use a custom lookup function
-for OrderedDict that facilitates our need.  However, both approaches are
-significantly more complicated than just using pointer arithmetic.
+mirroring the key order of dict's dk_entries with an array of node pointers.
+lookdict() and friends (dk_lookup) return the index of the entry in
+dk_entries, which is exactly the index we need into that array.
 
 The catch with mirroring the hash table ordering is that we have to keep
 the ordering in sync through any dict resizes.  However, that order only
@@ -536,14 +532,17 @@ static Py_ssize_t
 _odict_get_index_raw(PyODictObject *od, PyObject *key, Py_hash_t hash)
 {
     PyObject **value_addr = NULL;
-    PyDictKeyEntry *ep;
     PyDictKeysObject *keys = ((PyDictObject *)od)->ma_keys;
+    Py_ssize_t ix;
 
-    ep = (keys->dk_lookup)((PyDictObject *)od, key, hash, &value_addr);
-    if (ep == NULL)
+    ix = (keys->dk_lookup)((PyDictObject *)od, key, hash, &value_addr, NULL);
+    if (ix == DKIX_EMPTY) {
+        return keys->dk_nentries;  /* index of new entry */
+    }
+    if (ix < 0)
         return -1;
-    /* We use pointer arithmetic to get the entry's index into the table. */
-    return ep - keys->dk_entries;
+    /* The lookup function gives us the entry's index into dk_entries. */
+    return ix;
 }
 
 /* Replace od->od_fast_nodes with a new table matching the size of dict's. */
@@ -38,6 +38,7 @@ extern PyObject* PyInit_itertools(void);
 extern PyObject* PyInit__collections(void);
 extern PyObject* PyInit__heapq(void);
 extern PyObject* PyInit__bisect(void);
+extern PyObject* PyInit__asyncio(void);
 extern PyObject* PyInit__symtable(void);
 extern PyObject* PyInit_mmap(void);
 extern PyObject* PyInit__csv(void);
@@ -113,6 +114,7 @@ struct _inittab _PyImport_Inittab[] = {
     {"_random", PyInit__random},
     {"_bisect", PyInit__bisect},
     {"_heapq", PyInit__heapq},
+    {"_asyncio", PyInit__asyncio},
     {"_lsprof", PyInit__lsprof},
     {"itertools", PyInit_itertools},
     {"_collections", PyInit__collections},
@@ -146,6 +146,9 @@ static void format_exc_unbound(PyCodeObject *co, int oparg);
 static PyObject * unicode_concatenate(PyObject *, PyObject *,
                                       PyFrameObject *, const unsigned short *);
 static PyObject * special_lookup(PyObject *, _Py_Identifier *);
+static PyObject * load_attr_cached(_PyOpcache *, PyObject *, PyObject *);
+static int load_method_cached(_PyOpcache *, PyObject *, PyObject *,
+                              PyObject **);
 
 #define NAME_ERROR_MSG \
     "name '%.200s' is not defined"
@@ -155,6 +158,23 @@ static PyObject * special_lookup(PyObject *, _Py_Identifier *);
     "free variable '%.200s' referenced before assignment" \
     " in enclosing scope"
 
+/* Number of times a code object must be executed before its per-opcode
+   cache (co_opcache) is allocated.  Code that runs only a few times, such
+   as module bodies, never pays for the cache. */
+#define OPCACHE_MIN_RUNS 1024
+
+/* Number of misses after which a LOAD_ATTR or LOAD_METHOD cache entry
+   stops trying to specialize, e.g. because the instruction sees objects
+   of many different types. */
+#define OPCACHE_MAX_MISSES 20
+
+/* Check that a LOAD_ATTR or LOAD_METHOD cache entry was filled in for the
+   type tp, and that tp was not modified since. */
+#define OPCACHE_TYPE_MATCHES(entry, tp) \
+    ((entry)->type == (tp) && \
+     PyType_HasFeature((tp), Py_TPFLAGS_VALID_VERSION_TAG) && \
+     (entry)->tp_version_tag == (tp)->tp_version_tag)
+
 /* Dynamic execution profile */
 #ifdef DYNAMIC_EXECUTION_PROFILE
 #ifdef DXPAIRS
@@ -795,6 +815,13 @@ PyEval_EvalFrame(PyFrameObject *f) {
 
 PyObject *
 PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
+{
+    PyThreadState *tstate = PyThreadState_GET();
+    return tstate->interp->eval_frame(f, throwflag);
+}
+
+PyObject *
+_PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
 {
 #ifdef DXPAIRS
     int lastopcode = 0;
@@ -808,6 +835,7 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
     PyObject *retval = NULL;            /* Return value */
     PyThreadState *tstate = PyThreadState_GET();
     PyCodeObject *co;
+    _PyOpcache *co_opcache;
 
     /* when tracing we set things up so that
 
@@ -997,6 +1025,21 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
 #define JUMPTO(x)       (next_instr = first_instr + (x)/2)
 #define JUMPBY(x)       (next_instr += (x)/2)
 
+/* Per-opcode cache, see co_opcache in Include/code.h */
+
+#define OPCACHE_CHECK() \
+    do { \
+        co_opcache = NULL; \
+        if (co->co_opcache != NULL) { \
+            unsigned char co_opt_offset = \
+                co->co_opcache_map[next_instr - first_instr]; \
+            if (co_opt_offset > 0) { \
+                assert(co_opt_offset <= co->co_opcache_size); \
+                co_opcache = &co->co_opcache[co_opt_offset - 1]; \
+            } \
+        } \
+    } while (0)
+
 /* OpCode prediction macros
     Some opcodes tend to come in pairs thus making it possible to
     predict the second code when the first is run.  For example,
@@ -1166,6 +1209,17 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
     consts = co->co_consts;
     fastlocals = f->f_localsplus;
     freevars = f->f_localsplus + co->co_nlocals;
+
+    /* Only pay for the per-opcode cache once the code object has proved
+       to be hot. */
+    if (co->co_opcache_flag < OPCACHE_MIN_RUNS) {
+        co->co_opcache_flag++;
+        if (co->co_opcache_flag == OPCACHE_MIN_RUNS) {
+            if (_PyCode_InitOpcache(co) < 0)
+                goto exit_eval_frame;
+        }
+    }
+
     assert(PyBytes_Check(co->co_code));
     assert(PyBytes_GET_SIZE(co->co_code) <= INT_MAX);
     assert(PyBytes_GET_SIZE(co->co_code) % 2 == 0);
@@ -2407,6 +2461,25 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
             if (PyDict_CheckExact(f->f_globals)
                 && PyDict_CheckExact(f->f_builtins))
             {
+                OPCACHE_CHECK();
+                if (co_opcache != NULL && co_opcache->optimized) {
+                    _PyOpcache_LoadGlobal *lg = &co_opcache->u.lg;
+
+                    if (lg->globals_ver ==
+                            ((PyDictObject *)f->f_globals)->ma_version_tag
+                        && lg->builtins_ver ==
+                            ((PyDictObject *)f->f_builtins)->ma_version_tag)
+                    {
+                        /* Neither namespace changed since the value was
+                           cached, so it is still alive and still the
+                           right answer. */
+                        v = lg->ptr;
+                        Py_INCREF(v);
+                        PUSH(v);
+                        DISPATCH();
+                    }
+                }
+
                 v = _PyDict_LoadGlobal((PyDictObject *)f->f_globals,
                                        (PyDictObject *)f->f_builtins,
                                        name);
@@ -2419,6 +2492,17 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
                     }
                     goto error;
                 }
+
+                if (co_opcache != NULL) {
+                    _PyOpcache_LoadGlobal *lg = &co_opcache->u.lg;
+
+                    co_opcache->optimized = 1;
+                    lg->globals_ver =
+                        ((PyDictObject *)f->f_globals)->ma_version_tag;
+                    lg->builtins_ver =
+                        ((PyDictObject *)f->f_builtins)->ma_version_tag;
+                    lg->ptr = v; /* borrowed */
+                }
                 Py_INCREF(v);
             }
             else {
@@ -2785,7 +2869,12 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
         TARGET(LOAD_ATTR) {
             PyObject *name = GETITEM(names, oparg);
             PyObject *owner = TOP();
-            PyObject *res = PyObject_GetAttr(owner, name);
+            PyObject *res;
+            OPCACHE_CHECK();
+            if (co_opcache != NULL)
+                res = load_attr_cached(co_opcache, owner, name);
+            else
+                res = PyObject_GetAttr(owner, name);
             Py_DECREF(owner);
             SET_TOP(res);
             if (res == NULL)
@@ -3283,6 +3372,104 @@ PyEval_EvalFrameEx(PyFrameObject *f, int throwflag)
             DISPATCH();
         }
 
+        TARGET(LOAD_METHOD) {
+            /* Designed to work in tandem with CALL_METHOD. */
+            PyObject *name = GETITEM(names, oparg);
+            PyObject *obj = TOP();
+            PyObject *meth = NULL;
+            int meth_found;
+
+            OPCACHE_CHECK();
+            if (co_opcache != NULL)
+                meth_found = load_method_cached(co_opcache, obj, name, &meth);
+            else
+                meth_found = _PyObject_GetMethod(obj, name, &meth);
+
+            if (meth == NULL) {
+                /* Most likely attribute wasn't found. */
+                goto error;
+            }
+
+            if (meth_found) {
+                /* We can bypass temporary bound method object.
+                   meth is unbound method and obj is self.
+
+                   meth | self | arg1 | ... | argN
+                 */
+                SET_TOP(meth);
+                PUSH(obj);  /* self */
+            }
+            else {
+                /* meth is not an unbound method (but a regular attr, or
+                   something was returned by a descriptor protocol).  Set
+                   the second element of the stack to NULL, to signal
+                   CALL_METHOD that it's not a method call.
+
+                   NULL | meth | arg1 | ... | argN
+                */
+                SET_TOP(NULL);
+                Py_DECREF(obj);
+                PUSH(meth);
+            }
+            DISPATCH();
+        }
+
+        TARGET(CALL_METHOD) {
+            /* Designed to work in tandem with LOAD_METHOD. */
+            PyObject **sp, *res, *meth;
+            int nargs;
+
+            PCALL(PCALL_ALL);
+            sp = stack_pointer;
+
+            meth = PEEK(oparg + 2);
+            if (meth == NULL) {
+                /* `meth` is NULL when LOAD_METHOD thinks that it's not
+                   a method call.
+
+                   Stack layout:
+
+                       ... | NULL | callable | arg1 | ... | argN
+                                                            ^- TOP()
+                                               ^- (-oparg)
+                                    ^- (-oparg-1)
+                             ^- (-oparg-2)
+
+                   `callable` will be POPed by call_function.
+                   NULL will will be POPed manually later.
+                */
+                nargs = oparg;
+            }
+            else {
+                /* This is a method call.  Stack layout:
+
+                     ... | method | self | arg1 | ... | argN
+                                                        ^- TOP()
+                                           ^- (-oparg)
+                                    ^- (-oparg-1)
+                           ^- (-oparg-2)
+
+                  `self` and `method` will be POPed by call_function.
+                  We'll be passing `oparg + 1` to call_function, to
+                  make it accept the `self` as a first argument.
+                */
+                nargs = oparg + 1;
+            }
+#ifdef WITH_TSC
+            res = call_function(&sp, nargs, &intr0, &intr1);
+#else
+            res = call_function(&sp, nargs);
+#endif
+            stack_pointer = sp;
+            if (meth == NULL)
+                (void)POP(); /* POP the NULL. */
+
+            PUSH(res);
+            if (res == NULL)
+                goto error;
+            DISPATCH();
+        }
+
         TARGET(CALL_FUNCTION_VAR)
         TARGET(CALL_FUNCTION_KW)
         TARGET(CALL_FUNCTION_VAR_KW) {
@@ -4060,6 +4247,154 @@ PyEval_EvalCodeEx(PyObject *_co, PyObject *globals, PyObject *locals,
                                     NULL, NULL);
 }
 
+/* LOAD_ATTR using the per-opcode cache entry oc.  Attributes stored in the
+   instance dict, and __slots__ members, are cached using the type version
+   tag: as long as the type is not modified, there is no data descriptor
+   to check for the name.  Return a new reference, or NULL with an
+   exception set. */
+static PyObject *
+load_attr_cached(_PyOpcache *oc, PyObject *owner, PyObject *name)
+{
+    PyTypeObject *tp = Py_TYPE(owner);
+    _PyOpcache_LoadAttr *la = &oc->u.la;
+    PyObject *descr, *dict, *res;
+    unsigned int version;
+    Py_ssize_t hint;
+
+    if (oc->optimized && OPCACHE_TYPE_MATCHES(la, tp)) {
+        if (la->hint < -1) {
+            /* __slots__ member */
+            res = *(PyObject **)((char *)owner + ~la->hint);
+            if (res != NULL) {
+                Py_INCREF(res);
+                return res;
+            }
+        }
+        else {
+            dict = *(PyObject **)((char *)owner + tp->tp_dictoffset);
+            if (dict != NULL && PyDict_CheckExact(dict)) {
+                Py_INCREF(dict);
+                hint = _PyDict_GetItemHint((PyDictObject *)dict, name,
+                                           la->hint, &res);
+                if (res != NULL) {
+                    la->hint = hint;
+                    Py_INCREF(res);
+                    Py_DECREF(dict);
+                    return res;
+                }
+                Py_DECREF(dict);
+                if (PyErr_Occurred())
+                    return NULL;
+            }
+        }
+        /* Let the generic code raise AttributeError */
+        return PyObject_GetAttr(owner, name);
+    }
+
+    if (oc->optimized) {
+        oc->optimized = 0;
+        oc->misses++;
+    }
+    if (oc->misses >= OPCACHE_MAX_MISSES
+        || tp->tp_getattro != PyObject_GenericGetAttr
+        || tp->tp_dict == NULL)
+        goto fail;
+
+    descr = _PyType_Lookup(tp, name);
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_VALID_VERSION_TAG))
+        goto fail;
+    version = tp->tp_version_tag;
+    if (descr != NULL) {
+        PyMemberDef *dmem;
+
+        if (Py_TYPE(descr) != &PyMemberDescr_Type)
+            goto fail;
+        dmem = ((PyMemberDescrObject *)descr)->d_member;
+        if (dmem->type != T_OBJECT_EX)
+            goto fail;
+        res = *(PyObject **)((char *)owner + dmem->offset);
+        if (res == NULL)
+            goto fail;
+        la->hint = ~dmem->offset;
+    }
+    else {
+        if (tp->tp_dictoffset <= 0)
+            goto fail;
+        dict = *(PyObject **)((char *)owner + tp->tp_dictoffset);
+        if (dict == NULL || !PyDict_CheckExact(dict))
+            goto fail;
+        Py_INCREF(dict);
+        hint = _PyDict_GetItemHint((PyDictObject *)dict, name, -1, &res);
+        Py_DECREF(dict);
+        if (res == NULL) {
+            if (PyErr_Occurred())
+                return NULL;
+            goto fail;
+        }
+        la->hint = hint;
+    }
+    la->type = tp;
+    la->tp_version_tag = version;
+    oc->optimized = 1;
+    Py_INCREF(res);
+    return res;
+
+  fail:
+    if (oc->misses < OPCACHE_MAX_MISSES)
+        oc->misses++;
+    return PyObject_GetAttr(owner, name);
+}
+
+/* LOAD_METHOD using the per-opcode cache entry oc, see
+   _PyObject_GetMethod() for the meaning of the result.  Only methods that
+   are plain Python functions are cached. */
+static int
+load_method_cached(_PyOpcache *oc, PyObject *obj, PyObject *name,
+                   PyObject **method)
+{
+    PyTypeObject *tp = Py_TYPE(obj);
+    _PyOpcache_LoadMethod *lm = &oc->u.lm;
+    PyObject **dictptr;
+    int meth_found;
+
+    if (oc->optimized && OPCACHE_TYPE_MATCHES(lm, tp)) {
+        /* The method may still be shadowed by an instance attribute */
+        dictptr = _PyObject_GetDictPtr(obj);
+        if (dictptr == NULL || *dictptr == NULL
+            || PyDict_GetItem(*dictptr, name) == NULL)
+        {
+            Py_INCREF(lm->meth);
+            *method = lm->meth;
+            return 1;
+        }
+        return _PyObject_GetMethod(obj, name, method);
+    }
+
+    if (oc->optimized) {
+        oc->optimized = 0;
+        oc->misses++;
+    }
+    meth_found = _PyObject_GetMethod(obj, name, method);
+    if (oc->misses >= OPCACHE_MAX_MISSES)
+        return meth_found;
+
+    /* Looking the name up in the instance dict may have run arbitrary code,
+       so check again that the type still maps the name to this function
+       before recording the (now valid) version tag. */
+    if (meth_found && _PyType_Lookup(tp, name) == *method
+        && PyType_HasFeature(tp, Py_TPFLAGS_VALID_VERSION_TAG))
+    {
+        lm->type = tp;
+        lm->tp_version_tag = tp->tp_version_tag;
+        lm->meth = *method;
+        oc->optimized = 1;
+    }
+    else {
+        oc->misses++;
+    }
+    return meth_found;
+}
+
 static PyObject *
 special_lookup(PyObject *o, _Py_Identifier *id)
 {
@@ -5386,3 +5721,17 @@ _Py_GetDXProfile(PyObject *self, PyObject *args)
 }
 
 #endif
+
+Py_ssize_t
+_PyEval_RequestCodeExtraIndex(freefunc free)
+{
+    PyInterpreterState *interp = PyThreadState_Get()->interp;
+    Py_ssize_t new_index;
+
+    if (interp->co_extra_user_count == MAX_CO_EXTRA_USERS - 1) {
+        return -1;
+    }
+    new_index = interp->co_extra_user_count++;
+    interp->co_extra_freefuncs[new_index] = free;
+    return new_index;
+}
@@ -260,6 +260,36 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_imp__is_frozen_startup__doc__,
+"_is_frozen_startup($module, name, /)\n"
+"--\n"
+"\n"
+"Returns True if the module name is a frozen standard library module.\n"
+"\n"
+"These modules are frozen into the interpreter by \"make frozen-startup\"\n"
+"from the file of the same name in the standard library.");
+
+#define _IMP__IS_FROZEN_STARTUP_METHODDEF    \
+    {"_is_frozen_startup", (PyCFunction)_imp__is_frozen_startup, METH_O, _imp__is_frozen_startup__doc__},
+
+static PyObject *
+_imp__is_frozen_startup_impl(PyObject *module, PyObject *name);
+
+static PyObject *
+_imp__is_frozen_startup(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *name;
+
+    if (!PyArg_Parse(arg, "U:_is_frozen_startup", &name)) {
+        goto exit;
+    }
+    return_value = _imp__is_frozen_startup_impl(module, name);
+
+exit:
+    return return_value;
+}
+
 #if defined(HAVE_DYNAMIC_LOADING)
 
 PyDoc_STRVAR(_imp_create_dynamic__doc__,
@@ -354,6 +384,62 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_imp_get_import_times__doc__,
+"get_import_times($module, /)\n"
+"--\n"
+"\n"
+"Return the import times recorded under -X importtime.\n"
+"\n"
+"Each entry is a (name, self_us, cumulative_us, depth) tuple, in the order\n"
+"the imports completed.  The list is empty if import timing is disabled.");
+
+#define _IMP_GET_IMPORT_TIMES_METHODDEF    \
+    {"get_import_times", (PyCFunction)_imp_get_import_times, METH_NOARGS, _imp_get_import_times__doc__},
+
+static PyObject *
+_imp_get_import_times_impl(PyObject *module);
+
+static PyObject *
+_imp_get_import_times(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return _imp_get_import_times_impl(module);
+}
+
+PyDoc_STRVAR(_imp_source_hash__doc__,
+"source_hash($module, /, key, source)\n"
+"--\n"
+"\n"
+"Return the 8-byte hash of source used by hash-based .pyc files.");
+
+#define _IMP_SOURCE_HASH_METHODDEF    \
+    {"source_hash", (PyCFunction)_imp_source_hash, METH_VARARGS|METH_KEYWORDS, _imp_source_hash__doc__},
+
+static PyObject *
+_imp_source_hash_impl(PyObject *module, long key, Py_buffer *source);
+
+static PyObject *
+_imp_source_hash(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    static char *_keywords[] = {"key", "source", NULL};
+    long key;
+    Py_buffer source = {NULL, NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "ly*:source_hash", _keywords,
+        &key, &source)) {
+        goto exit;
+    }
+    return_value = _imp_source_hash_impl(module, key, &source);
+
+exit:
+    /* Cleanup for source */
+    if (source.obj) {
+       PyBuffer_Release(&source);
+    }
+
+    return return_value;
+}
+
 #ifndef _IMP_CREATE_DYNAMIC_METHODDEF
     #define _IMP_CREATE_DYNAMIC_METHODDEF
 #endif /* !defined(_IMP_CREATE_DYNAMIC_METHODDEF) */
@@ -361,4 +447,4 @@ exit:
 #ifndef _IMP_EXEC_DYNAMIC_METHODDEF
     #define _IMP_EXEC_DYNAMIC_METHODDEF
 #endif /* !defined(_IMP_EXEC_DYNAMIC_METHODDEF) */
-/*[clinic end generated code: output=d24d7f73702a907f input=a9049054013a1b77]*/
+/*[clinic end generated code: output=df19f2b1fb1ad6d7 input=a9049054013a1b77]*/
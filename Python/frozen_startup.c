@@ -0,0 +1,25 @@
+/* Standard library modules frozen into the interpreter for faster startup.
+
+   The table is empty unless the interpreter was built with
+   "make frozen-startup", which generates Python/frozen_startup_modules.h
+   in the build directory using Tools/freeze/freeze_startup.py.  The
+   Makefile always compiles this file against that header (a copy of the
+   empty frozen_startup.h by default); other builds use frozen_startup.h.
+   It is kept separate from PyImport_FrozenModules so that embedding
+   applications (and Tools/freeze) can keep replacing that table, and so
+   that the frozen copies can be ignored at runtime with
+   "-X frozen_modules=off". */
+
+#include "Python.h"
+#ifdef Py_FROZEN_STARTUP_MODULES_H
+#include "Python/frozen_startup_modules.h"
+#else
+#include "frozen_startup.h"
+#endif
+
+static const struct _frozen _PyImport_FrozenStartup[] = {
+    _Py_FROZEN_STARTUP_MODULES
+    {0, 0, 0} /* sentinel */
+};
+
+const struct _frozen *_PyImport_FrozenStartupModules = _PyImport_FrozenStartup;
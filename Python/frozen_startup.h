@@ -0,0 +1,8 @@
+/* Modules frozen into the interpreter to speed up startup.
+ *
+ * Auto-generated by Tools/freeze/freeze_startup.py; run "make frozen-startup"
+ * to freeze the modules and "make unfreeze-startup" to restore the default
+ * (empty) table.
+ */
+
+#define _Py_FROZEN_STARTUP_MODULES
@@ -86,6 +86,19 @@ int _PyOS_GetOpt(int argc, wchar_t **argv, wchar_t *optstring)
             return 'V';
         }
 
+        /* The only long option taking an argument; reported as 0 */
+        else if (wcscmp(argv[_PyOS_optind], L"--check-hash-based-pycs") == 0) {
+            ++_PyOS_optind;
+            if (_PyOS_optind >= argc) {
+                if (_PyOS_opterr)
+                    fprintf(stderr, "Argument expected for the "
+                            "--check-hash-based-pycs option\n");
+                return '_';
+            }
+            _PyOS_optarg = argv[_PyOS_optind++];
+            return 0;
+        }
+
 
         opt_ptr = &argv[_PyOS_optind++][1];
     }
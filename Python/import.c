@@ -31,6 +31,19 @@ struct _inittab *PyImport_Inittab = _PyImport_Inittab;
 
 static PyObject *initstr = NULL;
 
+const char *_Py_CheckHashBasedPycsMode = "default";
+
+/* -X importtime support.  import_time is -1 until the option has been
+   looked up, which can only happen once the sys module exists. */
+static int import_time = -1;
+static int import_level = 0;
+static _PyTime_t import_accumulated = 0;
+/* List of (name, self_us, cumulative_us, depth) tuples */
+static PyObject *import_times = NULL;
+
+/* -X frozen_modules=off support, looked up lazily like -X importtime. */
+static int frozen_startup = -1;
+
 /*[clinic input]
 module _imp
 [clinic start generated code]*/
@@ -291,6 +304,7 @@ void
 _PyImport_Fini(void)
 {
     Py_CLEAR(extensions);
+    Py_CLEAR(import_times);
 #ifdef WITH_THREAD
     if (import_lock != NULL) {
         PyThread_free_lock(import_lock);
@@ -1094,6 +1108,23 @@ _imp_create_builtin(PyObject *module, PyObject *spec)
 
 /* Frozen modules */
 
+static int
+frozen_startup_enabled(void)
+{
+    _Py_IDENTIFIER(frozen_modules);
+    PyObject *xoptions, *value;
+
+    if (frozen_startup >= 0)
+        return frozen_startup;
+    xoptions = PySys_GetObject("_xoptions");
+    if (xoptions == NULL || !PyDict_Check(xoptions))
+        return 1;
+    value = _PyDict_GetItemId(xoptions, &PyId_frozen_modules);
+    frozen_startup = (value == NULL || !PyUnicode_Check(value) ||
+                      PyUnicode_CompareWithASCIIString(value, "off") != 0);
+    return frozen_startup;
+}
+
 static const struct _frozen *
 find_frozen(PyObject *name)
 {
@@ -1102,13 +1133,18 @@ find_frozen(PyObject *name)
     if (name == NULL)
         return NULL;
 
-    for (p = PyImport_FrozenModules; ; p++) {
-        if (p->name == NULL)
-            return NULL;
+    for (p = PyImport_FrozenModules; p->name != NULL; p++) {
         if (PyUnicode_CompareWithASCIIString(name, p->name) == 0)
-            break;
+            return p;
+    }
+    if (_PyImport_FrozenStartupModules->name == NULL ||
+        !frozen_startup_enabled())
+        return NULL;
+    for (p = _PyImport_FrozenStartupModules; p->name != NULL; p++) {
+        if (PyUnicode_CompareWithASCIIString(name, p->name) == 0)
+            return p;
     }
-    return p;
+    return NULL;
 }
 
 static PyObject *
@@ -1336,6 +1372,111 @@ done:
 }
 
 
+static int
+import_time_enabled(void)
+{
+    _Py_IDENTIFIER(importtime);
+    PyObject *xoptions;
+    char *envvar;
+
+    if (import_time >= 0)
+        return import_time;
+    xoptions = PySys_GetObject("_xoptions");
+    if (xoptions == NULL || !PyDict_Check(xoptions))
+        return 0;
+    import_time = (_PyDict_GetItemId(xoptions, &PyId_importtime) != NULL);
+    if (!import_time) {
+        envvar = Py_GETENV("PYTHONPROFILEIMPORTTIME");
+        import_time = (envvar != NULL && *envvar != '\0');
+    }
+    return import_time;
+}
+
+static void
+import_time_report(PyObject *abs_name, _PyTime_t self_time,
+                   _PyTime_t cumulative)
+{
+    PyObject *type, *value, *tb, *record, *name_bytes;
+    const char *name;
+    long self_us, cumulative_us;
+
+    /* Don't clobber an exception raised by the import itself */
+    PyErr_Fetch(&type, &value, &tb);
+
+    self_us = (long)_PyTime_AsMicroseconds(self_time, _PyTime_ROUND_CEILING);
+    cumulative_us = (long)_PyTime_AsMicroseconds(cumulative,
+                                                 _PyTime_ROUND_CEILING);
+    name_bytes = NULL;
+    name = PyUnicode_AsUTF8(abs_name);
+    if (name == NULL) {
+        /* the name is not encodable to UTF-8 (lone surrogates) */
+        PyErr_Clear();
+        name_bytes = PyUnicode_AsEncodedString(abs_name, "utf-8",
+                                               "backslashreplace");
+        if (name_bytes != NULL) {
+            name = PyBytes_AS_STRING(name_bytes);
+        }
+        else {
+            PyErr_Clear();
+            name = "<unknown>";
+        }
+    }
+    fprintf(stderr, "import time: %9ld | %10ld | %*s%s\n",
+            self_us, cumulative_us, import_level * 2, "", name);
+    Py_XDECREF(name_bytes);
+
+    if (import_times == NULL)
+        import_times = PyList_New(0);
+    if (import_times != NULL) {
+        record = Py_BuildValue("(Olli)", abs_name, self_us, cumulative_us,
+                               import_level);
+        if (record == NULL || PyList_Append(import_times, record) < 0)
+            PyErr_Clear();
+        Py_XDECREF(record);
+    }
+    else {
+        PyErr_Clear();
+    }
+    PyErr_Restore(type, value, tb);
+}
+
+static PyObject *
+import_find_and_load(PyObject *abs_name, PyObject *builtins_import)
+{
+    _Py_IDENTIFIER(_find_and_load);
+    PyInterpreterState *interp = PyThreadState_GET()->interp;
+    PyObject *mod;
+    _PyTime_t t0 = 0, cumulative, accumulated_outer = 0;
+    int timed = import_time_enabled();
+
+    if (timed) {
+        static int header = 1;
+        if (header) {
+            fputs("import time: self [us] | cumulative | imported package\n",
+                  stderr);
+            header = 0;
+        }
+        import_level++;
+        accumulated_outer = import_accumulated;
+        import_accumulated = 0;
+        t0 = _PyTime_GetMonotonicClock();
+    }
+
+    /* _bootstrap._find_and_load() releases the import lock */
+    mod = _PyObject_CallMethodIdObjArgs(interp->importlib,
+                                        &PyId__find_and_load, abs_name,
+                                        builtins_import, NULL);
+
+    if (timed) {
+        cumulative = _PyTime_GetMonotonicClock() - t0;
+        import_level--;
+        import_time_report(abs_name, cumulative - import_accumulated,
+                           cumulative);
+        import_accumulated = accumulated_outer + cumulative;
+    }
+    return mod;
+}
+
 PyObject *
 PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
                                  PyObject *locals, PyObject *given_fromlist,
@@ -1347,7 +1488,6 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
     _Py_IDENTIFIER(__package__);
     _Py_IDENTIFIER(__path__);
     _Py_IDENTIFIER(__name__);
-    _Py_IDENTIFIER(_find_and_load);
     _Py_IDENTIFIER(_handle_fromlist);
     _Py_IDENTIFIER(_lock_unlock_module);
     PyObject *abs_name = NULL;
@@ -1590,7 +1730,14 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
            NOTE: because of this, initializing must be set *before*
            stuffing the new module in sys.modules.
          */
-        spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+        /* Look into the namespace of modules, so that an import of a
+           module made lazy by importlib.util.LazyLoader doesn't load it */
+        if (PyModule_Check(mod)) {
+            spec = _PyDict_GetItemId(PyModule_GetDict(mod), &PyId___spec__);
+            Py_XINCREF(spec);
+        }
+        else
+            spec = _PyObject_GetAttrId(mod, &PyId___spec__);
         if (spec != NULL) {
             value = _PyObject_GetAttrId(spec, &PyId__initializing);
             Py_DECREF(spec);
@@ -1622,10 +1769,7 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
         }
     }
     else {
-        /* _bootstrap._find_and_load() releases the import lock */
-        mod = _PyObject_CallMethodIdObjArgs(interp->importlib,
-                                            &PyId__find_and_load, abs_name,
-                                            builtins_import, NULL);
+        mod = import_find_and_load(abs_name, builtins_import);
         if (mod == NULL) {
             goto error;
         }
@@ -1971,6 +2115,34 @@ _imp_is_frozen_impl(PyObject *module, PyObject *name)
     return PyBool_FromLong((long) (p == NULL ? 0 : p->size));
 }
 
+/*[clinic input]
+_imp._is_frozen_startup
+
+    name: unicode
+    /
+
+Returns True if the module name is a frozen standard library module.
+
+These modules are frozen into the interpreter by "make frozen-startup"
+from the file of the same name in the standard library.
+[clinic start generated code]*/
+
+static PyObject *
+_imp__is_frozen_startup_impl(PyObject *module, PyObject *name)
+/*[clinic end generated code: output=d2d445e5c09def5b input=95b95c08e440a90d]*/
+{
+    const struct _frozen *p, *q;
+
+    p = find_frozen(name);
+    if (p != NULL) {
+        for (q = _PyImport_FrozenStartupModules; q->name != NULL; q++) {
+            if (p == q)
+                Py_RETURN_TRUE;
+        }
+    }
+    Py_RETURN_FALSE;
+}
+
 /* Common implementation for _imp.exec_dynamic and _imp.exec_builtin */
 static int
 exec_builtin_or_dynamic(PyObject *mod) {
@@ -2092,6 +2264,50 @@ _imp_exec_builtin_impl(PyObject *module, PyObject *mod)
     return exec_builtin_or_dynamic(mod);
 }
 
+/*[clinic input]
+_imp.get_import_times
+
+Return the import times recorded under -X importtime.
+
+Each entry is a (name, self_us, cumulative_us, depth) tuple, in the order
+the imports completed.  The list is empty if import timing is disabled.
+[clinic start generated code]*/
+
+static PyObject *
+_imp_get_import_times_impl(PyObject *module)
+/*[clinic end generated code: output=4a662b7680db46a8 input=da5b1e660ff30b92]*/
+{
+    if (import_times == NULL)
+        return PyList_New(0);
+    return PyList_GetSlice(import_times, 0, PyList_GET_SIZE(import_times));
+}
+
+/*[clinic input]
+_imp.source_hash
+
+    key: long
+    source: Py_buffer
+
+Return the 8-byte hash of source used by hash-based .pyc files.
+[clinic start generated code]*/
+
+static PyObject *
+_imp_source_hash_impl(PyObject *module, long key, Py_buffer *source)
+/*[clinic end generated code: output=edb292448cf399ea input=88feca63d08efbd5]*/
+{
+    PY_UINT64_T hash;
+    unsigned char data[8];
+    int i;
+
+    hash = _Py_KeyedHash((PY_UINT64_T)key, source->buf, source->len);
+    /* Always store the hash in little-endian order */
+    for (i = 0; i < 8; i++) {
+        data[i] = (unsigned char)(hash & 0xff);
+        hash >>= 8;
+    }
+    return PyBytes_FromStringAndSize((const char *)data, sizeof(data));
+}
+
 /*[clinic input]
 dump buffer
 [clinic start generated code]*/
@@ -2112,10 +2328,13 @@ static PyMethodDef imp_methods[] = {
     _IMP_INIT_FROZEN_METHODDEF
     _IMP_IS_BUILTIN_METHODDEF
     _IMP_IS_FROZEN_METHODDEF
+    _IMP__IS_FROZEN_STARTUP_METHODDEF
     _IMP_CREATE_DYNAMIC_METHODDEF
     _IMP_EXEC_DYNAMIC_METHODDEF
     _IMP_EXEC_BUILTIN_METHODDEF
     _IMP__FIX_CO_FILENAME_METHODDEF
+    _IMP_GET_IMPORT_TIMES_METHODDEF
+    _IMP_SOURCE_HASH_METHODDEF
     {NULL, NULL}  /* sentinel */
 };
 
@@ -2135,7 +2354,7 @@ static struct PyModuleDef impmodule = {
 PyMODINIT_FUNC
 PyInit_imp(void)
 {
-    PyObject *m, *d;
+    PyObject *m, *d, *pyc_mode;
 
     m = PyModule_Create(&impmodule);
     if (m == NULL)
@@ -2143,6 +2362,14 @@ PyInit_imp(void)
     d = PyModule_GetDict(m);
     if (d == NULL)
         goto failure;
+    pyc_mode = PyUnicode_FromString(_Py_CheckHashBasedPycsMode);
+    if (pyc_mode == NULL)
+        goto failure;
+    if (PyDict_SetItemString(d, "check_hash_based_pycs", pyc_mode) < 0) {
+        Py_DECREF(pyc_mode);
+        goto failure;
+    }
+    Py_DECREF(pyc_mode);
 
     return m;
   failure:
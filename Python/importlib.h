@@ -57,7 +57,7 @@ const unsigned char _Py_M__importlib[] = {
     0,0,115,60,0,0,0,120,40,100,6,68,0,93,32,125,
     2,116,0,124,1,124,2,131,2,114,6,116,1,124,0,124,
     2,116,2,124,1,124,2,131,2,131,3,1,0,113,6,87,
-    0,124,0,106,3,106,4,124,1,106,3,131,1,1,0,100,
+    0,124,0,106,3,160,4,124,1,106,3,161,1,1,0,100,
     5,83,0,41,7,122,47,83,105,109,112,108,101,32,115,117,
     98,115,116,105,116,117,116,101,32,102,111,114,32,102,117,110,
     99,116,111,111,108,115,46,117,112,100,97,116,101,95,119,114,
@@ -161,8 +161,8 @@ const unsigned char _Py_M__importlib[] = {
     32,116,111,10,32,32,32,32,116,97,107,101,32,108,111,99,
     107,115,32,66,32,116,104,101,110,32,65,41,46,10,32,32,
     32,32,99,2,0,0,0,0,0,0,0,2,0,0,0,2,
-    0,0,0,67,0,0,0,115,48,0,0,0,116,0,106,1,
-    131,0,124,0,95,2,116,0,106,1,131,0,124,0,95,3,
+    0,0,0,67,0,0,0,115,48,0,0,0,116,0,160,1,
+    161,0,124,0,95,2,116,0,160,1,161,0,124,0,95,3,
     124,1,124,0,95,4,100,0,124,0,95,5,100,1,124,0,
     95,6,100,1,124,0,95,7,100,0,83,0,41,2,78,233,
     0,0,0,0,41,8,218,7,95,116,104,114,101,97,100,90,
@@ -175,9 +175,9 @@ const unsigned char _Py_M__importlib[] = {
     0,0,1,10,1,10,1,6,1,6,1,6,1,122,20,95,
     77,111,100,117,108,101,76,111,99,107,46,95,95,105,110,105,
     116,95,95,99,1,0,0,0,0,0,0,0,4,0,0,0,
-    2,0,0,0,67,0,0,0,115,64,0,0,0,116,0,106,
-    1,131,0,125,1,124,0,106,2,125,2,120,44,116,3,106,
-    4,124,2,131,1,125,3,124,3,100,0,107,8,114,38,100,
+    3,0,0,0,67,0,0,0,115,64,0,0,0,116,0,160,
+    1,161,0,125,1,124,0,106,2,125,2,120,44,116,3,160,
+    4,124,2,161,1,125,3,124,3,100,0,107,8,114,38,100,
     1,83,0,124,3,106,2,125,2,124,2,124,1,107,2,114,
     16,100,2,83,0,113,16,87,0,100,0,83,0,41,3,78,
     70,84,41,5,114,34,0,0,0,218,9,103,101,116,95,105,
@@ -190,16 +190,16 @@ const unsigned char _Py_M__importlib[] = {
     1,8,1,4,1,6,1,8,1,122,24,95,77,111,100,117,
     108,101,76,111,99,107,46,104,97,115,95,100,101,97,100,108,
     111,99,107,99,1,0,0,0,0,0,0,0,2,0,0,0,
-    16,0,0,0,67,0,0,0,115,168,0,0,0,116,0,106,
-    1,131,0,125,1,124,0,116,2,124,1,60,0,122,138,120,
+    16,0,0,0,67,0,0,0,115,168,0,0,0,116,0,160,
+    1,161,0,125,1,124,0,116,2,124,1,60,0,122,138,120,
     132,124,0,106,3,143,96,1,0,124,0,106,4,100,1,107,
     2,115,48,124,0,106,5,124,1,107,2,114,72,124,1,124,
     0,95,5,124,0,4,0,106,4,100,2,55,0,2,0,95,
-    4,100,3,83,0,124,0,106,6,131,0,114,92,116,7,100,
-    4,124,0,22,0,131,1,130,1,124,0,106,8,106,9,100,
-    5,131,1,114,118,124,0,4,0,106,10,100,2,55,0,2,
+    4,100,3,83,0,124,0,160,6,161,0,114,92,116,7,100,
+    4,124,0,22,0,131,1,130,1,124,0,106,8,160,9,100,
+    5,161,1,114,118,124,0,4,0,106,10,100,2,55,0,2,
     0,95,10,87,0,100,6,81,0,82,0,88,0,124,0,106,
-    8,106,9,131,0,1,0,124,0,106,8,106,11,131,0,1,
+    8,160,9,161,0,1,0,124,0,106,8,160,11,161,0,1,
     0,113,20,87,0,87,0,100,6,116,2,124,1,61,0,88,
     0,100,6,83,0,41,7,122,185,10,32,32,32,32,32,32,
     32,32,65,99,113,117,105,114,101,32,116,104,101,32,109,111,
@@ -227,13 +227,13 @@ const unsigned char _Py_M__importlib[] = {
     1,24,2,10,1,18,2,122,19,95,77,111,100,117,108,101,
     76,111,99,107,46,97,99,113,117,105,114,101,99,1,0,0,
     0,0,0,0,0,2,0,0,0,10,0,0,0,67,0,0,
-    0,115,122,0,0,0,116,0,106,1,131,0,125,1,124,0,
+    0,115,122,0,0,0,116,0,160,1,161,0,125,1,124,0,
     106,2,143,98,1,0,124,0,106,3,124,1,107,3,114,34,
     116,4,100,1,131,1,130,1,124,0,106,5,100,2,107,4,
     115,48,116,6,130,1,124,0,4,0,106,5,100,3,56,0,
     2,0,95,5,124,0,106,5,100,2,107,2,114,108,100,0,
     124,0,95,3,124,0,106,7,114,108,124,0,4,0,106,7,
-    100,3,56,0,2,0,95,7,124,0,106,8,106,9,131,0,
+    100,3,56,0,2,0,95,7,124,0,106,8,160,9,161,0,
     1,0,87,0,100,0,81,0,82,0,88,0,100,0,83,0,
     41,4,78,122,31,99,97,110,110,111,116,32,114,101,108,101,
     97,115,101,32,117,110,45,97,99,113,117,105,114,101,100,32,
@@ -248,9 +248,9 @@ const unsigned char _Py_M__importlib[] = {
     1,8,1,8,1,10,1,8,1,14,1,14,1,10,1,6,
     1,6,1,14,1,122,19,95,77,111,100,117,108,101,76,111,
     99,107,46,114,101,108,101,97,115,101,99,1,0,0,0,0,
-    0,0,0,1,0,0,0,4,0,0,0,67,0,0,0,115,
-    18,0,0,0,100,1,106,0,124,0,106,1,116,2,124,0,
-    131,1,131,2,83,0,41,2,78,122,23,95,77,111,100,117,
+    0,0,0,1,0,0,0,5,0,0,0,67,0,0,0,115,
+    18,0,0,0,100,1,160,0,124,0,106,1,116,2,124,0,
+    131,1,161,2,83,0,41,2,78,122,23,95,77,111,100,117,
     108,101,76,111,99,107,40,123,33,114,125,41,32,97,116,32,
     123,125,41,3,218,6,102,111,114,109,97,116,114,15,0,0,
     0,218,2,105,100,41,1,114,19,0,0,0,114,10,0,0,
@@ -303,9 +303,9 @@ const unsigned char _Py_M__importlib[] = {
     0,114,47,0,0,0,148,0,0,0,115,6,0,0,0,0,
     1,10,1,8,1,122,24,95,68,117,109,109,121,77,111,100,
     117,108,101,76,111,99,107,46,114,101,108,101,97,115,101,99,
-    1,0,0,0,0,0,0,0,1,0,0,0,4,0,0,0,
-    67,0,0,0,115,18,0,0,0,100,1,106,0,124,0,106,
-    1,116,2,124,0,131,1,131,2,83,0,41,2,78,122,28,
+    1,0,0,0,0,0,0,0,1,0,0,0,5,0,0,0,
+    67,0,0,0,115,18,0,0,0,100,1,160,0,124,0,106,
+    1,116,2,124,0,131,1,161,2,83,0,41,2,78,122,28,
     95,68,117,109,109,121,77,111,100,117,108,101,76,111,99,107,
     40,123,33,114,125,41,32,97,116,32,123,125,41,3,114,50,
     0,0,0,114,15,0,0,0,114,51,0,0,0,41,1,114,
@@ -333,9 +333,9 @@ const unsigned char _Py_M__importlib[] = {
     0,0,0,1,6,1,122,27,95,77,111,100,117,108,101,76,
     111,99,107,77,97,110,97,103,101,114,46,95,95,105,110,105,
     116,95,95,99,1,0,0,0,0,0,0,0,1,0,0,0,
-    10,0,0,0,67,0,0,0,115,42,0,0,0,122,16,116,
+    11,0,0,0,67,0,0,0,115,42,0,0,0,122,16,116,
     0,124,0,106,1,131,1,124,0,95,2,87,0,100,0,116,
-    3,106,4,131,0,1,0,88,0,124,0,106,2,106,5,131,
+    3,160,4,161,0,1,0,88,0,124,0,106,2,160,5,161,
     0,1,0,100,0,83,0,41,1,78,41,6,218,16,95,103,
     101,116,95,109,111,100,117,108,101,95,108,111,99,107,114,18,
     0,0,0,114,55,0,0,0,218,4,95,105,109,112,218,12,
@@ -345,8 +345,8 @@ const unsigned char _Py_M__importlib[] = {
     115,8,0,0,0,0,1,2,1,16,2,10,1,122,28,95,
     77,111,100,117,108,101,76,111,99,107,77,97,110,97,103,101,
     114,46,95,95,101,110,116,101,114,95,95,99,1,0,0,0,
-    0,0,0,0,3,0,0,0,1,0,0,0,79,0,0,0,
-    115,14,0,0,0,124,0,106,0,106,1,131,0,1,0,100,
+    0,0,0,0,3,0,0,0,2,0,0,0,79,0,0,0,
+    115,14,0,0,0,124,0,106,0,160,1,161,0,1,0,100,
     0,83,0,41,1,78,41,2,114,55,0,0,0,114,47,0,
     0,0,41,3,114,19,0,0,0,114,29,0,0,0,90,6,
     107,119,97,114,103,115,114,10,0,0,0,114,10,0,0,0,
@@ -358,14 +358,14 @@ const unsigned char _Py_M__importlib[] = {
     0,0,0,114,10,0,0,0,114,10,0,0,0,114,10,0,
     0,0,114,11,0,0,0,114,54,0,0,0,157,0,0,0,
     115,6,0,0,0,8,2,8,4,8,7,114,54,0,0,0,
-    99,1,0,0,0,0,0,0,0,3,0,0,0,11,0,0,
+    99,1,0,0,0,0,0,0,0,3,0,0,0,12,0,0,
     0,3,0,0,0,115,106,0,0,0,100,1,125,1,121,14,
     116,0,136,0,25,0,131,0,125,1,87,0,110,20,4,0,
     116,1,107,10,114,38,1,0,1,0,1,0,89,0,110,2,
     88,0,124,1,100,1,107,8,114,102,116,2,100,1,107,8,
     114,66,116,3,136,0,131,1,125,1,110,8,116,4,136,0,
     131,1,125,1,135,0,102,1,100,2,100,3,132,8,125,2,
-    116,5,106,6,124,1,124,2,131,2,116,0,136,0,60,0,
+    116,5,160,6,124,1,124,2,161,2,116,0,136,0,60,0,
     124,1,83,0,41,4,122,109,71,101,116,32,111,114,32,99,
     114,101,97,116,101,32,116,104,101,32,109,111,100,117,108,101,
     32,108,111,99,107,32,102,111,114,32,97,32,103,105,118,101,
@@ -390,10 +390,10 @@ const unsigned char _Py_M__importlib[] = {
     1,14,1,14,1,6,1,8,1,8,1,10,2,8,1,12,
     2,16,1,114,56,0,0,0,99,1,0,0,0,0,0,0,
     0,2,0,0,0,11,0,0,0,67,0,0,0,115,62,0,
-    0,0,116,0,124,0,131,1,125,1,116,1,106,2,131,0,
-    1,0,121,12,124,1,106,3,131,0,1,0,87,0,110,20,
+    0,0,116,0,124,0,131,1,125,1,116,1,160,2,161,0,
+    1,0,121,12,124,1,160,3,161,0,1,0,87,0,110,20,
     4,0,116,4,107,10,114,48,1,0,1,0,1,0,89,0,
-    110,10,88,0,124,1,106,5,131,0,1,0,100,1,83,0,
+    110,10,88,0,124,1,160,5,161,0,1,0,100,1,83,0,
     41,2,97,21,1,0,0,82,101,108,101,97,115,101,32,116,
     104,101,32,103,108,111,98,97,108,32,105,109,112,111,114,116,
     32,108,111,99,107,44,32,97,110,100,32,97,99,113,117,105,
@@ -448,7 +448,7 @@ const unsigned char _Py_M__importlib[] = {
     0,114,45,0,0,0,41,1,218,9,118,101,114,98,111,115,
     105,116,121,99,1,0,0,0,1,0,0,0,3,0,0,0,
     4,0,0,0,71,0,0,0,115,56,0,0,0,116,0,106,
-    1,106,2,124,1,107,5,114,52,124,0,106,3,100,6,131,
+    1,106,2,124,1,107,5,114,52,124,0,160,3,100,6,161,
     1,115,30,100,3,124,0,23,0,125,0,116,4,124,0,106,
     5,124,2,140,0,100,4,116,0,106,6,144,1,131,1,1,
     0,100,5,83,0,41,7,122,61,80,114,105,110,116,32,116,
@@ -474,8 +474,8 @@ const unsigned char _Py_M__importlib[] = {
     100,32,109,111,100,117,108,101,32,105,115,32,98,117,105,108,
     116,45,105,110,46,99,2,0,0,0,0,0,0,0,2,0,
     0,0,4,0,0,0,19,0,0,0,115,40,0,0,0,124,
-    1,116,0,106,1,107,7,114,30,116,2,100,1,106,3,124,
-    1,131,1,100,2,124,1,144,1,131,1,130,1,136,0,124,
+    1,116,0,106,1,107,7,114,30,116,2,100,1,160,3,124,
+    1,161,1,100,2,124,1,144,1,131,1,130,1,136,0,124,
     0,124,1,131,2,83,0,41,3,78,122,29,123,33,114,125,
     32,105,115,32,110,111,116,32,97,32,98,117,105,108,116,45,
     105,110,32,109,111,100,117,108,101,114,15,0,0,0,41,4,
@@ -502,8 +502,8 @@ const unsigned char _Py_M__importlib[] = {
     32,118,101,114,105,102,121,32,116,104,101,32,110,97,109,101,
     100,32,109,111,100,117,108,101,32,105,115,32,102,114,111,122,
     101,110,46,99,2,0,0,0,0,0,0,0,2,0,0,0,
-    4,0,0,0,19,0,0,0,115,40,0,0,0,116,0,106,
-    1,124,1,131,1,115,30,116,2,100,1,106,3,124,1,131,
+    4,0,0,0,19,0,0,0,115,40,0,0,0,116,0,160,
+    1,124,1,161,1,115,30,116,2,100,1,160,3,124,1,161,
     1,100,2,124,1,144,1,131,1,130,1,136,0,124,0,124,
     1,131,2,83,0,41,3,78,122,27,123,33,114,125,32,105,
     115,32,110,111,116,32,97,32,102,114,111,122,101,110,32,109,
@@ -544,10 +544,10 @@ const unsigned char _Py_M__importlib[] = {
     218,17,95,108,111,97,100,95,109,111,100,117,108,101,95,115,
     104,105,109,0,1,0,0,115,12,0,0,0,0,6,10,1,
     10,1,10,1,10,1,12,2,114,90,0,0,0,99,1,0,
-    0,0,0,0,0,0,5,0,0,0,35,0,0,0,67,0,
+    0,0,0,0,0,0,5,0,0,0,36,0,0,0,67,0,
     0,0,115,218,0,0,0,116,0,124,0,100,1,100,0,131,
     3,125,1,116,1,124,1,100,2,131,2,114,54,121,10,124,
-    1,106,2,124,0,131,1,83,0,4,0,116,3,107,10,114,
+    1,160,2,124,0,161,1,83,0,4,0,116,3,107,10,114,
     52,1,0,1,0,1,0,89,0,110,2,88,0,121,10,124,
     0,106,4,125,2,87,0,110,20,4,0,116,5,107,10,114,
     84,1,0,1,0,1,0,89,0,110,18,88,0,124,2,100,
@@ -556,9 +556,9 @@ const unsigned char _Py_M__importlib[] = {
     136,1,0,1,0,1,0,100,3,125,3,89,0,110,2,88,
     0,121,10,124,0,106,8,125,4,87,0,110,52,4,0,116,
     5,107,10,114,200,1,0,1,0,1,0,124,1,100,0,107,
-    8,114,184,100,4,106,9,124,3,131,1,83,0,110,12,100,
-    5,106,9,124,3,124,1,131,2,83,0,89,0,110,14,88,
-    0,100,6,106,9,124,3,124,4,131,2,83,0,100,0,83,
+    8,114,184,100,4,160,9,124,3,161,1,83,0,110,12,100,
+    5,160,9,124,3,124,1,161,2,83,0,89,0,110,14,88,
+    0,100,6,160,9,124,3,124,4,161,2,83,0,100,0,83,
     0,41,7,78,218,10,95,95,108,111,97,100,101,114,95,95,
     218,11,109,111,100,117,108,101,95,114,101,112,114,250,1,63,
     122,13,60,109,111,100,117,108,101,32,123,33,114,125,62,122,
@@ -757,14 +757,14 @@ const unsigned char _Py_M__importlib[] = {
     115,14,0,0,0,0,2,6,1,6,1,6,1,6,1,14,
     3,6,1,122,19,77,111,100,117,108,101,83,112,101,99,46,
     95,95,105,110,105,116,95,95,99,1,0,0,0,0,0,0,
-    0,2,0,0,0,4,0,0,0,67,0,0,0,115,102,0,
-    0,0,100,1,106,0,124,0,106,1,131,1,100,2,106,0,
-    124,0,106,2,131,1,103,2,125,1,124,0,106,3,100,0,
-    107,9,114,52,124,1,106,4,100,3,106,0,124,0,106,3,
-    131,1,131,1,1,0,124,0,106,5,100,0,107,9,114,80,
-    124,1,106,4,100,4,106,0,124,0,106,5,131,1,131,1,
-    1,0,100,5,106,0,124,0,106,6,106,7,100,6,106,8,
-    124,1,131,1,131,2,83,0,41,7,78,122,9,110,97,109,
+    0,2,0,0,0,6,0,0,0,67,0,0,0,115,102,0,
+    0,0,100,1,160,0,124,0,106,1,161,1,100,2,160,0,
+    124,0,106,2,161,1,103,2,125,1,124,0,106,3,100,0,
+    107,9,114,52,124,1,160,4,100,3,160,0,124,0,106,3,
+    161,1,161,1,1,0,124,0,106,5,100,0,107,9,114,80,
+    124,1,160,4,100,4,160,0,124,0,106,5,161,1,161,1,
+    1,0,100,5,160,0,124,0,106,6,106,7,100,6,160,8,
+    124,1,161,1,161,2,83,0,41,7,78,122,9,110,97,109,
     101,61,123,33,114,125,122,11,108,111,97,100,101,114,61,123,
     33,114,125,122,11,111,114,105,103,105,110,61,123,33,114,125,
     122,29,115,117,98,109,111,100,117,108,101,95,115,101,97,114,
@@ -795,11 +795,11 @@ const unsigned char _Py_M__importlib[] = {
     95,95,138,1,0,0,115,20,0,0,0,0,1,6,1,2,
     1,12,1,12,1,12,1,10,1,12,1,12,1,14,1,122,
     17,77,111,100,117,108,101,83,112,101,99,46,95,95,101,113,
-    95,95,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
+    95,95,99,1,0,0,0,0,0,0,0,1,0,0,0,3,
     0,0,0,67,0,0,0,115,58,0,0,0,124,0,106,0,
     100,0,107,8,114,52,124,0,106,1,100,0,107,9,114,52,
     124,0,106,2,114,52,116,3,100,0,107,8,114,38,116,4,
-    130,1,116,3,106,5,124,0,106,1,131,1,124,0,95,0,
+    130,1,116,3,160,5,124,0,106,1,161,1,124,0,95,0,
     124,0,106,0,83,0,41,1,78,41,6,114,112,0,0,0,
     114,107,0,0,0,114,111,0,0,0,218,19,95,98,111,111,
     116,115,116,114,97,112,95,101,120,116,101,114,110,97,108,218,
@@ -815,9 +815,9 @@ const unsigned char _Py_M__importlib[] = {
     0,0,41,2,114,19,0,0,0,114,116,0,0,0,114,10,
     0,0,0,114,10,0,0,0,114,11,0,0,0,114,116,0,
     0,0,159,1,0,0,115,2,0,0,0,0,2,99,1,0,
-    0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,
+    0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,
     0,0,115,38,0,0,0,124,0,106,0,100,1,107,8,114,
-    28,124,0,106,1,106,2,100,2,131,1,100,3,25,0,83,
+    28,124,0,106,1,160,2,100,2,161,1,100,3,25,0,83,
     0,110,6,124,0,106,1,83,0,100,1,83,0,41,4,122,
     32,84,104,101,32,110,97,109,101,32,111,102,32,116,104,101,
     32,109,111,100,117,108,101,39,115,32,112,97,114,101,110,116,
@@ -856,8 +856,8 @@ const unsigned char _Py_M__importlib[] = {
     3,124,1,144,1,131,1,83,0,124,3,114,58,103,0,110,
     2,100,2,125,5,124,4,124,0,100,3,124,1,100,4,124,
     5,144,2,131,1,83,0,124,3,100,2,107,8,114,144,116,
-    0,124,1,100,5,131,2,114,140,121,14,124,1,106,4,124,
-    0,131,1,125,3,87,0,113,144,4,0,116,5,107,10,114,
+    0,124,1,100,5,131,2,114,140,121,14,124,1,160,4,124,
+    0,161,1,125,3,87,0,113,144,4,0,116,5,107,10,114,
     136,1,0,1,0,1,0,100,2,125,3,89,0,113,144,88,
     0,110,4,100,6,125,3,116,6,124,0,124,1,100,7,124,
     2,100,5,124,3,144,2,131,2,83,0,41,8,122,53,82,
@@ -923,8 +923,8 @@ const unsigned char _Py_M__importlib[] = {
     115,74,116,0,124,1,100,2,100,0,131,3,100,0,107,8,
     114,166,124,0,106,4,125,3,124,3,100,0,107,8,114,134,
     124,0,106,5,100,0,107,9,114,134,116,6,100,0,107,8,
-    114,110,116,7,130,1,116,6,106,8,125,4,124,4,106,9,
-    124,4,131,1,125,3,124,0,106,5,124,3,95,10,121,10,
+    114,110,116,7,130,1,116,6,106,8,125,4,124,4,160,9,
+    124,4,161,1,125,3,124,0,106,5,124,3,95,10,121,10,
     124,3,124,1,95,11,87,0,110,20,4,0,116,3,107,10,
     114,164,1,0,1,0,1,0,89,0,110,2,88,0,124,2,
     115,186,116,0,124,1,100,3,100,0,131,3,100,0,107,8,
@@ -969,7 +969,7 @@ const unsigned char _Py_M__importlib[] = {
     12,1,16,1,6,1,114,137,0,0,0,99,1,0,0,0,
     0,0,0,0,2,0,0,0,5,0,0,0,67,0,0,0,
     115,92,0,0,0,100,1,125,1,116,0,124,0,106,1,100,
-    2,131,2,114,30,124,0,106,1,106,2,124,0,131,1,125,
+    2,131,2,114,30,124,0,106,1,160,2,124,0,161,1,125,
     1,110,30,116,0,124,0,106,1,100,3,131,2,114,60,116,
     3,106,4,100,4,116,5,100,5,100,6,144,1,131,2,1,
     0,124,1,100,1,107,8,114,78,116,6,124,0,106,7,131,
@@ -995,14 +995,14 @@ const unsigned char _Py_M__importlib[] = {
     102,114,111,109,95,115,112,101,99,58,2,0,0,115,20,0,
     0,0,0,3,4,1,12,3,14,1,12,1,6,2,12,1,
     8,1,10,1,10,1,114,145,0,0,0,99,1,0,0,0,
-    0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,0,
+    0,0,0,0,2,0,0,0,4,0,0,0,67,0,0,0,
     115,110,0,0,0,124,0,106,0,100,1,107,8,114,14,100,
     2,110,4,124,0,106,0,125,1,124,0,106,1,100,1,107,
-    8,114,68,124,0,106,2,100,1,107,8,114,52,100,3,106,
-    3,124,1,131,1,83,0,113,106,100,4,106,3,124,1,124,
-    0,106,2,131,2,83,0,110,38,124,0,106,4,114,90,100,
-    5,106,3,124,1,124,0,106,1,131,2,83,0,110,16,100,
-    6,106,3,124,0,106,0,124,0,106,1,131,2,83,0,100,
+    8,114,68,124,0,106,2,100,1,107,8,114,52,100,3,160,
+    3,124,1,161,1,83,0,113,106,100,4,160,3,124,1,124,
+    0,106,2,161,2,83,0,110,38,124,0,106,4,114,90,100,
+    5,160,3,124,1,124,0,106,1,161,2,83,0,110,16,100,
+    6,160,3,124,0,106,0,124,0,106,1,161,2,83,0,100,
     1,83,0,41,7,122,38,82,101,116,117,114,110,32,116,104,
     101,32,114,101,112,114,32,116,111,32,117,115,101,32,102,111,
     114,32,116,104,101,32,109,111,100,117,108,101,46,78,114,93,
@@ -1019,17 +1019,17 @@ const unsigned char _Py_M__importlib[] = {
     1,12,2,16,2,6,1,16,2,114,97,0,0,0,99,2,
     0,0,0,0,0,0,0,4,0,0,0,12,0,0,0,67,
     0,0,0,115,194,0,0,0,124,0,106,0,125,2,116,1,
-    106,2,131,0,1,0,116,3,124,2,131,1,143,156,1,0,
-    116,4,106,5,106,6,124,2,131,1,124,1,107,9,114,64,
-    100,1,106,7,124,2,131,1,125,3,116,8,124,3,100,2,
+    160,2,161,0,1,0,116,3,124,2,131,1,143,156,1,0,
+    116,4,106,5,160,6,124,2,161,1,124,1,107,9,114,64,
+    100,1,160,7,124,2,161,1,125,3,116,8,124,3,100,2,
     124,2,144,1,131,1,130,1,124,0,106,9,100,3,107,8,
     114,120,124,0,106,10,100,3,107,8,114,100,116,8,100,4,
     100,2,124,0,106,0,144,1,131,1,130,1,116,11,124,0,
     124,1,100,5,100,6,144,1,131,2,1,0,124,1,83,0,
     116,11,124,0,124,1,100,5,100,6,144,1,131,2,1,0,
     116,12,124,0,106,9,100,7,131,2,115,162,124,0,106,9,
-    106,13,124,2,131,1,1,0,110,12,124,0,106,9,106,14,
-    124,1,131,1,1,0,87,0,100,3,81,0,82,0,88,0,
+    160,13,124,2,161,1,1,0,110,12,124,0,106,9,160,14,
+    124,1,161,1,1,0,87,0,100,3,81,0,82,0,88,0,
     116,4,106,5,124,2,25,0,83,0,41,8,122,70,69,120,
     101,99,117,116,101,32,116,104,101,32,115,112,101,99,39,115,
     32,115,112,101,99,105,102,105,101,100,32,109,111,100,117,108,
@@ -1052,14 +1052,14 @@ const unsigned char _Py_M__importlib[] = {
     10,1,14,1,10,1,10,1,16,2,16,1,4,1,16,1,
     12,4,14,2,22,1,114,86,0,0,0,99,1,0,0,0,
     0,0,0,0,2,0,0,0,27,0,0,0,67,0,0,0,
-    115,206,0,0,0,124,0,106,0,106,1,124,0,106,2,131,
+    115,206,0,0,0,124,0,106,0,160,1,124,0,106,2,161,
     1,1,0,116,3,106,4,124,0,106,2,25,0,125,1,116,
     5,124,1,100,1,100,0,131,3,100,0,107,8,114,76,121,
     12,124,0,106,0,124,1,95,6,87,0,110,20,4,0,116,
     7,107,10,114,74,1,0,1,0,1,0,89,0,110,2,88,
     0,116,5,124,1,100,2,100,0,131,3,100,0,107,8,114,
     154,121,40,124,1,106,8,124,1,95,9,116,10,124,1,100,
-    3,131,2,115,130,124,0,106,2,106,11,100,4,131,1,100,
+    3,131,2,115,130,124,0,106,2,160,11,100,4,161,1,100,
     5,25,0,124,1,95,9,87,0,110,20,4,0,116,7,107,
     10,114,152,1,0,1,0,1,0,89,0,110,2,88,0,116,
     5,124,1,100,6,100,0,131,3,100,0,107,8,114,202,121,
@@ -1085,7 +1085,7 @@ const unsigned char _Py_M__importlib[] = {
     1,125,1,116,4,124,1,131,1,143,56,1,0,124,0,106,
     0,100,0,107,8,114,86,124,0,106,5,100,0,107,8,114,
     98,116,6,100,2,100,3,124,0,106,7,144,1,131,1,130,
-    1,110,12,124,0,106,0,106,8,124,1,131,1,1,0,87,
+    1,110,12,124,0,106,0,160,8,124,1,161,1,1,0,87,
     0,100,0,81,0,82,0,88,0,116,9,106,10,124,0,106,
     7,25,0,83,0,41,4,78,114,139,0,0,0,122,14,109,
     105,115,115,105,110,103,32,108,111,97,100,101,114,114,15,0,
@@ -1099,7 +1099,7 @@ const unsigned char _Py_M__importlib[] = {
     2,10,2,12,1,8,2,8,1,10,1,10,1,10,1,18,
     3,22,5,114,150,0,0,0,99,1,0,0,0,0,0,0,
     0,1,0,0,0,9,0,0,0,67,0,0,0,115,38,0,
-    0,0,116,0,106,1,131,0,1,0,116,2,124,0,106,3,
+    0,0,116,0,160,1,161,0,1,0,116,2,124,0,106,3,
     131,1,143,10,1,0,116,4,124,0,131,1,83,0,81,0,
     82,0,88,0,100,1,83,0,41,2,122,191,82,101,116,117,
     114,110,32,97,32,110,101,119,32,109,111,100,117,108,101,32,
@@ -1139,8 +1139,8 @@ const unsigned char _Py_M__importlib[] = {
     32,116,104,101,32,110,101,101,100,32,116,111,10,32,32,32,
     32,105,110,115,116,97,110,116,105,97,116,101,32,116,104,101,
     32,99,108,97,115,115,46,10,10,32,32,32,32,99,1,0,
-    0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,
-    0,0,115,12,0,0,0,100,1,106,0,124,0,106,1,131,
+    0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,
+    0,0,115,12,0,0,0,100,1,160,0,124,0,106,1,161,
     1,83,0,41,2,122,115,82,101,116,117,114,110,32,114,101,
     112,114,32,102,111,114,32,116,104,101,32,109,111,100,117,108,
     101,46,10,10,32,32,32,32,32,32,32,32,84,104,101,32,
@@ -1157,8 +1157,8 @@ const unsigned char _Py_M__importlib[] = {
     109,112,111,114,116,101,114,46,109,111,100,117,108,101,95,114,
     101,112,114,78,99,4,0,0,0,0,0,0,0,4,0,0,
     0,5,0,0,0,67,0,0,0,115,48,0,0,0,124,2,
-    100,0,107,9,114,12,100,0,83,0,116,0,106,1,124,1,
-    131,1,114,40,116,2,124,1,124,0,100,1,100,2,144,1,
+    100,0,107,9,114,12,100,0,83,0,116,0,160,1,124,1,
+    161,1,114,40,116,2,124,1,124,0,100,1,100,2,144,1,
     131,2,83,0,110,4,100,0,83,0,100,0,83,0,41,3,
     78,114,107,0,0,0,122,8,98,117,105,108,116,45,105,110,
     41,3,114,57,0,0,0,90,10,105,115,95,98,117,105,108,
@@ -1169,8 +1169,8 @@ const unsigned char _Py_M__importlib[] = {
     115,10,0,0,0,0,2,8,1,4,1,10,1,18,2,122,
     25,66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,
     46,102,105,110,100,95,115,112,101,99,99,3,0,0,0,0,
-    0,0,0,4,0,0,0,3,0,0,0,67,0,0,0,115,
-    30,0,0,0,124,0,106,0,124,1,124,2,131,2,125,3,
+    0,0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,
+    30,0,0,0,124,0,160,0,124,1,124,2,161,2,125,3,
     124,3,100,1,107,9,114,26,124,3,106,1,83,0,100,1,
     83,0,41,2,122,175,70,105,110,100,32,116,104,101,32,98,
     117,105,108,116,45,105,110,32,109,111,100,117,108,101,46,10,
@@ -1192,7 +1192,7 @@ const unsigned char _Py_M__importlib[] = {
     101,114,46,102,105,110,100,95,109,111,100,117,108,101,99,2,
     0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,67,
     0,0,0,115,48,0,0,0,124,1,106,0,116,1,106,2,
-    107,7,114,36,116,3,100,1,106,4,124,1,106,0,131,1,
+    107,7,114,36,116,3,100,1,160,4,124,1,106,0,161,1,
     100,2,124,1,106,0,144,1,131,1,130,1,116,5,116,6,
     106,7,124,1,131,2,83,0,41,3,122,24,67,114,101,97,
     116,101,32,97,32,98,117,105,108,116,45,105,110,32,109,111,
@@ -1261,16 +1261,17 @@ const unsigned char _Py_M__importlib[] = {
     0,8,7,4,2,12,9,2,1,12,8,2,1,12,11,12,
     8,12,5,2,1,14,5,2,1,14,5,2,1,14,5,114,
     151,0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,
-    0,4,0,0,0,64,0,0,0,115,140,0,0,0,101,0,
+    0,4,0,0,0,64,0,0,0,115,156,0,0,0,101,0,
     90,1,100,0,90,2,100,1,90,3,101,4,100,2,100,3,
-    132,0,131,1,90,5,101,6,100,21,100,5,100,6,132,1,
-    131,1,90,7,101,6,100,22,100,7,100,8,132,1,131,1,
-    90,8,101,6,100,9,100,10,132,0,131,1,90,9,101,4,
-    100,11,100,12,132,0,131,1,90,10,101,6,100,13,100,14,
-    132,0,131,1,90,11,101,6,101,12,100,15,100,16,132,0,
-    131,1,131,1,90,13,101,6,101,12,100,17,100,18,132,0,
-    131,1,131,1,90,14,101,6,101,12,100,19,100,20,132,0,
-    131,1,131,1,90,15,100,4,83,0,41,23,218,14,70,114,
+    132,0,131,1,90,5,100,4,90,6,101,7,100,5,100,6,
+    132,0,131,1,90,8,101,7,100,23,100,7,100,8,132,1,
+    131,1,90,9,101,7,100,24,100,9,100,10,132,1,131,1,
+    90,10,101,7,100,11,100,12,132,0,131,1,90,11,101,4,
+    100,13,100,14,132,0,131,1,90,12,101,7,100,15,100,16,
+    132,0,131,1,90,13,101,7,101,14,100,17,100,18,132,0,
+    131,1,131,1,90,15,101,7,101,14,100,19,100,20,132,0,
+    131,1,131,1,90,16,101,7,101,14,100,21,100,22,132,0,
+    131,1,131,1,90,17,100,4,83,0,41,25,218,14,70,114,
     111,122,101,110,73,109,112,111,114,116,101,114,122,142,77,101,
     116,97,32,112,97,116,104,32,105,109,112,111,114,116,32,102,
     111,114,32,102,114,111,122,101,110,32,109,111,100,117,108,101,
@@ -1281,8 +1282,8 @@ const unsigned char _Py_M__importlib[] = {
     116,104,101,32,110,101,101,100,32,116,111,10,32,32,32,32,
     105,110,115,116,97,110,116,105,97,116,101,32,116,104,101,32,
     99,108,97,115,115,46,10,10,32,32,32,32,99,1,0,0,
-    0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,
-    0,115,12,0,0,0,100,1,106,0,124,0,106,1,131,1,
+    0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,
+    0,115,12,0,0,0,100,1,160,0,124,0,106,1,161,1,
     83,0,41,2,122,115,82,101,116,117,114,110,32,114,101,112,
     114,32,102,111,114,32,116,104,101,32,109,111,100,117,108,101,
     46,10,10,32,32,32,32,32,32,32,32,84,104,101,32,109,
@@ -1296,590 +1297,635 @@ const unsigned char _Py_M__importlib[] = {
     1,109,114,10,0,0,0,114,10,0,0,0,114,11,0,0,
     0,114,92,0,0,0,12,3,0,0,115,2,0,0,0,0,
     7,122,26,70,114,111,122,101,110,73,109,112,111,114,116,101,
-    114,46,109,111,100,117,108,101,95,114,101,112,114,78,99,4,
-    0,0,0,0,0,0,0,4,0,0,0,5,0,0,0,67,
-    0,0,0,115,36,0,0,0,116,0,106,1,124,1,131,1,
-    114,28,116,2,124,1,124,0,100,1,100,2,144,1,131,2,
-    83,0,110,4,100,0,83,0,100,0,83,0,41,3,78,114,
-    107,0,0,0,90,6,102,114,111,122,101,110,41,3,114,57,
-    0,0,0,114,82,0,0,0,114,85,0,0,0,41,4,114,
-    152,0,0,0,114,78,0,0,0,114,153,0,0,0,114,154,
+    114,46,109,111,100,117,108,101,95,114,101,112,114,78,99,2,
+    0,0,0,0,0,0,0,4,0,0,0,6,0,0,0,67,
+    0,0,0,115,164,0,0,0,116,0,100,1,107,8,115,20,
+    116,1,160,2,124,1,161,1,12,0,114,24,100,1,83,0,
+    116,0,106,3,125,2,124,0,106,4,100,1,107,8,114,100,
+    100,2,124,0,95,4,120,52,116,5,106,6,68,0,93,42,
+    125,3,124,3,114,54,116,7,124,3,116,8,131,2,114,54,
+    116,0,160,9,124,2,124,3,100,3,131,2,161,1,114,54,
+    124,3,124,0,95,4,80,0,113,54,87,0,124,0,106,4,
+    115,110,100,1,83,0,116,1,160,10,124,1,161,1,114,142,
+    124,2,124,0,106,4,124,1,160,11,100,4,161,1,100,7,
+    149,2,140,1,83,0,124,2,124,0,106,4,124,1,160,11,
+    100,4,161,1,140,1,100,6,23,0,83,0,41,8,122,108,
+    82,101,116,117,114,110,32,116,104,101,32,112,97,116,104,32,
+    111,102,32,116,104,101,32,102,105,108,101,32,105,110,32,116,
+    104,101,32,115,116,97,110,100,97,114,100,32,108,105,98,114,
+    97,114,121,32,119,104,105,99,104,32,116,104,101,10,32,32,
+    32,32,32,32,32,32,102,114,111,122,101,110,32,109,111,100,
+    117,108,101,32,119,97,115,32,98,117,105,108,116,32,102,114,
+    111,109,44,32,111,114,32,78,111,110,101,46,78,218,0,122,
+    5,111,115,46,112,121,114,121,0,0,0,250,11,95,95,105,
+    110,105,116,95,95,46,112,121,122,3,46,112,121,41,1,114,
+    164,0,0,0,41,12,114,119,0,0,0,114,57,0,0,0,
+    90,18,95,105,115,95,102,114,111,122,101,110,95,115,116,97,
+    114,116,117,112,90,10,95,112,97,116,104,95,106,111,105,110,
+    218,11,95,115,116,100,108,105,98,95,100,105,114,114,14,0,
+    0,0,114,153,0,0,0,218,10,105,115,105,110,115,116,97,
+    110,99,101,218,3,115,116,114,90,12,95,112,97,116,104,95,
+    105,115,102,105,108,101,218,17,105,115,95,102,114,111,122,101,
+    110,95,112,97,99,107,97,103,101,218,5,115,112,108,105,116,
+    41,4,114,152,0,0,0,114,78,0,0,0,90,9,112,97,
+    116,104,95,106,111,105,110,90,5,101,110,116,114,121,114,10,
+    0,0,0,114,10,0,0,0,114,11,0,0,0,218,12,95,
+    115,116,100,108,105,98,95,112,97,116,104,24,3,0,0,115,
+    36,0,0,0,0,4,8,1,12,1,4,1,6,1,10,4,
+    6,1,12,1,14,1,4,1,12,1,6,1,6,1,6,1,
+    4,1,10,1,14,1,8,1,122,27,70,114,111,122,101,110,
+    73,109,112,111,114,116,101,114,46,95,115,116,100,108,105,98,
+    95,112,97,116,104,99,4,0,0,0,0,0,0,0,6,0,
+    0,0,5,0,0,0,67,0,0,0,115,70,0,0,0,116,
+    0,160,1,124,1,161,1,114,62,116,2,124,1,124,0,100,
+    1,100,2,144,1,131,2,125,4,124,0,160,3,124,1,161,
+    1,125,5,124,5,100,0,107,9,114,56,124,5,124,4,95,
+    4,100,3,124,4,95,5,124,4,83,0,110,4,100,0,83,
+    0,100,0,83,0,41,4,78,114,107,0,0,0,90,6,102,
+    114,111,122,101,110,84,41,6,114,57,0,0,0,114,82,0,
+    0,0,114,85,0,0,0,114,170,0,0,0,114,107,0,0,
+    0,114,117,0,0,0,41,6,114,152,0,0,0,114,78,0,
+    0,0,114,153,0,0,0,114,154,0,0,0,114,88,0,0,
+    0,114,100,0,0,0,114,10,0,0,0,114,10,0,0,0,
+    114,11,0,0,0,114,155,0,0,0,50,3,0,0,115,16,
+    0,0,0,0,2,10,1,16,3,10,1,8,1,6,1,6,
+    1,6,2,122,24,70,114,111,122,101,110,73,109,112,111,114,
+    116,101,114,46,102,105,110,100,95,115,112,101,99,99,3,0,
+    0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,
+    0,0,115,18,0,0,0,116,0,160,1,124,1,161,1,114,
+    14,124,0,83,0,100,1,83,0,41,2,122,93,70,105,110,
+    100,32,97,32,102,114,111,122,101,110,32,109,111,100,117,108,
+    101,46,10,10,32,32,32,32,32,32,32,32,84,104,105,115,
+    32,109,101,116,104,111,100,32,105,115,32,100,101,112,114,101,
+    99,97,116,101,100,46,32,32,85,115,101,32,102,105,110,100,
+    95,115,112,101,99,40,41,32,105,110,115,116,101,97,100,46,
+    10,10,32,32,32,32,32,32,32,32,78,41,2,114,57,0,
+    0,0,114,82,0,0,0,41,3,114,152,0,0,0,114,78,
+    0,0,0,114,153,0,0,0,114,10,0,0,0,114,10,0,
+    0,0,114,11,0,0,0,114,156,0,0,0,64,3,0,0,
+    115,2,0,0,0,0,7,122,26,70,114,111,122,101,110,73,
+    109,112,111,114,116,101,114,46,102,105,110,100,95,109,111,100,
+    117,108,101,99,2,0,0,0,0,0,0,0,2,0,0,0,
+    1,0,0,0,67,0,0,0,115,4,0,0,0,100,1,83,
+    0,41,2,122,42,85,115,101,32,100,101,102,97,117,108,116,
+    32,115,101,109,97,110,116,105,99,115,32,102,111,114,32,109,
+    111,100,117,108,101,32,99,114,101,97,116,105,111,110,46,78,
+    114,10,0,0,0,41,2,114,152,0,0,0,114,88,0,0,
+    0,114,10,0,0,0,114,10,0,0,0,114,11,0,0,0,
+    114,138,0,0,0,73,3,0,0,115,0,0,0,0,122,28,
+    70,114,111,122,101,110,73,109,112,111,114,116,101,114,46,99,
+    114,101,97,116,101,95,109,111,100,117,108,101,99,1,0,0,
+    0,0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,
+    0,115,90,0,0,0,124,0,106,0,106,1,125,1,116,2,
+    160,3,124,1,161,1,115,38,116,4,100,1,160,5,124,1,
+    161,1,100,2,124,1,144,1,131,1,130,1,116,6,116,2,
+    106,7,124,1,131,2,125,2,124,0,106,0,106,8,114,74,
+    116,2,160,9,124,2,124,0,106,0,106,10,161,2,1,0,
+    116,11,124,2,124,0,106,12,131,2,1,0,100,0,83,0,
+    41,3,78,122,27,123,33,114,125,32,105,115,32,110,111,116,
+    32,97,32,102,114,111,122,101,110,32,109,111,100,117,108,101,
+    114,15,0,0,0,41,13,114,95,0,0,0,114,15,0,0,
+    0,114,57,0,0,0,114,82,0,0,0,114,77,0,0,0,
+    114,50,0,0,0,114,65,0,0,0,218,17,103,101,116,95,
+    102,114,111,122,101,110,95,111,98,106,101,99,116,114,117,0,
+    0,0,90,16,95,102,105,120,95,99,111,95,102,105,108,101,
+    110,97,109,101,114,107,0,0,0,218,4,101,120,101,99,114,
+    7,0,0,0,41,3,114,89,0,0,0,114,15,0,0,0,
+    218,4,99,111,100,101,114,10,0,0,0,114,10,0,0,0,
+    114,11,0,0,0,114,139,0,0,0,77,3,0,0,115,16,
+    0,0,0,0,2,8,1,10,1,12,1,8,1,12,1,8,
+    1,16,1,122,26,70,114,111,122,101,110,73,109,112,111,114,
+    116,101,114,46,101,120,101,99,95,109,111,100,117,108,101,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    67,0,0,0,115,10,0,0,0,116,0,124,0,124,1,131,
+    2,83,0,41,1,122,95,76,111,97,100,32,97,32,102,114,
+    111,122,101,110,32,109,111,100,117,108,101,46,10,10,32,32,
+    32,32,32,32,32,32,84,104,105,115,32,109,101,116,104,111,
+    100,32,105,115,32,100,101,112,114,101,99,97,116,101,100,46,
+    32,32,85,115,101,32,101,120,101,99,95,109,111,100,117,108,
+    101,40,41,32,105,110,115,116,101,97,100,46,10,10,32,32,
+    32,32,32,32,32,32,41,1,114,90,0,0,0,41,2,114,
+    152,0,0,0,114,78,0,0,0,114,10,0,0,0,114,10,
+    0,0,0,114,11,0,0,0,114,147,0,0,0,88,3,0,
+    0,115,2,0,0,0,0,7,122,26,70,114,111,122,101,110,
+    73,109,112,111,114,116,101,114,46,108,111,97,100,95,109,111,
+    100,117,108,101,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,3,0,0,0,67,0,0,0,115,10,0,0,0,116,0,
+    160,1,124,1,161,1,83,0,41,1,122,45,82,101,116,117,
+    114,110,32,116,104,101,32,99,111,100,101,32,111,98,106,101,
+    99,116,32,102,111,114,32,116,104,101,32,102,114,111,122,101,
+    110,32,109,111,100,117,108,101,46,41,2,114,57,0,0,0,
+    114,171,0,0,0,41,2,114,152,0,0,0,114,78,0,0,
+    0,114,10,0,0,0,114,10,0,0,0,114,11,0,0,0,
+    114,157,0,0,0,97,3,0,0,115,2,0,0,0,0,4,
+    122,23,70,114,111,122,101,110,73,109,112,111,114,116,101,114,
+    46,103,101,116,95,99,111,100,101,99,2,0,0,0,0,0,
+    0,0,2,0,0,0,1,0,0,0,67,0,0,0,115,4,
+    0,0,0,100,1,83,0,41,2,122,54,82,101,116,117,114,
+    110,32,78,111,110,101,32,97,115,32,102,114,111,122,101,110,
+    32,109,111,100,117,108,101,115,32,100,111,32,110,111,116,32,
+    104,97,118,101,32,115,111,117,114,99,101,32,99,111,100,101,
+    46,78,114,10,0,0,0,41,2,114,152,0,0,0,114,78,
     0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,
-    0,0,114,155,0,0,0,21,3,0,0,115,6,0,0,0,
-    0,2,10,1,18,2,122,24,70,114,111,122,101,110,73,109,
-    112,111,114,116,101,114,46,102,105,110,100,95,115,112,101,99,
-    99,3,0,0,0,0,0,0,0,3,0,0,0,2,0,0,
-    0,67,0,0,0,115,18,0,0,0,116,0,106,1,124,1,
-    131,1,114,14,124,0,83,0,100,1,83,0,41,2,122,93,
-    70,105,110,100,32,97,32,102,114,111,122,101,110,32,109,111,
-    100,117,108,101,46,10,10,32,32,32,32,32,32,32,32,84,
-    104,105,115,32,109,101,116,104,111,100,32,105,115,32,100,101,
-    112,114,101,99,97,116,101,100,46,32,32,85,115,101,32,102,
-    105,110,100,95,115,112,101,99,40,41,32,105,110,115,116,101,
-    97,100,46,10,10,32,32,32,32,32,32,32,32,78,41,2,
-    114,57,0,0,0,114,82,0,0,0,41,3,114,152,0,0,
-    0,114,78,0,0,0,114,153,0,0,0,114,10,0,0,0,
-    114,10,0,0,0,114,11,0,0,0,114,156,0,0,0,28,
-    3,0,0,115,2,0,0,0,0,7,122,26,70,114,111,122,
-    101,110,73,109,112,111,114,116,101,114,46,102,105,110,100,95,
-    109,111,100,117,108,101,99,2,0,0,0,0,0,0,0,2,
-    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
-    100,1,83,0,41,2,122,42,85,115,101,32,100,101,102,97,
-    117,108,116,32,115,101,109,97,110,116,105,99,115,32,102,111,
-    114,32,109,111,100,117,108,101,32,99,114,101,97,116,105,111,
-    110,46,78,114,10,0,0,0,41,2,114,152,0,0,0,114,
-    88,0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,
-    0,0,0,114,138,0,0,0,37,3,0,0,115,0,0,0,
-    0,122,28,70,114,111,122,101,110,73,109,112,111,114,116,101,
-    114,46,99,114,101,97,116,101,95,109,111,100,117,108,101,99,
-    1,0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,
-    67,0,0,0,115,66,0,0,0,124,0,106,0,106,1,125,
-    1,116,2,106,3,124,1,131,1,115,38,116,4,100,1,106,
-    5,124,1,131,1,100,2,124,1,144,1,131,1,130,1,116,
-    6,116,2,106,7,124,1,131,2,125,2,116,8,124,2,124,
-    0,106,9,131,2,1,0,100,0,83,0,41,3,78,122,27,
-    123,33,114,125,32,105,115,32,110,111,116,32,97,32,102,114,
-    111,122,101,110,32,109,111,100,117,108,101,114,15,0,0,0,
-    41,10,114,95,0,0,0,114,15,0,0,0,114,57,0,0,
-    0,114,82,0,0,0,114,77,0,0,0,114,50,0,0,0,
-    114,65,0,0,0,218,17,103,101,116,95,102,114,111,122,101,
-    110,95,111,98,106,101,99,116,218,4,101,120,101,99,114,7,
-    0,0,0,41,3,114,89,0,0,0,114,15,0,0,0,218,
-    4,99,111,100,101,114,10,0,0,0,114,10,0,0,0,114,
-    11,0,0,0,114,139,0,0,0,41,3,0,0,115,12,0,
-    0,0,0,2,8,1,10,1,12,1,8,1,12,1,122,26,
-    70,114,111,122,101,110,73,109,112,111,114,116,101,114,46,101,
-    120,101,99,95,109,111,100,117,108,101,99,2,0,0,0,0,
-    0,0,0,2,0,0,0,3,0,0,0,67,0,0,0,115,
-    10,0,0,0,116,0,124,0,124,1,131,2,83,0,41,1,
-    122,95,76,111,97,100,32,97,32,102,114,111,122,101,110,32,
-    109,111,100,117,108,101,46,10,10,32,32,32,32,32,32,32,
-    32,84,104,105,115,32,109,101,116,104,111,100,32,105,115,32,
-    100,101,112,114,101,99,97,116,101,100,46,32,32,85,115,101,
-    32,101,120,101,99,95,109,111,100,117,108,101,40,41,32,105,
-    110,115,116,101,97,100,46,10,10,32,32,32,32,32,32,32,
-    32,41,1,114,90,0,0,0,41,2,114,152,0,0,0,114,
-    78,0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,
-    0,0,0,114,147,0,0,0,50,3,0,0,115,2,0,0,
-    0,0,7,122,26,70,114,111,122,101,110,73,109,112,111,114,
-    116,101,114,46,108,111,97,100,95,109,111,100,117,108,101,99,
-    2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,
-    67,0,0,0,115,10,0,0,0,116,0,106,1,124,1,131,
-    1,83,0,41,1,122,45,82,101,116,117,114,110,32,116,104,
-    101,32,99,111,100,101,32,111,98,106,101,99,116,32,102,111,
-    114,32,116,104,101,32,102,114,111,122,101,110,32,109,111,100,
-    117,108,101,46,41,2,114,57,0,0,0,114,163,0,0,0,
-    41,2,114,152,0,0,0,114,78,0,0,0,114,10,0,0,
-    0,114,10,0,0,0,114,11,0,0,0,114,157,0,0,0,
-    59,3,0,0,115,2,0,0,0,0,4,122,23,70,114,111,
-    122,101,110,73,109,112,111,114,116,101,114,46,103,101,116,95,
-    99,111,100,101,99,2,0,0,0,0,0,0,0,2,0,0,
-    0,1,0,0,0,67,0,0,0,115,4,0,0,0,100,1,
-    83,0,41,2,122,54,82,101,116,117,114,110,32,78,111,110,
-    101,32,97,115,32,102,114,111,122,101,110,32,109,111,100,117,
-    108,101,115,32,100,111,32,110,111,116,32,104,97,118,101,32,
-    115,111,117,114,99,101,32,99,111,100,101,46,78,114,10,0,
-    0,0,41,2,114,152,0,0,0,114,78,0,0,0,114,10,
-    0,0,0,114,10,0,0,0,114,11,0,0,0,114,158,0,
-    0,0,65,3,0,0,115,2,0,0,0,0,4,122,25,70,
-    114,111,122,101,110,73,109,112,111,114,116,101,114,46,103,101,
-    116,95,115,111,117,114,99,101,99,2,0,0,0,0,0,0,
-    0,2,0,0,0,2,0,0,0,67,0,0,0,115,10,0,
-    0,0,116,0,106,1,124,1,131,1,83,0,41,1,122,46,
-    82,101,116,117,114,110,32,84,114,117,101,32,105,102,32,116,
-    104,101,32,102,114,111,122,101,110,32,109,111,100,117,108,101,
-    32,105,115,32,97,32,112,97,99,107,97,103,101,46,41,2,
-    114,57,0,0,0,90,17,105,115,95,102,114,111,122,101,110,
-    95,112,97,99,107,97,103,101,41,2,114,152,0,0,0,114,
-    78,0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,
-    0,0,0,114,109,0,0,0,71,3,0,0,115,2,0,0,
-    0,0,4,122,25,70,114,111,122,101,110,73,109,112,111,114,
-    116,101,114,46,105,115,95,112,97,99,107,97,103,101,41,2,
-    78,78,41,1,78,41,16,114,1,0,0,0,114,0,0,0,
-    0,114,2,0,0,0,114,3,0,0,0,114,159,0,0,0,
-    114,92,0,0,0,114,160,0,0,0,114,155,0,0,0,114,
-    156,0,0,0,114,138,0,0,0,114,139,0,0,0,114,147,
-    0,0,0,114,84,0,0,0,114,157,0,0,0,114,158,0,
-    0,0,114,109,0,0,0,114,10,0,0,0,114,10,0,0,
-    0,114,10,0,0,0,114,11,0,0,0,114,161,0,0,0,
-    3,3,0,0,115,30,0,0,0,8,7,4,2,12,9,2,
-    1,12,6,2,1,12,8,12,4,12,9,12,9,2,1,14,
-    5,2,1,14,5,2,1,114,161,0,0,0,99,0,0,0,
-    0,0,0,0,0,0,0,0,0,2,0,0,0,64,0,0,
-    0,115,32,0,0,0,101,0,90,1,100,0,90,2,100,1,
-    90,3,100,2,100,3,132,0,90,4,100,4,100,5,132,0,
-    90,5,100,6,83,0,41,7,218,18,95,73,109,112,111,114,
-    116,76,111,99,107,67,111,110,116,101,120,116,122,36,67,111,
-    110,116,101,120,116,32,109,97,110,97,103,101,114,32,102,111,
-    114,32,116,104,101,32,105,109,112,111,114,116,32,108,111,99,
-    107,46,99,1,0,0,0,0,0,0,0,1,0,0,0,1,
-    0,0,0,67,0,0,0,115,12,0,0,0,116,0,106,1,
-    131,0,1,0,100,1,83,0,41,2,122,24,65,99,113,117,
-    105,114,101,32,116,104,101,32,105,109,112,111,114,116,32,108,
-    111,99,107,46,78,41,2,114,57,0,0,0,114,146,0,0,
-    0,41,1,114,19,0,0,0,114,10,0,0,0,114,10,0,
-    0,0,114,11,0,0,0,114,23,0,0,0,84,3,0,0,
-    115,2,0,0,0,0,2,122,28,95,73,109,112,111,114,116,
-    76,111,99,107,67,111,110,116,101,120,116,46,95,95,101,110,
-    116,101,114,95,95,99,4,0,0,0,0,0,0,0,4,0,
-    0,0,1,0,0,0,67,0,0,0,115,12,0,0,0,116,
-    0,106,1,131,0,1,0,100,1,83,0,41,2,122,60,82,
-    101,108,101,97,115,101,32,116,104,101,32,105,109,112,111,114,
-    116,32,108,111,99,107,32,114,101,103,97,114,100,108,101,115,
-    115,32,111,102,32,97,110,121,32,114,97,105,115,101,100,32,
-    101,120,99,101,112,116,105,111,110,115,46,78,41,2,114,57,
-    0,0,0,114,58,0,0,0,41,4,114,19,0,0,0,90,
-    8,101,120,99,95,116,121,112,101,90,9,101,120,99,95,118,
-    97,108,117,101,90,13,101,120,99,95,116,114,97,99,101,98,
-    97,99,107,114,10,0,0,0,114,10,0,0,0,114,11,0,
-    0,0,114,30,0,0,0,88,3,0,0,115,2,0,0,0,
-    0,2,122,27,95,73,109,112,111,114,116,76,111,99,107,67,
-    111,110,116,101,120,116,46,95,95,101,120,105,116,95,95,78,
-    41,6,114,1,0,0,0,114,0,0,0,0,114,2,0,0,
-    0,114,3,0,0,0,114,23,0,0,0,114,30,0,0,0,
-    114,10,0,0,0,114,10,0,0,0,114,10,0,0,0,114,
-    11,0,0,0,114,166,0,0,0,80,3,0,0,115,6,0,
-    0,0,8,2,4,2,8,4,114,166,0,0,0,99,3,0,
-    0,0,0,0,0,0,5,0,0,0,4,0,0,0,67,0,
-    0,0,115,64,0,0,0,124,1,106,0,100,1,124,2,100,
-    2,24,0,131,2,125,3,116,1,124,3,131,1,124,2,107,
-    0,114,36,116,2,100,3,131,1,130,1,124,3,100,4,25,
-    0,125,4,124,0,114,60,100,5,106,3,124,4,124,0,131,
-    2,83,0,124,4,83,0,41,6,122,50,82,101,115,111,108,
-    118,101,32,97,32,114,101,108,97,116,105,118,101,32,109,111,
-    100,117,108,101,32,110,97,109,101,32,116,111,32,97,110,32,
-    97,98,115,111,108,117,116,101,32,111,110,101,46,114,121,0,
-    0,0,114,45,0,0,0,122,50,97,116,116,101,109,112,116,
-    101,100,32,114,101,108,97,116,105,118,101,32,105,109,112,111,
-    114,116,32,98,101,121,111,110,100,32,116,111,112,45,108,101,
-    118,101,108,32,112,97,99,107,97,103,101,114,33,0,0,0,
-    122,5,123,125,46,123,125,41,4,218,6,114,115,112,108,105,
-    116,218,3,108,101,110,218,10,86,97,108,117,101,69,114,114,
-    111,114,114,50,0,0,0,41,5,114,15,0,0,0,218,7,
-    112,97,99,107,97,103,101,218,5,108,101,118,101,108,90,4,
-    98,105,116,115,90,4,98,97,115,101,114,10,0,0,0,114,
-    10,0,0,0,114,11,0,0,0,218,13,95,114,101,115,111,
-    108,118,101,95,110,97,109,101,93,3,0,0,115,10,0,0,
-    0,0,2,16,1,12,1,8,1,8,1,114,172,0,0,0,
-    99,3,0,0,0,0,0,0,0,4,0,0,0,3,0,0,
-    0,67,0,0,0,115,34,0,0,0,124,0,106,0,124,1,
-    124,2,131,2,125,3,124,3,100,0,107,8,114,24,100,0,
-    83,0,116,1,124,1,124,3,131,2,83,0,41,1,78,41,
-    2,114,156,0,0,0,114,85,0,0,0,41,4,218,6,102,
-    105,110,100,101,114,114,15,0,0,0,114,153,0,0,0,114,
-    99,0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,
-    0,0,0,218,17,95,102,105,110,100,95,115,112,101,99,95,
-    108,101,103,97,99,121,102,3,0,0,115,8,0,0,0,0,
-    3,12,1,8,1,4,1,114,174,0,0,0,99,3,0,0,
-    0,0,0,0,0,10,0,0,0,27,0,0,0,67,0,0,
-    0,115,244,0,0,0,116,0,106,1,125,3,124,3,100,1,
-    107,8,114,22,116,2,100,2,131,1,130,1,124,3,115,38,
-    116,3,106,4,100,3,116,5,131,2,1,0,124,0,116,0,
-    106,6,107,6,125,4,120,190,124,3,68,0,93,178,125,5,
-    116,7,131,0,143,72,1,0,121,10,124,5,106,8,125,6,
-    87,0,110,42,4,0,116,9,107,10,114,118,1,0,1,0,
-    1,0,116,10,124,5,124,0,124,1,131,3,125,7,124,7,
-    100,1,107,8,114,114,119,54,89,0,110,14,88,0,124,6,
-    124,0,124,1,124,2,131,3,125,7,87,0,100,1,81,0,
-    82,0,88,0,124,7,100,1,107,9,114,54,124,4,12,0,
-    114,228,124,0,116,0,106,6,107,6,114,228,116,0,106,6,
-    124,0,25,0,125,8,121,10,124,8,106,11,125,9,87,0,
-    110,20,4,0,116,9,107,10,114,206,1,0,1,0,1,0,
-    124,7,83,0,88,0,124,9,100,1,107,8,114,222,124,7,
-    83,0,113,232,124,9,83,0,113,54,124,7,83,0,113,54,
-    87,0,100,1,83,0,100,1,83,0,41,4,122,21,70,105,
-    110,100,32,97,32,109,111,100,117,108,101,39,115,32,115,112,
-    101,99,46,78,122,53,115,121,115,46,109,101,116,97,95,112,
-    97,116,104,32,105,115,32,78,111,110,101,44,32,80,121,116,
-    104,111,110,32,105,115,32,108,105,107,101,108,121,32,115,104,
-    117,116,116,105,110,103,32,100,111,119,110,122,22,115,121,115,
-    46,109,101,116,97,95,112,97,116,104,32,105,115,32,101,109,
-    112,116,121,41,12,114,14,0,0,0,218,9,109,101,116,97,
-    95,112,97,116,104,114,77,0,0,0,114,142,0,0,0,114,
-    143,0,0,0,218,13,73,109,112,111,114,116,87,97,114,110,
-    105,110,103,114,21,0,0,0,114,166,0,0,0,114,155,0,
-    0,0,114,96,0,0,0,114,174,0,0,0,114,95,0,0,
-    0,41,10,114,15,0,0,0,114,153,0,0,0,114,154,0,
-    0,0,114,175,0,0,0,90,9,105,115,95,114,101,108,111,
-    97,100,114,173,0,0,0,114,155,0,0,0,114,88,0,0,
-    0,114,89,0,0,0,114,95,0,0,0,114,10,0,0,0,
-    114,10,0,0,0,114,11,0,0,0,218,10,95,102,105,110,
-    100,95,115,112,101,99,111,3,0,0,115,54,0,0,0,0,
-    2,6,1,8,2,8,3,4,1,12,5,10,1,10,1,8,
-    1,2,1,10,1,14,1,12,1,8,1,8,2,22,1,8,
-    2,16,1,10,1,2,1,10,1,14,4,6,2,8,1,6,
-    2,6,2,8,2,114,177,0,0,0,99,3,0,0,0,0,
-    0,0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,
-    140,0,0,0,116,0,124,0,116,1,131,2,115,28,116,2,
-    100,1,106,3,116,4,124,0,131,1,131,1,131,1,130,1,
-    124,2,100,2,107,0,114,44,116,5,100,3,131,1,130,1,
-    124,2,100,2,107,4,114,114,116,0,124,1,116,1,131,2,
-    115,72,116,2,100,4,131,1,130,1,110,42,124,1,115,86,
-    116,6,100,5,131,1,130,1,110,28,124,1,116,7,106,8,
-    107,7,114,114,100,6,125,3,116,9,124,3,106,3,124,1,
-    131,1,131,1,130,1,124,0,12,0,114,136,124,2,100,2,
-    107,2,114,136,116,5,100,7,131,1,130,1,100,8,83,0,
-    41,9,122,28,86,101,114,105,102,121,32,97,114,103,117,109,
-    101,110,116,115,32,97,114,101,32,34,115,97,110,101,34,46,
-    122,31,109,111,100,117,108,101,32,110,97,109,101,32,109,117,
-    115,116,32,98,101,32,115,116,114,44,32,110,111,116,32,123,
-    125,114,33,0,0,0,122,18,108,101,118,101,108,32,109,117,
-    115,116,32,98,101,32,62,61,32,48,122,31,95,95,112,97,
-    99,107,97,103,101,95,95,32,110,111,116,32,115,101,116,32,
-    116,111,32,97,32,115,116,114,105,110,103,122,54,97,116,116,
-    101,109,112,116,101,100,32,114,101,108,97,116,105,118,101,32,
-    105,109,112,111,114,116,32,119,105,116,104,32,110,111,32,107,
-    110,111,119,110,32,112,97,114,101,110,116,32,112,97,99,107,
-    97,103,101,122,61,80,97,114,101,110,116,32,109,111,100,117,
-    108,101,32,123,33,114,125,32,110,111,116,32,108,111,97,100,
-    101,100,44,32,99,97,110,110,111,116,32,112,101,114,102,111,
-    114,109,32,114,101,108,97,116,105,118,101,32,105,109,112,111,
-    114,116,122,17,69,109,112,116,121,32,109,111,100,117,108,101,
-    32,110,97,109,101,78,41,10,218,10,105,115,105,110,115,116,
-    97,110,99,101,218,3,115,116,114,218,9,84,121,112,101,69,
-    114,114,111,114,114,50,0,0,0,114,13,0,0,0,114,169,
-    0,0,0,114,77,0,0,0,114,14,0,0,0,114,21,0,
-    0,0,218,11,83,121,115,116,101,109,69,114,114,111,114,41,
-    4,114,15,0,0,0,114,170,0,0,0,114,171,0,0,0,
-    114,148,0,0,0,114,10,0,0,0,114,10,0,0,0,114,
-    11,0,0,0,218,13,95,115,97,110,105,116,121,95,99,104,
-    101,99,107,158,3,0,0,115,28,0,0,0,0,2,10,1,
-    18,1,8,1,8,1,8,1,10,1,10,1,4,1,10,2,
-    10,1,4,2,14,1,14,1,114,182,0,0,0,122,16,78,
-    111,32,109,111,100,117,108,101,32,110,97,109,101,100,32,122,
-    4,123,33,114,125,99,2,0,0,0,0,0,0,0,8,0,
-    0,0,12,0,0,0,67,0,0,0,115,224,0,0,0,100,
-    0,125,2,124,0,106,0,100,1,131,1,100,2,25,0,125,
-    3,124,3,114,136,124,3,116,1,106,2,107,7,114,42,116,
-    3,124,1,124,3,131,2,1,0,124,0,116,1,106,2,107,
-    6,114,62,116,1,106,2,124,0,25,0,83,0,116,1,106,
-    2,124,3,25,0,125,4,121,10,124,4,106,4,125,2,87,
-    0,110,52,4,0,116,5,107,10,114,134,1,0,1,0,1,
-    0,116,6,100,3,23,0,106,7,124,0,124,3,131,2,125,
-    5,116,8,124,5,100,4,124,0,144,1,131,1,100,0,130,
-    2,89,0,110,2,88,0,116,9,124,0,124,2,131,2,125,
-    6,124,6,100,0,107,8,114,176,116,8,116,6,106,7,124,
-    0,131,1,100,4,124,0,144,1,131,1,130,1,110,8,116,
-    10,124,6,131,1,125,7,124,3,114,220,116,1,106,2,124,
-    3,25,0,125,4,116,11,124,4,124,0,106,0,100,1,131,
-    1,100,5,25,0,124,7,131,3,1,0,124,7,83,0,41,
-    6,78,114,121,0,0,0,114,33,0,0,0,122,23,59,32,
-    123,33,114,125,32,105,115,32,110,111,116,32,97,32,112,97,
-    99,107,97,103,101,114,15,0,0,0,114,141,0,0,0,41,
-    12,114,122,0,0,0,114,14,0,0,0,114,21,0,0,0,
-    114,65,0,0,0,114,131,0,0,0,114,96,0,0,0,218,
-    8,95,69,82,82,95,77,83,71,114,50,0,0,0,114,77,
-    0,0,0,114,177,0,0,0,114,150,0,0,0,114,5,0,
-    0,0,41,8,114,15,0,0,0,218,7,105,109,112,111,114,
-    116,95,114,153,0,0,0,114,123,0,0,0,90,13,112,97,
-    114,101,110,116,95,109,111,100,117,108,101,114,148,0,0,0,
-    114,88,0,0,0,114,89,0,0,0,114,10,0,0,0,114,
-    10,0,0,0,114,11,0,0,0,218,23,95,102,105,110,100,
-    95,97,110,100,95,108,111,97,100,95,117,110,108,111,99,107,
-    101,100,181,3,0,0,115,42,0,0,0,0,1,4,1,14,
-    1,4,1,10,1,10,2,10,1,10,1,10,1,2,1,10,
-    1,14,1,16,1,22,1,10,1,8,1,22,2,8,1,4,
-    2,10,1,22,1,114,185,0,0,0,99,2,0,0,0,0,
-    0,0,0,2,0,0,0,10,0,0,0,67,0,0,0,115,
-    30,0,0,0,116,0,124,0,131,1,143,12,1,0,116,1,
-    124,0,124,1,131,2,83,0,81,0,82,0,88,0,100,1,
-    83,0,41,2,122,54,70,105,110,100,32,97,110,100,32,108,
-    111,97,100,32,116,104,101,32,109,111,100,117,108,101,44,32,
-    97,110,100,32,114,101,108,101,97,115,101,32,116,104,101,32,
-    105,109,112,111,114,116,32,108,111,99,107,46,78,41,2,114,
-    54,0,0,0,114,185,0,0,0,41,2,114,15,0,0,0,
-    114,184,0,0,0,114,10,0,0,0,114,10,0,0,0,114,
-    11,0,0,0,218,14,95,102,105,110,100,95,97,110,100,95,
-    108,111,97,100,208,3,0,0,115,4,0,0,0,0,2,10,
-    1,114,186,0,0,0,114,33,0,0,0,99,3,0,0,0,
-    0,0,0,0,5,0,0,0,4,0,0,0,67,0,0,0,
-    115,122,0,0,0,116,0,124,0,124,1,124,2,131,3,1,
-    0,124,2,100,1,107,4,114,32,116,1,124,0,124,1,124,
-    2,131,3,125,0,116,2,106,3,131,0,1,0,124,0,116,
-    4,106,5,107,7,114,60,116,6,124,0,116,7,131,2,83,
-    0,116,4,106,5,124,0,25,0,125,3,124,3,100,2,107,
-    8,114,110,116,2,106,8,131,0,1,0,100,3,106,9,124,
-    0,131,1,125,4,116,10,124,4,100,4,124,0,144,1,131,
-    1,130,1,116,11,124,0,131,1,1,0,124,3,83,0,41,
-    5,97,50,1,0,0,73,109,112,111,114,116,32,97,110,100,
-    32,114,101,116,117,114,110,32,116,104,101,32,109,111,100,117,
-    108,101,32,98,97,115,101,100,32,111,110,32,105,116,115,32,
-    110,97,109,101,44,32,116,104,101,32,112,97,99,107,97,103,
-    101,32,116,104,101,32,99,97,108,108,32,105,115,10,32,32,
-    32,32,98,101,105,110,103,32,109,97,100,101,32,102,114,111,
-    109,44,32,97,110,100,32,116,104,101,32,108,101,118,101,108,
-    32,97,100,106,117,115,116,109,101,110,116,46,10,10,32,32,
-    32,32,84,104,105,115,32,102,117,110,99,116,105,111,110,32,
-    114,101,112,114,101,115,101,110,116,115,32,116,104,101,32,103,
-    114,101,97,116,101,115,116,32,99,111,109,109,111,110,32,100,
-    101,110,111,109,105,110,97,116,111,114,32,111,102,32,102,117,
-    110,99,116,105,111,110,97,108,105,116,121,10,32,32,32,32,
-    98,101,116,119,101,101,110,32,105,109,112,111,114,116,95,109,
-    111,100,117,108,101,32,97,110,100,32,95,95,105,109,112,111,
-    114,116,95,95,46,32,84,104,105,115,32,105,110,99,108,117,
-    100,101,115,32,115,101,116,116,105,110,103,32,95,95,112,97,
-    99,107,97,103,101,95,95,32,105,102,10,32,32,32,32,116,
-    104,101,32,108,111,97,100,101,114,32,100,105,100,32,110,111,
-    116,46,10,10,32,32,32,32,114,33,0,0,0,78,122,40,
-    105,109,112,111,114,116,32,111,102,32,123,125,32,104,97,108,
-    116,101,100,59,32,78,111,110,101,32,105,110,32,115,121,115,
-    46,109,111,100,117,108,101,115,114,15,0,0,0,41,12,114,
-    182,0,0,0,114,172,0,0,0,114,57,0,0,0,114,146,
-    0,0,0,114,14,0,0,0,114,21,0,0,0,114,186,0,
-    0,0,218,11,95,103,99,100,95,105,109,112,111,114,116,114,
-    58,0,0,0,114,50,0,0,0,114,77,0,0,0,114,63,
-    0,0,0,41,5,114,15,0,0,0,114,170,0,0,0,114,
-    171,0,0,0,114,89,0,0,0,114,74,0,0,0,114,10,
-    0,0,0,114,10,0,0,0,114,11,0,0,0,114,187,0,
-    0,0,214,3,0,0,115,28,0,0,0,0,9,12,1,8,
-    1,12,1,8,1,10,1,10,1,10,1,8,1,8,1,4,
-    1,6,1,14,1,8,1,114,187,0,0,0,99,3,0,0,
-    0,0,0,0,0,6,0,0,0,17,0,0,0,67,0,0,
-    0,115,178,0,0,0,116,0,124,0,100,1,131,2,114,174,
-    100,2,124,1,107,6,114,58,116,1,124,1,131,1,125,1,
-    124,1,106,2,100,2,131,1,1,0,116,0,124,0,100,3,
-    131,2,114,58,124,1,106,3,124,0,106,4,131,1,1,0,
-    120,114,124,1,68,0,93,106,125,3,116,0,124,0,124,3,
-    131,2,115,64,100,4,106,5,124,0,106,6,124,3,131,2,
-    125,4,121,14,116,7,124,2,124,4,131,2,1,0,87,0,
-    113,64,4,0,116,8,107,10,114,168,1,0,125,5,1,0,
-    122,34,116,9,124,5,131,1,106,10,116,11,131,1,114,150,
-    124,5,106,12,124,4,107,2,114,150,119,64,130,0,87,0,
-    89,0,100,5,100,5,125,5,126,5,88,0,113,64,88,0,
-    113,64,87,0,124,0,83,0,41,6,122,238,70,105,103,117,
-    114,101,32,111,117,116,32,119,104,97,116,32,95,95,105,109,
-    112,111,114,116,95,95,32,115,104,111,117,108,100,32,114,101,
-    116,117,114,110,46,10,10,32,32,32,32,84,104,101,32,105,
-    109,112,111,114,116,95,32,112,97,114,97,109,101,116,101,114,
-    32,105,115,32,97,32,99,97,108,108,97,98,108,101,32,119,
-    104,105,99,104,32,116,97,107,101,115,32,116,104,101,32,110,
-    97,109,101,32,111,102,32,109,111,100,117,108,101,32,116,111,
-    10,32,32,32,32,105,109,112,111,114,116,46,32,73,116,32,
-    105,115,32,114,101,113,117,105,114,101,100,32,116,111,32,100,
-    101,99,111,117,112,108,101,32,116,104,101,32,102,117,110,99,
-    116,105,111,110,32,102,114,111,109,32,97,115,115,117,109,105,
-    110,103,32,105,109,112,111,114,116,108,105,98,39,115,10,32,
-    32,32,32,105,109,112,111,114,116,32,105,109,112,108,101,109,
-    101,110,116,97,116,105,111,110,32,105,115,32,100,101,115,105,
-    114,101,100,46,10,10,32,32,32,32,114,131,0,0,0,250,
-    1,42,218,7,95,95,97,108,108,95,95,122,5,123,125,46,
-    123,125,78,41,13,114,4,0,0,0,114,130,0,0,0,218,
-    6,114,101,109,111,118,101,218,6,101,120,116,101,110,100,114,
-    189,0,0,0,114,50,0,0,0,114,1,0,0,0,114,65,
-    0,0,0,114,77,0,0,0,114,179,0,0,0,114,71,0,
-    0,0,218,15,95,69,82,82,95,77,83,71,95,80,82,69,
-    70,73,88,114,15,0,0,0,41,6,114,89,0,0,0,218,
-    8,102,114,111,109,108,105,115,116,114,184,0,0,0,218,1,
-    120,90,9,102,114,111,109,95,110,97,109,101,90,3,101,120,
-    99,114,10,0,0,0,114,10,0,0,0,114,11,0,0,0,
-    218,16,95,104,97,110,100,108,101,95,102,114,111,109,108,105,
-    115,116,238,3,0,0,115,34,0,0,0,0,10,10,1,8,
-    1,8,1,10,1,10,1,12,1,10,1,10,1,14,1,2,
-    1,14,1,16,4,14,1,10,1,2,1,24,1,114,195,0,
-    0,0,99,1,0,0,0,0,0,0,0,3,0,0,0,7,
-    0,0,0,67,0,0,0,115,160,0,0,0,124,0,106,0,
-    100,1,131,1,125,1,124,0,106,0,100,2,131,1,125,2,
-    124,1,100,3,107,9,114,92,124,2,100,3,107,9,114,86,
-    124,1,124,2,106,1,107,3,114,86,116,2,106,3,100,4,
-    106,4,100,5,124,1,155,2,100,6,124,2,106,1,155,2,
-    100,7,103,5,131,1,116,5,100,8,100,9,144,1,131,2,
-    1,0,124,1,83,0,110,64,124,2,100,3,107,9,114,108,
-    124,2,106,1,83,0,110,48,116,2,106,3,100,10,116,5,
-    100,8,100,9,144,1,131,2,1,0,124,0,100,11,25,0,
-    125,1,100,12,124,0,107,7,114,156,124,1,106,6,100,13,
-    131,1,100,14,25,0,125,1,124,1,83,0,41,15,122,167,
-    67,97,108,99,117,108,97,116,101,32,119,104,97,116,32,95,
-    95,112,97,99,107,97,103,101,95,95,32,115,104,111,117,108,
-    100,32,98,101,46,10,10,32,32,32,32,95,95,112,97,99,
-    107,97,103,101,95,95,32,105,115,32,110,111,116,32,103,117,
-    97,114,97,110,116,101,101,100,32,116,111,32,98,101,32,100,
-    101,102,105,110,101,100,32,111,114,32,99,111,117,108,100,32,
-    98,101,32,115,101,116,32,116,111,32,78,111,110,101,10,32,
-    32,32,32,116,111,32,114,101,112,114,101,115,101,110,116,32,
-    116,104,97,116,32,105,116,115,32,112,114,111,112,101,114,32,
-    118,97,108,117,101,32,105,115,32,117,110,107,110,111,119,110,
-    46,10,10,32,32,32,32,114,134,0,0,0,114,95,0,0,
-    0,78,218,0,122,32,95,95,112,97,99,107,97,103,101,95,
-    95,32,33,61,32,95,95,115,112,101,99,95,95,46,112,97,
-    114,101,110,116,32,40,122,4,32,33,61,32,250,1,41,114,
-    140,0,0,0,233,3,0,0,0,122,89,99,97,110,39,116,
-    32,114,101,115,111,108,118,101,32,112,97,99,107,97,103,101,
-    32,102,114,111,109,32,95,95,115,112,101,99,95,95,32,111,
-    114,32,95,95,112,97,99,107,97,103,101,95,95,44,32,102,
-    97,108,108,105,110,103,32,98,97,99,107,32,111,110,32,95,
-    95,110,97,109,101,95,95,32,97,110,100,32,95,95,112,97,
-    116,104,95,95,114,1,0,0,0,114,131,0,0,0,114,121,
-    0,0,0,114,33,0,0,0,41,7,114,42,0,0,0,114,
-    123,0,0,0,114,142,0,0,0,114,143,0,0,0,114,115,
-    0,0,0,114,176,0,0,0,114,122,0,0,0,41,3,218,
-    7,103,108,111,98,97,108,115,114,170,0,0,0,114,88,0,
-    0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,0,
-    0,218,17,95,99,97,108,99,95,95,95,112,97,99,107,97,
-    103,101,95,95,14,4,0,0,115,30,0,0,0,0,7,10,
-    1,10,1,8,1,18,1,28,2,12,1,6,1,8,1,8,
-    2,6,2,12,1,8,1,8,1,14,1,114,200,0,0,0,
-    99,5,0,0,0,0,0,0,0,9,0,0,0,5,0,0,
-    0,67,0,0,0,115,170,0,0,0,124,4,100,1,107,2,
-    114,18,116,0,124,0,131,1,125,5,110,36,124,1,100,2,
-    107,9,114,30,124,1,110,2,105,0,125,6,116,1,124,6,
-    131,1,125,7,116,0,124,0,124,7,124,4,131,3,125,5,
-    124,3,115,154,124,4,100,1,107,2,114,86,116,0,124,0,
-    106,2,100,3,131,1,100,1,25,0,131,1,83,0,113,166,
-    124,0,115,96,124,5,83,0,113,166,116,3,124,0,131,1,
-    116,3,124,0,106,2,100,3,131,1,100,1,25,0,131,1,
-    24,0,125,8,116,4,106,5,124,5,106,6,100,2,116,3,
-    124,5,106,6,131,1,124,8,24,0,133,2,25,0,25,0,
-    83,0,110,12,116,7,124,5,124,3,116,0,131,3,83,0,
-    100,2,83,0,41,4,97,215,1,0,0,73,109,112,111,114,
-    116,32,97,32,109,111,100,117,108,101,46,10,10,32,32,32,
-    32,84,104,101,32,39,103,108,111,98,97,108,115,39,32,97,
-    114,103,117,109,101,110,116,32,105,115,32,117,115,101,100,32,
-    116,111,32,105,110,102,101,114,32,119,104,101,114,101,32,116,
-    104,101,32,105,109,112,111,114,116,32,105,115,32,111,99,99,
-    117,114,114,105,110,103,32,102,114,111,109,10,32,32,32,32,
-    116,111,32,104,97,110,100,108,101,32,114,101,108,97,116,105,
-    118,101,32,105,109,112,111,114,116,115,46,32,84,104,101,32,
-    39,108,111,99,97,108,115,39,32,97,114,103,117,109,101,110,
-    116,32,105,115,32,105,103,110,111,114,101,100,46,32,84,104,
-    101,10,32,32,32,32,39,102,114,111,109,108,105,115,116,39,
-    32,97,114,103,117,109,101,110,116,32,115,112,101,99,105,102,
-    105,101,115,32,119,104,97,116,32,115,104,111,117,108,100,32,
-    101,120,105,115,116,32,97,115,32,97,116,116,114,105,98,117,
-    116,101,115,32,111,110,32,116,104,101,32,109,111,100,117,108,
-    101,10,32,32,32,32,98,101,105,110,103,32,105,109,112,111,
-    114,116,101,100,32,40,101,46,103,46,32,96,96,102,114,111,
-    109,32,109,111,100,117,108,101,32,105,109,112,111,114,116,32,
-    60,102,114,111,109,108,105,115,116,62,96,96,41,46,32,32,
-    84,104,101,32,39,108,101,118,101,108,39,10,32,32,32,32,
-    97,114,103,117,109,101,110,116,32,114,101,112,114,101,115,101,
-    110,116,115,32,116,104,101,32,112,97,99,107,97,103,101,32,
-    108,111,99,97,116,105,111,110,32,116,111,32,105,109,112,111,
-    114,116,32,102,114,111,109,32,105,110,32,97,32,114,101,108,
-    97,116,105,118,101,10,32,32,32,32,105,109,112,111,114,116,
-    32,40,101,46,103,46,32,96,96,102,114,111,109,32,46,46,
-    112,107,103,32,105,109,112,111,114,116,32,109,111,100,96,96,
-    32,119,111,117,108,100,32,104,97,118,101,32,97,32,39,108,
-    101,118,101,108,39,32,111,102,32,50,41,46,10,10,32,32,
-    32,32,114,33,0,0,0,78,114,121,0,0,0,41,8,114,
-    187,0,0,0,114,200,0,0,0,218,9,112,97,114,116,105,
-    116,105,111,110,114,168,0,0,0,114,14,0,0,0,114,21,
-    0,0,0,114,1,0,0,0,114,195,0,0,0,41,9,114,
-    15,0,0,0,114,199,0,0,0,218,6,108,111,99,97,108,
-    115,114,193,0,0,0,114,171,0,0,0,114,89,0,0,0,
-    90,8,103,108,111,98,97,108,115,95,114,170,0,0,0,90,
-    7,99,117,116,95,111,102,102,114,10,0,0,0,114,10,0,
-    0,0,114,11,0,0,0,218,10,95,95,105,109,112,111,114,
-    116,95,95,41,4,0,0,115,26,0,0,0,0,11,8,1,
-    10,2,16,1,8,1,12,1,4,3,8,1,20,1,4,1,
-    6,4,26,3,32,2,114,203,0,0,0,99,1,0,0,0,
-    0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,0,
-    115,38,0,0,0,116,0,106,1,124,0,131,1,125,1,124,
-    1,100,0,107,8,114,30,116,2,100,1,124,0,23,0,131,
-    1,130,1,116,3,124,1,131,1,83,0,41,2,78,122,25,
-    110,111,32,98,117,105,108,116,45,105,110,32,109,111,100,117,
-    108,101,32,110,97,109,101,100,32,41,4,114,151,0,0,0,
-    114,155,0,0,0,114,77,0,0,0,114,150,0,0,0,41,
-    2,114,15,0,0,0,114,88,0,0,0,114,10,0,0,0,
-    114,10,0,0,0,114,11,0,0,0,218,18,95,98,117,105,
-    108,116,105,110,95,102,114,111,109,95,110,97,109,101,76,4,
-    0,0,115,8,0,0,0,0,1,10,1,8,1,12,1,114,
-    204,0,0,0,99,2,0,0,0,0,0,0,0,12,0,0,
-    0,12,0,0,0,67,0,0,0,115,244,0,0,0,124,1,
-    97,0,124,0,97,1,116,2,116,1,131,1,125,2,120,86,
-    116,1,106,3,106,4,131,0,68,0,93,72,92,2,125,3,
-    125,4,116,5,124,4,124,2,131,2,114,28,124,3,116,1,
-    106,6,107,6,114,62,116,7,125,5,110,18,116,0,106,8,
-    124,3,131,1,114,28,116,9,125,5,110,2,113,28,116,10,
-    124,4,124,5,131,2,125,6,116,11,124,6,124,4,131,2,
-    1,0,113,28,87,0,116,1,106,3,116,12,25,0,125,7,
-    120,54,100,5,68,0,93,46,125,8,124,8,116,1,106,3,
-    107,7,114,144,116,13,124,8,131,1,125,9,110,10,116,1,
-    106,3,124,8,25,0,125,9,116,14,124,7,124,8,124,9,
-    131,3,1,0,113,120,87,0,121,12,116,13,100,2,131,1,
-    125,10,87,0,110,24,4,0,116,15,107,10,114,206,1,0,
-    1,0,1,0,100,3,125,10,89,0,110,2,88,0,116,14,
-    124,7,100,2,124,10,131,3,1,0,116,13,100,4,131,1,
-    125,11,116,14,124,7,100,4,124,11,131,3,1,0,100,3,
-    83,0,41,6,122,250,83,101,116,117,112,32,105,109,112,111,
-    114,116,108,105,98,32,98,121,32,105,109,112,111,114,116,105,
-    110,103,32,110,101,101,100,101,100,32,98,117,105,108,116,45,
-    105,110,32,109,111,100,117,108,101,115,32,97,110,100,32,105,
-    110,106,101,99,116,105,110,103,32,116,104,101,109,10,32,32,
-    32,32,105,110,116,111,32,116,104,101,32,103,108,111,98,97,
-    108,32,110,97,109,101,115,112,97,99,101,46,10,10,32,32,
-    32,32,65,115,32,115,121,115,32,105,115,32,110,101,101,100,
-    101,100,32,102,111,114,32,115,121,115,46,109,111,100,117,108,
-    101,115,32,97,99,99,101,115,115,32,97,110,100,32,95,105,
-    109,112,32,105,115,32,110,101,101,100,101,100,32,116,111,32,
-    108,111,97,100,32,98,117,105,108,116,45,105,110,10,32,32,
-    32,32,109,111,100,117,108,101,115,44,32,116,104,111,115,101,
-    32,116,119,111,32,109,111,100,117,108,101,115,32,109,117,115,
-    116,32,98,101,32,101,120,112,108,105,99,105,116,108,121,32,
-    112,97,115,115,101,100,32,105,110,46,10,10,32,32,32,32,
-    114,142,0,0,0,114,34,0,0,0,78,114,62,0,0,0,
-    41,1,122,9,95,119,97,114,110,105,110,103,115,41,16,114,
-    57,0,0,0,114,14,0,0,0,114,13,0,0,0,114,21,
-    0,0,0,218,5,105,116,101,109,115,114,178,0,0,0,114,
-    76,0,0,0,114,151,0,0,0,114,82,0,0,0,114,161,
-    0,0,0,114,132,0,0,0,114,137,0,0,0,114,1,0,
-    0,0,114,204,0,0,0,114,5,0,0,0,114,77,0,0,
-    0,41,12,218,10,115,121,115,95,109,111,100,117,108,101,218,
-    11,95,105,109,112,95,109,111,100,117,108,101,90,11,109,111,
-    100,117,108,101,95,116,121,112,101,114,15,0,0,0,114,89,
-    0,0,0,114,99,0,0,0,114,88,0,0,0,90,11,115,
-    101,108,102,95,109,111,100,117,108,101,90,12,98,117,105,108,
-    116,105,110,95,110,97,109,101,90,14,98,117,105,108,116,105,
-    110,95,109,111,100,117,108,101,90,13,116,104,114,101,97,100,
-    95,109,111,100,117,108,101,90,14,119,101,97,107,114,101,102,
-    95,109,111,100,117,108,101,114,10,0,0,0,114,10,0,0,
-    0,114,11,0,0,0,218,6,95,115,101,116,117,112,83,4,
-    0,0,115,50,0,0,0,0,9,4,1,4,3,8,1,20,
-    1,10,1,10,1,6,1,10,1,6,2,2,1,10,1,14,
-    3,10,1,10,1,10,1,10,2,10,1,16,3,2,1,12,
-    1,14,2,10,1,12,3,8,1,114,208,0,0,0,99,2,
-    0,0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,
-    0,0,0,115,66,0,0,0,116,0,124,0,124,1,131,2,
-    1,0,116,1,106,2,106,3,116,4,131,1,1,0,116,1,
-    106,2,106,3,116,5,131,1,1,0,100,1,100,2,108,6,
-    125,2,124,2,97,7,124,2,106,8,116,1,106,9,116,10,
-    25,0,131,1,1,0,100,2,83,0,41,3,122,50,73,110,
-    115,116,97,108,108,32,105,109,112,111,114,116,108,105,98,32,
-    97,115,32,116,104,101,32,105,109,112,108,101,109,101,110,116,
-    97,116,105,111,110,32,111,102,32,105,109,112,111,114,116,46,
-    114,33,0,0,0,78,41,11,114,208,0,0,0,114,14,0,
-    0,0,114,175,0,0,0,114,113,0,0,0,114,151,0,0,
-    0,114,161,0,0,0,218,26,95,102,114,111,122,101,110,95,
-    105,109,112,111,114,116,108,105,98,95,101,120,116,101,114,110,
-    97,108,114,119,0,0,0,218,8,95,105,110,115,116,97,108,
-    108,114,21,0,0,0,114,1,0,0,0,41,3,114,206,0,
-    0,0,114,207,0,0,0,114,209,0,0,0,114,10,0,0,
-    0,114,10,0,0,0,114,11,0,0,0,114,210,0,0,0,
-    130,4,0,0,115,12,0,0,0,0,2,10,2,12,1,12,
-    3,8,1,4,1,114,210,0,0,0,41,2,78,78,41,1,
-    78,41,2,78,114,33,0,0,0,41,51,114,3,0,0,0,
-    114,119,0,0,0,114,12,0,0,0,114,16,0,0,0,114,
-    17,0,0,0,114,59,0,0,0,114,41,0,0,0,114,48,
-    0,0,0,114,31,0,0,0,114,32,0,0,0,114,53,0,
-    0,0,114,54,0,0,0,114,56,0,0,0,114,63,0,0,
-    0,114,65,0,0,0,114,75,0,0,0,114,81,0,0,0,
-    114,84,0,0,0,114,90,0,0,0,114,101,0,0,0,114,
-    102,0,0,0,114,106,0,0,0,114,85,0,0,0,218,6,
-    111,98,106,101,99,116,90,9,95,80,79,80,85,76,65,84,
-    69,114,132,0,0,0,114,137,0,0,0,114,145,0,0,0,
-    114,97,0,0,0,114,86,0,0,0,114,149,0,0,0,114,
-    150,0,0,0,114,87,0,0,0,114,151,0,0,0,114,161,
-    0,0,0,114,166,0,0,0,114,172,0,0,0,114,174,0,
-    0,0,114,177,0,0,0,114,182,0,0,0,114,192,0,0,
-    0,114,183,0,0,0,114,185,0,0,0,114,186,0,0,0,
-    114,187,0,0,0,114,195,0,0,0,114,200,0,0,0,114,
-    203,0,0,0,114,204,0,0,0,114,208,0,0,0,114,210,
-    0,0,0,114,10,0,0,0,114,10,0,0,0,114,10,0,
-    0,0,114,11,0,0,0,218,8,60,109,111,100,117,108,101,
-    62,8,0,0,0,115,96,0,0,0,4,17,4,2,8,8,
-    8,4,14,20,4,2,4,3,16,4,14,68,14,21,14,19,
-    8,19,8,19,8,11,14,8,8,11,8,12,8,16,8,36,
-    14,27,14,101,16,26,6,3,10,45,14,60,8,18,8,17,
-    8,25,8,29,8,23,8,16,14,73,14,77,14,13,8,9,
-    8,9,10,47,8,20,4,1,8,2,8,27,8,6,10,24,
-    8,32,8,27,18,35,8,7,8,47,
+    0,0,114,158,0,0,0,103,3,0,0,115,2,0,0,0,
+    0,4,122,25,70,114,111,122,101,110,73,109,112,111,114,116,
+    101,114,46,103,101,116,95,115,111,117,114,99,101,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,
+    0,0,115,10,0,0,0,116,0,160,1,124,1,161,1,83,
+    0,41,1,122,46,82,101,116,117,114,110,32,84,114,117,101,
+    32,105,102,32,116,104,101,32,102,114,111,122,101,110,32,109,
+    111,100,117,108,101,32,105,115,32,97,32,112,97,99,107,97,
+    103,101,46,41,2,114,57,0,0,0,114,168,0,0,0,41,
+    2,114,152,0,0,0,114,78,0,0,0,114,10,0,0,0,
+    114,10,0,0,0,114,11,0,0,0,114,109,0,0,0,109,
+    3,0,0,115,2,0,0,0,0,4,122,25,70,114,111,122,
+    101,110,73,109,112,111,114,116,101,114,46,105,115,95,112,97,
+    99,107,97,103,101,41,2,78,78,41,1,78,41,18,114,1,
+    0,0,0,114,0,0,0,0,114,2,0,0,0,114,3,0,
+    0,0,114,159,0,0,0,114,92,0,0,0,114,165,0,0,
+    0,114,160,0,0,0,114,170,0,0,0,114,155,0,0,0,
+    114,156,0,0,0,114,138,0,0,0,114,139,0,0,0,114,
+    147,0,0,0,114,84,0,0,0,114,157,0,0,0,114,158,
+    0,0,0,114,109,0,0,0,114,10,0,0,0,114,10,0,
+    0,0,114,10,0,0,0,114,11,0,0,0,114,161,0,0,
+    0,3,3,0,0,115,34,0,0,0,8,7,4,2,12,10,
+    4,2,12,26,2,1,12,13,2,1,12,8,12,4,12,11,
+    12,9,2,1,14,5,2,1,14,5,2,1,114,161,0,0,
+    0,99,0,0,0,0,0,0,0,0,0,0,0,0,2,0,
+    0,0,64,0,0,0,115,32,0,0,0,101,0,90,1,100,
+    0,90,2,100,1,90,3,100,2,100,3,132,0,90,4,100,
+    4,100,5,132,0,90,5,100,6,83,0,41,7,218,18,95,
+    73,109,112,111,114,116,76,111,99,107,67,111,110,116,101,120,
+    116,122,36,67,111,110,116,101,120,116,32,109,97,110,97,103,
+    101,114,32,102,111,114,32,116,104,101,32,105,109,112,111,114,
+    116,32,108,111,99,107,46,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,2,0,0,0,67,0,0,0,115,12,0,0,
+    0,116,0,160,1,161,0,1,0,100,1,83,0,41,2,122,
+    24,65,99,113,117,105,114,101,32,116,104,101,32,105,109,112,
+    111,114,116,32,108,111,99,107,46,78,41,2,114,57,0,0,
+    0,114,146,0,0,0,41,1,114,19,0,0,0,114,10,0,
+    0,0,114,10,0,0,0,114,11,0,0,0,114,23,0,0,
+    0,122,3,0,0,115,2,0,0,0,0,2,122,28,95,73,
+    109,112,111,114,116,76,111,99,107,67,111,110,116,101,120,116,
+    46,95,95,101,110,116,101,114,95,95,99,4,0,0,0,0,
+    0,0,0,4,0,0,0,2,0,0,0,67,0,0,0,115,
+    12,0,0,0,116,0,160,1,161,0,1,0,100,1,83,0,
+    41,2,122,60,82,101,108,101,97,115,101,32,116,104,101,32,
+    105,109,112,111,114,116,32,108,111,99,107,32,114,101,103,97,
+    114,100,108,101,115,115,32,111,102,32,97,110,121,32,114,97,
+    105,115,101,100,32,101,120,99,101,112,116,105,111,110,115,46,
+    78,41,2,114,57,0,0,0,114,58,0,0,0,41,4,114,
+    19,0,0,0,90,8,101,120,99,95,116,121,112,101,90,9,
+    101,120,99,95,118,97,108,117,101,90,13,101,120,99,95,116,
+    114,97,99,101,98,97,99,107,114,10,0,0,0,114,10,0,
+    0,0,114,11,0,0,0,114,30,0,0,0,126,3,0,0,
+    115,2,0,0,0,0,2,122,27,95,73,109,112,111,114,116,
+    76,111,99,107,67,111,110,116,101,120,116,46,95,95,101,120,
+    105,116,95,95,78,41,6,114,1,0,0,0,114,0,0,0,
+    0,114,2,0,0,0,114,3,0,0,0,114,23,0,0,0,
+    114,30,0,0,0,114,10,0,0,0,114,10,0,0,0,114,
+    10,0,0,0,114,11,0,0,0,114,174,0,0,0,118,3,
+    0,0,115,6,0,0,0,8,2,4,2,8,4,114,174,0,
+    0,0,99,3,0,0,0,0,0,0,0,5,0,0,0,5,
+    0,0,0,67,0,0,0,115,64,0,0,0,124,1,160,0,
+    100,1,124,2,100,2,24,0,161,2,125,3,116,1,124,3,
+    131,1,124,2,107,0,114,36,116,2,100,3,131,1,130,1,
+    124,3,100,4,25,0,125,4,124,0,114,60,100,5,160,3,
+    124,4,124,0,161,2,83,0,124,4,83,0,41,6,122,50,
+    82,101,115,111,108,118,101,32,97,32,114,101,108,97,116,105,
+    118,101,32,109,111,100,117,108,101,32,110,97,109,101,32,116,
+    111,32,97,110,32,97,98,115,111,108,117,116,101,32,111,110,
+    101,46,114,121,0,0,0,114,45,0,0,0,122,50,97,116,
+    116,101,109,112,116,101,100,32,114,101,108,97,116,105,118,101,
+    32,105,109,112,111,114,116,32,98,101,121,111,110,100,32,116,
+    111,112,45,108,101,118,101,108,32,112,97,99,107,97,103,101,
+    114,33,0,0,0,122,5,123,125,46,123,125,41,4,218,6,
+    114,115,112,108,105,116,218,3,108,101,110,218,10,86,97,108,
+    117,101,69,114,114,111,114,114,50,0,0,0,41,5,114,15,
+    0,0,0,218,7,112,97,99,107,97,103,101,218,5,108,101,
+    118,101,108,90,4,98,105,116,115,90,4,98,97,115,101,114,
+    10,0,0,0,114,10,0,0,0,114,11,0,0,0,218,13,
+    95,114,101,115,111,108,118,101,95,110,97,109,101,131,3,0,
+    0,115,10,0,0,0,0,2,16,1,12,1,8,1,8,1,
+    114,180,0,0,0,99,3,0,0,0,0,0,0,0,4,0,
+    0,0,4,0,0,0,67,0,0,0,115,34,0,0,0,124,
+    0,160,0,124,1,124,2,161,2,125,3,124,3,100,0,107,
+    8,114,24,100,0,83,0,116,1,124,1,124,3,131,2,83,
+    0,41,1,78,41,2,114,156,0,0,0,114,85,0,0,0,
+    41,4,218,6,102,105,110,100,101,114,114,15,0,0,0,114,
+    153,0,0,0,114,99,0,0,0,114,10,0,0,0,114,10,
+    0,0,0,114,11,0,0,0,218,17,95,102,105,110,100,95,
+    115,112,101,99,95,108,101,103,97,99,121,140,3,0,0,115,
+    8,0,0,0,0,3,12,1,8,1,4,1,114,182,0,0,
+    0,99,3,0,0,0,0,0,0,0,10,0,0,0,27,0,
+    0,0,67,0,0,0,115,244,0,0,0,116,0,106,1,125,
+    3,124,3,100,1,107,8,114,22,116,2,100,2,131,1,130,
+    1,124,3,115,38,116,3,160,4,100,3,116,5,161,2,1,
+    0,124,0,116,0,106,6,107,6,125,4,120,190,124,3,68,
+    0,93,178,125,5,116,7,131,0,143,72,1,0,121,10,124,
+    5,106,8,125,6,87,0,110,42,4,0,116,9,107,10,114,
+    118,1,0,1,0,1,0,116,10,124,5,124,0,124,1,131,
+    3,125,7,124,7,100,1,107,8,114,114,119,54,89,0,110,
+    14,88,0,124,6,124,0,124,1,124,2,131,3,125,7,87,
+    0,100,1,81,0,82,0,88,0,124,7,100,1,107,9,114,
+    54,124,4,12,0,114,228,124,0,116,0,106,6,107,6,114,
+    228,116,0,106,6,124,0,25,0,125,8,121,10,124,8,106,
+    11,125,9,87,0,110,20,4,0,116,9,107,10,114,206,1,
+    0,1,0,1,0,124,7,83,0,88,0,124,9,100,1,107,
+    8,114,222,124,7,83,0,113,232,124,9,83,0,113,54,124,
+    7,83,0,113,54,87,0,100,1,83,0,100,1,83,0,41,
+    4,122,21,70,105,110,100,32,97,32,109,111,100,117,108,101,
+    39,115,32,115,112,101,99,46,78,122,53,115,121,115,46,109,
+    101,116,97,95,112,97,116,104,32,105,115,32,78,111,110,101,
+    44,32,80,121,116,104,111,110,32,105,115,32,108,105,107,101,
+    108,121,32,115,104,117,116,116,105,110,103,32,100,111,119,110,
+    122,22,115,121,115,46,109,101,116,97,95,112,97,116,104,32,
+    105,115,32,101,109,112,116,121,41,12,114,14,0,0,0,218,
+    9,109,101,116,97,95,112,97,116,104,114,77,0,0,0,114,
+    142,0,0,0,114,143,0,0,0,218,13,73,109,112,111,114,
+    116,87,97,114,110,105,110,103,114,21,0,0,0,114,174,0,
+    0,0,114,155,0,0,0,114,96,0,0,0,114,182,0,0,
+    0,114,95,0,0,0,41,10,114,15,0,0,0,114,153,0,
+    0,0,114,154,0,0,0,114,183,0,0,0,90,9,105,115,
+    95,114,101,108,111,97,100,114,181,0,0,0,114,155,0,0,
+    0,114,88,0,0,0,114,89,0,0,0,114,95,0,0,0,
+    114,10,0,0,0,114,10,0,0,0,114,11,0,0,0,218,
+    10,95,102,105,110,100,95,115,112,101,99,149,3,0,0,115,
+    54,0,0,0,0,2,6,1,8,2,8,3,4,1,12,5,
+    10,1,10,1,8,1,2,1,10,1,14,1,12,1,8,1,
+    8,2,22,1,8,2,16,1,10,1,2,1,10,1,14,4,
+    6,2,8,1,6,2,6,2,8,2,114,185,0,0,0,99,
+    3,0,0,0,0,0,0,0,4,0,0,0,5,0,0,0,
+    67,0,0,0,115,140,0,0,0,116,0,124,0,116,1,131,
+    2,115,28,116,2,100,1,160,3,116,4,124,0,131,1,161,
+    1,131,1,130,1,124,2,100,2,107,0,114,44,116,5,100,
+    3,131,1,130,1,124,2,100,2,107,4,114,114,116,0,124,
+    1,116,1,131,2,115,72,116,2,100,4,131,1,130,1,110,
+    42,124,1,115,86,116,6,100,5,131,1,130,1,110,28,124,
+    1,116,7,106,8,107,7,114,114,100,6,125,3,116,9,124,
+    3,160,3,124,1,161,1,131,1,130,1,124,0,12,0,114,
+    136,124,2,100,2,107,2,114,136,116,5,100,7,131,1,130,
+    1,100,8,83,0,41,9,122,28,86,101,114,105,102,121,32,
+    97,114,103,117,109,101,110,116,115,32,97,114,101,32,34,115,
+    97,110,101,34,46,122,31,109,111,100,117,108,101,32,110,97,
+    109,101,32,109,117,115,116,32,98,101,32,115,116,114,44,32,
+    110,111,116,32,123,125,114,33,0,0,0,122,18,108,101,118,
+    101,108,32,109,117,115,116,32,98,101,32,62,61,32,48,122,
+    31,95,95,112,97,99,107,97,103,101,95,95,32,110,111,116,
+    32,115,101,116,32,116,111,32,97,32,115,116,114,105,110,103,
+    122,54,97,116,116,101,109,112,116,101,100,32,114,101,108,97,
+    116,105,118,101,32,105,109,112,111,114,116,32,119,105,116,104,
+    32,110,111,32,107,110,111,119,110,32,112,97,114,101,110,116,
+    32,112,97,99,107,97,103,101,122,61,80,97,114,101,110,116,
+    32,109,111,100,117,108,101,32,123,33,114,125,32,110,111,116,
+    32,108,111,97,100,101,100,44,32,99,97,110,110,111,116,32,
+    112,101,114,102,111,114,109,32,114,101,108,97,116,105,118,101,
+    32,105,109,112,111,114,116,122,17,69,109,112,116,121,32,109,
+    111,100,117,108,101,32,110,97,109,101,78,41,10,114,166,0,
+    0,0,114,167,0,0,0,218,9,84,121,112,101,69,114,114,
+    111,114,114,50,0,0,0,114,13,0,0,0,114,177,0,0,
+    0,114,77,0,0,0,114,14,0,0,0,114,21,0,0,0,
+    218,11,83,121,115,116,101,109,69,114,114,111,114,41,4,114,
+    15,0,0,0,114,178,0,0,0,114,179,0,0,0,114,148,
+    0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,
+    0,0,218,13,95,115,97,110,105,116,121,95,99,104,101,99,
+    107,196,3,0,0,115,28,0,0,0,0,2,10,1,18,1,
+    8,1,8,1,8,1,10,1,10,1,4,1,10,2,10,1,
+    4,2,14,1,14,1,114,188,0,0,0,122,16,78,111,32,
+    109,111,100,117,108,101,32,110,97,109,101,100,32,122,4,123,
+    33,114,125,99,2,0,0,0,0,0,0,0,8,0,0,0,
+    13,0,0,0,67,0,0,0,115,224,0,0,0,100,0,125,
+    2,124,0,160,0,100,1,161,1,100,2,25,0,125,3,124,
+    3,114,136,124,3,116,1,106,2,107,7,114,42,116,3,124,
+    1,124,3,131,2,1,0,124,0,116,1,106,2,107,6,114,
+    62,116,1,106,2,124,0,25,0,83,0,116,1,106,2,124,
+    3,25,0,125,4,121,10,124,4,106,4,125,2,87,0,110,
+    52,4,0,116,5,107,10,114,134,1,0,1,0,1,0,116,
+    6,100,3,23,0,160,7,124,0,124,3,161,2,125,5,116,
+    8,124,5,100,4,124,0,144,1,131,1,100,0,130,2,89,
+    0,110,2,88,0,116,9,124,0,124,2,131,2,125,6,124,
+    6,100,0,107,8,114,176,116,8,116,6,160,7,124,0,161,
+    1,100,4,124,0,144,1,131,1,130,1,110,8,116,10,124,
+    6,131,1,125,7,124,3,114,220,116,1,106,2,124,3,25,
+    0,125,4,116,11,124,4,124,0,160,0,100,1,161,1,100,
+    5,25,0,124,7,131,3,1,0,124,7,83,0,41,6,78,
+    114,121,0,0,0,114,33,0,0,0,122,23,59,32,123,33,
+    114,125,32,105,115,32,110,111,116,32,97,32,112,97,99,107,
+    97,103,101,114,15,0,0,0,114,141,0,0,0,41,12,114,
+    122,0,0,0,114,14,0,0,0,114,21,0,0,0,114,65,
+    0,0,0,114,131,0,0,0,114,96,0,0,0,218,8,95,
+    69,82,82,95,77,83,71,114,50,0,0,0,114,77,0,0,
+    0,114,185,0,0,0,114,150,0,0,0,114,5,0,0,0,
+    41,8,114,15,0,0,0,218,7,105,109,112,111,114,116,95,
+    114,153,0,0,0,114,123,0,0,0,90,13,112,97,114,101,
+    110,116,95,109,111,100,117,108,101,114,148,0,0,0,114,88,
+    0,0,0,114,89,0,0,0,114,10,0,0,0,114,10,0,
+    0,0,114,11,0,0,0,218,23,95,102,105,110,100,95,97,
+    110,100,95,108,111,97,100,95,117,110,108,111,99,107,101,100,
+    219,3,0,0,115,42,0,0,0,0,1,4,1,14,1,4,
+    1,10,1,10,2,10,1,10,1,10,1,2,1,10,1,14,
+    1,16,1,22,1,10,1,8,1,22,2,8,1,4,2,10,
+    1,22,1,114,191,0,0,0,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,10,0,0,0,67,0,0,0,115,30,0,
+    0,0,116,0,124,0,131,1,143,12,1,0,116,1,124,0,
+    124,1,131,2,83,0,81,0,82,0,88,0,100,1,83,0,
+    41,2,122,54,70,105,110,100,32,97,110,100,32,108,111,97,
+    100,32,116,104,101,32,109,111,100,117,108,101,44,32,97,110,
+    100,32,114,101,108,101,97,115,101,32,116,104,101,32,105,109,
+    112,111,114,116,32,108,111,99,107,46,78,41,2,114,54,0,
+    0,0,114,191,0,0,0,41,2,114,15,0,0,0,114,190,
+    0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,
+    0,0,218,14,95,102,105,110,100,95,97,110,100,95,108,111,
+    97,100,246,3,0,0,115,4,0,0,0,0,2,10,1,114,
+    192,0,0,0,114,33,0,0,0,99,3,0,0,0,0,0,
+    0,0,5,0,0,0,4,0,0,0,67,0,0,0,115,122,
+    0,0,0,116,0,124,0,124,1,124,2,131,3,1,0,124,
+    2,100,1,107,4,114,32,116,1,124,0,124,1,124,2,131,
+    3,125,0,116,2,160,3,161,0,1,0,124,0,116,4,106,
+    5,107,7,114,60,116,6,124,0,116,7,131,2,83,0,116,
+    4,106,5,124,0,25,0,125,3,124,3,100,2,107,8,114,
+    110,116,2,160,8,161,0,1,0,100,3,160,9,124,0,161,
+    1,125,4,116,10,124,4,100,4,124,0,144,1,131,1,130,
+    1,116,11,124,0,131,1,1,0,124,3,83,0,41,5,97,
+    50,1,0,0,73,109,112,111,114,116,32,97,110,100,32,114,
+    101,116,117,114,110,32,116,104,101,32,109,111,100,117,108,101,
+    32,98,97,115,101,100,32,111,110,32,105,116,115,32,110,97,
+    109,101,44,32,116,104,101,32,112,97,99,107,97,103,101,32,
+    116,104,101,32,99,97,108,108,32,105,115,10,32,32,32,32,
+    98,101,105,110,103,32,109,97,100,101,32,102,114,111,109,44,
+    32,97,110,100,32,116,104,101,32,108,101,118,101,108,32,97,
+    100,106,117,115,116,109,101,110,116,46,10,10,32,32,32,32,
+    84,104,105,115,32,102,117,110,99,116,105,111,110,32,114,101,
+    112,114,101,115,101,110,116,115,32,116,104,101,32,103,114,101,
+    97,116,101,115,116,32,99,111,109,109,111,110,32,100,101,110,
+    111,109,105,110,97,116,111,114,32,111,102,32,102,117,110,99,
+    116,105,111,110,97,108,105,116,121,10,32,32,32,32,98,101,
+    116,119,101,101,110,32,105,109,112,111,114,116,95,109,111,100,
+    117,108,101,32,97,110,100,32,95,95,105,109,112,111,114,116,
+    95,95,46,32,84,104,105,115,32,105,110,99,108,117,100,101,
+    115,32,115,101,116,116,105,110,103,32,95,95,112,97,99,107,
+    97,103,101,95,95,32,105,102,10,32,32,32,32,116,104,101,
+    32,108,111,97,100,101,114,32,100,105,100,32,110,111,116,46,
+    10,10,32,32,32,32,114,33,0,0,0,78,122,40,105,109,
+    112,111,114,116,32,111,102,32,123,125,32,104,97,108,116,101,
+    100,59,32,78,111,110,101,32,105,110,32,115,121,115,46,109,
+    111,100,117,108,101,115,114,15,0,0,0,41,12,114,188,0,
+    0,0,114,180,0,0,0,114,57,0,0,0,114,146,0,0,
+    0,114,14,0,0,0,114,21,0,0,0,114,192,0,0,0,
+    218,11,95,103,99,100,95,105,109,112,111,114,116,114,58,0,
+    0,0,114,50,0,0,0,114,77,0,0,0,114,63,0,0,
+    0,41,5,114,15,0,0,0,114,178,0,0,0,114,179,0,
+    0,0,114,89,0,0,0,114,74,0,0,0,114,10,0,0,
+    0,114,10,0,0,0,114,11,0,0,0,114,193,0,0,0,
+    252,3,0,0,115,28,0,0,0,0,9,12,1,8,1,12,
+    1,8,1,10,1,10,1,10,1,8,1,8,1,4,1,6,
+    1,14,1,8,1,114,193,0,0,0,99,3,0,0,0,0,
+    0,0,0,6,0,0,0,17,0,0,0,67,0,0,0,115,
+    178,0,0,0,116,0,124,0,100,1,131,2,114,174,100,2,
+    124,1,107,6,114,58,116,1,124,1,131,1,125,1,124,1,
+    160,2,100,2,161,1,1,0,116,0,124,0,100,3,131,2,
+    114,58,124,1,160,3,124,0,106,4,161,1,1,0,120,114,
+    124,1,68,0,93,106,125,3,116,0,124,0,124,3,131,2,
+    115,64,100,4,160,5,124,0,106,6,124,3,161,2,125,4,
+    121,14,116,7,124,2,124,4,131,2,1,0,87,0,113,64,
+    4,0,116,8,107,10,114,168,1,0,125,5,1,0,122,34,
+    116,9,124,5,131,1,160,10,116,11,161,1,114,150,124,5,
+    106,12,124,4,107,2,114,150,119,64,130,0,87,0,89,0,
+    100,5,100,5,125,5,126,5,88,0,113,64,88,0,113,64,
+    87,0,124,0,83,0,41,6,122,238,70,105,103,117,114,101,
+    32,111,117,116,32,119,104,97,116,32,95,95,105,109,112,111,
+    114,116,95,95,32,115,104,111,117,108,100,32,114,101,116,117,
+    114,110,46,10,10,32,32,32,32,84,104,101,32,105,109,112,
+    111,114,116,95,32,112,97,114,97,109,101,116,101,114,32,105,
+    115,32,97,32,99,97,108,108,97,98,108,101,32,119,104,105,
+    99,104,32,116,97,107,101,115,32,116,104,101,32,110,97,109,
+    101,32,111,102,32,109,111,100,117,108,101,32,116,111,10,32,
+    32,32,32,105,109,112,111,114,116,46,32,73,116,32,105,115,
+    32,114,101,113,117,105,114,101,100,32,116,111,32,100,101,99,
+    111,117,112,108,101,32,116,104,101,32,102,117,110,99,116,105,
+    111,110,32,102,114,111,109,32,97,115,115,117,109,105,110,103,
+    32,105,109,112,111,114,116,108,105,98,39,115,10,32,32,32,
+    32,105,109,112,111,114,116,32,105,109,112,108,101,109,101,110,
+    116,97,116,105,111,110,32,105,115,32,100,101,115,105,114,101,
+    100,46,10,10,32,32,32,32,114,131,0,0,0,250,1,42,
+    218,7,95,95,97,108,108,95,95,122,5,123,125,46,123,125,
+    78,41,13,114,4,0,0,0,114,130,0,0,0,218,6,114,
+    101,109,111,118,101,218,6,101,120,116,101,110,100,114,195,0,
+    0,0,114,50,0,0,0,114,1,0,0,0,114,65,0,0,
+    0,114,77,0,0,0,114,167,0,0,0,114,71,0,0,0,
+    218,15,95,69,82,82,95,77,83,71,95,80,82,69,70,73,
+    88,114,15,0,0,0,41,6,114,89,0,0,0,218,8,102,
+    114,111,109,108,105,115,116,114,190,0,0,0,218,1,120,90,
+    9,102,114,111,109,95,110,97,109,101,90,3,101,120,99,114,
+    10,0,0,0,114,10,0,0,0,114,11,0,0,0,218,16,
+    95,104,97,110,100,108,101,95,102,114,111,109,108,105,115,116,
+    20,4,0,0,115,34,0,0,0,0,10,10,1,8,1,8,
+    1,10,1,10,1,12,1,10,1,10,1,14,1,2,1,14,
+    1,16,4,14,1,10,1,2,1,24,1,114,201,0,0,0,
+    99,1,0,0,0,0,0,0,0,3,0,0,0,7,0,0,
+    0,67,0,0,0,115,160,0,0,0,124,0,160,0,100,1,
+    161,1,125,1,124,0,160,0,100,2,161,1,125,2,124,1,
+    100,3,107,9,114,92,124,2,100,3,107,9,114,86,124,1,
+    124,2,106,1,107,3,114,86,116,2,106,3,100,4,106,4,
+    100,5,124,1,155,2,100,6,124,2,106,1,155,2,100,7,
+    103,5,131,1,116,5,100,8,100,9,144,1,131,2,1,0,
+    124,1,83,0,110,64,124,2,100,3,107,9,114,108,124,2,
+    106,1,83,0,110,48,116,2,106,3,100,10,116,5,100,8,
+    100,9,144,1,131,2,1,0,124,0,100,11,25,0,125,1,
+    100,12,124,0,107,7,114,156,124,1,160,6,100,13,161,1,
+    100,14,25,0,125,1,124,1,83,0,41,15,122,167,67,97,
+    108,99,117,108,97,116,101,32,119,104,97,116,32,95,95,112,
+    97,99,107,97,103,101,95,95,32,115,104,111,117,108,100,32,
+    98,101,46,10,10,32,32,32,32,95,95,112,97,99,107,97,
+    103,101,95,95,32,105,115,32,110,111,116,32,103,117,97,114,
+    97,110,116,101,101,100,32,116,111,32,98,101,32,100,101,102,
+    105,110,101,100,32,111,114,32,99,111,117,108,100,32,98,101,
+    32,115,101,116,32,116,111,32,78,111,110,101,10,32,32,32,
+    32,116,111,32,114,101,112,114,101,115,101,110,116,32,116,104,
+    97,116,32,105,116,115,32,112,114,111,112,101,114,32,118,97,
+    108,117,101,32,105,115,32,117,110,107,110,111,119,110,46,10,
+    10,32,32,32,32,114,134,0,0,0,114,95,0,0,0,78,
+    114,163,0,0,0,122,32,95,95,112,97,99,107,97,103,101,
+    95,95,32,33,61,32,95,95,115,112,101,99,95,95,46,112,
+    97,114,101,110,116,32,40,122,4,32,33,61,32,250,1,41,
+    114,140,0,0,0,233,3,0,0,0,122,89,99,97,110,39,
+    116,32,114,101,115,111,108,118,101,32,112,97,99,107,97,103,
+    101,32,102,114,111,109,32,95,95,115,112,101,99,95,95,32,
+    111,114,32,95,95,112,97,99,107,97,103,101,95,95,44,32,
+    102,97,108,108,105,110,103,32,98,97,99,107,32,111,110,32,
+    95,95,110,97,109,101,95,95,32,97,110,100,32,95,95,112,
+    97,116,104,95,95,114,1,0,0,0,114,131,0,0,0,114,
+    121,0,0,0,114,33,0,0,0,41,7,114,42,0,0,0,
+    114,123,0,0,0,114,142,0,0,0,114,143,0,0,0,114,
+    115,0,0,0,114,184,0,0,0,114,122,0,0,0,41,3,
+    218,7,103,108,111,98,97,108,115,114,178,0,0,0,114,88,
+    0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,
+    0,0,218,17,95,99,97,108,99,95,95,95,112,97,99,107,
+    97,103,101,95,95,52,4,0,0,115,30,0,0,0,0,7,
+    10,1,10,1,8,1,18,1,28,2,12,1,6,1,8,1,
+    8,2,6,2,12,1,8,1,8,1,14,1,114,205,0,0,
+    0,99,5,0,0,0,0,0,0,0,9,0,0,0,5,0,
+    0,0,67,0,0,0,115,170,0,0,0,124,4,100,1,107,
+    2,114,18,116,0,124,0,131,1,125,5,110,36,124,1,100,
+    2,107,9,114,30,124,1,110,2,105,0,125,6,116,1,124,
+    6,131,1,125,7,116,0,124,0,124,7,124,4,131,3,125,
+    5,124,3,115,154,124,4,100,1,107,2,114,86,116,0,124,
+    0,160,2,100,3,161,1,100,1,25,0,131,1,83,0,113,
+    166,124,0,115,96,124,5,83,0,113,166,116,3,124,0,131,
+    1,116,3,124,0,160,2,100,3,161,1,100,1,25,0,131,
+    1,24,0,125,8,116,4,106,5,124,5,106,6,100,2,116,
+    3,124,5,106,6,131,1,124,8,24,0,133,2,25,0,25,
+    0,83,0,110,12,116,7,124,5,124,3,116,0,131,3,83,
+    0,100,2,83,0,41,4,97,215,1,0,0,73,109,112,111,
+    114,116,32,97,32,109,111,100,117,108,101,46,10,10,32,32,
+    32,32,84,104,101,32,39,103,108,111,98,97,108,115,39,32,
+    97,114,103,117,109,101,110,116,32,105,115,32,117,115,101,100,
+    32,116,111,32,105,110,102,101,114,32,119,104,101,114,101,32,
+    116,104,101,32,105,109,112,111,114,116,32,105,115,32,111,99,
+    99,117,114,114,105,110,103,32,102,114,111,109,10,32,32,32,
+    32,116,111,32,104,97,110,100,108,101,32,114,101,108,97,116,
+    105,118,101,32,105,109,112,111,114,116,115,46,32,84,104,101,
+    32,39,108,111,99,97,108,115,39,32,97,114,103,117,109,101,
+    110,116,32,105,115,32,105,103,110,111,114,101,100,46,32,84,
+    104,101,10,32,32,32,32,39,102,114,111,109,108,105,115,116,
+    39,32,97,114,103,117,109,101,110,116,32,115,112,101,99,105,
+    102,105,101,115,32,119,104,97,116,32,115,104,111,117,108,100,
+    32,101,120,105,115,116,32,97,115,32,97,116,116,114,105,98,
+    117,116,101,115,32,111,110,32,116,104,101,32,109,111,100,117,
+    108,101,10,32,32,32,32,98,101,105,110,103,32,105,109,112,
+    111,114,116,101,100,32,40,101,46,103,46,32,96,96,102,114,
+    111,109,32,109,111,100,117,108,101,32,105,109,112,111,114,116,
+    32,60,102,114,111,109,108,105,115,116,62,96,96,41,46,32,
+    32,84,104,101,32,39,108,101,118,101,108,39,10,32,32,32,
+    32,97,114,103,117,109,101,110,116,32,114,101,112,114,101,115,
+    101,110,116,115,32,116,104,101,32,112,97,99,107,97,103,101,
+    32,108,111,99,97,116,105,111,110,32,116,111,32,105,109,112,
+    111,114,116,32,102,114,111,109,32,105,110,32,97,32,114,101,
+    108,97,116,105,118,101,10,32,32,32,32,105,109,112,111,114,
+    116,32,40,101,46,103,46,32,96,96,102,114,111,109,32,46,
+    46,112,107,103,32,105,109,112,111,114,116,32,109,111,100,96,
+    96,32,119,111,117,108,100,32,104,97,118,101,32,97,32,39,
+    108,101,118,101,108,39,32,111,102,32,50,41,46,10,10,32,
+    32,32,32,114,33,0,0,0,78,114,121,0,0,0,41,8,
+    114,193,0,0,0,114,205,0,0,0,218,9,112,97,114,116,
+    105,116,105,111,110,114,176,0,0,0,114,14,0,0,0,114,
+    21,0,0,0,114,1,0,0,0,114,201,0,0,0,41,9,
+    114,15,0,0,0,114,204,0,0,0,218,6,108,111,99,97,
+    108,115,114,199,0,0,0,114,179,0,0,0,114,89,0,0,
+    0,90,8,103,108,111,98,97,108,115,95,114,178,0,0,0,
+    90,7,99,117,116,95,111,102,102,114,10,0,0,0,114,10,
+    0,0,0,114,11,0,0,0,218,10,95,95,105,109,112,111,
+    114,116,95,95,79,4,0,0,115,26,0,0,0,0,11,8,
+    1,10,2,16,1,8,1,12,1,4,3,8,1,20,1,4,
+    1,6,4,26,3,32,2,114,208,0,0,0,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,
+    0,115,38,0,0,0,116,0,160,1,124,0,161,1,125,1,
+    124,1,100,0,107,8,114,30,116,2,100,1,124,0,23,0,
+    131,1,130,1,116,3,124,1,131,1,83,0,41,2,78,122,
+    25,110,111,32,98,117,105,108,116,45,105,110,32,109,111,100,
+    117,108,101,32,110,97,109,101,100,32,41,4,114,151,0,0,
+    0,114,155,0,0,0,114,77,0,0,0,114,150,0,0,0,
+    41,2,114,15,0,0,0,114,88,0,0,0,114,10,0,0,
+    0,114,10,0,0,0,114,11,0,0,0,218,18,95,98,117,
+    105,108,116,105,110,95,102,114,111,109,95,110,97,109,101,114,
+    4,0,0,115,8,0,0,0,0,1,10,1,8,1,12,1,
+    114,209,0,0,0,99,2,0,0,0,0,0,0,0,12,0,
+    0,0,12,0,0,0,67,0,0,0,115,244,0,0,0,124,
+    1,97,0,124,0,97,1,116,2,116,1,131,1,125,2,120,
+    86,116,1,106,3,160,4,161,0,68,0,93,72,92,2,125,
+    3,125,4,116,5,124,4,124,2,131,2,114,28,124,3,116,
+    1,106,6,107,6,114,62,116,7,125,5,110,18,116,0,160,
+    8,124,3,161,1,114,28,116,9,125,5,110,2,113,28,116,
+    10,124,4,124,5,131,2,125,6,116,11,124,6,124,4,131,
+    2,1,0,113,28,87,0,116,1,106,3,116,12,25,0,125,
+    7,120,54,100,5,68,0,93,46,125,8,124,8,116,1,106,
+    3,107,7,114,144,116,13,124,8,131,1,125,9,110,10,116,
+    1,106,3,124,8,25,0,125,9,116,14,124,7,124,8,124,
+    9,131,3,1,0,113,120,87,0,121,12,116,13,100,2,131,
+    1,125,10,87,0,110,24,4,0,116,15,107,10,114,206,1,
+    0,1,0,1,0,100,3,125,10,89,0,110,2,88,0,116,
+    14,124,7,100,2,124,10,131,3,1,0,116,13,100,4,131,
+    1,125,11,116,14,124,7,100,4,124,11,131,3,1,0,100,
+    3,83,0,41,6,122,250,83,101,116,117,112,32,105,109,112,
+    111,114,116,108,105,98,32,98,121,32,105,109,112,111,114,116,
+    105,110,103,32,110,101,101,100,101,100,32,98,117,105,108,116,
+    45,105,110,32,109,111,100,117,108,101,115,32,97,110,100,32,
+    105,110,106,101,99,116,105,110,103,32,116,104,101,109,10,32,
+    32,32,32,105,110,116,111,32,116,104,101,32,103,108,111,98,
+    97,108,32,110,97,109,101,115,112,97,99,101,46,10,10,32,
+    32,32,32,65,115,32,115,121,115,32,105,115,32,110,101,101,
+    100,101,100,32,102,111,114,32,115,121,115,46,109,111,100,117,
+    108,101,115,32,97,99,99,101,115,115,32,97,110,100,32,95,
+    105,109,112,32,105,115,32,110,101,101,100,101,100,32,116,111,
+    32,108,111,97,100,32,98,117,105,108,116,45,105,110,10,32,
+    32,32,32,109,111,100,117,108,101,115,44,32,116,104,111,115,
+    101,32,116,119,111,32,109,111,100,117,108,101,115,32,109,117,
+    115,116,32,98,101,32,101,120,112,108,105,99,105,116,108,121,
+    32,112,97,115,115,101,100,32,105,110,46,10,10,32,32,32,
+    32,114,142,0,0,0,114,34,0,0,0,78,114,62,0,0,
+    0,41,1,122,9,95,119,97,114,110,105,110,103,115,41,16,
+    114,57,0,0,0,114,14,0,0,0,114,13,0,0,0,114,
+    21,0,0,0,218,5,105,116,101,109,115,114,166,0,0,0,
+    114,76,0,0,0,114,151,0,0,0,114,82,0,0,0,114,
+    161,0,0,0,114,132,0,0,0,114,137,0,0,0,114,1,
+    0,0,0,114,209,0,0,0,114,5,0,0,0,114,77,0,
+    0,0,41,12,218,10,115,121,115,95,109,111,100,117,108,101,
+    218,11,95,105,109,112,95,109,111,100,117,108,101,90,11,109,
+    111,100,117,108,101,95,116,121,112,101,114,15,0,0,0,114,
+    89,0,0,0,114,99,0,0,0,114,88,0,0,0,90,11,
+    115,101,108,102,95,109,111,100,117,108,101,90,12,98,117,105,
+    108,116,105,110,95,110,97,109,101,90,14,98,117,105,108,116,
+    105,110,95,109,111,100,117,108,101,90,13,116,104,114,101,97,
+    100,95,109,111,100,117,108,101,90,14,119,101,97,107,114,101,
+    102,95,109,111,100,117,108,101,114,10,0,0,0,114,10,0,
+    0,0,114,11,0,0,0,218,6,95,115,101,116,117,112,121,
+    4,0,0,115,50,0,0,0,0,9,4,1,4,3,8,1,
+    20,1,10,1,10,1,6,1,10,1,6,2,2,1,10,1,
+    14,3,10,1,10,1,10,1,10,2,10,1,16,3,2,1,
+    12,1,14,2,10,1,12,3,8,1,114,213,0,0,0,99,
+    2,0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,
+    67,0,0,0,115,66,0,0,0,116,0,124,0,124,1,131,
+    2,1,0,116,1,106,2,160,3,116,4,161,1,1,0,116,
+    1,106,2,160,3,116,5,161,1,1,0,100,1,100,2,108,
+    6,125,2,124,2,97,7,124,2,160,8,116,1,106,9,116,
+    10,25,0,161,1,1,0,100,2,83,0,41,3,122,50,73,
+    110,115,116,97,108,108,32,105,109,112,111,114,116,108,105,98,
+    32,97,115,32,116,104,101,32,105,109,112,108,101,109,101,110,
+    116,97,116,105,111,110,32,111,102,32,105,109,112,111,114,116,
+    46,114,33,0,0,0,78,41,11,114,213,0,0,0,114,14,
+    0,0,0,114,183,0,0,0,114,113,0,0,0,114,151,0,
+    0,0,114,161,0,0,0,218,26,95,102,114,111,122,101,110,
+    95,105,109,112,111,114,116,108,105,98,95,101,120,116,101,114,
+    110,97,108,114,119,0,0,0,218,8,95,105,110,115,116,97,
+    108,108,114,21,0,0,0,114,1,0,0,0,41,3,114,211,
+    0,0,0,114,212,0,0,0,114,214,0,0,0,114,10,0,
+    0,0,114,10,0,0,0,114,11,0,0,0,114,215,0,0,
+    0,168,4,0,0,115,12,0,0,0,0,2,10,2,12,1,
+    12,3,8,1,4,1,114,215,0,0,0,41,2,78,78,41,
+    1,78,41,2,78,114,33,0,0,0,41,51,114,3,0,0,
+    0,114,119,0,0,0,114,12,0,0,0,114,16,0,0,0,
+    114,17,0,0,0,114,59,0,0,0,114,41,0,0,0,114,
+    48,0,0,0,114,31,0,0,0,114,32,0,0,0,114,53,
+    0,0,0,114,54,0,0,0,114,56,0,0,0,114,63,0,
+    0,0,114,65,0,0,0,114,75,0,0,0,114,81,0,0,
+    0,114,84,0,0,0,114,90,0,0,0,114,101,0,0,0,
+    114,102,0,0,0,114,106,0,0,0,114,85,0,0,0,218,
+    6,111,98,106,101,99,116,90,9,95,80,79,80,85,76,65,
+    84,69,114,132,0,0,0,114,137,0,0,0,114,145,0,0,
+    0,114,97,0,0,0,114,86,0,0,0,114,149,0,0,0,
+    114,150,0,0,0,114,87,0,0,0,114,151,0,0,0,114,
+    161,0,0,0,114,174,0,0,0,114,180,0,0,0,114,182,
+    0,0,0,114,185,0,0,0,114,188,0,0,0,114,198,0,
+    0,0,114,189,0,0,0,114,191,0,0,0,114,192,0,0,
+    0,114,193,0,0,0,114,201,0,0,0,114,205,0,0,0,
+    114,208,0,0,0,114,209,0,0,0,114,213,0,0,0,114,
+    215,0,0,0,114,10,0,0,0,114,10,0,0,0,114,10,
+    0,0,0,114,11,0,0,0,218,8,60,109,111,100,117,108,
+    101,62,8,0,0,0,115,96,0,0,0,4,17,4,2,8,
+    8,8,4,14,20,4,2,4,3,16,4,14,68,14,21,14,
+    19,8,19,8,19,8,11,14,8,8,11,8,12,8,16,8,
+    36,14,27,14,101,16,26,6,3,10,45,14,60,8,18,8,
+    17,8,25,8,29,8,23,8,16,14,73,14,115,14,13,8,
+    9,8,9,10,47,8,20,4,1,8,2,8,27,8,6,10,
+    24,8,32,8,27,18,35,8,7,8,47,
 };
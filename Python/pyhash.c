@@ -284,7 +284,6 @@ static PyHash_FuncDef PyHash_Func = {fnv, "fnv", 8 * SIZEOF_PY_HASH_T,
 #endif /* Py_HASH_ALGORITHM == Py_HASH_FNV */
 
 
-#if Py_HASH_ALGORITHM == Py_HASH_SIPHASH24
 /* **************************************************************************
  <MIT License>
  Copyright (c) 2013  Marek Majkowski <marek@popcount.org>
@@ -367,10 +366,8 @@ typedef unsigned char PY_UINT8_T;
     HALF_ROUND(v2,v1,v0,v3,17,21);
 
 
-static Py_hash_t
-siphash24(const void *src, Py_ssize_t src_sz) {
-    PY_UINT64_T k0 = _le64toh(_Py_HashSecret.siphash.k0);
-    PY_UINT64_T k1 = _le64toh(_Py_HashSecret.siphash.k1);
+static PY_UINT64_T
+siphash24(PY_UINT64_T k0, PY_UINT64_T k1, const void *src, Py_ssize_t src_sz) {
     PY_UINT64_T b = (PY_UINT64_T)src_sz << 56;
     const PY_UINT64_T *in = (PY_UINT64_T*)src;
 
@@ -415,10 +412,27 @@ siphash24(const void *src, Py_ssize_t src_sz) {
 
     /* modified */
     t = (v0 ^ v1) ^ (v2 ^ v3);
-    return (Py_hash_t)t;
+    return t;
+}
+
+/* Keyed hash of a buffer, independent of the hash randomization secret.
+   Used to fingerprint source files in hash-based .pyc files. */
+PY_UINT64_T
+_Py_KeyedHash(PY_UINT64_T key, const void *src, Py_ssize_t src_sz)
+{
+    return siphash24(key, 0, src, src_sz);
+}
+
+#if Py_HASH_ALGORITHM == Py_HASH_SIPHASH24
+static Py_hash_t
+pysiphash(const void *src, Py_ssize_t src_sz) {
+    return (Py_hash_t)siphash24(
+        _le64toh(_Py_HashSecret.siphash.k0),
+        _le64toh(_Py_HashSecret.siphash.k1),
+        src, src_sz);
 }
 
-static PyHash_FuncDef PyHash_Func = {siphash24, "siphash24", 64, 128};
+static PyHash_FuncDef PyHash_Func = {pysiphash, "siphash24", 64, 128};
 
 #endif /* Py_HASH_ALGORITHM == Py_HASH_SIPHASH24 */
 
@@ -100,6 +100,8 @@ PyInterpreterState_New(void)
 #ifdef WITH_TSC
         interp->tscdump = 0;
 #endif
+        interp->eval_frame = _PyEval_EvalFrameDefault;
+        interp->co_extra_user_count = 0;
 
         HEAD_LOCK();
         interp->next = interp_head;
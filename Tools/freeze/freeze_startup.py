@@ -0,0 +1,116 @@
+#! /usr/bin/env python3
+
+"""Freeze the modules imported on every interpreter startup.
+
+Usage: freeze_startup.py [--empty] output
+
+Writes output (normally Python/frozen_startup_modules.h in the build
+directory, see "make frozen-startup") with the marshalled code of
+STARTUP_MODULES, taken from the Lib directory next to this script.  The
+interpreter used to run this script must be the one being built, since
+the marshal format and bytecode have to match.  With --empty, an empty
+table is written instead, which restores the default build.
+
+Frozen modules shadow the corresponding files in Lib, so the header has
+to be regenerated after any of them is edited; the Makefile does this
+automatically.  The tracked Python/frozen_startup.h is never
+overwritten.  Packages are never frozen: a frozen package has an empty
+__path__ and could not find the submodules which are left on disk (e.g.
+the other encodings).
+"""
+
+import getopt
+import marshal
+import os
+import sys
+
+# Modules imported by "python -c pass" on a typical installation, in
+# import order.
+STARTUP_MODULES = [
+    'codecs',
+    'encodings.aliases',
+    'encodings.ascii',
+    'encodings.latin_1',
+    'encodings.utf_8',
+    '_weakrefset',
+    'abc',
+    'io',
+    '_bootlocale',
+    'stat',
+    'genericpath',
+    'posixpath',
+    '_collections_abc',
+    'os',
+    '_sitebuiltins',
+    'sysconfig',
+    'site',
+]
+
+LIBDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      os.pardir, os.pardir, 'Lib')
+
+HEADER = """\
+/* Modules frozen into the interpreter to speed up startup.
+ *
+ * Auto-generated by Tools/freeze/freeze_startup.py; run "make frozen-startup"
+ * to freeze the modules and "make unfreeze-startup" to restore the default
+ * (empty) table.
+ */
+"""
+
+
+def symbol(name):
+    return '_Py_M__' + name.replace('.', '__')
+
+
+def freeze(name):
+    """Return the marshalled code object of the module *name*."""
+    path = os.path.join(LIBDIR, *name.split('.')) + '.py'
+    with open(path, 'rb') as f:
+        source = f.read()
+    code = compile(source, '<frozen {}>'.format(name), 'exec',
+                   dont_inherit=True)
+    return marshal.dumps(code)
+
+
+def write_array(out, name, data):
+    out.write('static const unsigned char {}[] = {{\n'.format(symbol(name)))
+    for i in range(0, len(data), 16):
+        out.write('    ' + ','.join(map(str, data[i:i+16])) + ',\n')
+    out.write('};\n')
+
+
+def write_header(out, modules):
+    out.write(HEADER)
+    for name in modules:
+        out.write('\n')
+        write_array(out, name, freeze(name))
+    out.write('\n#define _Py_FROZEN_STARTUP_MODULES')
+    for name in modules:
+        out.write(' \\\n    {{"{0}", {1}, (int)sizeof({1})}},'.format(
+            name, symbol(name)))
+    out.write('\n')
+
+
+def main(args):
+    try:
+        opts, args = getopt.getopt(args, '', ['empty'])
+    except getopt.error as msg:
+        sys.exit(msg)
+    if len(args) != 1:
+        sys.exit(__doc__)
+    modules = STARTUP_MODULES
+    for opt, _ in opts:
+        if opt == '--empty':
+            modules = []
+    output = args[0]
+    # Write to a temporary file first so that a failure does not leave a
+    # truncated header behind.
+    tmp = output + '.new'
+    with open(tmp, 'w') as out:
+        write_header(out, modules)
+    os.replace(tmp, output)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -43,6 +43,7 @@ def main():
                 try:
                     with open(name_c, 'rb') as f:
                         magic_str = f.read(4)
+                        flags_str = f.read(4)
                         mtime_str = f.read(4)
                 except IOError:
                     print('Cannot open', repr(name_c))
@@ -51,6 +52,11 @@ def main():
                     print('Bad MAGIC word in ".pyc" file', end=' ')
                     print(repr(name_c))
                     continue
+                if get_long(flags_str) != 0:
+                    # Hash-based pycs don't record the source mtime
+                    if verbose:
+                        print('Hash-based ".pyc" file', repr(name_c))
+                    continue
                 mtime = get_long(mtime_str)
                 if mtime in {0, -1}:
                     print('Bad ".pyc" file', repr(name_c))
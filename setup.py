@@ -640,6 +640,8 @@ class PyBuildExt(build_ext):
         exts.append( Extension("atexit", ["atexitmodule.c"]) )
         # _json speedups
         exts.append( Extension("_json", ["_json.c"]) )
+        # asyncio speedups
+        exts.append( Extension("_asyncio", ["_asynciomodule.c"]) )
         # Python C API test module
         exts.append( Extension('_testcapi', ['_testcapimodule.c'],
                                depends=['testcapi_long.h']) )
@@ -1577,6 +1579,14 @@ class PyBuildExt(build_ext):
                                     include_dirs=["Modules/_multiprocessing"]))
         else:
             missing.append('_multiprocessing')
+
+        # POSIX shared memory objects for multiprocessing.shared_memory
+        if host_platform != 'win32':
+            exts.append( Extension('_posixshmem',
+                                   ['_multiprocessing/posixshmem.c'],
+                                   libraries=libraries) )
+        else:
+            missing.append('_posixshmem')
         # End multiprocessing
 
         # Platform-specific libraries